@@ -2,6 +2,7 @@ import numpy as np
 
 from opensourceleg.actuators.base import CONTROL_MODES
 from opensourceleg.actuators.dephy import DephyActuator
+from opensourceleg.actuators.group import ActuatorGroup
 from opensourceleg.control.fsm import State, StateMachine
 from opensourceleg.logging.logger import Logger
 from opensourceleg.robots.osl import OpenSourceLeg
@@ -241,6 +242,7 @@ if __name__ == "__main__":
     )
 
     osl_fsm = create_simple_walking_fsm(osl)
+    joints = ActuatorGroup([osl.knee, osl.ankle])
 
     with osl, osl_fsm:
         osl.update()
@@ -248,28 +250,18 @@ if __name__ == "__main__":
 
         input("Press Enter to start walking...")
 
-        # knee
-        osl.knee.set_control_mode(mode=CONTROL_MODES.IMPEDANCE)
-        osl.knee.set_impedance_gains()
-
-        # ankle
-        osl.ankle.set_control_mode(mode=CONTROL_MODES.IMPEDANCE)
-        osl.ankle.set_impedance_gains()
+        joints.set_control_mode(mode=CONTROL_MODES.IMPEDANCE)
+        joints.set_impedance_gains()
 
         for t in clock:
             osl.update()
             osl_fsm.update(osl=osl)
-            osl.knee.set_output_impedance(
-                k=osl_fsm.current_state.knee_stiffness,
-                b=osl_fsm.current_state.knee_damping,
-            )
-            osl.ankle.set_output_impedance(
-                k=osl_fsm.current_state.ankle_stiffness,
-                b=osl_fsm.current_state.ankle_damping,
+            state = osl_fsm.current_state
+            joints.set_output_impedances(
+                k=[state.knee_stiffness, state.ankle_stiffness],
+                b=[state.knee_damping, state.ankle_damping],
             )
-
-            osl.knee.set_output_position(np.deg2rad(osl_fsm.current_state.knee_theta))
-            osl.ankle.set_output_position(np.deg2rad(osl_fsm.current_state.ankle_theta))
+            joints.set_output_positions(np.deg2rad([state.knee_theta, state.ankle_theta]))
 
             fsm_logger.info(
                 f"T: {t:.3f}s, "
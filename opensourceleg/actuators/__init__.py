@@ -1,3 +1,5 @@
 from .base import *  # noqa: F403
 from .decorators import *  # noqa: F403
 from .dephy import *  # noqa: F403
+from .group import *  # noqa: F403
+from .simulated import *  # noqa: F403
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Sequence
+from concurrent.futures import Executor
 from dataclasses import dataclass
 from enum import Enum
 from functools import partial
@@ -19,6 +21,7 @@ import numpy as np
 
 from opensourceleg.logging.exceptions import ControlModeException
 from opensourceleg.logging.logger import LOGGER
+from opensourceleg.utilities.clock import Clock, SystemClock
 
 # TODO: Add validators for every custom data type
 
@@ -242,6 +245,8 @@ def requires(*modes: CONTROL_MODES) -> Callable[[T], T]:
 
     The decorator attaches a set of required modes to the function,
     ensuring that the function is only active in the specified control modes.
+    On an `ActuatorBase` subclass, these modes take precedence over the
+    class-level `_METHOD_REQUIRED_MODES` entry for the method.
 
     Args:
         *modes (CONTROL_MODES): One or more control modes required for the method.
@@ -282,6 +287,90 @@ def requires(*modes: CONTROL_MODES) -> Callable[[T], T]:
     return decorator
 
 
+class ActuatorState:
+    """
+    Snapshot of the decoded state of an actuator at its last update.
+
+    Actuators that support it decode their raw data frame into this record once per update, and their
+    properties return its fields, so the controller, the logger and the safety checks all read the
+    same values without converting the raw data again. Positions are in radians, velocities in rad/s,
+    torques in Nm, temperatures in degrees celsius and IMU readings in m/s^2 and rad/s. Voltages and
+    currents keep the units of the corresponding actuator properties.
+
+    Examples:
+        >>> state = actuator.state
+        >>> state.motor_position, state.motor_torque
+        (0.52, 1.3)
+        >>> LOGGER.track_attributes(actuator.state, ["motor_position", "motor_current"])
+    """
+
+    __slots__ = (
+        "accelx",
+        "accely",
+        "accelz",
+        "battery_current",
+        "battery_voltage",
+        "case_temperature",
+        "gyrox",
+        "gyroy",
+        "gyroz",
+        "motor_acceleration",
+        "motor_current",
+        "motor_encoder_counts",
+        "motor_position",
+        "motor_torque",
+        "motor_velocity",
+        "motor_voltage",
+        "winding_temperature",
+    )
+
+    def __init__(self) -> None:
+        self.motor_position: float = 0.0
+        self.motor_velocity: float = 0.0
+        self.motor_acceleration: float = 0.0
+        self.motor_voltage: float = 0.0
+        self.motor_current: float = 0.0
+        self.motor_torque: float = 0.0
+        self.motor_encoder_counts: int = 0
+        self.battery_voltage: float = 0.0
+        self.battery_current: float = 0.0
+        self.case_temperature: float = 0.0
+        self.winding_temperature: float = 0.0
+        self.accelx: float = 0.0
+        self.accely: float = 0.0
+        self.accelz: float = 0.0
+        self.gyrox: float = 0.0
+        self.gyroy: float = 0.0
+        self.gyroz: float = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"ActuatorState(motor_position={self.motor_position}, motor_velocity={self.motor_velocity}, "
+            f"motor_torque={self.motor_torque})"
+        )
+
+    def copy(self) -> "ActuatorState":
+        """
+        Copy the snapshot, for example to keep it after the next update.
+
+        Returns:
+            ActuatorState: A new record with the same values.
+        """
+        state = ActuatorState.__new__(ActuatorState)
+        for name in self.__slots__:
+            setattr(state, name, getattr(self, name))
+        return state
+
+    def as_dict(self) -> dict[str, float]:
+        """
+        Get the snapshot as a dictionary.
+
+        Returns:
+            dict[str, float]: The values by field name.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
 class ActuatorBase(ABC):
     """
     Base class defining the structure and interface for an actuator.
@@ -364,6 +453,46 @@ class ActuatorBase(ABC):
         "set_impedance_gains": {CONTROL_MODES.IMPEDANCE},
     }
 
+    # Precomputed per subclass: the methods restricted in each mode, and for each pair of modes the
+    # methods that become available and restricted when switching between them
+    _MODE_RESTRICTED_METHODS: ClassVar[dict[CONTROL_MODES, frozenset[str]]] = {}
+    _MODE_TRANSITIONS: ClassVar[dict[tuple[CONTROL_MODES, CONTROL_MODES], tuple[frozenset[str], frozenset[str]]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._build_mode_dispatch()
+
+    @classmethod
+    def _build_mode_dispatch(cls) -> None:
+        """
+        Precompute which methods are restricted in each control mode.
+
+        Combines the class-level `_METHOD_REQUIRED_MODES` mapping with the modes attached by the
+        `requires` decorator, so that switching the control mode only has to look up the result.
+
+        Examples:
+            >>> DummyActuator._MODE_RESTRICTED_METHODS[CONTROL_MODES.VOLTAGE]
+            frozenset({'set_motor_current', 'set_motor_position', ...})
+        """
+        required_modes: dict[str, set[CONTROL_MODES]] = {
+            name: set(modes) for name, modes in cls._METHOD_REQUIRED_MODES.items() if callable(getattr(cls, name, None))
+        }
+        for name in dir(cls):
+            modes = getattr(getattr(cls, name, None), "_required_modes", None)
+            if isinstance(modes, set):
+                required_modes[name] = set(modes)
+
+        restricted = {
+            mode: frozenset(name for name, modes in required_modes.items() if mode not in modes)
+            for mode in CONTROL_MODES
+        }
+        cls._MODE_RESTRICTED_METHODS = restricted
+        cls._MODE_TRANSITIONS = {
+            (old, new): (restricted[old] - restricted[new], restricted[new] - restricted[old])
+            for old in CONTROL_MODES
+            for new in CONTROL_MODES
+        }
+
     def __init__(
         self,
         tag: str,
@@ -406,10 +535,19 @@ class ActuatorBase(ABC):
         self._is_open: bool = False
         self._is_streaming: bool = False
 
-        self._original_methods: dict[str, MethodWithRequiredModes] = {}
+        # Last command sent on each channel, with the time it was sent, for change-only transmission
+        self._command_cache: dict[str, tuple[tuple[float, ...], float]] = {}
+        self._command_tolerance: Optional[float] = None
+        self._keep_alive: Optional[float] = None
+        self._command_clock: Clock = SystemClock()  # Measures the keep-alive period
+        self._skipped_commands: int = 0
 
-        self._set_original_methods()
-        self._set_mutated_methods()
+        # One restricted stand-in per method, created once so that switching modes does not allocate
+        self._restricted_methods: dict[str, Callable[..., None]] = {
+            name: partial(self._restricted_method, name)
+            for name in frozenset().union(*self._MODE_RESTRICTED_METHODS.values())
+        }
+        self._switch_restricted_methods(self._MODE_RESTRICTED_METHODS[CONTROL_MODES.IDLE], frozenset())
 
     def __enter__(self) -> "ActuatorBase":
         """
@@ -466,47 +604,29 @@ class ActuatorBase(ABC):
         """
         raise ControlModeException(tag=self._tag, attribute=method_name, mode=self._mode.name)
 
-    def _set_original_methods(self) -> None:
-        """
-        Store the original methods that require specific control modes.
-
-        Uses a class-level mapping of methods to their required control modes
-        to ensure proper inheritance of restrictions in derived classes.
-
-        Examples:
-            >>> print(actuator._original_methods)  # Dictionary of method names to methods
+    def _switch_restricted_methods(self, restricted: frozenset[str], available: frozenset[str]) -> None:
         """
-        # Get the method-to-required-modes mapping for this class
-        method_modes_map = getattr(self.__class__, "_METHOD_REQUIRED_MODES", {})
+        Shadow the methods that become restricted and unshadow those that become available.
 
-        for method_name, _required_modes in method_modes_map.items():
-            try:
-                method = getattr(self, method_name)
-                if callable(method):
-                    self._original_methods[method_name] = method
-                    # LOGGER.debug(
-                    #     msg=f"[{self.tag}] {method_name}() is available in modes: "
-                    #     f"{[mode.name for mode in required_modes]}"
-                    # )
-            except AttributeError:
-                LOGGER.debug(msg=f"[{self.tag}] {method_name}() is not implemented in {self.__class__.__name__}.")
-
-    def _set_mutated_methods(self) -> None:
-        """
-        Update actuator methods based on the current control mode.
+        A restricted method is shadowed by an instance attribute that raises `ControlModeException`.
+        An available method has no instance attribute, so calling it costs the same as any other
+        method call.
 
-        For each method stored in `_original_methods`, if the current control mode
-        is permitted, the original method is used; otherwise, a restricted version
-        that logs an error is assigned.
+        Args:
+            restricted (frozenset[str]): The names of the methods to restrict.
+            available (frozenset[str]): The names of the methods to make available.
 
         Examples:
-            >>> actuator._set_mutated_methods()
+            >>> actuator._switch_restricted_methods(frozenset({"set_motor_voltage"}), frozenset())
         """
-        for method_name, method in self._original_methods.items():
-            if self._mode in self._METHOD_REQUIRED_MODES[method_name]:
-                setattr(self, method_name, method)
-            else:
-                setattr(self, method_name, partial(self._restricted_method, method_name))
+        attributes = self.__dict__
+        stand_ins = self._restricted_methods
+        for name in available:
+            # Leave attributes that were replaced, for example by a test patch, in place
+            if attributes.get(name) is stand_ins[name]:
+                del attributes[name]
+        for name in restricted:
+            attributes[name] = stand_ins[name]
 
     @property
     @abstractmethod
@@ -561,6 +681,36 @@ class ActuatorBase(ABC):
         """
         pass
 
+    @classmethod
+    def update_group(
+        cls, actuators: Sequence["ActuatorBase"], executor: Optional[Executor] = None
+    ) -> Optional[Awaitable[Any]]:
+        """
+        Update several actuators of this class at once.
+
+        The default calls `update` on each actuator, in parallel on the executor if one is given, which
+        helps when each actuator has its own blocking link such as a serial port. Subclasses whose
+        transport can exchange data with several actuators in one transaction override this.
+
+        Args:
+            actuators (Sequence[ActuatorBase]): The actuators to update, all instances of this class.
+            executor (Optional[Executor]): An executor to run blocking updates in parallel. Defaults to None.
+
+        Returns:
+            Optional[Awaitable[Any]]: An awaitable that completes the update if the transport is
+                asynchronous; otherwise, None.
+
+        Examples:
+            >>> DummyActuator.update_group([knee, ankle])
+        """
+        if executor is not None and len(actuators) > 1:
+            for future in [executor.submit(actuator.update) for actuator in actuators]:
+                future.result()
+        else:
+            for actuator in actuators:
+                actuator.update()
+        return None
+
     def _get_control_mode_config(self, mode: CONTROL_MODES) -> Optional[ControlModeConfig]:
         """
         Retrieve the control mode configuration for a specified mode.
@@ -577,7 +727,7 @@ class ActuatorBase(ABC):
             None
         """
         return cast(
-            Optional[ControlModeConfig],
+            "Optional[ControlModeConfig]",
             getattr(self._CONTROL_MODE_CONFIGS, mode.name),
         )
 
@@ -603,13 +753,89 @@ class ActuatorBase(ABC):
         if current_config:
             current_config.exit_callback(self)
 
+        # Exit callbacks may stop the motor, so the first commands in the new mode must always be sent
+        self._command_cache.clear()
+        available, restricted = self._MODE_TRANSITIONS[self._mode, mode]
         self._mode = mode
 
         new_config = self._get_control_mode_config(self.mode)
         if new_config:
             new_config.entry_callback(self)
 
-        self._set_mutated_methods()
+        self._switch_restricted_methods(restricted, available)
+
+    def set_command_deduplication(
+        self, tolerance: Optional[float] = 0.0, keep_alive: Optional[float] = 0.1, clock: Optional[Clock] = None
+    ) -> None:
+        """
+        Skip sending commands that have not changed since they were last sent.
+
+        A setpoint or a set of gains is only sent if a value differs from the last one sent on the same
+        channel by more than the tolerance, or if the keep-alive period has passed since it was last sent,
+        so that watchdogs on the actuator keep seeing commands. Switching the control mode always sends the
+        next commands.
+
+        Args:
+            tolerance (Optional[float]): The largest change, in the units of the transmitted command, that
+                is not sent. None disables deduplication. Defaults to 0.0 (only identical commands are skipped).
+            keep_alive (Optional[float]): The time in seconds after which an unchanged command is sent again.
+                None never resends unchanged commands. Defaults to 0.1.
+            clock (Optional[Clock]): The clock the keep-alive period is measured on, for example the clock of
+                the `SoftRealtimeLoop` that sends the commands. Defaults to None, which keeps the current
+                clock (the system clock unless the actuator was given one).
+
+        Raises:
+            ValueError: If the tolerance or the keep-alive period is negative.
+
+        Examples:
+            >>> actuator.set_command_deduplication(tolerance=0.0, keep_alive=0.1)
+            >>> actuator.set_impedance_gains(kp=40, ki=400, kd=0, k=200, b=400, ff=128)  # Sent
+            >>> actuator.set_impedance_gains(kp=40, ki=400, kd=0, k=200, b=400, ff=128)  # Skipped
+        """
+        if tolerance is not None and tolerance < 0:
+            raise ValueError(f"tolerance must not be negative, got {tolerance}")
+        if keep_alive is not None and keep_alive < 0:
+            raise ValueError(f"keep_alive must not be negative, got {keep_alive}")
+
+        self._command_tolerance = tolerance
+        self._keep_alive = keep_alive
+        if clock is not None:
+            self._command_clock = clock
+        self._command_cache.clear()
+
+    def _command_changed(self, channel: str, *values: float) -> bool:
+        """
+        Check if a command must be sent, and if so record it as the last command sent on its channel.
+
+        Subclasses call this right before transmitting a command.
+
+        Args:
+            channel (str): The channel of the command, for example "setpoint" or "gains".
+            *values (float): The values of the command as they will be transmitted.
+
+        Returns:
+            bool: True if the command must be sent; False if it can be skipped.
+
+        Examples:
+            >>> if actuator._command_changed("gains", kp, ki, kd):
+            ...     actuator.send_gains(kp, ki, kd)
+        """
+        if self._command_tolerance is None:
+            return True
+
+        now = self._command_clock.monotonic()
+        last = self._command_cache.get(channel)
+        if last is not None:
+            sent, sent_at = last
+            fresh = self._keep_alive is None or now - sent_at < self._keep_alive
+            if fresh and len(sent) == len(values):
+                tolerance = self._command_tolerance
+                if all(abs(value - previous) <= tolerance for value, previous in zip(values, sent)):
+                    self._skipped_commands += 1
+                    return False
+
+        self._command_cache[channel] = (values, now)
+        return True
 
     @abstractmethod
     def set_motor_voltage(self, value: float) -> None:
@@ -1133,3 +1359,17 @@ class ActuatorBase(ABC):
             True
         """
         return self._is_streaming
+
+    @property
+    def skipped_commands(self) -> int:
+        """
+        Number of commands skipped because they had not changed since they were last sent.
+
+        Returns:
+            int: The number of skipped commands.
+
+        Examples:
+            >>> actuator.skipped_commands
+            0
+        """
+        return self._skipped_commands
@@ -1,7 +1,7 @@
 import os
 import time
 from ctypes import c_int
-from typing import Optional
+from typing import Any, Optional
 
 import numpy as np
 from flexsea.device import Device
@@ -11,6 +11,7 @@ from opensourceleg.actuators.base import (
     CONTROL_MODES,
     MOTOR_CONSTANTS,
     ActuatorBase,
+    ActuatorState,
     ControlGains,
     ControlModeConfig,
 )
@@ -20,7 +21,7 @@ from opensourceleg.actuators.decorators import (
     check_actuator_stream,
 )
 from opensourceleg.extras.safety import I2tLimitException, ThermalLimitException
-from opensourceleg.logging import LOGGER
+from opensourceleg.logging import LOGGER, LogLevel
 from opensourceleg.logging.decorators import (
     deprecated_with_routing,
 )
@@ -176,6 +177,7 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
             soft_border_C_case=10,
         )
         self._thermal_scale: float = 1.0
+        self._state: ActuatorState = ActuatorState()
 
         self._mode = CONTROL_MODES.IDLE
 
@@ -208,6 +210,8 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
                 msg=f"[{self.__repr__()}] Need admin previleges to open the port '{self.port}'. \n\n \
                     Please run the script with 'sudo' command or add the user to the dialout group.\n"
             )
+            # os._exit skips cleanup handlers, so write out buffered log data first
+            LOGGER.close()
             os._exit(status=1)
 
         self.start_streaming(self._frequency)
@@ -215,6 +219,7 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
         self._is_streaming = True
 
         self._data = self.read()
+        self._decode_state(self._data)
         self.set_control_mode(CONTROL_MODES.VOLTAGE)
 
     @check_actuator_stream
@@ -255,23 +260,25 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
             >>> print(f"Motor current: {actuator.motor_current} mA")
         """
         self._data = self.read()
+        state = self._decode_state(self._data)
 
-        self._thermal_model.T_c = self.case_temperature
+        self._thermal_model.T_c = state.case_temperature
         self._thermal_scale = self._thermal_model.update_and_get_scale(
             dt=1 / self.frequency,
-            motor_current=self.motor_current,
+            motor_current=state.motor_current,
         )
-        if self.case_temperature >= self.max_case_temperature:
+        state.winding_temperature = float(self._thermal_model.T_w)
+        if state.case_temperature >= self.max_case_temperature:
             LOGGER.error(
                 msg=f"[{str.upper(self.tag)}] Case thermal limit {self.max_case_temperature} reached. "
-                f"Current Case Temperature: {self.case_temperature} C. Exiting."
+                f"Current Case Temperature: {state.case_temperature} C. Exiting."
             )
             raise ThermalLimitException()
 
-        if self.winding_temperature >= self.max_winding_temperature:
+        if state.winding_temperature >= self.max_winding_temperature:
             LOGGER.error(
                 msg=f"[{str.upper(self.tag)}] Winding thermal limit {self.max_winding_temperature} reached."
-                f"Current Winding Temperature: {self.winding_temperature} C. Exiting."
+                f"Current Winding Temperature: {state.winding_temperature} C. Exiting."
             )
             raise ThermalLimitException()
         # Check for thermal fault, bit 2 of the execute status byte
@@ -280,9 +287,48 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
             # review physical setup to ensure excessive torque is not normally applied
             # If issue persists, review "Maximum Average Current", "Current Limit", and
             # "Time at current limit" settings for the Dephy ActPack Firmware using the Plan GUI software
-            LOGGER.error(msg=f"[{str.upper(self.tag)}] I2t limit exceeded. " f"Current: {self.motor_current} mA. ")
+            LOGGER.error(msg=f"[{str.upper(self.tag)}] I2t limit exceeded. " f"Current: {state.motor_current} mA. ")
             raise I2tLimitException()
 
+    def _decode_state(self, data: Any) -> ActuatorState:
+        """
+        Decode a raw data frame into the state snapshot.
+
+        Args:
+            data (Any): The data frame returned by `read`.
+
+        Returns:
+            ActuatorState: The updated snapshot.
+        """
+        state = self._state
+        if data is None:
+            LOGGER.log_rate_limited(
+                LogLevel.DEBUG,
+                f"[{self.tag}] Actuator data is none, please ensure that the actuator is connected and streaming.",
+                key=(self.tag, "no_data"),
+            )
+            return state
+
+        constants = self.MOTOR_CONSTANTS
+        state.motor_encoder_counts = int(data["mot_ang"])
+        state.motor_position = state.motor_encoder_counts * constants.RAD_PER_COUNT - self.motor_zero_position
+        state.motor_velocity = float(int(data["mot_vel"]) * RAD_PER_DEG)
+        state.motor_acceleration = float(data["mot_acc"])
+        state.motor_voltage = float(data["mot_volt"])
+        state.motor_current = float(data["mot_cur"])
+        state.motor_torque = state.motor_current * constants.NM_PER_MILLIAMP
+        state.battery_voltage = float(data["batt_volt"])
+        state.battery_current = float(data["batt_curr"])
+        state.case_temperature = float(data["temperature"])
+        state.winding_temperature = float(self._thermal_model.T_w)
+        state.accelx = float(data["accelx"] * M_PER_SEC_SQUARED_ACCLSB)
+        state.accely = float(data["accely"] * M_PER_SEC_SQUARED_ACCLSB)
+        state.accelz = float(data["accelz"] * M_PER_SEC_SQUARED_ACCLSB)
+        state.gyrox = float(data["gyrox"] * RAD_PER_SEC_GYROLSB)
+        state.gyroy = float(data["gyroy"] * RAD_PER_SEC_GYROLSB)
+        state.gyroz = float(data["gyroz"] * RAD_PER_SEC_GYROLSB)
+        return state
+
     def home(
         self,
         homing_voltage: int = 2000,
@@ -354,6 +400,19 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
         self._is_homed = True
         LOGGER.info(f"[{str.upper(self.tag)}] Homing complete.")
 
+    def set_motor_zero_position(self, value: float) -> None:
+        """
+        Sets the motor zero position in radians, and shifts the motor position of the current state to match.
+
+        Args:
+            value (float): The motor zero position in radians.
+
+        Examples:
+            >>> actuator.set_motor_zero_position(0.5)
+        """
+        self._state.motor_position += self.motor_zero_position - value
+        super().set_motor_zero_position(value)
+
     def set_motor_torque(self, value: float) -> None:
         """
         Sets the motor torque in Nm. This is the torque that is applied to the motor rotor, not the joint or output.
@@ -405,11 +464,13 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
             >>> actuator.start()
             >>> actuator.set_motor_current(1000)
         """
-        self.command_motor_current(value=int(value))
+        if self._command_changed("setpoint", int(value)):
+            self.command_motor_current(value=int(value))
 
     @deprecated_with_routing(alternative_func=set_motor_current)
     def set_current(self, value: float) -> None:
-        self.command_motor_current(value=int(value))
+        if self._command_changed("setpoint", int(value)):
+            self.command_motor_current(value=int(value))
 
     def set_motor_voltage(self, value: float) -> None:
         """
@@ -426,11 +487,13 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
             >>> actuator.start()
             >>> actuator.set_motor_voltage(100) TODO: Validate number
         """
-        self.command_motor_voltage(value=int(value))
+        if self._command_changed("setpoint", int(value)):
+            self.command_motor_voltage(value=int(value))
 
     @deprecated_with_routing(alternative_func=set_motor_voltage)
     def set_voltage(self, value: float) -> None:
-        self.command_motor_voltage(value=int(value))
+        if self._command_changed("setpoint", int(value)):
+            self.command_motor_voltage(value=int(value))
 
     def set_motor_position(self, value: float) -> None:
         """
@@ -449,14 +512,13 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
             >>> actuator.set_motor_position(0.1)
         """
         # TODO: New Dephy API splits impedance equilibrium position and position control into separate methods
+        counts = int((value + self.motor_zero_position) / self.MOTOR_CONSTANTS.RAD_PER_COUNT)
         if self.mode == CONTROL_MODES.POSITION:
-            self.command_motor_position(
-                value=int((value + self.motor_zero_position) / self.MOTOR_CONSTANTS.RAD_PER_COUNT),
-            )
+            if self._command_changed("setpoint", counts):
+                self.command_motor_position(value=counts)
         elif self.mode == CONTROL_MODES.IMPEDANCE:
-            self.command_motor_impedance(
-                value=int((value + self.motor_zero_position) / self.MOTOR_CONSTANTS.RAD_PER_COUNT),
-            )
+            if self._command_changed("setpoint", counts):
+                self.command_motor_impedance(value=counts)
         else:
             raise ControlModeException(tag=self._tag, attribute="set_motor_position", mode=self._mode.name)
 
@@ -484,14 +546,15 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
             >>> actuator.start()
             >>> actuator.set_position_gains(kp=30, ki=0, kd=0, ff=0)
         """
-        self.set_gains(
-            kp=int(kp),
-            ki=int(ki),
-            kd=int(kd),
-            k=0,
-            b=0,
-            ff=int(ff),
-        )
+        if self._command_changed("gains", int(kp), int(ki), int(kd), 0, 0, int(ff)):
+            self.set_gains(
+                kp=int(kp),
+                ki=int(ki),
+                kd=int(kd),
+                k=0,
+                b=0,
+                ff=int(ff),
+            )
 
     def set_current_gains(
         self,
@@ -517,14 +580,15 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
             >>> actuator.start()
             >>> actuator.set_current_gains(kp=40, ki=400, kd=0, ff=128)
         """
-        self.set_gains(
-            kp=int(kp),
-            ki=int(ki),
-            kd=int(kd),
-            k=0,
-            b=0,
-            ff=int(ff),
-        )
+        if self._command_changed("gains", int(kp), int(ki), int(kd), 0, 0, int(ff)):
+            self.set_gains(
+                kp=int(kp),
+                ki=int(ki),
+                kd=int(kd),
+                k=0,
+                b=0,
+                ff=int(ff),
+            )
 
     def set_output_impedance(
         self,
@@ -597,14 +661,15 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
             >>> actuator.start()
             >>> actuator.set_impedance_gains(kp=40, ki=400, kd=0, k=200, b=400, ff=128)
         """
-        self.set_gains(
-            kp=int(kp),
-            ki=int(ki),
-            kd=int(kd),
-            k=int(k),
-            b=int(b),
-            ff=int(ff),
-        )
+        if self._command_changed("gains", int(kp), int(ki), int(kd), int(k), int(b), int(ff)):
+            self.set_gains(
+                kp=int(kp),
+                ki=int(ki),
+                kd=int(kd),
+                k=int(k),
+                b=int(b),
+                ff=int(ff),
+            )
 
     def set_motor_impedance(
         self,
@@ -656,13 +721,7 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
             >>> actuator.start()
             >>> print(f"Motor voltage: {actuator.motor_voltage} mV")
         """
-        if self._data is not None:
-            return float(self._data["mot_volt"])
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
+        return self._state.motor_voltage
 
     @property
     def motor_current(self) -> float:
@@ -677,13 +736,7 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
             >>> actuator.start()
             >>> print(f"Motor current: {actuator.motor_current} mA")
         """
-        if self._data is not None:
-            return float(self._data["mot_cur"])
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
+        return self._state.motor_current
 
     @property
     def motor_torque(self) -> float:
@@ -698,13 +751,7 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
             >>> actuator.start()
             >>> print(f"Motor torque: {actuator.motor_torque} Nm")
         """
-        if self._data is not None:
-            return float(self._data["mot_cur"] * self.MOTOR_CONSTANTS.NM_PER_MILLIAMP)
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
+        return self._state.motor_torque
 
     @property
     def motor_position(self) -> float:
@@ -719,13 +766,7 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
             >>> actuator.start()
             >>> print(f"Motor position: {actuator.motor_position} rad")
         """
-        if self._data is not None:
-            return float(self._data["mot_ang"] * self.MOTOR_CONSTANTS.RAD_PER_COUNT) - self.motor_zero_position
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
+        return self._state.motor_position
 
     @property
     def motor_encoder_counts(self) -> int:
@@ -740,13 +781,7 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
             >>> actuator.start()
             >>> print(f"Motor encoder counts: {actuator.motor_encoder_counts}")
         """
-        if self._data is not None:
-            return int(self._data["mot_ang"])
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0."
-            )
-            return 0
+        return self._state.motor_encoder_counts
 
     @property
     def motor_velocity(self) -> float:
@@ -761,14 +796,7 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
             >>> actuator.start()
             >>> print(f"Motor velocity: {actuator.motor_velocity} rad/s")
         """
-
-        if self._data is not None:
-            return int(self._data["mot_vel"]) * RAD_PER_DEG
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
+        return self._state.motor_velocity
 
     @property
     def motor_acceleration(self) -> float:
@@ -783,14 +811,7 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
             >>> actuator.start()
             >>> print(f"Motor acceleration: {actuator.motor_acceleration} rad/s^2")
         """
-
-        if self._data is not None:
-            return float(self._data["mot_acc"])
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
+        return self._state.motor_acceleration
 
     @property
     def battery_voltage(self) -> float:
@@ -805,13 +826,7 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
             >>> actuator.start()
             >>> print(f"Battery voltage: {actuator.battery_voltage} mV")
         """
-        if self._data is not None:
-            return float(self._data["batt_volt"])
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
+        return self._state.battery_voltage
 
     @property
     def battery_current(self) -> float:
@@ -826,13 +841,7 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
             >>> actuator.start()
             >>> print(f"Battery current: {actuator.battery_current} mA")
         """
-        if self._data is not None:
-            return float(self._data["batt_curr"])
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
+        return self._state.battery_current
 
     @property
     def output_torque(self) -> float:
@@ -862,13 +871,7 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
             >>> actuator.start()
             >>> print(f"Case temperature: {actuator.case_temperature} C")
         """
-        if self._data is not None:
-            return float(self._data["temperature"])
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
+        return self._state.case_temperature
 
     @property
     def winding_temperature(self) -> float:
@@ -884,10 +887,7 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
             >>> actuator.start()
             >>> print(f"Winding temperature: {actuator.winding_temperature} C")
         """
-        if self._data is not None:
-            return float(self._thermal_model.T_w)
-        else:
-            return 0.0
+        return self._state.winding_temperature
 
     @property
     def genvars(self) -> np.ndarray:
@@ -904,8 +904,11 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
                 ]
             )
         else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning zeros"
+            LOGGER.log_rate_limited(
+                LogLevel.DEBUG,
+                f"[{self.tag}] Actuator data is none, please ensure that the actuator is connected and streaming. "
+                "Returning zeros",
+                key=(self.tag, "no_genvars"),
             )
             return np.zeros(shape=6)
 
@@ -923,13 +926,7 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
             >>> actuator.start()
             >>> print(f"Acceleration in x direction: {actuator.accelx} m/s^2")
         """
-        if self._data is not None:
-            return float(self._data["accelx"] * M_PER_SEC_SQUARED_ACCLSB)
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
+        return self._state.accelx
 
     @property
     def accely(self) -> float:
@@ -945,13 +942,7 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
             >>> actuator.start()
             >>> print(f"Acceleration in y direction: {actuator.accely} m/s^2")
         """
-        if self._data is not None:
-            return float(self._data["accely"] * M_PER_SEC_SQUARED_ACCLSB)
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
+        return self._state.accely
 
     @property
     def accelz(self) -> float:
@@ -967,13 +958,7 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
             >>> actuator.start()
             >>> print(f"Acceleration in z direction: {actuator.accelz} m/s^2")
         """
-        if self._data is not None:
-            return float(self._data["accelz"] * M_PER_SEC_SQUARED_ACCLSB)
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
+        return self._state.accelz
 
     @property
     def gyrox(self) -> float:
@@ -989,13 +974,7 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
             >>> actuator.start()
             >>> print(f"Angular velocity in x direction: {actuator.gyrox} rad/s")
         """
-        if self._data is not None:
-            return float(self._data["gyrox"] * RAD_PER_SEC_GYROLSB)
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
+        return self._state.gyrox
 
     @property
     def gyroy(self) -> float:
@@ -1011,13 +990,7 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
             >>> actuator.start()
             >>> print(f"Angular velocity in y direction: {actuator.gyroy} rad/s")
         """
-        if self._data is not None:
-            return float(self._data["gyroy"] * RAD_PER_SEC_GYROLSB)
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
+        return self._state.gyroy
 
     @property
     def gyroz(self) -> float:
@@ -1033,13 +1006,7 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
             >>> actuator.start()
             >>> print(f"Angular velocity in z direction: {actuator.gyroz} rad/s")
         """
-        if self._data is not None:
-            return float(self._data["gyroz"] * RAD_PER_SEC_GYROLSB)
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
+        return self._state.gyroz
 
     @property
     def thermal_scaling_factor(self) -> float:
@@ -1061,6 +1028,24 @@ class DephyActuator(Device, ActuatorBase):  # type: ignore[no-any-unimported]
         """
         return self._thermal_scale
 
+    @property
+    def state(self) -> ActuatorState:
+        """
+        Decoded state of the actuator at its last update.
+
+        The record is updated in place by every call to `update`; use `state.copy()` to keep a snapshot.
+
+        Returns:
+            ActuatorState: The state snapshot.
+
+        Examples:
+            >>> actuator = DephyActuator(port='/dev/ttyACM0')
+            >>> actuator.start()
+            >>> actuator.update()
+            >>> print(f"Motor position: {actuator.state.motor_position} rad")
+        """
+        return self._state
+
 
 def _dephy_legacy_voltage_mode_entry(dephy_actuator: "DephyActuator") -> None:
     LOGGER.debug(msg=f"[{dephy_actuator.tag}] Entering {CONTROL_MODES.VOLTAGE.name} control mode.")
@@ -1094,6 +1079,20 @@ def _dephy_legacy_impedance_mode_exit(dephy_actuator: "DephyActuator") -> None:
     LOGGER.debug(msg=f"[{dephy_actuator.tag}] Exiting {CONTROL_MODES.IMPEDANCE.name} control mode.")
 
 
+class _AttributeFrame:
+    """
+    Gives a legacy data frame, whose fields are attributes, the item access of a current one.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self) -> None:
+        self.data: Any = None
+
+    def __getitem__(self, name: str) -> Any:
+        return getattr(self.data, name)
+
+
 DEPHY_LEGACY_CONTROL_MODE_CONFIGS = CONTROL_MODE_CONFIGS(
     POSITION=ControlModeConfig(
         entry_callback=_dephy_legacy_position_mode_entry,
@@ -1169,6 +1168,8 @@ class DephyLegacyActuator(DephyActuator):
             soft_border_C_case=10,
         )
         self._thermal_scale: float = 1.0
+        self._state: ActuatorState = ActuatorState()
+        self._frame: _AttributeFrame = _AttributeFrame()
 
         self._mode = CONTROL_MODES.IDLE
 
@@ -1193,9 +1194,12 @@ class DephyLegacyActuator(DephyActuator):
                 msg=f"[{self.__repr__()}] Need admin previleges to open the port '{self.port}'. \n\n \
                     Please run the script with 'sudo' command or add the user to the dialout group.\n"
             )
+            # os._exit skips cleanup handlers, so write out buffered log data first
+            LOGGER.close()
             os._exit(status=1)
 
         self._data = self.read()
+        self._decode_state(self._data)
 
         # TODO: Verify if we need this sleep here
         time.sleep(0.1)
@@ -1216,34 +1220,40 @@ class DephyLegacyActuator(DephyActuator):
 
     def update(self) -> None:
         self._data = self.read()
+        state = self._decode_state(self._data)
 
-        self._thermal_model.T_c = self.case_temperature
+        self._thermal_model.T_c = state.case_temperature
         self._thermal_scale = self._thermal_model.update_and_get_scale(
             dt=1 / self.frequency,
-            motor_current=self.motor_current,
+            motor_current=state.motor_current,
         )
-        if self.case_temperature >= self.max_case_temperature:
+        state.winding_temperature = float(self._thermal_model.T_w)
+        if state.case_temperature >= self.max_case_temperature:
             LOGGER.error(
                 f"[{str.upper(self.tag)}] Case thermal limit {self.max_case_temperature} reached. "
-                f"Current case temperature: {self.case_temperature}. Stopping motor."
+                f"Current case temperature: {state.case_temperature}. Stopping motor."
             )
             raise ThermalLimitException()
 
-        if self.winding_temperature >= self.max_winding_temperature:
+        if state.winding_temperature >= self.max_winding_temperature:
             LOGGER.error(
                 f"[{str.upper(self.tag)}] Winding thermal limit {self.max_winding_temperature} reached. "
-                f"Current winding temperature: {self.winding_temperature}. Stopping motor."
+                f"Current winding temperature: {state.winding_temperature}. Stopping motor."
             )
             raise ThermalLimitException()
         # Check for thermal fault, bit 2 of the execute status byte
 
         if self._data.status_ex & 0b00000010 == 0b00000010:
             LOGGER.error(
-                f"[{str.upper(self.tag)}] Thermal Fault: Winding temperature: {self.winding_temperature}; "
-                f"Case temperature: {self.case_temperature}."
+                f"[{str.upper(self.tag)}] Thermal Fault: Winding temperature: {state.winding_temperature}; "
+                f"Case temperature: {state.case_temperature}."
             )
             raise ThermalLimitException("Internal thermal limit tripped.")
 
+    def _decode_state(self, data: Any) -> ActuatorState:
+        self._frame.data = data
+        return super()._decode_state(self._frame if data is not None else None)
+
     def set_motor_current(
         self,
         value: float,
@@ -1254,11 +1264,13 @@ class DephyLegacyActuator(DephyActuator):
         Args:
             value (float): The current to set in mA.
         """
-        self.send_motor_command(ctrl_mode=c_int(self.mode.value), value=int(value))
+        if self._command_changed("setpoint", int(value)):
+            self.send_motor_command(ctrl_mode=c_int(self.mode.value), value=int(value))
 
     @deprecated_with_routing(alternative_func=set_motor_current)
     def set_current(self, value: float) -> None:
-        self.send_motor_command(ctrl_mode=c_int(self.mode.value), value=int(value))
+        if self._command_changed("setpoint", int(value)):
+            self.send_motor_command(ctrl_mode=c_int(self.mode.value), value=int(value))
 
     def set_motor_voltage(self, value: float) -> None:
         """
@@ -1267,11 +1279,13 @@ class DephyLegacyActuator(DephyActuator):
         Args:
             value (float): The voltage to set in mV.
         """
-        self.send_motor_command(ctrl_mode=c_int(self.mode.value), value=int(value))
+        if self._command_changed("setpoint", int(value)):
+            self.send_motor_command(ctrl_mode=c_int(self.mode.value), value=int(value))
 
     @deprecated_with_routing(alternative_func=set_motor_voltage)
     def set_voltage(self, value: float) -> None:
-        self.send_motor_command(ctrl_mode=c_int(self.mode.value), value=int(value))
+        if self._command_changed("setpoint", int(value)):
+            self.send_motor_command(ctrl_mode=c_int(self.mode.value), value=int(value))
 
     def set_motor_position(self, value: float) -> None:
         """
@@ -1281,148 +1295,9 @@ class DephyLegacyActuator(DephyActuator):
         Args:
             value (float): The position to set
         """
-        self.send_motor_command(
-            ctrl_mode=c_int(self.mode.value),
-            value=int((value + self.motor_zero_position) / self.MOTOR_CONSTANTS.RAD_PER_COUNT),
-        )
-
-    @property
-    def motor_voltage(self) -> float:
-        """Q-axis motor voltage in mV."""
-        if self._data is not None:
-            return float(self._data.mot_volt)
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
-
-    @property
-    def motor_current(self) -> float:
-        if self._data is not None:
-            return float(self._data.mot_cur)
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
-
-    @property
-    def motor_torque(self) -> float:
-        """
-        Torque at the motor output in Nm.
-        """
-        if self._data is not None:
-            return float(self._data.mot_cur * self.MOTOR_CONSTANTS.NM_PER_MILLIAMP)
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
-
-    @property
-    def motor_position(self) -> float:
-        """
-        Motor position in radians.
-        """
-        if self._data is not None:
-            return float(self._data.mot_ang * self.MOTOR_CONSTANTS.RAD_PER_COUNT) - self.motor_zero_position
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
-
-    @property
-    def motor_encoder_counts(self) -> int:
-        """Raw reading from motor encoder in counts."""
-        if self._data is not None:
-            return int(self._data.mot_ang)
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0."
-            )
-            return 0
-
-    @property
-    def motor_velocity(self) -> float:
-        """
-        Motor velocity in rad/s.
-        """
-        if self._data is not None:
-            return int(self._data.mot_vel) * RAD_PER_DEG
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
-
-    @property
-    def motor_acceleration(self) -> float:
-        """
-        Motor acceleration in rad/s^2.
-        """
-        if self._data is not None:
-            return float(self._data.mot_acc)
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
-
-    @property
-    def battery_voltage(self) -> float:
-        """Battery voltage in mV."""
-        if self._data is not None:
-            return float(self._data.batt_volt)
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
-
-    @property
-    def battery_current(self) -> float:
-        """Battery current in mA."""
-        if self._data is not None:
-            return float(self._data.batt_curr)
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
-
-    @property
-    def output_torque(self) -> float:
-        """
-        Torque at the joint output in Nm.
-        This is calculated using motor current, k_t, and the gear ratio.
-        """
-        return self.motor_torque * self.gear_ratio
-
-    @property
-    def case_temperature(self) -> float:
-        """
-        Case temperature of the actuator in celsius.
-        """
-        if self._data is not None:
-            return float(self._data.temperature)
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
-
-    @property
-    def winding_temperature(self) -> float:
-        """
-        ESTIMATED temperature of the windings in celsius.
-        This is calculated based on the thermal model using motor current.
-        """
-        if self._data is not None:
-            return float(self._thermal_model.T_w)
-        else:
-            return 0.0
+        counts = int((value + self.motor_zero_position) / self.MOTOR_CONSTANTS.RAD_PER_COUNT)
+        if self._command_changed("setpoint", counts):
+            self.send_motor_command(ctrl_mode=c_int(self.mode.value), value=counts)
 
     @property
     def genvars(self) -> np.ndarray:
@@ -1439,81 +1314,14 @@ class DephyLegacyActuator(DephyActuator):
                 ]
             )
         else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning zeros"
+            LOGGER.log_rate_limited(
+                LogLevel.DEBUG,
+                f"[{self.tag}] Actuator data is none, please ensure that the actuator is connected and streaming. "
+                "Returning zeros",
+                key=(self.tag, "no_genvars"),
             )
             return np.zeros(shape=6)
 
-    @property
-    def accelx(self) -> float:
-        """
-        Acceleration in x direction in m/s^2.
-        Measured using actpack's onboard IMU.
-        """
-        if self._data is not None:
-            return float(self._data.accelx * M_PER_SEC_SQUARED_ACCLSB)
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
-
-    @property
-    def accely(self) -> float:
-        """
-        Acceleration in y direction in m/s^2.
-        Measured using actpack's onboard IMU.
-        """
-        if self._data is not None:
-            return float(self._data.accely * M_PER_SEC_SQUARED_ACCLSB)
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
-
-    @property
-    def accelz(self) -> float:
-        """
-        Acceleration in z direction in m/s^2.
-        Measured using actpack's onboard IMU.
-        """
-        if self._data is not None:
-            return float(self._data.accelz * M_PER_SEC_SQUARED_ACCLSB)
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
-
-    @property
-    def gyrox(self) -> float:
-        """
-        Angular velocity in x direction in rad/s.
-        Measured using actpack's onboard IMU.
-        """
-        if self._data is not None:
-            return float(self._data.gyrox * RAD_PER_SEC_GYROLSB)
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
-
-    @property
-    def gyroy(self) -> float:
-        """
-        Angular velocity in y direction in rad/s.
-        Measured using actpack's onboard IMU.
-        """
-        if self._data is not None:
-            return float(self._data.gyroy * RAD_PER_SEC_GYROLSB)
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
-
     @property
     def is_streaming(self) -> bool:
         return self._is_streaming
@@ -1530,20 +1338,6 @@ class DephyLegacyActuator(DephyActuator):
     def is_open(self, value: bool) -> None:
         self._is_open = value
 
-    @property
-    def gyroz(self) -> float:
-        """
-        Angular velocity in z direction in rad/s.
-        Measured using actpack's onboard IMU.
-        """
-        if self._data is not None:
-            return float(self._data.gyroz * RAD_PER_SEC_GYROLSB)
-        else:
-            LOGGER.debug(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
-            )
-            return 0.0
-
 
 if __name__ == "__main__":
     pass
@@ -0,0 +1,435 @@
+import asyncio
+import inspect
+from collections.abc import Awaitable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from opensourceleg.actuators.base import CONTROL_MODES, ActuatorBase
+from opensourceleg.logging.exceptions import ControlModeException
+
+__all__ = ["ActuatorGroup"]
+
+ArrayLike = Union[float, Sequence[float], npt.NDArray[np.float64]]
+
+
+async def _await_all(awaitables: list[Awaitable[Any]]) -> None:
+    await asyncio.gather(*awaitables)
+
+
+class ActuatorGroup:
+    """
+    Commands and reads several actuators, for example all joints of a leg, as one unit.
+
+    Setters take one value per actuator, in the order the actuators were given, or a single value for
+    all of them. Before a batch is sent, the control mode of every actuator is checked, so a batch is
+    either applied to all actuators or raises without sending anything. Reads return one stacked array
+    with a value per actuator.
+
+    Updates are dispatched per actuator class through `ActuatorBase.update_group`, so backends with a
+    transport that talks to several actuators at once, such as the Moteus multi-servo cycle, update the
+    whole group in one transaction. Other backends are updated one by one, or in parallel threads if
+    `parallel` is set, which helps actuators with their own blocking serial links such as Dephy.
+
+    If any actuator has an asynchronous transport, `update` and the setters return an awaitable that
+    must be awaited; otherwise, they return None.
+
+    The threads used for parallel updates are shut down by `close`, when the group is used as a context
+    manager and exits, or when the group is garbage collected.
+
+    Args:
+        actuators (Sequence[ActuatorBase]): The actuators, each with a unique tag.
+        parallel (bool): Whether to update actuators whose transport has no batched update in parallel
+            threads. Defaults to False.
+
+    Raises:
+        ValueError: If there are no actuators or two actuators share a tag.
+
+    Examples:
+        >>> joints = ActuatorGroup([knee, ankle])
+        >>> joints.set_control_mode(CONTROL_MODES.IMPEDANCE)
+        >>> joints.set_impedance_gains()
+        >>> joints.update()
+        >>> joints.set_output_impedances(k=[120.0, 200.0], b=[3.0, 2.0])
+        >>> joints.set_output_positions(np.deg2rad([5.0, -10.0]))
+        >>> joints.output_positions
+        array([ 0.087, -0.175])
+    """
+
+    def __init__(self, actuators: Sequence[ActuatorBase], parallel: bool = False) -> None:
+        self._actuators: list[ActuatorBase] = list(actuators)
+        if not self._actuators:
+            raise ValueError("An actuator group needs at least one actuator")
+
+        self._index: dict[str, int] = {}
+        for i, actuator in enumerate(self._actuators):
+            if actuator.tag in self._index:
+                raise ValueError(f"Two actuators in the group share the tag {actuator.tag}")
+            self._index[actuator.tag] = i
+
+        # Actuators of the same class share a transport, so they are updated together
+        self._backends: dict[type[ActuatorBase], list[ActuatorBase]] = {}
+        for actuator in self._actuators:
+            self._backends.setdefault(type(actuator), []).append(actuator)
+
+        self._executor: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=len(self._actuators), thread_name_prefix="actuator_group")
+            if parallel and len(self._actuators) > 1
+            else None
+        )
+
+    def __repr__(self) -> str:
+        return f"ActuatorGroup(tags={self.tags})"
+
+    def __len__(self) -> int:
+        return len(self._actuators)
+
+    def __iter__(self) -> Iterator[ActuatorBase]:
+        return iter(self._actuators)
+
+    def __getitem__(self, key: Union[int, str]) -> ActuatorBase:
+        return self._actuators[self._index[key] if isinstance(key, str) else key]
+
+    def __enter__(self) -> "ActuatorGroup":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # Do not block the garbage collector on updates still running in the pool
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def close(self) -> None:
+        """
+        Shut down the threads used for parallel updates.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def update(self) -> Optional[Awaitable[None]]:
+        """
+        Update every actuator, in one transaction per actuator class where the transport supports it.
+
+        Returns:
+            Optional[Awaitable[None]]: An awaitable that completes the update if any transport is
+                asynchronous; otherwise, None.
+        """
+        pending = []
+        for actuator_class, actuators in self._backends.items():
+            result = actuator_class.update_group(actuators, self._executor)
+            if result is not None:
+                pending.append(result)
+        return _await_all(pending) if pending else None
+
+    def set_control_mode(self, mode: CONTROL_MODES) -> None:
+        """
+        Set the control mode of every actuator.
+
+        Args:
+            mode (CONTROL_MODES): The new control mode.
+        """
+        for actuator in self._actuators:
+            actuator.set_control_mode(mode)
+
+    def set_motor_voltages(self, values: ArrayLike) -> Optional[Awaitable[None]]:
+        """
+        Set the motor voltage of every actuator.
+
+        Args:
+            values (ArrayLike): The motor voltages, one per actuator or one for all.
+        """
+        return self._set("set_motor_voltage", value=values)
+
+    def set_motor_currents(self, values: ArrayLike) -> Optional[Awaitable[None]]:
+        """
+        Set the motor current of every actuator.
+
+        Args:
+            values (ArrayLike): The motor currents, one per actuator or one for all.
+        """
+        return self._set("set_motor_current", value=values)
+
+    def set_motor_positions(self, values: ArrayLike) -> Optional[Awaitable[None]]:
+        """
+        Set the motor position of every actuator.
+
+        Args:
+            values (ArrayLike): The motor positions in radians, one per actuator or one for all.
+        """
+        return self._set("set_motor_position", value=values)
+
+    def set_output_positions(self, values: ArrayLike) -> Optional[Awaitable[None]]:
+        """
+        Set the output position of every actuator.
+
+        Args:
+            values (ArrayLike): The output positions in radians, one per actuator or one for all.
+        """
+        return self._set("set_output_position", value=values)
+
+    def set_motor_torques(self, values: ArrayLike) -> Optional[Awaitable[None]]:
+        """
+        Set the motor torque of every actuator.
+
+        Args:
+            values (ArrayLike): The motor torques in Nm, one per actuator or one for all.
+        """
+        return self._set("set_motor_torque", value=values)
+
+    def set_output_torques(self, values: ArrayLike) -> Optional[Awaitable[None]]:
+        """
+        Set the output torque of every actuator.
+
+        Args:
+            values (ArrayLike): The output torques in Nm, one per actuator or one for all.
+        """
+        return self._set("set_output_torque", value=values)
+
+    def set_output_impedances(
+        self, k: Optional[ArrayLike] = None, b: Optional[ArrayLike] = None
+    ) -> Optional[Awaitable[None]]:
+        """
+        Set the output impedance of every actuator.
+
+        Args:
+            k (Optional[ArrayLike]): The stiffnesses in Nm/rad. Defaults to each actuator's default.
+            b (Optional[ArrayLike]): The damping coefficients in Nm/(rad/s). Defaults to each actuator's default.
+        """
+        return self._set("set_output_impedance", k=k, b=b)
+
+    def set_current_gains(
+        self,
+        kp: Optional[ArrayLike] = None,
+        ki: Optional[ArrayLike] = None,
+        kd: Optional[ArrayLike] = None,
+        ff: Optional[ArrayLike] = None,
+    ) -> Optional[Awaitable[None]]:
+        """
+        Set the current control gains of every actuator. Gains that are not given keep each actuator's default.
+        """
+        return self._set("set_current_gains", kp=kp, ki=ki, kd=kd, ff=ff)
+
+    def set_position_gains(
+        self,
+        kp: Optional[ArrayLike] = None,
+        ki: Optional[ArrayLike] = None,
+        kd: Optional[ArrayLike] = None,
+        ff: Optional[ArrayLike] = None,
+    ) -> Optional[Awaitable[None]]:
+        """
+        Set the position control gains of every actuator. Gains that are not given keep each actuator's default.
+        """
+        return self._set("set_position_gains", kp=kp, ki=ki, kd=kd, ff=ff)
+
+    def set_impedance_gains(
+        self,
+        kp: Optional[ArrayLike] = None,
+        ki: Optional[ArrayLike] = None,
+        kd: Optional[ArrayLike] = None,
+        k: Optional[ArrayLike] = None,
+        b: Optional[ArrayLike] = None,
+        ff: Optional[ArrayLike] = None,
+    ) -> Optional[Awaitable[None]]:
+        """
+        Set the impedance control gains of every actuator. Gains that are not given keep each actuator's default.
+        """
+        return self._set("set_impedance_gains", kp=kp, ki=ki, kd=kd, k=k, b=b, ff=ff)
+
+    def _set(self, method_name: str, **vectors: Optional[ArrayLike]) -> Optional[Awaitable[None]]:
+        """
+        Call a setter on every actuator with its element of each vector.
+
+        Args:
+            method_name (str): The name of the setter.
+            **vectors (Optional[ArrayLike]): The arguments of the setter, one value per actuator or one
+                for all. Arguments that are None are not passed.
+
+        Returns:
+            Optional[Awaitable[None]]: An awaitable that completes the call if any setter is asynchronous.
+
+        Raises:
+            ControlModeException: If the setter is not available in the control mode of an actuator.
+            ValueError: If a vector does not have one value per actuator.
+        """
+        for actuator in self._actuators:
+            if method_name in actuator._MODE_RESTRICTED_METHODS.get(actuator.mode, ()):
+                raise ControlModeException(tag=actuator.tag, attribute=method_name, mode=actuator.mode.name)
+
+        count = len(self._actuators)
+        arguments = {}
+        for name, values in vectors.items():
+            if values is not None:
+                try:
+                    arguments[name] = np.broadcast_to(np.asarray(values, dtype=np.float64), (count,))
+                except ValueError as e:
+                    raise ValueError(f"{name} needs one value per actuator ({count}) or a single value") from e
+
+        pending = []
+        for i, actuator in enumerate(self._actuators):
+            result = getattr(actuator, method_name)(**{name: float(v[i]) for name, v in arguments.items()})
+            if inspect.isawaitable(result):
+                pending.append(result)
+        return _await_all(pending) if pending else None
+
+    def read(self, attribute: str) -> np.ndarray:
+        """
+        Read an attribute of every actuator into one array.
+
+        Args:
+            attribute (str): The name of the attribute, for example "output_position".
+
+        Returns:
+            np.ndarray: The values, one per actuator.
+
+        Examples:
+            >>> joints.read("case_temperature")
+            array([31.2, 29.8])
+        """
+        return np.fromiter(
+            (getattr(actuator, attribute) for actuator in self._actuators), dtype=np.float64, count=len(self)
+        )
+
+    def read_many(self, attributes: Sequence[str]) -> np.ndarray:
+        """
+        Read several attributes of every actuator into one stacked array.
+
+        Args:
+            attributes (Sequence[str]): The names of the attributes.
+
+        Returns:
+            np.ndarray: The values, with one row per actuator and one column per attribute.
+
+        Examples:
+            >>> joints.read_many(["output_position", "output_velocity"]).shape
+            (2, 2)
+        """
+        return np.array(
+            [[getattr(actuator, attribute) for attribute in attributes] for actuator in self._actuators],
+            dtype=np.float64,
+        ).reshape(len(self), len(attributes))
+
+    @property
+    def actuators(self) -> list[ActuatorBase]:
+        """
+        Get the actuators in the order of the vectors.
+
+        Returns:
+            list[ActuatorBase]: The actuators.
+        """
+        return list(self._actuators)
+
+    @property
+    def tags(self) -> list[str]:
+        """
+        Get the tags of the actuators in the order of the vectors.
+
+        Returns:
+            list[str]: The tags.
+        """
+        return [actuator.tag for actuator in self._actuators]
+
+    @property
+    def modes(self) -> list[CONTROL_MODES]:
+        """
+        Get the control mode of every actuator.
+
+        Returns:
+            list[CONTROL_MODES]: The control modes.
+        """
+        return [actuator.mode for actuator in self._actuators]
+
+    @property
+    def motor_positions(self) -> np.ndarray:
+        """
+        Get the motor positions in radians.
+
+        Returns:
+            np.ndarray: The motor position of every actuator.
+        """
+        return self.read("motor_position")
+
+    @property
+    def motor_velocities(self) -> np.ndarray:
+        """
+        Get the motor velocities in rad/s.
+
+        Returns:
+            np.ndarray: The motor velocity of every actuator.
+        """
+        return self.read("motor_velocity")
+
+    @property
+    def motor_torques(self) -> np.ndarray:
+        """
+        Get the motor torques in Nm.
+
+        Returns:
+            np.ndarray: The motor torque of every actuator.
+        """
+        return self.read("motor_torque")
+
+    @property
+    def motor_currents(self) -> np.ndarray:
+        """
+        Get the motor currents.
+
+        Returns:
+            np.ndarray: The motor current of every actuator, in the units of its `motor_current`.
+        """
+        return self.read("motor_current")
+
+    @property
+    def output_positions(self) -> np.ndarray:
+        """
+        Get the output positions in radians.
+
+        Returns:
+            np.ndarray: The output position of every actuator.
+        """
+        return self.read("output_position")
+
+    @property
+    def output_velocities(self) -> np.ndarray:
+        """
+        Get the output velocities in rad/s.
+
+        Returns:
+            np.ndarray: The output velocity of every actuator.
+        """
+        return self.read("output_velocity")
+
+    @property
+    def output_torques(self) -> np.ndarray:
+        """
+        Get the output torques in Nm.
+
+        Returns:
+            np.ndarray: The output torque of every actuator.
+        """
+        return self.read("output_torque")
+
+    @property
+    def case_temperatures(self) -> np.ndarray:
+        """
+        Get the case temperatures in degrees celsius.
+
+        Returns:
+            np.ndarray: The case temperature of every actuator.
+        """
+        return self.read("case_temperature")
+
+    @property
+    def winding_temperatures(self) -> np.ndarray:
+        """
+        Get the winding temperatures in degrees celsius.
+
+        Returns:
+            np.ndarray: The winding temperature of every actuator.
+        """
+        return self.read("winding_temperature")
@@ -1,6 +1,8 @@
 import math
 import os
-from typing import ClassVar, Optional
+from collections.abc import Sequence
+from concurrent.futures import Executor
+from typing import ClassVar, Optional, cast
 
 import numpy as np
 from moteus import Command, Controller, Stream
@@ -20,7 +22,7 @@ from opensourceleg.actuators.decorators import (
     check_actuator_open,
     check_actuator_stream,
 )
-from opensourceleg.logging.logger import LOGGER
+from opensourceleg.logging.logger import LOGGER, LogLevel
 from opensourceleg.math import ThermalModel
 from opensourceleg.safety import ThermalLimitException
 
@@ -150,7 +152,6 @@ class MoteusInterface:
             self.transport = pihat.Pi3HatRouter(servo_bus_map=self.bus_map)
 
     async def update(self):
-        # TODO: multiple servo update simultaneously should go here
         self._commands = []
 
     async def stop(self):
@@ -230,6 +231,8 @@ class MoteusActuator(ActuatorBase, Controller):
                 msg=f"[{self.__repr__()}] Need admin previleges to open the port. \n\n \
                     Please run the script with 'sudo' command or add the user to the dialout group.\n"
             )
+            # os._exit skips cleanup handlers, so write out buffered log data first
+            LOGGER.close()
             os._exit(status=1)
 
         default_mode_config = self._get_control_mode_config(self._mode)
@@ -252,7 +255,40 @@ class MoteusActuator(ActuatorBase, Controller):
         self._command = self.make_query()
 
     async def update(self):
-        self._data = await self._interface.transport.cycle([self._command])
+        self._data = await self._interface.transport.cycle([self._command]) or None
+        self._process_data()
+
+    @classmethod
+    async def update_group(cls, actuators: Sequence[ActuatorBase], executor: Optional[Executor] = None) -> None:
+        """
+        Update several Moteus actuators with a single transport cycle, which sends every command and
+        collects every reply in one transaction over all buses. A servo that does not reply has no data
+        until its next reply, and the others are updated as usual.
+
+        Args:
+            actuators (Sequence[ActuatorBase]): The Moteus actuators to update.
+            executor (Optional[Executor]): Unused, the transport already talks to all servos at once.
+        """
+        servos = cast(Sequence[MoteusActuator], actuators)
+        results = await servos[0]._interface.transport.cycle([servo._command for servo in servos])
+        for servo in servos:
+            servo._data = [result for result in results if result.id == servo._servo_id] or None
+            servo._process_data()
+
+    def _process_data(self) -> None:
+        """
+        Update the thermal model from the latest reply, check the thermal limits and reset the command to a query.
+
+        Without a reply the thermal model and limits are left as they are.
+        """
+        if self._data is None:
+            LOGGER.log_rate_limited(
+                LogLevel.WARNING,
+                f"[{self.tag}] No reply from servo {self._servo_id}, please check the connection.",
+                key=(self.tag, "no_reply"),
+            )
+            self._command = self.make_query()
+            return
 
         self._thermal_model.T_c = self.case_temperature
         self._thermal_scale = self._thermal_model.update_and_get_scale(
@@ -441,8 +477,11 @@ class MoteusActuator(ActuatorBase, Controller):
         if self._data is not None:
             return float(self._data[0].values[MoteusRegister.VOLTAGE])
         else:
-            LOGGER.warning(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
+            LOGGER.log_rate_limited(
+                LogLevel.WARNING,
+                f"[{self.tag}] Actuator data is none, please ensure that the actuator is connected and streaming. "
+                "Returning 0.0.",
+                key=(self.tag, "no_data"),
             )
             return 0.0
 
@@ -451,8 +490,11 @@ class MoteusActuator(ActuatorBase, Controller):
         if self._data is not None:
             return float(self._data[0].values[MoteusRegister.Q_CURRENT])
         else:
-            LOGGER.warning(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
+            LOGGER.log_rate_limited(
+                LogLevel.WARNING,
+                f"[{self.tag}] Actuator data is none, please ensure that the actuator is connected and streaming. "
+                "Returning 0.0.",
+                key=(self.tag, "no_data"),
             )
             return 0.0
 
@@ -461,8 +503,11 @@ class MoteusActuator(ActuatorBase, Controller):
         if self._data is not None:
             return float(self.motor_current * self.MOTOR_CONSTANTS.NM_PER_MILLIAMP) / self.gear_ratio
         else:
-            LOGGER.warning(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
+            LOGGER.log_rate_limited(
+                LogLevel.WARNING,
+                f"[{self.tag}] Actuator data is none, please ensure that the actuator is connected and streaming. "
+                "Returning 0.0.",
+                key=(self.tag, "no_data"),
             )
             return 0.0
 
@@ -471,8 +516,11 @@ class MoteusActuator(ActuatorBase, Controller):
         if self._data is not None:
             return float(self._data[0].values[MoteusRegister.POSITION] * 2 * np.pi) - self.motor_zero_position
         else:
-            LOGGER.warning(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
+            LOGGER.log_rate_limited(
+                LogLevel.WARNING,
+                f"[{self.tag}] Actuator data is none, please ensure that the actuator is connected and streaming. "
+                "Returning 0.0.",
+                key=(self.tag, "no_data"),
             )
             return 0.0
 
@@ -481,8 +529,11 @@ class MoteusActuator(ActuatorBase, Controller):
         if self._data is not None:
             return float(self._data[0].values[MoteusRegister.VELOCITY] * 2 * np.pi)
         else:
-            LOGGER.warning(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
+            LOGGER.log_rate_limited(
+                LogLevel.WARNING,
+                f"[{self.tag}] Actuator data is none, please ensure that the actuator is connected and streaming. "
+                "Returning 0.0.",
+                key=(self.tag, "no_data"),
             )
             return 0.0
 
@@ -492,8 +543,11 @@ class MoteusActuator(ActuatorBase, Controller):
         if self._data is not None:
             return float(self._data[0].values[MoteusRegister.VOLTAGE])
         else:
-            LOGGER.warning(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
+            LOGGER.log_rate_limited(
+                LogLevel.WARNING,
+                f"[{self.tag}] Actuator data is none, please ensure that the actuator is connected and streaming. "
+                "Returning 0.0.",
+                key=(self.tag, "no_data"),
             )
             return 0.0
 
@@ -503,8 +557,11 @@ class MoteusActuator(ActuatorBase, Controller):
         if self._data is not None:
             return float(self._data[0].values[MoteusRegister.Q_CURRENT])
         else:
-            LOGGER.warning(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
+            LOGGER.log_rate_limited(
+                LogLevel.WARNING,
+                f"[{self.tag}] Actuator data is none, please ensure that the actuator is connected and streaming. "
+                "Returning 0.0.",
+                key=(self.tag, "no_data"),
             )
             return 0.0
 
@@ -521,8 +578,11 @@ class MoteusActuator(ActuatorBase, Controller):
         if self._data is not None:
             return float(self._data[0].values[MoteusRegister.TEMPERATURE])
         else:
-            LOGGER.warning(
-                msg="Actuator data is none, please ensure that the actuator is connected and streaming. Returning 0.0."
+            LOGGER.log_rate_limited(
+                LogLevel.WARNING,
+                f"[{self.tag}] Actuator data is none, please ensure that the actuator is connected and streaming. "
+                "Returning 0.0.",
+                key=(self.tag, "no_data"),
             )
             return 0.0
 
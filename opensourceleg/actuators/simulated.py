@@ -0,0 +1,892 @@
+import math
+from typing import Callable, Optional
+
+import numpy as np
+
+from opensourceleg.actuators.base import (
+    CONTROL_MODE_CONFIGS,
+    CONTROL_MODES,
+    MOTOR_CONSTANTS,
+    ActuatorBase,
+    ActuatorState,
+    ControlGains,
+    ControlModeConfig,
+    requires,
+)
+from opensourceleg.extras.safety import ThermalLimitException
+from opensourceleg.logging import LOGGER
+from opensourceleg.math import ThermalModel
+from opensourceleg.utilities.clock import Clock
+
+__all__ = ["SIMULATED_ACTUATOR_CONSTANTS", "SimulatedActuator"]
+
+# The motor of the Dephy ActPack, so that gains tuned on hardware carry over to the simulation
+SIMULATED_ACTUATOR_CONSTANTS = MOTOR_CONSTANTS(
+    MOTOR_COUNT_PER_REV=16384,
+    NM_PER_AMP=0.1133,
+    NM_PER_RAD_TO_K=((2 * np.pi / 16384) / 0.0007812 * 1e3 / 0.1133),
+    NM_S_PER_RAD_TO_B=((np.pi / 180) / 0.00028444 * 1e3 / 0.1133),
+    MAX_CASE_TEMPERATURE=80,
+    MAX_WINDING_TEMPERATURE=110,
+)
+
+DEFAULT_POSITION_GAINS = ControlGains(kp=30, ki=0, kd=0, k=0, b=0, ff=0)
+
+DEFAULT_CURRENT_GAINS = ControlGains(kp=40, ki=400, kd=0, k=0, b=0, ff=128)
+
+DEFAULT_VELOCITY_GAINS = ControlGains(kp=100, ki=1000, kd=0, k=0, b=0, ff=0)
+
+DEFAULT_IMPEDANCE_GAINS = ControlGains(kp=40, ki=400, kd=0, k=200, b=400, ff=128)
+
+
+def _simulated_mode_entry(actuator: "SimulatedActuator") -> None:
+    LOGGER.debug(msg=f"[{actuator.tag}] Entering {actuator.mode.name} control mode.")
+    # Start from a safe setpoint: no drive, or holding the current position
+    actuator.stop_motor()
+
+
+def _simulated_mode_exit(actuator: "SimulatedActuator") -> None:
+    LOGGER.debug(msg=f"[{actuator.tag}] Exiting {actuator.mode.name} control mode.")
+
+
+def _simulated_mode_config() -> ControlModeConfig:
+    return ControlModeConfig(
+        entry_callback=_simulated_mode_entry,
+        exit_callback=_simulated_mode_exit,
+        has_gains=False,
+        max_gains=None,
+    )
+
+
+SIMULATED_CONTROL_MODE_CONFIGS = CONTROL_MODE_CONFIGS(
+    POSITION=_simulated_mode_config(),
+    CURRENT=_simulated_mode_config(),
+    VOLTAGE=_simulated_mode_config(),
+    IMPEDANCE=_simulated_mode_config(),
+    VELOCITY=_simulated_mode_config(),
+    TORQUE=_simulated_mode_config(),
+)
+
+
+class SimulatedActuator(ActuatorBase):
+    """
+    Simulated actuator for running controllers without hardware.
+
+    The actuator integrates the electrical dynamics of the motor winding, the rotor and reflected load
+    inertia with viscous and Coulomb friction, and the two-node `ThermalModel`, at `substeps` integration
+    steps per update. The firmware control loops run at the same rate: a current loop tuned from the
+    electrical model, and position, velocity and impedance loops that produce its current reference.
+
+    Commands and readings use the units of `DephyActuator` (mV, mA, rad, rad/s and Nm), and impedance
+    gains are converted with the `MOTOR_CONSTANTS` scale factors, so controllers written for Dephy
+    actuators run unchanged. Each update advances the simulation by `1 / frequency` seconds, or, if a
+    clock is given, by the time that elapsed on it since the previous update, so the simulation stays
+    in step with a `SoftRealtimeLoop` driven by a `SimulatedClock`.
+
+    A load at the output, for example the limb or a spring, can be modelled with `load`, a function of
+    the output position and velocity that returns the torque the load applies at the output in Nm.
+
+    Args:
+        tag (str): A unique identifier for the actuator. Defaults to "SimulatedActuator".
+        gear_ratio (float): The gear ratio of the actuator. Defaults to 1.0.
+        motor_constants (MOTOR_CONSTANTS): The motor constants. Defaults to those of the Dephy ActPack.
+        frequency (int): The update frequency in Hz. Defaults to 500.
+        substeps (int): The number of integration steps per update. Defaults to 20.
+        resistance (float): The phase resistance in ohms. Defaults to 0.376.
+        inductance (float): The phase inductance in henries. Defaults to 0.000138.
+        rotor_inertia (float): The inertia of the rotor in kg*m^2. Defaults to 0.00012.
+        load_inertia (float): The inertia of the load at the output in kg*m^2. Defaults to 0.0.
+        viscous_friction (float): The viscous friction at the rotor in Nm*s/rad. Defaults to 0.0001.
+        coulomb_friction (float): The Coulomb friction at the rotor in Nm. Defaults to 0.01.
+        battery_voltage (float): The supply voltage in mV, which limits the motor voltage. Defaults to 36000.
+        current_limit (float): The largest current the firmware loops command in mA. Defaults to 20000.
+        current_bandwidth (float): The bandwidth of the simulated current loop in Hz. Defaults to 500.
+        ambient_temperature (float): The ambient temperature in degrees celsius. Defaults to 21.
+        load (Optional[Callable[[float, float], float]]): The torque in Nm that the load applies at the
+            output, given the output position and velocity. Defaults to None (no load).
+        clock (Optional[Clock]): The clock that sets the time simulated by each update, and that the
+            keep-alive period of command deduplication is measured on. Defaults to None (each update
+            simulates `1 / frequency` seconds).
+
+    Examples:
+        >>> clock = SimulatedClock()
+        >>> actuator = SimulatedActuator(gear_ratio=9.0, frequency=1000, clock=clock)
+        >>> loop = SoftRealtimeLoop(dt=0.001, clock=clock)
+        >>> with actuator:
+        ...     actuator.set_control_mode(CONTROL_MODES.IMPEDANCE)
+        ...     actuator.set_output_impedance(k=100, b=3)
+        ...     for t in loop:
+        ...         actuator.update()
+        ...         actuator.set_output_position(0.5 * np.sin(t))
+    """
+
+    def __init__(
+        self,
+        tag: str = "SimulatedActuator",
+        gear_ratio: float = 1.0,
+        motor_constants: MOTOR_CONSTANTS = SIMULATED_ACTUATOR_CONSTANTS,
+        frequency: int = 500,
+        substeps: int = 20,
+        resistance: float = 0.376,
+        inductance: float = 0.000138,
+        rotor_inertia: float = 0.00012,
+        load_inertia: float = 0.0,
+        viscous_friction: float = 0.0001,
+        coulomb_friction: float = 0.01,
+        battery_voltage: float = 36000,
+        current_limit: float = 20000,
+        current_bandwidth: float = 500,
+        ambient_temperature: float = 21,
+        load: Optional[Callable[[float, float], float]] = None,
+        clock: Optional[Clock] = None,
+    ) -> None:
+        if substeps < 1:
+            raise ValueError(f"substeps must be at least 1, got {substeps}")
+        if min(resistance, inductance, rotor_inertia, battery_voltage, current_limit, current_bandwidth) <= 0:
+            raise ValueError("resistance, inductance, inertia, voltage, current limit and bandwidth must be positive")
+        if min(load_inertia, viscous_friction, coulomb_friction) < 0:
+            raise ValueError("load inertia and friction must not be negative")
+
+        super().__init__(
+            tag=tag,
+            gear_ratio=gear_ratio,
+            motor_constants=motor_constants,
+            frequency=frequency,
+        )
+
+        self.load: Optional[Callable[[float, float], float]] = load
+        self._clock: Optional[Clock] = clock
+        if clock is not None:
+            self._command_clock = clock
+        self._substeps: int = substeps
+        self._step: float = 1 / (frequency * substeps)
+
+        self._resistance: float = resistance
+        self._inductance: float = inductance
+        self._inertia: float = rotor_inertia + load_inertia / gear_ratio**2
+        self._viscous_friction: float = viscous_friction
+        self._coulomb_friction: float = coulomb_friction
+        self._battery_voltage: float = battery_voltage * 1e-3
+        self._current_limit: float = current_limit * 1e-3
+        # Current loop gains that cancel the electrical pole, giving a first-order response at the bandwidth
+        bandwidth = 2 * np.pi * current_bandwidth
+        self._current_kp: float = inductance * bandwidth
+        self._current_ki: float = resistance * bandwidth
+
+        self._thermal_model: ThermalModel = ThermalModel(
+            ambient=ambient_temperature,
+            temp_limit_windings=self.max_winding_temperature,
+            soft_border_C_windings=10,
+            temp_limit_case=self.max_case_temperature,
+            soft_border_C_case=10,
+        )
+        self._thermal_scale: float = 1.0
+        self._state: ActuatorState = ActuatorState()
+
+        self._position_gains: ControlGains = DEFAULT_POSITION_GAINS
+        self._current_gains: ControlGains = DEFAULT_CURRENT_GAINS
+        self._velocity_gains: ControlGains = DEFAULT_VELOCITY_GAINS
+        self._impedance_gains: ControlGains = DEFAULT_IMPEDANCE_GAINS
+
+        self._position: float = 0.0  # rad, rotor angle from the encoder origin
+        self._velocity: float = 0.0  # rad/s
+        self._current: float = 0.0  # A
+        self._voltage: float = 0.0  # V
+        self._elapsed: float = 0.0  # s, simulated time
+        self._pending_time: float = 0.0  # s, clock time not yet simulated
+        self._last_clock_time: Optional[float] = None
+        self.stop_motor()
+
+    def __repr__(self) -> str:
+        return f"{self.tag}[SimulatedActuator]"
+
+    @property
+    def _CONTROL_MODE_CONFIGS(self) -> CONTROL_MODE_CONFIGS:
+        return SIMULATED_CONTROL_MODE_CONFIGS
+
+    def start(self) -> None:
+        """
+        Start the simulation, and set the control mode to VOLTAGE like the hardware actuators.
+
+        Examples:
+            >>> actuator = SimulatedActuator()
+            >>> actuator.start()
+        """
+        self._is_open = True
+        self._is_streaming = True
+        self._last_clock_time = self._clock.monotonic() if self._clock is not None else None
+        self._pending_time = 0.0
+        self._decode_state(0.0, 0.0)
+        self.set_control_mode(CONTROL_MODES.VOLTAGE)
+
+    def stop(self) -> None:
+        """
+        Stop the motor and switch to IDLE mode, in which the winding is open and the rotor coasts.
+
+        Examples:
+            >>> actuator.stop()
+        """
+        self.stop_motor()
+        self.set_control_mode(mode=CONTROL_MODES.IDLE)
+        self._is_streaming = False
+        self._is_open = False
+
+    def stop_motor(self) -> None:
+        """
+        Command zero voltage, current or torque, or hold the current position in the position modes,
+        and reset the integrators of the firmware loops.
+
+        Examples:
+            >>> actuator.stop_motor()
+        """
+        if self._mode in (CONTROL_MODES.POSITION, CONTROL_MODES.IMPEDANCE):
+            self._command: float = self._position
+        else:
+            self._command = 0.0
+        self._outer_integral: float = 0.0
+        self._current_integral: float = 0.0
+
+    def update(self) -> None:
+        """
+        Advance the simulation by one update period and refresh the state.
+
+        Raises:
+            ThermalLimitException: If the case or winding temperature reaches its limit.
+
+        Examples:
+            >>> actuator.update()
+            >>> print(f"Motor current: {actuator.motor_current} mA")
+        """
+        if self._clock is None:
+            steps = self._substeps
+        else:
+            now = self._clock.monotonic()
+            if self._last_clock_time is not None:
+                self._pending_time += now - self._last_clock_time
+            self._last_clock_time = now
+            steps = int(self._pending_time / self._step + 1e-6)
+            self._pending_time -= steps * self._step
+        if steps == 0:
+            return
+
+        duration = steps * self._step
+        velocity = self._velocity
+        mean_square_current = self._integrate(steps)
+        self._elapsed += duration
+
+        # Heat the motor with the current that flowed, then read the torque scale without advancing time
+        rms_current = 1e3 * math.sqrt(mean_square_current)
+        self._thermal_model.update(dt=duration, motor_current=rms_current)
+        self._thermal_scale = self._thermal_model.update_and_get_scale(dt=0.0, motor_current=rms_current)
+        state = self._decode_state((self._velocity - velocity) / duration, rms_current)
+
+        if state.case_temperature >= self.max_case_temperature:
+            LOGGER.error(
+                msg=f"[{str.upper(self.tag)}] Case thermal limit {self.max_case_temperature} reached. "
+                f"Current Case Temperature: {state.case_temperature} C. Exiting."
+            )
+            raise ThermalLimitException()
+
+        if state.winding_temperature >= self.max_winding_temperature:
+            LOGGER.error(
+                msg=f"[{str.upper(self.tag)}] Winding thermal limit {self.max_winding_temperature} reached."
+                f"Current Winding Temperature: {state.winding_temperature} C. Exiting."
+            )
+            raise ThermalLimitException()
+
+    def _integrate(self, steps: int) -> float:
+        """
+        Integrate the motor and the firmware loops over a number of substeps.
+
+        The winding current is advanced with the exact solution of the RL circuit over each step, and the
+        rotor with semi-implicit Euler, treating friction implicitly so that it stops the rotor instead of
+        reversing it.
+
+        Args:
+            steps (int): The number of substeps.
+
+        Returns:
+            float: The mean square of the winding current in A^2.
+        """
+        h = self._step
+        kt = self.MOTOR_CONSTANTS.NM_PER_AMP
+        resistance = self._resistance
+        decay = math.exp(-resistance * h / self._inductance)
+        inertia = self._inertia
+        friction_step = self._coulomb_friction * h / inertia
+        viscous_decay = 1 / (1 + self._viscous_friction * h / inertia)
+        gear_ratio = self.gear_ratio
+        zero = self.motor_zero_position
+        load = self.load
+        idle = self._mode == CONTROL_MODES.IDLE
+
+        position, velocity, current = self._position, self._velocity, self._current
+        square_current = 0.0
+        for _ in range(steps):
+            if idle:
+                # The winding is open, so no current flows
+                voltage = current = 0.0
+            else:
+                voltage = self._drive_voltage(position, velocity, current, h)
+                steady_current = (voltage - kt * velocity) / resistance
+                current = steady_current + (current - steady_current) * decay
+            square_current += current * current
+
+            torque = kt * current
+            if load is not None:
+                torque += load((position - zero) / gear_ratio, velocity / gear_ratio) / gear_ratio
+            velocity += torque / inertia * h
+            if abs(velocity) <= friction_step:
+                velocity = 0.0
+            else:
+                velocity -= math.copysign(friction_step, velocity)
+            velocity *= viscous_decay
+            position += velocity * h
+
+        self._position, self._velocity, self._current, self._voltage = position, velocity, current, voltage
+        return square_current / steps
+
+    def _drive_voltage(self, position: float, velocity: float, current: float, h: float) -> float:
+        """
+        Run the firmware loops for one substep.
+
+        Args:
+            position (float): The rotor angle in rad.
+            velocity (float): The rotor velocity in rad/s.
+            current (float): The winding current in A.
+            h (float): The substep in seconds.
+
+        Returns:
+            float: The voltage applied to the winding in V.
+        """
+        limit = self._battery_voltage
+        if self._mode == CONTROL_MODES.VOLTAGE:
+            return min(max(self._command, -limit), limit)
+
+        reference = min(max(self._current_reference(position, velocity, h), -self._current_limit), self._current_limit)
+        error = reference - current
+        # Back-EMF feedforward plus PI, integrating only while the output is not saturated
+        unsaturated = self.MOTOR_CONSTANTS.NM_PER_AMP * velocity + self._current_kp * error + self._current_integral
+        voltage = min(max(unsaturated, -limit), limit)
+        if voltage == unsaturated:
+            self._current_integral += self._current_ki * error * h
+        return voltage
+
+    def _current_reference(self, position: float, velocity: float, h: float) -> float:
+        """
+        Get the current reference of the current loop from the active control mode.
+
+        Args:
+            position (float): The rotor angle in rad.
+            velocity (float): The rotor velocity in rad/s.
+            h (float): The substep in seconds.
+
+        Returns:
+            float: The current reference in A.
+        """
+        mode = self._mode
+        if mode == CONTROL_MODES.POSITION:
+            gains = self._position_gains
+            error = (self._command - position) / self.MOTOR_CONSTANTS.RAD_PER_COUNT
+            self._outer_integral += error * h
+            rate = velocity / self.MOTOR_CONSTANTS.RAD_PER_COUNT
+            return 1e-3 * (gains.kp * error + gains.ki * self._outer_integral - gains.kd * rate)
+        if mode == CONTROL_MODES.IMPEDANCE:
+            gains = self._impedance_gains
+            stiffness = gains.k / self.MOTOR_CONSTANTS.NM_PER_RAD_TO_K
+            damping = gains.b / self.MOTOR_CONSTANTS.NM_S_PER_RAD_TO_B
+            torque = stiffness * (self._command - position) - damping * velocity
+            return torque / self.MOTOR_CONSTANTS.NM_PER_AMP
+        if mode == CONTROL_MODES.VELOCITY:
+            gains = self._velocity_gains
+            error = self._command - velocity
+            self._outer_integral += error * h
+            return 1e-3 * (gains.kp * error + gains.ki * self._outer_integral)
+        return self._command
+
+    def _decode_state(self, acceleration: float, rms_current: float) -> ActuatorState:
+        """
+        Write the simulated quantities into the state snapshot, as the hardware would report them.
+
+        Args:
+            acceleration (float): The mean rotor acceleration over the last update in rad/s^2.
+            rms_current (float): The RMS winding current over the last update in mA.
+
+        Returns:
+            ActuatorState: The updated snapshot.
+        """
+        state = self._state
+        constants = self.MOTOR_CONSTANTS
+        state.motor_encoder_counts = int(round(self._position / constants.RAD_PER_COUNT))
+        state.motor_position = state.motor_encoder_counts * constants.RAD_PER_COUNT - self.motor_zero_position
+        state.motor_velocity = self._velocity
+        state.motor_acceleration = acceleration
+        state.motor_voltage = 1e3 * self._voltage
+        state.motor_current = 1e3 * self._current
+        state.motor_torque = state.motor_current * constants.NM_PER_MILLIAMP
+        state.battery_voltage = 1e3 * self._battery_voltage
+        state.battery_current = 1e3 * self._voltage * self._current / self._battery_voltage
+        state.case_temperature = float(self._thermal_model.T_c)
+        state.winding_temperature = float(self._thermal_model.T_w)
+        return state
+
+    def home(
+        self,
+        homing_voltage: int = 2000,
+        homing_frequency: Optional[int] = None,
+        homing_direction: int = -1,
+        output_position_offset: float = 0.0,
+        current_threshold: int = 5000,
+        velocity_threshold: float = 0.001,
+    ) -> None:
+        """
+        Home the actuator at its current position.
+
+        The simulated actuator has no hard stop to drive against, so the current position becomes the zero
+        position, shifted by the output position offset. The other arguments are accepted for compatibility
+        with the hardware actuators and ignored.
+
+        Args:
+            homing_voltage (int): Ignored.
+            homing_frequency (Optional[int]): Ignored.
+            homing_direction (int): Ignored.
+            output_position_offset (float): Offset in radians to add to the output position. Defaults to 0.0.
+            current_threshold (int): Ignored.
+            velocity_threshold (float): Ignored.
+
+        Examples:
+            >>> actuator.home(output_position_offset=0.1)
+            >>> actuator.is_homed
+            True
+        """
+        self.set_motor_zero_position(value=self.motor_position + output_position_offset * self.gear_ratio)
+        self._is_homed = True
+        LOGGER.info(f"[{str.upper(self.tag)}] Homing complete.")
+
+    def set_motor_zero_position(self, value: float) -> None:
+        """
+        Sets the motor zero position in radians, and shifts the motor position of the current state to match.
+
+        Args:
+            value (float): The motor zero position in radians.
+
+        Examples:
+            >>> actuator.set_motor_zero_position(0.5)
+        """
+        self._state.motor_position += self.motor_zero_position - value
+        super().set_motor_zero_position(value)
+
+    def set_motor_voltage(self, value: float) -> None:
+        """
+        Sets the motor voltage in mV.
+
+        Args:
+            value (float): The voltage to set in mV.
+
+        Examples:
+            >>> actuator.set_control_mode(CONTROL_MODES.VOLTAGE)
+            >>> actuator.set_motor_voltage(1000)
+        """
+        self._command = value * 1e-3
+
+    def set_motor_current(self, value: float) -> None:
+        """
+        Sets the motor current in mA.
+
+        Args:
+            value (float): The current to set in mA.
+
+        Examples:
+            >>> actuator.set_control_mode(CONTROL_MODES.CURRENT)
+            >>> actuator.set_motor_current(1000)
+        """
+        self._command = value * 1e-3
+
+    def set_motor_torque(self, value: float) -> None:
+        """
+        Sets the motor torque in Nm, through the current loop.
+
+        Args:
+            value (float): The torque to set in Nm.
+
+        Examples:
+            >>> actuator.set_control_mode(CONTROL_MODES.TORQUE)
+            >>> actuator.set_motor_torque(0.1)
+        """
+        self._command = value / self.MOTOR_CONSTANTS.NM_PER_AMP
+
+    def set_output_torque(self, value: float) -> None:
+        """
+        Sets the output torque in Nm.
+
+        Args:
+            value (float): The torque to set in Nm.
+
+        Examples:
+            >>> actuator.set_control_mode(CONTROL_MODES.TORQUE)
+            >>> actuator.set_output_torque(1.0)
+        """
+        self.set_motor_torque(value=value / self.gear_ratio)
+
+    def set_motor_position(self, value: float) -> None:
+        """
+        Sets the motor position in radians.
+        If in impedance mode, this sets the equilibrium angle in radians.
+
+        Args:
+            value (float): The position to set in radians.
+
+        Examples:
+            >>> actuator.set_control_mode(CONTROL_MODES.POSITION)
+            >>> actuator.set_motor_position(0.1)
+        """
+        self._command = value + self.motor_zero_position
+
+    @requires(CONTROL_MODES.VELOCITY)
+    def set_motor_velocity(self, value: float) -> None:
+        """
+        Sets the motor velocity in rad/s.
+
+        Args:
+            value (float): The velocity to set in rad/s.
+
+        Examples:
+            >>> actuator.set_control_mode(CONTROL_MODES.VELOCITY)
+            >>> actuator.set_motor_velocity(10.0)
+        """
+        self._command = value
+
+    @requires(CONTROL_MODES.VELOCITY)
+    def set_output_velocity(self, value: float) -> None:
+        """
+        Sets the output velocity in rad/s.
+
+        Args:
+            value (float): The velocity to set in rad/s.
+
+        Examples:
+            >>> actuator.set_control_mode(CONTROL_MODES.VELOCITY)
+            >>> actuator.set_output_velocity(1.0)
+        """
+        self.set_motor_velocity(value=value * self.gear_ratio)
+
+    def set_position_gains(
+        self,
+        kp: float = DEFAULT_POSITION_GAINS.kp,
+        ki: float = DEFAULT_POSITION_GAINS.ki,
+        kd: float = DEFAULT_POSITION_GAINS.kd,
+        ff: float = DEFAULT_POSITION_GAINS.ff,
+    ) -> None:
+        """
+        Sets the gains of the position loop, which commands the current loop in mA from the position error
+        in encoder counts: kp in mA/count, ki in mA/(count*s) and kd in mA/(count/s).
+
+        Args:
+            kp (float): The proportional gain
+            ki (float): The integral gain
+            kd (float): The derivative gain
+            ff (float): The feedforward gain, unused by the simulation
+
+        Examples:
+            >>> actuator.set_control_mode(CONTROL_MODES.POSITION)
+            >>> actuator.set_position_gains(kp=30, ki=0, kd=0, ff=0)
+        """
+        self._position_gains = ControlGains(kp=kp, ki=ki, kd=kd, k=0, b=0, ff=ff)
+        self._outer_integral = 0.0
+
+    def set_current_gains(
+        self,
+        kp: float = DEFAULT_CURRENT_GAINS.kp,
+        ki: float = DEFAULT_CURRENT_GAINS.ki,
+        kd: float = DEFAULT_CURRENT_GAINS.kd,
+        ff: float = DEFAULT_CURRENT_GAINS.ff,
+    ) -> None:
+        """
+        Sets the current gains. The simulated current loop is tuned from the electrical model with
+        `current_bandwidth` instead, so the gains are only stored.
+
+        Args:
+            kp (float): The proportional gain
+            ki (float): The integral gain
+            kd (float): The derivative gain
+            ff (float): The feedforward gain
+
+        Examples:
+            >>> actuator.set_control_mode(CONTROL_MODES.CURRENT)
+            >>> actuator.set_current_gains(kp=40, ki=400, kd=0, ff=128)
+        """
+        self._current_gains = ControlGains(kp=kp, ki=ki, kd=kd, k=0, b=0, ff=ff)
+
+    @requires(CONTROL_MODES.VELOCITY)
+    def set_velocity_gains(
+        self,
+        kp: float = DEFAULT_VELOCITY_GAINS.kp,
+        ki: float = DEFAULT_VELOCITY_GAINS.ki,
+        kd: float = DEFAULT_VELOCITY_GAINS.kd,
+        ff: float = DEFAULT_VELOCITY_GAINS.ff,
+    ) -> None:
+        """
+        Sets the gains of the velocity loop, which commands the current loop in mA from the velocity error
+        in rad/s: kp in mA/(rad/s) and ki in mA/rad.
+
+        Args:
+            kp (float): The proportional gain
+            ki (float): The integral gain
+            kd (float): The derivative gain, unused by the simulation
+            ff (float): The feedforward gain, unused by the simulation
+
+        Examples:
+            >>> actuator.set_control_mode(CONTROL_MODES.VELOCITY)
+            >>> actuator.set_velocity_gains(kp=100, ki=1000)
+        """
+        self._velocity_gains = ControlGains(kp=kp, ki=ki, kd=kd, k=0, b=0, ff=ff)
+        self._outer_integral = 0.0
+
+    def set_impedance_gains(
+        self,
+        kp: float = DEFAULT_IMPEDANCE_GAINS.kp,
+        ki: float = DEFAULT_IMPEDANCE_GAINS.ki,
+        kd: float = DEFAULT_IMPEDANCE_GAINS.kd,
+        k: float = DEFAULT_IMPEDANCE_GAINS.k,
+        b: float = DEFAULT_IMPEDANCE_GAINS.b,
+        ff: float = DEFAULT_IMPEDANCE_GAINS.ff,
+    ) -> None:
+        """
+        Sets the impedance gains in actuator units. The stiffness and damping are converted to Nm/rad and
+        Nm/rad/s with the `NM_PER_RAD_TO_K` and `NM_S_PER_RAD_TO_B` motor constants; kp, ki and ff are
+        current loop gains and are only stored.
+
+        Args:
+            kp (float): The proportional gain
+            ki (float): The integral gain
+            kd (float): The derivative gain
+            k (float): The spring constant
+            b (float): The damping constant
+            ff (float): The feedforward gain
+
+        Examples:
+            >>> actuator.set_control_mode(CONTROL_MODES.IMPEDANCE)
+            >>> actuator.set_impedance_gains(kp=40, ki=400, kd=0, k=200, b=400, ff=128)
+        """
+        self._impedance_gains = ControlGains(kp=kp, ki=ki, kd=kd, k=k, b=b, ff=ff)
+
+    def set_motor_impedance(
+        self,
+        kp: float = DEFAULT_IMPEDANCE_GAINS.kp,
+        ki: float = DEFAULT_IMPEDANCE_GAINS.ki,
+        kd: float = DEFAULT_IMPEDANCE_GAINS.kd,
+        k: float = 0.08922,
+        b: float = 0.0038070,
+        ff: float = DEFAULT_IMPEDANCE_GAINS.ff,
+    ) -> None:
+        """
+        Set the impedance gains of the motor in real units: Nm/rad and Nm/rad/s.
+
+        Args:
+            kp (float): Proportional gain. Defaults to 40.
+            ki (float): Integral gain. Defaults to 400.
+            kd (float): Derivative gain. Defaults to 0.
+            k (float): Spring constant. Defaults to 0.08922 Nm/rad.
+            b (float): Damping constant. Defaults to 0.0038070 Nm/rad/s.
+            ff (float): Feedforward gain. Defaults to 128.
+
+        Examples:
+            >>> actuator.set_control_mode(CONTROL_MODES.IMPEDANCE)
+            >>> actuator.set_motor_impedance(k=0.08922, b=0.0038070)
+        """
+        self.set_impedance_gains(
+            kp=kp,
+            ki=ki,
+            kd=kd,
+            k=k * self.MOTOR_CONSTANTS.NM_PER_RAD_TO_K,
+            b=b * self.MOTOR_CONSTANTS.NM_S_PER_RAD_TO_B,
+            ff=ff,
+        )
+
+    def set_output_impedance(
+        self,
+        kp: float = DEFAULT_IMPEDANCE_GAINS.kp,
+        ki: float = DEFAULT_IMPEDANCE_GAINS.ki,
+        kd: float = DEFAULT_IMPEDANCE_GAINS.kd,
+        k: float = 100.0,
+        b: float = 3.0,
+        ff: float = 128,
+    ) -> None:
+        """
+        Set the impedance gains of the joint in real units: Nm/rad and Nm/rad/s.
+        This sets the impedance at the output and automatically scales based on gear ratios.
+
+        Args:
+            kp (float): Proportional gain. Defaults to 40.
+            ki (float): Integral gain. Defaults to 400.
+            kd (float): Derivative gain. Defaults to 0.
+            k (float): Spring constant. Defaults to 100 Nm/rad.
+            b (float): Damping constant. Defaults to 3.0 Nm/rad/s.
+            ff (float): Feedforward gain. Defaults to 128.
+
+        Examples:
+            >>> actuator.set_control_mode(CONTROL_MODES.IMPEDANCE)
+            >>> actuator.set_output_impedance(k=100, b=3)
+        """
+        self.set_motor_impedance(
+            kp=kp,
+            ki=ki,
+            kd=kd,
+            k=k / (self.gear_ratio**2),
+            b=b / (self.gear_ratio**2),
+            ff=ff,
+        )
+
+    @property
+    def motor_position(self) -> float:
+        """
+        Motor position in radians, quantized to encoder counts.
+
+        Returns:
+            float: Motor position in radians.
+        """
+        return self._state.motor_position
+
+    @property
+    def motor_velocity(self) -> float:
+        """
+        Motor velocity in rad/s.
+
+        Returns:
+            float: Motor velocity in rad/s.
+        """
+        return self._state.motor_velocity
+
+    @property
+    def motor_acceleration(self) -> float:
+        """
+        Mean motor acceleration over the last update in rad/s^2.
+
+        Returns:
+            float: Motor acceleration in rad/s^2.
+        """
+        return self._state.motor_acceleration
+
+    @property
+    def motor_voltage(self) -> float:
+        """
+        Q-axis motor voltage in mV.
+
+        Returns:
+            float: Motor voltage in mV.
+        """
+        return self._state.motor_voltage
+
+    @property
+    def motor_current(self) -> float:
+        """
+        Motor current in mA.
+
+        Returns:
+            float: Motor current in mA.
+        """
+        return self._state.motor_current
+
+    @property
+    def motor_torque(self) -> float:
+        """
+        Torque at the motor output in Nm.
+
+        Returns:
+            float: Motor torque in Nm.
+        """
+        return self._state.motor_torque
+
+    @property
+    def motor_encoder_counts(self) -> int:
+        """
+        Raw encoder counts.
+
+        Returns:
+            int: Motor encoder counts.
+        """
+        return self._state.motor_encoder_counts
+
+    @property
+    def battery_voltage(self) -> float:
+        """
+        Battery voltage in mV.
+
+        Returns:
+            float: Battery voltage in mV.
+        """
+        return self._state.battery_voltage
+
+    @property
+    def battery_current(self) -> float:
+        """
+        Battery current in mA, from the power drawn by the winding.
+
+        Returns:
+            float: Battery current in mA.
+        """
+        return self._state.battery_current
+
+    @property
+    def case_temperature(self) -> float:
+        """
+        Case temperature in celsius, from the thermal model.
+
+        Returns:
+            float: Case temperature in celsius.
+        """
+        return self._state.case_temperature
+
+    @property
+    def winding_temperature(self) -> float:
+        """
+        Winding temperature in celsius, from the thermal model.
+
+        Returns:
+            float: Winding temperature in celsius.
+        """
+        return self._state.winding_temperature
+
+    @property
+    def thermal_scaling_factor(self) -> float:
+        """
+        Scale factor to use in torque control, in [0,1].
+        If you scale the torque command by this factor, the motor temperature will never
+        exceed max allowable temperature. For a proof, see paper referenced in thermal model.
+
+        Returns:
+            float: Thermal scaling factor.
+        """
+        return self._thermal_scale
+
+    @property
+    def state(self) -> ActuatorState:
+        """
+        Simulated state of the actuator at its last update.
+
+        The record is updated in place by every call to `update`; use `state.copy()` to keep a snapshot.
+
+        Returns:
+            ActuatorState: The state snapshot.
+        """
+        return self._state
+
+    @property
+    def elapsed_time(self) -> float:
+        """
+        Time simulated since the actuator was created, in seconds.
+
+        Returns:
+            float: The simulated time in seconds.
+        """
+        return self._elapsed
+
+    @property
+    def thermal_model(self) -> ThermalModel:
+        """
+        Thermal model of the simulated motor, for example to set its temperatures before a run.
+
+        Returns:
+            ThermalModel: The thermal model.
+        """
+        return self._thermal_model
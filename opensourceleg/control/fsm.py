@@ -19,8 +19,8 @@ import time
 from collections.abc import Iterator
 from typing import Any, Callable, Optional
 
-from opensourceleg.logging.logger import LOGGER
-from opensourceleg.utilities import SoftRealtimeLoop
+from opensourceleg.logging.logger import LOGGER, LogLevel
+from opensourceleg.utilities import Clock, SoftRealtimeLoop, SystemClock
 
 
 class State:
@@ -30,6 +30,7 @@ class State:
         minimum_time_in_state: float = 0.0,
         entry_callbacks: Optional[list[Callable[[Any], None]]] = None,
         exit_callbacks: Optional[list[Callable[[Any], None]]] = None,
+        clock: Optional[Clock] = None,
         **kwargs: Any,
     ) -> None:
         """
@@ -43,6 +44,8 @@ class State:
                 Defaults to 0.0 seconds.
             entry_callbacks: List of functions to call when entering the state.
             exit_callbacks: List of functions to call when exiting the state.
+            clock: Clock to time the state with. Defaults to the system clock. A state machine
+                created with a clock sets it on every state added to it.
             **kwargs: Additional attributes to set on the state
 
         Example:
@@ -59,6 +62,7 @@ class State:
         self._min_time_in_state: float = minimum_time_in_state
         self._entry_callbacks: list[Callable[[Any], None]] = entry_callbacks or []
         self._exit_callbacks: list[Callable[[Any], None]] = exit_callbacks or []
+        self.clock: Clock = SystemClock() if clock is None else clock
 
         for key, value in kwargs.items():
             setattr(self, key, value)
@@ -122,7 +126,7 @@ class State:
         Example:
             >>> state.enter(x=1)
         """
-        self._time_entered = time.monotonic()
+        self._time_entered = self.clock.monotonic()
         for c in self._entry_callbacks:
             c(*args, **kwargs)
 
@@ -137,7 +141,7 @@ class State:
         Example:
             >>> state.exit(x=1)
         """
-        self._time_exited = time.monotonic()
+        self._time_exited = self.clock.monotonic()
         for c in self._exit_callbacks:
             c(*args, **kwargs)
 
@@ -169,7 +173,7 @@ class State:
         Returns:
             float: The current time spent in the state
         """
-        return time.monotonic() - self._time_entered
+        return self.clock.monotonic() - self._time_entered
 
     @property
     def time_spent_in_state(self) -> float:
@@ -353,6 +357,7 @@ class StateMachine:
         self,
         states: Optional[list[State]] = None,
         initial_state_name: Optional[str] = None,
+        clock: Optional[Clock] = None,
     ) -> None:
         """
         A flexible finite state machine class that supports:
@@ -364,6 +369,8 @@ class StateMachine:
         Args:
             states: List of states to add to the state machine
             initial_state_name: Name of the initial state to set
+            clock: Clock to time the states with, for example the clock of the loop running the
+                state machine. Defaults to None, which leaves the clock of each state unchanged.
 
         Example:
             >>> sm = StateMachine(states=[State("idle"), State("walking"), State("running")],
@@ -376,6 +383,7 @@ class StateMachine:
 
         self._initial_state: Optional[State] = None
         self._current_state: Optional[State] = None
+        self._clock: Optional[Clock] = clock
 
         if states:
             self.add_states(states, initial_state_name)
@@ -396,6 +404,8 @@ class StateMachine:
         """
         for state in states:
             if state not in self._states:
+                if self._clock is not None:
+                    state.clock = self._clock
                 self._states.append(state)
                 # Set up transition map entry
                 if state not in self._transition_map:
@@ -542,7 +552,7 @@ class StateMachine:
         transitions = self._transition_map.get(self._current_state, [])
 
         if not transitions:
-            LOGGER.debug(f"No transitions defined for state {self._current_state.name}")
+            LOGGER.log_rate_limited(LogLevel.DEBUG, "No transitions defined for state %s", self._current_state.name)
             return
 
         for transition in transitions:
@@ -554,7 +564,7 @@ class StateMachine:
 
                 return
 
-        LOGGER.debug(f"No valid transitions from state {self._current_state.name}")
+        LOGGER.log_rate_limited(LogLevel.DEBUG, "No valid transitions from state %s", self._current_state.name)
 
     def start(self, *args: Any, **kwargs: Any) -> None:
         """
@@ -0,0 +1,132 @@
+"""
+Compares the cost of switching control modes and of calling a mode-restricted setter with the
+precomputed dispatch of `ActuatorBase` against the previous approach, which replaced every
+restricted method on the instance on each mode switch.
+
+Run with `python -m opensourceleg.extras.benchmarks.control_modes`.
+"""
+
+import timeit
+from functools import partial
+from typing import Any
+
+from opensourceleg.actuators.base import CONTROL_MODE_CONFIGS, CONTROL_MODES, MOTOR_CONSTANTS, ActuatorBase
+
+ITERATIONS = 100000
+REPEATS = 5
+CONFIGS = CONTROL_MODE_CONFIGS()
+
+
+class BenchmarkActuator(ActuatorBase):
+    @property
+    def _CONTROL_MODE_CONFIGS(self) -> CONTROL_MODE_CONFIGS:
+        return CONFIGS
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def update(self) -> None:
+        pass
+
+    def set_motor_voltage(self, value: float) -> None:
+        pass
+
+    def set_motor_current(self, value: float) -> None:
+        pass
+
+    def set_motor_position(self, value: float) -> None:
+        pass
+
+    def set_motor_torque(self, value: float) -> None:
+        pass
+
+    def set_output_torque(self, value: float) -> None:
+        pass
+
+    def set_current_gains(self, kp: float, ki: float, kd: float, ff: float) -> None:
+        pass
+
+    def set_position_gains(self, kp: float, ki: float, kd: float, ff: float) -> None:
+        pass
+
+    def set_impedance_gains(self, kp: float, ki: float, kd: float, k: float, b: float, ff: float) -> None:
+        pass
+
+    def home(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    @property
+    def motor_position(self) -> float:
+        return 0.0
+
+    @property
+    def motor_velocity(self) -> float:
+        return 0.0
+
+    @property
+    def motor_voltage(self) -> float:
+        return 0.0
+
+    @property
+    def motor_current(self) -> float:
+        return 0.0
+
+    @property
+    def motor_torque(self) -> float:
+        return 0.0
+
+    @property
+    def case_temperature(self) -> float:
+        return 0.0
+
+    @property
+    def winding_temperature(self) -> float:
+        return 0.0
+
+
+class SetattrActuator(BenchmarkActuator):
+    """
+    Reproduces the previous dispatch: every mode switch rebinds each restricted method on the instance.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._original_methods = {name: getattr(self, name) for name in self._restricted_methods}
+        self._set_mutated_methods()
+
+    def _set_mutated_methods(self) -> None:
+        for method_name, method in self._original_methods.items():
+            if self._mode in self._METHOD_REQUIRED_MODES[method_name]:
+                setattr(self, method_name, method)
+            else:
+                setattr(self, method_name, partial(self._restricted_method, method_name))
+
+    def _switch_restricted_methods(self, restricted: frozenset[str], available: frozenset[str]) -> None:
+        if hasattr(self, "_original_methods"):
+            self._set_mutated_methods()
+
+
+def _time(statement: str, actuator: ActuatorBase) -> float:
+    times = timeit.repeat(
+        statement, globals={"actuator": actuator, "CONTROL_MODES": CONTROL_MODES}, number=ITERATIONS, repeat=REPEATS
+    )
+    return 1e9 * min(times) / ITERATIONS
+
+
+def main() -> None:
+    constants = MOTOR_CONSTANTS(2048, 0.02, 0.001, 0.0001, 80.0, 120.0)
+    for name, actuator_class in [("setattr (previous)", SetattrActuator), ("dispatch table", BenchmarkActuator)]:
+        actuator = actuator_class(tag="benchmark", gear_ratio=9.0, motor_constants=constants)
+        switch = _time(
+            "actuator.set_control_mode(CONTROL_MODES.CURRENT); actuator.set_control_mode(CONTROL_MODES.POSITION)",
+            actuator,
+        )
+        call = _time("actuator.set_motor_position(0.0)", actuator)
+        print(f"{name}: mode switch {switch / 2:.0f} ns, setter call {call:.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,8 @@
+from .binary import *  # noqa: F403
+from .buffers import *  # noqa: F403
+from .compressed import *  # noqa: F403
 from .logger import *  # noqa: F403
+from .segments import *  # noqa: F403
+from .sharedmemory import *  # noqa: F403
+from .telemetry import *  # noqa: F403
+from .writer import *  # noqa: F403
@@ -0,0 +1,337 @@
+"""
+Binary log module for opensourceleg library.
+
+Module Overview:
+
+This module defines a typed, fixed-width binary log format for tracked variables. Each row is
+stored as one record of a NumPy structured array, and the file is a standard `.npy` file, so
+it can be opened with `numpy.load(path, mmap_mode="r")` or with `read_binary_log`.
+
+The type of each column is inferred from its first value that is not None or NaN in the first batch
+that is written. Numbers are stored as floats so that missing values can be NaN, except in columns
+declared as integer columns, which are never missing. The header reserves space
+for the row count and is rewritten after every batch, and `read_binary_log` recovers the row
+count from the file size, so logs cut short by a crash can still be read.
+
+Key Classes:
+
+- `BinaryLogWriter`: Appends rows of tracked values to a `.npy` file.
+
+Key Functions:
+
+- `infer_dtype`: Infer a structured dtype from column names and a sample row.
+- `read_binary_log`: Memory-map a binary log written by `BinaryLogWriter`.
+
+Usage Guide:
+
+1. Create a `BinaryLogWriter` with a file path and the column names.
+2. Call `write_rows` with batches of rows.
+3. Call `close` when done, then open the file with `read_binary_log`.
+"""
+
+import os
+import struct
+from collections.abc import Collection, Iterable, Sequence
+from numbers import Integral, Real
+from typing import Any, Optional
+
+import numpy as np
+
+__all__ = ["BinaryLogWriter", "infer_dtype", "read_binary_log"]
+
+_MAGIC = b"\x93NUMPY"
+_STRING_WIDTH = 64
+_SHAPE_DIGITS = 20  # Room reserved in the header for the row count
+_HEADER_ALIGNMENT = 64
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and value != value)
+
+
+def infer_dtype(
+    names: Sequence[str],
+    row: Sequence[Any],
+    integer_columns: Collection[str] = (),
+) -> np.dtype:
+    """
+    Infer a structured dtype from column names and a sample row.
+
+    Real numbers, including integers and booleans, are stored as `<f8` so that missing and failed
+    values can be NaN. Integers in `integer_columns` are stored as `<i8` instead. Missing values (None
+    or NaN) are stored as `<f8`, and everything else as a fixed-width unicode string. Duplicate
+    column names are made unique with a numeric suffix.
+
+    Args:
+        names (Sequence[str]): The column names.
+        row (Sequence[Any]): A sample row with one value per column.
+        integer_columns (Collection[str]): Names of columns that always hold an integer. Defaults to ().
+
+    Returns:
+        np.dtype: The structured dtype.
+
+    Raises:
+        ValueError: If the number of names does not match the number of values.
+
+    Examples:
+        >>> infer_dtype(["a", "b"], [1, 2.0], integer_columns=["a"])
+        dtype([('a', '<i8'), ('b', '<f8')])
+    """
+    if len(names) != len(row):
+        raise ValueError(f"Expected {len(names)} values, got {len(row)}")
+
+    fields = []
+    seen: dict[str, int] = {}
+    for name, value in zip(names, row):
+        name = str(name)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}_{seen[name]}"
+        else:
+            seen[name] = 0
+
+        if _is_missing(value):
+            fields.append((name, "<f8"))
+        elif name in integer_columns and isinstance(value, Integral) and not isinstance(value, (bool, np.bool_)):
+            fields.append((name, "<i8"))
+        elif isinstance(value, (Real, np.bool_)):
+            fields.append((name, "<f8"))
+        else:
+            fields.append((name, f"<U{max(_STRING_WIDTH, len(str(value)))}"))
+
+    return np.dtype(fields)
+
+
+def _fill_value(dtype: np.dtype) -> Any:
+    if dtype.kind == "f":
+        return np.nan
+    if dtype.kind == "U":
+        return ""
+    return dtype.type(0)
+
+
+def _header_bytes(dtype: np.dtype, rows: int, version: tuple[int, int], size: int) -> bytes:
+    header = "{'descr': %r, 'fortran_order': False, 'shape': (%d,), }" % (
+        np.lib.format.dtype_to_descr(dtype),
+        rows,
+    )
+    length_format = "<H" if version == (1, 0) else "<I"
+    prefix = _MAGIC + bytes(version) + struct.pack(length_format, size)
+    return prefix + header.ljust(size - 1).encode("latin1") + b"\n"
+
+
+class BinaryLogWriter:
+    """
+    Appends rows of tracked values to a `.npy` file as records of a structured array.
+
+    The file is created and the dtype is inferred when the first batch is written, from the first value of
+    each column that is not None or NaN, so a failed read on the first row does not decide the type of its
+    column. Numbers, including integers and booleans, are stored as floats, so missing values and failed
+    reads are NaN. Values that cannot be converted to their column type are stored as NaN in float
+    columns, 0 in integer columns, and an empty string in string columns.
+
+    Args:
+        path (str): The path of the `.npy` file. Existing files are overwritten.
+        names (Sequence[str]): The column names.
+        integer_columns (Collection[str]): Names of columns that always hold an integer and are stored
+            as `<i8`. Defaults to ().
+
+    Examples:
+        >>> writer = BinaryLogWriter("./log.npy", ["time", "position"])
+        >>> writer.write_rows([[0.0, 1.5], [0.01, 1.6]])
+        >>> writer.close()
+        >>> read_binary_log("./log.npy")["position"]
+        memmap([1.5, 1.6])
+    """
+
+    def __init__(self, path: str, names: Sequence[str], integer_columns: Collection[str] = ()) -> None:
+        self._path = path
+        self._names = list(names)
+        self._integer_columns = frozenset(integer_columns)
+        self._dtype: Optional[np.dtype] = None
+        self._file: Optional[Any] = None
+        self._header_size: int = 0
+        self._version: tuple[int, int] = (1, 0)
+        self._row_count: int = 0
+
+    def __repr__(self) -> str:
+        return f"BinaryLogWriter(path={self._path}, rows={self._row_count})"
+
+    def write_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        """
+        Append rows to the file and update the row count in the header.
+
+        Args:
+            rows (Iterable[Sequence[Any]]): The rows to append, or a 2-D array with one row per record.
+        """
+        if not isinstance(rows, np.ndarray):
+            rows = list(rows)
+        if not len(rows):
+            return
+
+        if self._file is None:
+            self._open(self._sample_row(rows))
+
+        records = self._to_records(rows)
+        self._file.write(records.tobytes())  # type: ignore[union-attr]
+        self._row_count += len(records)
+        self._write_header()
+
+    def flush(self) -> None:
+        """
+        Flush written rows to the operating system.
+        """
+        if self._file is not None:
+            self._file.flush()
+
+    def sync(self) -> None:
+        """
+        Flush written rows and sync them to disk.
+        """
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """
+        Flush and close the file.
+        """
+        if self._file is not None:
+            self._file.flush()
+            self._file.close()
+            self._file = None
+
+    def _sample_row(self, rows: Any) -> list[Any]:
+        if isinstance(rows, np.ndarray) and rows.dtype.names is None:
+            return list(rows[0])
+
+        sample: list[Any] = [None] * len(rows[0])
+        unknown = set(range(len(sample)))
+        for row in rows:
+            for i in list(unknown):
+                if i < len(row) and not _is_missing(row[i]):
+                    sample[i] = row[i]
+                    unknown.discard(i)
+            if not unknown:
+                break
+        return sample
+
+    def _open(self, first_row: Sequence[Any]) -> None:
+        self._dtype = infer_dtype(self._names, first_row, self._integer_columns)
+
+        longest = len(_header_bytes(self._dtype, 10**_SHAPE_DIGITS - 1, (1, 0), 0))
+        self._header_size = -(-longest // _HEADER_ALIGNMENT) * _HEADER_ALIGNMENT
+        if self._header_size - 10 > 0xFFFF:
+            # Version 2.0 uses a 4 byte header length
+            self._version = (2, 0)
+            self._header_size += _HEADER_ALIGNMENT
+
+        self._file = open(self._path, "wb")
+        self._write_header()
+
+    def _write_header(self) -> None:
+        prefix_size = 10 if self._version == (1, 0) else 12
+        header = _header_bytes(
+            self._dtype,  # type: ignore[arg-type]
+            self._row_count,
+            self._version,
+            self._header_size - prefix_size,
+        )
+        self._file.seek(0)  # type: ignore[union-attr]
+        self._file.write(header)  # type: ignore[union-attr]
+        self._file.seek(0, os.SEEK_END)  # type: ignore[union-attr]
+
+    def _to_records(self, rows: Any) -> np.ndarray:
+        dtype: np.dtype = self._dtype  # type: ignore[assignment]
+        if (
+            isinstance(rows, np.ndarray)
+            and rows.ndim == 2
+            and rows.shape[1] == len(dtype.names)  # type: ignore[arg-type]
+            and all(dtype[name] == np.float64 for name in dtype.names)  # type: ignore[union-attr]
+        ):
+            # Blocks from an ArrayRingBuffer already have the record layout
+            return np.ascontiguousarray(rows, dtype=np.float64).view(dtype).reshape(-1)
+        if (
+            isinstance(rows, np.ndarray) and rows.dtype.names is not None and len(rows.dtype.names) == len(dtype.names)  # type: ignore[arg-type]
+        ):
+            # Structured blocks are converted field by field, matched by position
+            return rows.astype(dtype)
+
+        try:
+            return np.array([tuple(row) for row in rows], dtype=self._dtype)
+        except (TypeError, ValueError):
+            pass
+
+        # Slow path: convert field by field so one bad value does not lose the whole batch
+        records = np.empty(len(rows), dtype=dtype)
+        for name in dtype.names:  # type: ignore[union-attr]
+            records[name] = _fill_value(dtype[name])
+        for i, row in enumerate(rows):
+            for name, value in zip(dtype.names, row):  # type: ignore[arg-type]
+                try:
+                    records[i][name] = value
+                except (TypeError, ValueError):
+                    continue
+        return records
+
+    @property
+    def path(self) -> str:
+        """
+        Get the path of the binary log file.
+
+        Returns:
+            str: The file path.
+        """
+        return self._path
+
+    @property
+    def dtype(self) -> Optional[np.dtype]:
+        """
+        Get the structured dtype of the records.
+
+        Returns:
+            Optional[np.dtype]: The dtype, or None if no rows have been written yet.
+        """
+        return self._dtype
+
+    @property
+    def row_count(self) -> int:
+        """
+        Get the number of rows written.
+
+        Returns:
+            int: The number of rows written.
+        """
+        return self._row_count
+
+
+def read_binary_log(path: str) -> np.ndarray:
+    """
+    Memory-map a binary log written by `BinaryLogWriter`.
+
+    The number of rows is taken from the file size rather than the header, so the rows written
+    before an unclean shutdown are still returned.
+
+    Args:
+        path (str): The path of the `.npy` file.
+
+    Returns:
+        np.ndarray: A read-only structured array backed by the file.
+
+    Examples:
+        >>> data = read_binary_log("./log.npy")
+        >>> data.dtype.names
+        ('time', 'position')
+    """
+    with open(path, "rb") as f:
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            _, _, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            _, _, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+
+    rows = (os.path.getsize(path) - offset) // dtype.itemsize
+    if rows == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(rows,))
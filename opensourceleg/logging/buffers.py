@@ -0,0 +1,226 @@
+"""
+Buffer module for opensourceleg library.
+
+Module Overview:
+
+This module defines `ArrayRingBuffer`, a preallocated NumPy storage backend for the values of
+tracked variables. Each row holds one sample of every tracked variable plus a monotonic
+timestamp and a tick index, and rows are written in place, so buffering a sample does not allocate a list or
+convert values to strings.
+
+Key Classes:
+
+- `ArrayRingBuffer`: Fixed-capacity ring of float64 rows with int64 timestamp and tick columns.
+
+Usage Guide:
+
+1. Create an `ArrayRingBuffer` with a capacity and number of columns.
+2. Call `next_row` once per sample and write the values into the returned row.
+3. Read the buffered block with `rows`, `timestamps` and `ticks` (or all at once with `records`),
+   then call `clear`.
+"""
+
+import time
+from typing import Optional
+
+import numpy as np
+
+__all__ = ["ArrayRingBuffer"]
+
+
+class ArrayRingBuffer:
+    """
+    Fixed-capacity ring of float64 rows with int64 timestamp and tick columns.
+
+    Values that cannot be stored as float64 should be written as NaN. When the ring is full, `next_row`
+    overwrites the oldest row and counts it in `overwritten_rows`.
+
+    Args:
+        capacity (int): The number of rows held before the oldest row is overwritten.
+        columns (int): The number of values per row. Defaults to 0.
+
+    Examples:
+        >>> buffer = ArrayRingBuffer(capacity=100, columns=2)
+        >>> row = buffer.next_row()
+        >>> row[0] = 1.0
+        >>> row[1] = 2.0
+        >>> buffer.rows()
+        array([[1., 2.]])
+    """
+
+    def __init__(self, capacity: int, columns: int = 0) -> None:
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        if columns < 0:
+            raise ValueError(f"columns must not be negative, got {columns}")
+
+        self._capacity: int = capacity
+        self._data: np.ndarray = np.full((capacity, columns), np.nan, dtype=np.float64)
+        self._timestamps: np.ndarray = np.zeros(capacity, dtype=np.int64)
+        self._ticks: np.ndarray = np.zeros(capacity, dtype=np.int64)
+        self._sequence: int = 0
+        self._start: int = 0
+        self._count: int = 0
+        self._overwritten_rows: int = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return f"ArrayRingBuffer(capacity={self._capacity}, columns={self.columns}, rows={self._count})"
+
+    def next_row(self, timestamp_ns: Optional[int] = None, tick: Optional[int] = None) -> np.ndarray:
+        """
+        Claim the next row and return it for writing.
+
+        The row is reset to NaN so that values which are not written are recorded as missing.
+
+        Args:
+            timestamp_ns (Optional[int]): Timestamp of the sample in nanoseconds. Defaults to
+                `time.monotonic_ns()`.
+            tick (Optional[int]): Index of the sample. Defaults to the number of rows claimed before this one.
+
+        Returns:
+            np.ndarray: A writable view of the row.
+        """
+        if self._count == self._capacity:
+            self._start = (self._start + 1) % self._capacity
+            self._count -= 1
+            self._overwritten_rows += 1
+
+        index = (self._start + self._count) % self._capacity
+        self._count += 1
+        self._timestamps[index] = time.monotonic_ns() if timestamp_ns is None else timestamp_ns
+        self._ticks[index] = self._sequence if tick is None else tick
+        self._sequence += 1
+        row: np.ndarray = self._data[index]
+        row.fill(np.nan)
+        return row
+
+    def rows(self) -> np.ndarray:
+        """
+        Get the buffered rows, oldest first.
+
+        Returns:
+            np.ndarray: A (rows, columns) array. This is a view of the buffer unless the ring has wrapped,
+                so it must be copied if it is kept after the next call to `next_row`.
+        """
+        return self._ordered(self._data)
+
+    def timestamps(self) -> np.ndarray:
+        """
+        Get the timestamps of the buffered rows, oldest first.
+
+        Returns:
+            np.ndarray: The int64 timestamps in nanoseconds, with the same layout caveat as `rows`.
+        """
+        return self._ordered(self._timestamps)
+
+    def ticks(self) -> np.ndarray:
+        """
+        Get the tick indices of the buffered rows, oldest first.
+
+        Returns:
+            np.ndarray: The int64 tick indices, with the same layout caveat as `rows`.
+        """
+        return self._ordered(self._ticks)
+
+    def records(self) -> np.ndarray:
+        """
+        Get the buffered rows as a structured array with the timestamp and tick in the first two fields.
+
+        Returns:
+            np.ndarray: A new structured array with int64 fields `f0` (timestamp) and `f1` (tick),
+                followed by one float64 field per column.
+        """
+        dtype = np.dtype([("", np.int64), ("", np.int64)] + [("", np.float64)] * self.columns)
+        records = np.empty(self._count, dtype=dtype)
+        records["f0"] = self.timestamps()
+        records["f1"] = self.ticks()
+        for column, values in enumerate(self.rows().T):
+            records[f"f{column + 2}"] = values
+        return records
+
+    def clear(self) -> None:
+        """
+        Discard all buffered rows. The storage is kept for reuse.
+        """
+        self._start = 0
+        self._count = 0
+
+    def add_column(self) -> None:
+        """
+        Append a column. Rows already buffered record the new column as NaN.
+        """
+        self._data = np.hstack((self._data, np.full((self._capacity, 1), np.nan, dtype=np.float64)))
+
+    def remove_column(self, index: int) -> None:
+        """
+        Remove a column from the buffer, including from rows already buffered.
+
+        Args:
+            index (int): The index of the column to remove.
+        """
+        self._data = np.delete(self._data, index, axis=1)
+
+    def resize(self, capacity: int) -> None:
+        """
+        Change the capacity, keeping the most recent rows that fit.
+
+        Args:
+            capacity (int): The new capacity.
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+
+        keep = min(self._count, capacity)
+        data = np.full((capacity, self.columns), np.nan, dtype=np.float64)
+        timestamps = np.zeros(capacity, dtype=np.int64)
+        ticks = np.zeros(capacity, dtype=np.int64)
+        data[:keep] = self.rows()[self._count - keep :]
+        timestamps[:keep] = self.timestamps()[self._count - keep :]
+        ticks[:keep] = self.ticks()[self._count - keep :]
+
+        self._overwritten_rows += self._count - keep
+        self._data = data
+        self._timestamps = timestamps
+        self._ticks = ticks
+        self._capacity = capacity
+        self._start = 0
+        self._count = keep
+
+    def _ordered(self, array: np.ndarray) -> np.ndarray:
+        end = self._start + self._count
+        if end <= self._capacity:
+            return array[self._start : end]
+        return np.concatenate((array[self._start :], array[: end - self._capacity]))
+
+    @property
+    def capacity(self) -> int:
+        """
+        Get the number of rows the buffer holds.
+
+        Returns:
+            int: The capacity in rows.
+        """
+        return self._capacity
+
+    @property
+    def columns(self) -> int:
+        """
+        Get the number of values per row.
+
+        Returns:
+            int: The number of columns.
+        """
+        return int(self._data.shape[1])
+
+    @property
+    def overwritten_rows(self) -> int:
+        """
+        Get the number of rows overwritten because the buffer was full.
+
+        Returns:
+            int: The number of overwritten rows.
+        """
+        return self._overwritten_rows
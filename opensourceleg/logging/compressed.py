@@ -0,0 +1,459 @@
+"""
+Compressed log module for opensourceleg library.
+
+Module Overview:
+
+This module defines a compressed, seekable log format for tracked variables. Each batch of rows
+is encoded as CSV text and compressed as an independent frame, so a reader can decompress any
+frame on its own. Every frame header records the time range and number of rows it covers, and
+an index of all frames is appended when the file is closed, so a reader can find the frames
+for a time range without decompressing the rest of the file. If the file was not closed
+cleanly, the index is rebuilt by walking the frame headers.
+
+The codec is chosen from what is installed: zstandard, then lz4, then zlib from the standard library.
+
+File Layout:
+
+    header: magic "OSLC" | version (uint8) | codec (uint8) | columns length (uint32) | columns (CSV text)
+    frame:  magic "OSLF" | compressed length (uint32) | raw length (uint32) | CRC-32 of compressed data (uint32)
+            | start time ns (int64) | end time ns (int64) | rows (uint32) | compressed data
+    footer: index entries (one per frame) | index offset (uint64) | magic "OSLX"
+
+Key Classes:
+
+- `Compression`: Enum of the supported codecs.
+- `CompressedLogWriter`: Appends rows to a compressed log file, one frame per batch.
+- `CompressedLogReader`: Reads frames, or the rows within a time range, from a compressed log file.
+- `FrameInfo`: Location, size, and time range of one frame.
+
+Usage Guide:
+
+1. Create a `CompressedLogWriter` with a file path and the column names, and call `write_rows`.
+2. Call `close` to append the frame index.
+3. Open the file with `CompressedLogReader` and call `read_range` or `read_all`.
+"""
+
+import csv
+import io
+import os
+import struct
+import time
+import zlib
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Optional
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+__all__ = [
+    "CompressedLogReader",
+    "CompressedLogWriter",
+    "Compression",
+    "FrameInfo",
+    "available_compression",
+]
+
+_FILE_MAGIC = b"OSLC"
+_FRAME_MAGIC = b"OSLF"
+_INDEX_MAGIC = b"OSLX"
+_VERSION = 1
+
+_FILE_HEADER = struct.Struct("<4sBBI")
+_FRAME_HEADER = struct.Struct("<4sIIIqqI")
+_INDEX_ENTRY = struct.Struct("<QIIqqI")
+_INDEX_TRAILER = struct.Struct("<Q4s")
+
+
+class Compression(Enum):
+    """
+    Enum for the codecs supported by the compressed log format.
+
+    Attributes:
+        ZSTD: Zstandard, from the optional `zstandard` package.
+        LZ4: LZ4 frames, from the optional `lz4` package.
+        ZLIB: Deflate, from the standard library. Always available.
+    """
+
+    ZSTD = 1
+    LZ4 = 2
+    ZLIB = 3
+
+
+def available_compression() -> Compression:
+    """
+    Get the preferred codec that is installed.
+
+    Returns:
+        Compression: ZSTD if `zstandard` is installed, otherwise LZ4 if `lz4` is installed, otherwise ZLIB.
+    """
+    if zstandard is not None:
+        return Compression.ZSTD
+    if lz4_frame is not None:
+        return Compression.LZ4
+    return Compression.ZLIB
+
+
+def _compress(codec: Compression, data: bytes) -> bytes:
+    if codec == Compression.ZSTD:
+        return zstandard.ZstdCompressor(level=3).compress(data)  # type: ignore[no-any-return]
+    if codec == Compression.LZ4:
+        return lz4_frame.compress(data)  # type: ignore[no-any-return]
+    return zlib.compress(data, 6)
+
+
+def _decompress(codec: Compression, data: bytes, raw_length: int) -> bytes:
+    if codec == Compression.ZSTD:
+        if zstandard is None:
+            raise ImportError("The zstandard package is required to read this log.")
+        return zstandard.ZstdDecompressor().decompress(data, max_output_size=raw_length)  # type: ignore[no-any-return]
+    if codec == Compression.LZ4:
+        if lz4_frame is None:
+            raise ImportError("The lz4 package is required to read this log.")
+        return lz4_frame.decompress(data)  # type: ignore[no-any-return]
+    return zlib.decompress(data)
+
+
+def _encode_rows(rows: Iterable[Sequence[Any]]) -> tuple[bytes, int]:
+    text = io.StringIO()
+    writer = csv.writer(text)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return text.getvalue().encode("utf-8"), count
+
+
+@dataclass(frozen=True)
+class FrameInfo:
+    """
+    Location, size, and time range of one frame in a compressed log file.
+
+    Attributes:
+        offset (int): The file offset of the compressed data.
+        compressed_length (int): The size of the compressed data in bytes.
+        raw_length (int): The size of the decompressed data in bytes.
+        start_ns (int): The time of the first row in the frame, in nanoseconds.
+        end_ns (int): The time of the last row in the frame, in nanoseconds.
+        rows (int): The number of rows in the frame.
+    """
+
+    offset: int
+    compressed_length: int
+    raw_length: int
+    start_ns: int
+    end_ns: int
+    rows: int
+
+
+class CompressedLogWriter:
+    """
+    Appends rows to a compressed log file as independent, seekable frames.
+
+    Each call to `write_rows` produces one frame. If the caller does not give the time range
+    of the rows, the frame covers the time from the end of the previous frame until the call.
+
+    Args:
+        path (str): The path of the log file. Existing files are overwritten.
+        names (Sequence[str]): The column names.
+        codec (Optional[Compression]): The codec to use. Defaults to the best installed codec.
+
+    Examples:
+        >>> writer = CompressedLogWriter("./log.clog", ["time", "position"])
+        >>> writer.write_rows([[0.0, 1.5], [0.01, 1.6]])
+        >>> writer.close()
+    """
+
+    def __init__(self, path: str, names: Sequence[str], codec: Optional[Compression] = None) -> None:
+        self._path = path
+        self._codec: Compression = codec or available_compression()
+        if self._codec == Compression.ZSTD and zstandard is None:
+            raise ImportError("The zstandard package is required for ZSTD compression.")
+        if self._codec == Compression.LZ4 and lz4_frame is None:
+            raise ImportError("The lz4 package is required for LZ4 compression.")
+
+        self._frames: list[FrameInfo] = []
+        self._last_end_ns: int = time.monotonic_ns()
+        self._raw_bytes: int = 0
+        self._compressed_bytes: int = 0
+
+        columns, _ = _encode_rows([names])
+        self._file: Optional[Any] = open(path, "wb")
+        self._file.write(_FILE_HEADER.pack(_FILE_MAGIC, _VERSION, self._codec.value, len(columns)) + columns)
+
+    def __repr__(self) -> str:
+        return f"CompressedLogWriter(path={self._path}, codec={self._codec.name}, frames={len(self._frames)})"
+
+    def write_rows(
+        self,
+        rows: Iterable[Sequence[Any]],
+        start_ns: Optional[int] = None,
+        end_ns: Optional[int] = None,
+    ) -> None:
+        """
+        Compress rows into one frame and append it to the file.
+
+        Args:
+            rows (Iterable[Sequence[Any]]): The rows to append.
+            start_ns (Optional[int]): The time of the first row in nanoseconds. Defaults to the end of the
+                previous frame.
+            end_ns (Optional[int]): The time of the last row in nanoseconds. Defaults to `time.monotonic_ns()`.
+        """
+        if self._file is None:
+            raise ValueError(f"Compressed log {self._path} is closed")
+
+        raw, count = _encode_rows(rows)
+        if not count:
+            return
+
+        end_ns = time.monotonic_ns() if end_ns is None else end_ns
+        start_ns = self._last_end_ns if start_ns is None else start_ns
+        self._last_end_ns = end_ns
+
+        compressed = _compress(self._codec, raw)
+        header = _FRAME_HEADER.pack(
+            _FRAME_MAGIC, len(compressed), len(raw), zlib.crc32(compressed), start_ns, end_ns, count
+        )
+        self._file.write(header)
+        self._frames.append(FrameInfo(self._file.tell(), len(compressed), len(raw), start_ns, end_ns, count))
+        self._file.write(compressed)
+        self._file.flush()
+
+        self._raw_bytes += len(raw)
+        self._compressed_bytes += len(compressed)
+
+    def sync(self) -> None:
+        """
+        Flush written frames and sync them to disk.
+        """
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """
+        Append the frame index and close the file.
+        """
+        if self._file is None:
+            return
+
+        index_offset = self._file.tell()
+        for frame in self._frames:
+            self._file.write(
+                _INDEX_ENTRY.pack(
+                    frame.offset, frame.compressed_length, frame.raw_length, frame.start_ns, frame.end_ns, frame.rows
+                )
+            )
+        self._file.write(_INDEX_TRAILER.pack(index_offset, _INDEX_MAGIC))
+        self._file.close()
+        self._file = None
+
+    @property
+    def path(self) -> str:
+        """
+        Get the path of the log file.
+
+        Returns:
+            str: The file path.
+        """
+        return self._path
+
+    @property
+    def codec(self) -> Compression:
+        """
+        Get the codec used to compress frames.
+
+        Returns:
+            Compression: The codec.
+        """
+        return self._codec
+
+    @property
+    def compression_ratio(self) -> float:
+        """
+        Get the ratio of raw to compressed bytes written so far.
+
+        Returns:
+            float: The compression ratio, or 0.0 if nothing has been written.
+        """
+        return self._raw_bytes / self._compressed_bytes if self._compressed_bytes else 0.0
+
+
+class CompressedLogReader:
+    """
+    Reads frames from a compressed log file written by `CompressedLogWriter`.
+
+    Opening the file reads only the header and the frame index. Frames are decompressed on demand.
+
+    Args:
+        path (str): The path of the log file.
+
+    Raises:
+        ValueError: If the file is not a compressed log file.
+
+    Examples:
+        >>> reader = CompressedLogReader("./log.clog")
+        >>> reader.columns
+        ['time', 'position']
+        >>> rows = reader.read_range(start_ns, end_ns)
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        with open(path, "rb") as f:
+            data = f.read(_FILE_HEADER.size)
+            if len(data) < _FILE_HEADER.size:
+                raise ValueError(f"{path} is not a compressed log file")
+            magic, _, codec, columns_length = _FILE_HEADER.unpack(data)
+            if magic != _FILE_MAGIC:
+                raise ValueError(f"{path} is not a compressed log file")
+
+            self._codec = Compression(codec)
+            columns = f.read(columns_length).decode("utf-8")
+            self._columns: list[str] = next(csv.reader(io.StringIO(columns)), [])
+            self._data_offset = f.tell()
+            self._frames = self._read_index(f) or self._scan_frames(f)
+
+    def __repr__(self) -> str:
+        return f"CompressedLogReader(path={self._path}, frames={len(self._frames)})"
+
+    def _read_index(self, f: Any) -> list[FrameInfo]:
+        end = f.seek(0, 2)
+        if end - self._data_offset < _INDEX_TRAILER.size:
+            return []
+
+        f.seek(end - _INDEX_TRAILER.size)
+        index_offset, magic = _INDEX_TRAILER.unpack(f.read(_INDEX_TRAILER.size))
+        index_length = end - _INDEX_TRAILER.size - index_offset
+        if magic != _INDEX_MAGIC or index_offset < self._data_offset or index_length % _INDEX_ENTRY.size:
+            return []
+
+        f.seek(index_offset)
+        data = f.read(index_length)
+        return [FrameInfo(*entry) for entry in _INDEX_ENTRY.iter_unpack(data)]
+
+    def _scan_frames(self, f: Any) -> list[FrameInfo]:
+        # Rebuild the index from the frame headers of a file that was not closed cleanly
+        frames = []
+        end = f.seek(0, 2)
+        offset = self._data_offset
+        while offset + _FRAME_HEADER.size <= end:
+            f.seek(offset)
+            magic, compressed_length, raw_length, _, start_ns, end_ns, rows = _FRAME_HEADER.unpack(
+                f.read(_FRAME_HEADER.size)
+            )
+            data_offset = offset + _FRAME_HEADER.size
+            if magic != _FRAME_MAGIC or data_offset + compressed_length > end:
+                break
+            frames.append(FrameInfo(data_offset, compressed_length, raw_length, start_ns, end_ns, rows))
+            offset = data_offset + compressed_length
+        return frames
+
+    def read_frame(self, index: int) -> list[list[str]]:
+        """
+        Decompress one frame.
+
+        Args:
+            index (int): The index of the frame.
+
+        Returns:
+            list[list[str]]: The rows in the frame.
+
+        Raises:
+            ValueError: If the frame fails its checksum.
+        """
+        frame = self._frames[index]
+        with open(self._path, "rb") as f:
+            f.seek(frame.offset - _FRAME_HEADER.size)
+            header = _FRAME_HEADER.unpack(f.read(_FRAME_HEADER.size))
+            compressed = f.read(frame.compressed_length)
+
+        if zlib.crc32(compressed) != header[3]:
+            raise ValueError(f"Frame {index} of {self._path} is corrupt")
+
+        raw = _decompress(self._codec, compressed, frame.raw_length)
+        return list(csv.reader(io.StringIO(raw.decode("utf-8"))))
+
+    def iter_frames(self, start_ns: Optional[int] = None, end_ns: Optional[int] = None) -> Iterator[list[list[str]]]:
+        """
+        Decompress the frames that overlap a time range, one at a time.
+
+        Args:
+            start_ns (Optional[int]): The start of the range in nanoseconds. Defaults to the start of the file.
+            end_ns (Optional[int]): The end of the range in nanoseconds. Defaults to the end of the file.
+
+        Yields:
+            list[list[str]]: The rows of each frame.
+        """
+        for index, frame in enumerate(self._frames):
+            if start_ns is not None and frame.end_ns < start_ns:
+                continue
+            if end_ns is not None and frame.start_ns > end_ns:
+                continue
+            yield self.read_frame(index)
+
+    def read_range(self, start_ns: Optional[int] = None, end_ns: Optional[int] = None) -> list[list[str]]:
+        """
+        Read the rows of every frame that overlaps a time range.
+
+        Only the overlapping frames are decompressed. Rows are returned whole frames at a time, so
+        the first and last frames may include rows just outside the range.
+
+        Args:
+            start_ns (Optional[int]): The start of the range in nanoseconds. Defaults to the start of the file.
+            end_ns (Optional[int]): The end of the range in nanoseconds. Defaults to the end of the file.
+
+        Returns:
+            list[list[str]]: The rows.
+        """
+        rows = []
+        for frame_rows in self.iter_frames(start_ns, end_ns):
+            rows.extend(frame_rows)
+        return rows
+
+    def read_all(self) -> list[list[str]]:
+        """
+        Read every row in the file.
+
+        Returns:
+            list[list[str]]: The rows.
+        """
+        return self.read_range()
+
+    @property
+    def columns(self) -> list[str]:
+        """
+        Get the column names.
+
+        Returns:
+            list[str]: The column names.
+        """
+        return list(self._columns)
+
+    @property
+    def codec(self) -> Compression:
+        """
+        Get the codec the file was written with.
+
+        Returns:
+            Compression: The codec.
+        """
+        return self._codec
+
+    @property
+    def frames(self) -> list[FrameInfo]:
+        """
+        Get the frame index.
+
+        Returns:
+            list[FrameInfo]: One entry per frame, in file order.
+        """
+        return list(self._frames)
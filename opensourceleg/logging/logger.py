@@ -13,6 +13,42 @@ Key Classes:
   setting different logging levels for file and stream handlers.
 - `LOGGER`: Global instance of the `Logger` class that can be used throughout.
 
+Asynchronous Writing:
+
+When `async_writer` is enabled, rows are handed off to a `BackgroundWriter` (see
+`opensourceleg.logging.writer`) instead of being written on the thread that calls `update`.
+The writer thread formats, writes and syncs the rows to disk, and `close` drains it.
+
+Timestamp Columns:
+
+When `timestamp_columns` is enabled, every row starts with a `timestamp_ns` column holding
+`time.monotonic_ns()` and a `tick` column holding the index of the `update` call since the
+last reset. Both are captured once per `update` and written by every data format.
+
+Decimation:
+
+A variable tracked with `decimation=N` is only read on every Nth `update`. On the other ticks
+its cell is left empty in CSV files and NaN in numeric formats, and ticks on which no variable
+is due do not produce a row at all.
+
+Attribute Tracking:
+
+`track_attributes` tracks several attributes of one object at once. Consecutive attributes of
+the same object with the same decimation are read with a single `operator.attrgetter` call per
+tick, and are only read one by one, with per-variable error handling, when that call raises.
+
+Live Telemetry:
+
+When `telemetry_name` is set, every row is also published into a shared memory ring buffer
+(see `opensourceleg.logging.telemetry`) that other processes can poll with a `TelemetryReader`
+without locks. The ring is recreated under the same name whenever the tracked variables change.
+
+Hot Path Messages:
+
+Messages logged at a level that is disabled return before any locking or formatting. Use
+`%`-style arguments or a `LazyMessage` to defer building the text until a handler emits the
+record, and `log_rate_limited` for messages that may repeat on every iteration of a control loop.
+
 Usage Guide:
 
 1. Create an instance of the `Logger` class.
@@ -26,16 +62,34 @@ Usage Guide:
 import contextlib
 import csv
 import logging
+import operator
 import os
+import sys
 import threading
+import time
 from builtins import open  # noqa: UP029
 from collections import deque
+from collections.abc import Hashable, Sequence
 from datetime import datetime
 from enum import Enum
+from functools import partial
+from itertools import repeat
 from logging.handlers import RotatingFileHandler
 from typing import Any, Callable, Optional, Union
 
-__all__ = ["LOGGER", "LogLevel", "Logger"]
+import numpy as np
+
+from opensourceleg.logging.binary import BinaryLogWriter
+from opensourceleg.logging.buffers import ArrayRingBuffer
+from opensourceleg.logging.compressed import CompressedLogWriter
+from opensourceleg.logging.segments import SegmentWriter
+from opensourceleg.logging.telemetry import TelemetryPublisher
+from opensourceleg.logging.writer import BackgroundWriter, BackpressurePolicy
+
+__all__ = ["LOGGER", "BufferBackend", "DataFormat", "LazyMessage", "LogLevel", "Logger"]
+
+# Marks a value that could not be read in the slow path of a fused read
+_READ_FAILED = object()
 
 
 class LogLevel(Enum):
@@ -57,6 +111,71 @@ class LogLevel(Enum):
     CRITICAL = logging.CRITICAL
 
 
+class DataFormat(Enum):
+    """
+    Enum for the file formats used by the Logger class to record tracked variables.
+
+    Attributes:
+        CSV: Comma-separated text, one row per update.
+        BINARY: Typed, fixed-width records in a NumPy `.npy` file (see `opensourceleg.logging.binary`).
+        SEGMENTED: Checksummed, append-only `.seg` files that survive crashes and rotate by size or age
+            (see `opensourceleg.logging.segments`).
+        COMPRESSED: A `.clog` file of independently compressed, time-indexed frames, one per flush
+            (see `opensourceleg.logging.compressed`). Use it with `async_writer=True` so that compression
+            runs on the writer thread rather than the control thread.
+    """
+
+    CSV = "csv"
+    BINARY = "binary"
+    SEGMENTED = "segmented"
+    COMPRESSED = "compressed"
+
+
+class BufferBackend(Enum):
+    """
+    Enum for the storage used by the Logger class to buffer tracked values between flushes.
+
+    Attributes:
+        DEQUE: A deque of Python lists. Values of any type are kept as they are.
+        NUMPY: A preallocated float64 array with a timestamp column (see `opensourceleg.logging.buffers`).
+            Values are stored without per-sample allocation; values that are not numeric are stored as NaN.
+    """
+
+    DEQUE = "deque"
+    NUMPY = "numpy"
+
+
+class LazyMessage:
+    """
+    Log message whose text is only built when a handler formats the record.
+
+    The function is called with the given arguments each time the message is converted to a string,
+    so messages at disabled levels, or suppressed by `Logger.log_rate_limited`, cost no formatting.
+
+    Args:
+        func (Callable[..., object]): Function that builds the message.
+        *args (Any): Positional arguments passed to `func`.
+        **kwargs (Any): Keyword arguments passed to `func`.
+
+    Examples:
+        >>> LOGGER.debug(LazyMessage("Joint state: {}".format, joint.describe()))
+        >>> LOGGER.debug(LazyMessage(np.array2string, data, precision=3))
+    """
+
+    __slots__ = ("_args", "_func", "_kwargs")
+
+    def __init__(self, func: Callable[..., object], *args: Any, **kwargs: Any) -> None:
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+
+    def __str__(self) -> str:
+        return str(self._func(*self._args, **self._kwargs))
+
+    def __repr__(self) -> str:
+        return f"LazyMessage({self._func!r})"
+
+
 class Logger(logging.Logger):
     """
     Represents a custom singleton logger class that extends the built-in Python logger. The logger provides additional
@@ -73,6 +192,14 @@ class Logger(logging.Logger):
         file_name (Union[str, None]): The base name for the log file.
         buffer_size (int): The maximum number of log entries to buffer before writing to the CSV file.
         enable_csv_logging (bool): Whether to enable CSV logging.
+        async_writer (bool): Whether to write CSV rows from a background writer thread.
+        async_queue_size (int): The maximum number of rows queued for the background writer.
+        backpressure_policy (BackpressurePolicy): What to do when the background writer queue is full.
+        data_format (DataFormat): The file format used to record tracked variables.
+        buffer_backend (BufferBackend): The storage used to buffer tracked values between flushes.
+        timestamp_columns (bool): Whether to prefix each row with `timestamp_ns` and `tick` columns.
+        segment_max_seconds (float): The maximum age of a segment in seconds before rotation when using the
+            SEGMENTED data format. Segments also rotate at `file_max_bytes`. 0 disables.
 
     Properties:
         - **file_path**: The path to the log file.
@@ -83,10 +210,24 @@ class Logger(logging.Logger):
         - **file_backup_count**: The number of backup log files to keep.
         - **csv_logging_enabled**: Whether CSV logging is enabled.
         - **tracked_variable_count**: The number of currently tracked variables.
+        - **async_writer_enabled**: Whether rows are written from a background writer thread.
+        - **dropped_rows**: The number of rows dropped by the background writer.
+        - **failed_rows**: The number of rows lost because they failed to write.
+        - **data_format**: The file format used to record tracked variables.
+        - **binary_path**: The path to the binary data file.
+        - **segment_base_path**: The path prefix of the segment files.
+        - **compressed_path**: The path to the compressed data file.
+        - **buffer_backend**: The storage used to buffer tracked values between flushes.
+        - **timestamp_columns_enabled**: Whether rows are prefixed with `timestamp_ns` and `tick` columns.
 
     Methods:
         - **track_variable**: Track a variable for logging.
+        - **track_attributes**: Track several attributes of an object with a single fused getter.
         - **flush_buffer**: Write the buffered log entries to the CSV file.
+        - **set_async_writer**: Enable or disable the background writer thread.
+        - **set_data_format**: Set the file format used to record tracked variables.
+        - **set_buffer_backend**: Set the storage used to buffer tracked values between flushes.
+        - **set_timestamp_columns**: Enable or disable the `timestamp_ns` and `tick` columns.
         - **reset**: Reset the logger state.
         - **close**: Close the logger and flush any remaining log entries.
         - **debug**: Log a debug message.
@@ -136,6 +277,15 @@ class Logger(logging.Logger):
         file_name: Union[str, None] = None,
         buffer_size: int = 1000,
         enable_csv_logging: bool = True,
+        async_writer: bool = False,
+        async_queue_size: int = 10000,
+        backpressure_policy: BackpressurePolicy = BackpressurePolicy.BLOCK,
+        data_format: DataFormat = DataFormat.CSV,
+        buffer_backend: BufferBackend = BufferBackend.DEQUE,
+        timestamp_columns: bool = False,
+        segment_max_seconds: float = 0,
+        telemetry_name: Optional[str] = None,
+        telemetry_capacity: int = 1024,
     ) -> None:
         """
         Initialize the Logger instance.
@@ -152,6 +302,15 @@ class Logger(logging.Logger):
             file_name (Union[str, None]): Optional user-specified file name prefix.
             buffer_size (int): Maximum number of log records to buffer before writing to CSV.
             enable_csv_logging (bool): Whether to enable CSV logging.
+            async_writer (bool): Whether to write CSV rows from a background writer thread.
+            async_queue_size (int): Maximum number of rows queued for the background writer.
+            backpressure_policy (BackpressurePolicy): What to do when the background writer queue is full.
+            data_format (DataFormat): The file format used to record tracked variables.
+            buffer_backend (BufferBackend): The storage used to buffer tracked values between flushes.
+            timestamp_columns (bool): Whether to prefix each row with `timestamp_ns` and `tick` columns.
+            segment_max_seconds (float): The maximum age of a segment in seconds before rotation. 0 disables.
+            telemetry_name (Optional[str]): Name of the shared memory block to publish rows into. None disables.
+            telemetry_capacity (int): Number of rows held in the telemetry ring buffer.
         """
         with self._lock:
             if not hasattr(self, "_initialized"):
@@ -167,6 +326,10 @@ class Logger(logging.Logger):
 
                 self._file_path: str = ""
                 self._csv_path: str = ""
+                self._binary_path: str = ""
+                self._segment_base_path: str = ""
+                self._compressed_path: str = ""
+                self._data_file_index: int = 0  # Suffix of the current data file, 0 for none
                 self._file: Optional[Any] = None
                 self._writer = None
                 self._is_logging = False
@@ -177,8 +340,42 @@ class Logger(logging.Logger):
                 self._buffer: deque = deque(maxlen=buffer_size)
                 self._buffer_size: int = buffer_size
                 self._error_count: dict[int, int] = {}  # Track errors per variable
+                self._decimation: dict[int, int] = {}  # Read every Nth update per variable
+                self._attributes: dict[int, tuple[Any, str]] = {}  # Object and attribute per fusable variable
+                self._failing: set[int] = set()  # Variables with a nonzero error count
+                self._plan: list[tuple[int, tuple[int, ...], Callable[[], Any], int, bool]] = []
+                self._decimations: list[int] = []
                 self._max_errors_before_untrack: int = 5  # Auto-untrack after this many errors
 
+                self._file_lock = threading.Lock()  # Serializes CSV writes between threads
+                self._async_enabled: bool = async_writer
+                self._async_queue_size: int = async_queue_size
+                self._backpressure_policy: BackpressurePolicy = backpressure_policy
+                self._async_writer: Optional[BackgroundWriter] = None
+                self._dropped_rows: int = 0
+                self._failed_rows: int = 0
+
+                self._data_format: DataFormat = data_format
+                self._binary_writer: Optional[BinaryLogWriter] = None
+                self._segment_writer: Optional[SegmentWriter] = None
+                self._segment_max_seconds: float = segment_max_seconds
+                self._compressed_writer: Optional[CompressedLogWriter] = None
+
+                self._buffer_backend: BufferBackend = buffer_backend
+                self._array_buffer: Optional[ArrayRingBuffer] = None
+                if buffer_backend == BufferBackend.NUMPY:
+                    self._array_buffer = ArrayRingBuffer(capacity=buffer_size)
+
+                self._timestamp_columns: bool = timestamp_columns
+                self._tick: int = 0
+
+                self._telemetry_name: Optional[str] = telemetry_name
+                self._telemetry_capacity: int = telemetry_capacity
+                self._telemetry: Optional[TelemetryPublisher] = None
+
+                # Window start, messages emitted and messages suppressed per rate-limited call site
+                self._rate_limits: dict[Hashable, list] = {}
+
                 try:
                     self._setup_logging()
                     self._initialized: bool = True
@@ -195,6 +392,12 @@ class Logger(logging.Logger):
                 self.set_buffer_size(buffer_size)
                 self._enable_csv_logging = enable_csv_logging
                 self._log_path = log_path
+                self.set_async_writer(async_writer, async_queue_size, backpressure_policy)
+                self.set_data_format(data_format)
+                self.set_buffer_backend(buffer_backend)
+                self.set_timestamp_columns(timestamp_columns)
+                self._segment_max_seconds = segment_max_seconds
+                self.set_telemetry(telemetry_name, telemetry_capacity)
 
     def _setup_logging(self) -> None:
         """
@@ -211,6 +414,19 @@ class Logger(logging.Logger):
                 self._stream_handler.setFormatter(fmt=self._std_formatter)
                 self.addHandler(hdlr=self._stream_handler)
 
+    def setLevel(self, level: Union[int, str]) -> None:
+        """
+        Set the logger level.
+
+        The Logger is not registered with the logging manager, so the level cache used by
+        `isEnabledFor` is cleared here rather than by the manager.
+
+        Args:
+            level (Union[int, str]): The new level.
+        """
+        super().setLevel(level)
+        self._cache.clear()  # type: ignore[attr-defined]
+
     def set_stream_terminator(self, terminator: str) -> None:
         """
         Set the terminator for the stream handler.
@@ -246,17 +462,24 @@ class Logger(logging.Logger):
         """
         Ensure that the file handler is set up.
         """
+        # Checked without the lock first so that logging calls after setup never contend for it
+        if hasattr(self, "_file_handler"):
+            return
         with self._lock:
             if not hasattr(self, "_file_handler"):
                 self._setup_file_handler()
 
-    def track_variable(self, var_func: Callable[[], Any], name: str) -> None:
+    def track_variable(self, var_func: Callable[[], Any], name: str, decimation: int = 1) -> None:
         """
         Record the value of a variable and log it to a CSV file.
 
+        Once a data file is open its columns are fixed, so tracking a new variable writes the buffered rows
+        to it and starts a new data file with a numbered suffix.
+
         Args:
             var_func: A function that returns the value of the variable.
             name: The name of the variable.
+            decimation: Read the variable on every Nth call to `update`. Defaults to 1 (every call).
 
         Examples:
             >>> class MyClass:
@@ -266,14 +489,96 @@ class Logger(logging.Logger):
             >>> LOGGER.track_variable(lambda: obj.value, "answer")
             >>> LOGGER.update()
             >>> LOGGER.flush_buffer()
+
+            >>> LOGGER.track_variable(lambda: obj.temperature, "temperature", decimation=100)
         """
         with self._lock:
+            if decimation < 1:
+                self.warning(f"Invalid decimation for {name}: {decimation}. Using 1.")
+                decimation = 1
+
             var_id = id(var_func)
+            if var_id not in self._tracked_vars:
+                self._start_new_data_file()
+                if self._array_buffer is not None:
+                    self._array_buffer.add_column()
             self._tracked_vars[var_id] = var_func
             self._var_names[var_id] = name
+            self._decimation[var_id] = decimation
             self._error_count[var_id] = 0  # Initialize error count
+            self._rebuild_plan()
             self.debug(f"Started tracking variable: {name}")
 
+    def track_attributes(self, obj: Any, names: Sequence[str], prefix: str = "", decimation: int = 1) -> None:
+        """
+        Track several attributes of an object, read with a single fused getter on every update.
+
+        Args:
+            obj: The object to read the attributes from.
+            names: The attribute names. Dotted names such as "joint.position" are supported.
+            prefix: A prefix added to each attribute name to form the column name. Defaults to "".
+            decimation: Read the attributes on every Nth call to `update`. Defaults to 1 (every call).
+
+        Examples:
+            >>> LOGGER.track_attributes(actuator, ["motor_position", "motor_current"], prefix="knee_")
+            >>> LOGGER.update()
+        """
+        with self._lock:
+            for name in names:
+                get_value = partial(operator.attrgetter(name), obj)
+                self._attributes[id(get_value)] = (obj, name)
+                self.track_variable(get_value, f"{prefix}{name}", decimation=decimation)
+
+    def _rebuild_plan(self) -> None:
+        """
+        Precompute the per-tick read plan from the tracked variables.
+
+        `update` walks this list instead of the tracking dictionaries, so it does not look up
+        names or decimation factors on every tick. Consecutive attributes of the same object with
+        the same decimation are merged into one entry with a fused `operator.attrgetter`.
+
+        Each entry is (first column, variable ids, getter, decimation, fused).
+        """
+        runs: list[list[int]] = []
+        for var_id in self._tracked_vars:
+            if runs and self._can_fuse(runs[-1][-1], var_id):
+                runs[-1].append(var_id)
+            else:
+                runs.append([var_id])
+
+        plan: list[tuple[int, tuple[int, ...], Callable[[], Any], int, bool]] = []
+        column = 0
+        for run in runs:
+            if len(run) == 1:
+                get_value = self._tracked_vars[run[0]]
+            else:
+                obj = self._attributes[run[0]][0]
+                get_value = partial(operator.attrgetter(*(self._attributes[var_id][1] for var_id in run)), obj)
+            plan.append((column, tuple(run), get_value, self._decimation.get(run[0], 1), len(run) > 1))
+            column += len(run)
+
+        self._plan = plan
+        self._decimations = sorted({entry[3] for entry in plan})
+        # The telemetry ring has one column per variable, so it is recreated on the next update
+        self._close_telemetry()
+
+    def _can_fuse(self, previous: int, var_id: int) -> bool:
+        """
+        Check whether a tracked variable can be read by the same fused getter as the one before it.
+
+        Args:
+            previous (int): The id of the previous tracked variable.
+            var_id (int): The id of the tracked variable.
+
+        Returns:
+            bool: True if both are attributes of the same object with the same decimation.
+        """
+        if previous not in self._attributes or var_id not in self._attributes:
+            return False
+        return self._attributes[previous][0] is self._attributes[var_id][0] and self._decimation.get(
+            previous, 1
+        ) == self._decimation.get(var_id, 1)
+
     def get_tracked_variables(self) -> list[tuple[str, Any]]:
         """
         Get a list of currently tracked variables and their current values.
@@ -331,7 +636,8 @@ class Logger(logging.Logger):
 
                 self._user_file_name = file_name
                 self._file_path = os.path.join(self._log_path, f"{file_name}.log")
-                self._csv_path = os.path.join(self._log_path, f"{file_name}.csv")
+                self._data_file_index = 0
+                self._set_data_paths(os.path.join(self._log_path, file_name))
 
                 # If we already have a file handler, we need to recreate it
                 if hasattr(self, "_file_handler"):
@@ -341,7 +647,7 @@ class Logger(logging.Logger):
                     self._setup_file_handler()
 
                 # Reset CSV file if it exists
-                if self._file:
+                if self._data_file_open():
                     self.close()
             except Exception as e:
                 self.error(f"Error setting file name: {e}")
@@ -413,6 +719,8 @@ class Logger(logging.Logger):
                 self.warning(f"Invalid buffer size: {buffer_size}. Using default of 1000.")
                 buffer_size = 1000
             self._buffer_size = buffer_size
+            if self._array_buffer is not None:
+                self._array_buffer.resize(buffer_size)
             # Create a new buffer with the updated size and copy over existing items
             old_buffer = list(self._buffer)
             self._buffer = deque(maxlen=buffer_size)
@@ -431,12 +739,134 @@ class Logger(logging.Logger):
                 self._enable_csv_logging = enable
                 if not enable:
                     self.flush_buffer()
-                    if self._file:
-                        self._file.close()
-                        self._file = None
-                        self._writer = None
+                    self._stop_async_writer()
+                    self._close_data_file()
                 self.debug(f"CSV logging {'enabled' if enable else 'disabled'}")
 
+    def set_async_writer(
+        self,
+        enable: bool,
+        queue_size: Optional[int] = None,
+        policy: Optional[BackpressurePolicy] = None,
+    ) -> None:
+        """
+        Enable or disable writing CSV rows from a background writer thread.
+
+        Any rows already buffered or queued are written out before the mode changes.
+
+        Args:
+            enable (bool): Whether to use the background writer thread.
+            queue_size (Optional[int]): Maximum number of rows queued for the writer thread.
+                Keeps the current value if None.
+            policy (Optional[BackpressurePolicy]): What to do when the queue is full.
+                Keeps the current value if None.
+
+        Examples:
+            >>> LOGGER.set_async_writer(True, queue_size=5000, policy=BackpressurePolicy.DROP_OLDEST)
+        """
+        with self._lock:
+            if queue_size is not None and queue_size <= 0:
+                self.warning(f"Invalid async queue size: {queue_size}. Using default of 10000.")
+                queue_size = 10000
+
+            self.flush_buffer()
+            self._stop_async_writer()
+
+            self._async_enabled = enable
+            if queue_size is not None:
+                self._async_queue_size = queue_size
+            if policy is not None:
+                self._backpressure_policy = policy
+
+    def set_data_format(self, data_format: DataFormat) -> None:
+        """
+        Set the file format used to record tracked variables.
+
+        Any rows already buffered are written to the current file, which is then closed.
+        The next flush opens a new file in the new format.
+
+        Args:
+            data_format (DataFormat): The file format.
+
+        Examples:
+            >>> LOGGER.set_data_format(DataFormat.BINARY)
+            >>> LOGGER.binary_path
+            "./my_log_file.npy"
+        """
+        with self._lock:
+            if self._data_format == data_format:
+                return
+
+            self.flush_buffer()
+            self._stop_async_writer()
+            self._close_data_file()
+            self._data_format = data_format
+
+    def set_buffer_backend(self, buffer_backend: BufferBackend) -> None:
+        """
+        Set the storage used to buffer tracked values between flushes.
+
+        Any rows already buffered are flushed first.
+
+        Args:
+            buffer_backend (BufferBackend): The buffer backend.
+
+        Examples:
+            >>> LOGGER.set_buffer_backend(BufferBackend.NUMPY)
+        """
+        with self._lock:
+            if self._buffer_backend == buffer_backend:
+                return
+
+            self.flush_buffer()
+            self._buffer.clear()
+            self._array_buffer = None
+            if buffer_backend == BufferBackend.NUMPY:
+                self._array_buffer = ArrayRingBuffer(capacity=self._buffer_size, columns=len(self._tracked_vars))
+            self._buffer_backend = buffer_backend
+
+    def set_timestamp_columns(self, enable: bool) -> None:
+        """
+        Enable or disable the `timestamp_ns` and `tick` columns at the start of each row.
+
+        Any rows already buffered are written to the current file, which is then closed so that
+        a new file with a numbered suffix gets a matching header.
+
+        Args:
+            enable (bool): Whether to write the timestamp and tick columns.
+
+        Examples:
+            >>> LOGGER.set_timestamp_columns(True)
+        """
+        with self._lock:
+            if self._timestamp_columns == enable:
+                return
+
+            self._start_new_data_file()
+            self._timestamp_columns = enable
+
+    def set_telemetry(self, name: Optional[str], capacity: int = 1024) -> None:
+        """
+        Enable or disable publishing rows into a shared memory ring buffer for live monitoring.
+
+        The ring is created on the next call to `update`. Other processes read it with
+        `TelemetryReader(name)`.
+
+        Args:
+            name (Optional[str]): Name of the shared memory block. None disables telemetry.
+            capacity (int): Number of rows held in the ring buffer. Defaults to 1024.
+
+        Examples:
+            >>> LOGGER.set_telemetry("osl")
+        """
+        with self._lock:
+            if name == self._telemetry_name and capacity == self._telemetry_capacity:
+                return
+
+            self._close_telemetry()
+            self._telemetry_name = name
+            self._telemetry_capacity = capacity
+
     def set_max_errors_before_untrack(self, max_errors: int) -> None:
         """
         Set the maximum number of errors before a variable is automatically untracked.
@@ -466,40 +896,287 @@ class Logger(logging.Logger):
             return
 
         with self._lock:
-            data = []
-            vars_to_untrack = []
+            # Binary files store typed values and the background writer formats rows itself,
+            # so only stringify here when writing CSV inline
+            stringify = self._data_format == DataFormat.CSV and not self._async_enabled
+
+            tick = self._tick
+            self._tick += 1
+            # Skip the row entirely when every variable is decimated away on this tick
+            if self._decimations[0] != 1 and all(tick % decimation for decimation in self._decimations):
+                return
+
+            # Telemetry publishes the raw values, so the row is only stringified after publishing
+            publish = self._telemetry_name is not None
+            data, row = self._begin_row(tick, stringify and not publish)
+            if row is None:
+                vars_to_untrack = self._read_into_list(tick, data, stringify and not publish)
+            else:
+                vars_to_untrack = self._read_into_row(tick, row)
 
-            for var_id, get_value in self._tracked_vars.items():
-                try:
+            if publish:
+                self._publish_telemetry(tick, data, row)
+                if stringify and row is None:
+                    data = ["" if value is None else str(value) for value in data]
+            if row is None:
+                self._buffer.append(data)
+
+            # Untrack variables with too many errors
+            for var_id in vars_to_untrack:
+                self._auto_untrack(var_id)
+
+            if len(self._pending_rows()) >= self._buffer_size:
+                self.flush_buffer()
+
+    def _read_into_list(self, tick: int, data: list[Any], stringify: bool) -> list[int]:
+        """
+        Read the variables that are due on this tick and append them to a row list.
+
+        CSV rows mark failed reads with "ERROR" and leave cells of variables that are not due empty. The
+        other formats store typed values, so both are recorded as NaN to keep the column numeric.
+
+        Args:
+            tick (int): The index of the current update.
+            data (list[Any]): The row to append values to.
+            stringify (bool): Whether to store values as strings.
+
+        Returns:
+            list[int]: The ids of variables that should be untracked after too many errors.
+        """
+        if self._data_format == DataFormat.CSV:
+            missing: Any = "" if stringify else None
+            failed_value: Any = "ERROR"
+        else:
+            missing = failed_value = np.nan
+        vars_to_untrack: list[int] = []
+
+        for _, var_ids, get_value, decimation, fused in self._plan:
+            if decimation != 1 and tick % decimation:
+                data.extend(repeat(missing, len(var_ids)))
+                continue
+
+            try:
+                if fused:
+                    values = get_value()
+                    data.extend(map(str, values) if stringify else values)
+                else:
                     value = get_value()
-                    data.append(str(value))
-                    # Reset error count on successful retrieval
-                    self._error_count[var_id] = 0
-                except Exception as e:
-                    var_name = self._var_names.get(var_id, "unknown")
-                    self.warning(f"Error getting value for {var_name}: {e}")
-                    data.append("ERROR")
+                    data.append(str(value) if stringify else value)
+            except Exception as e:
+                values, failed = self._handle_read_failure(var_ids, fused, e)
+                data.extend(failed_value if v is _READ_FAILED else (str(v) if stringify else v) for v in values)
+                vars_to_untrack += failed
+                continue
 
-                    # Increment error count and check if we should untrack
-                    self._error_count[var_id] = self._error_count.get(var_id, 0) + 1
-                    if self._error_count[var_id] >= self._max_errors_before_untrack:
-                        vars_to_untrack.append((var_id, var_name))
+            # Only variables that failed recently have an error count to reset
+            if self._failing:
+                self._clear_errors(var_ids)
 
-            # Only add data if we have variables to track
-            if data:
-                self._buffer.append(data)
+        return vars_to_untrack
 
-            # Untrack variables with too many errors
-            for var_id, var_name in vars_to_untrack:
-                self._tracked_vars.pop(var_id, None)
-                self._var_names.pop(var_id, None)
-                self._error_count.pop(var_id, None)
-                self.warning(
-                    f"Auto-untracked variable {var_name} after {self._max_errors_before_untrack} consecutive errors"
+    def _read_into_row(self, tick: int, row: np.ndarray) -> list[int]:
+        """
+        Read the variables that are due on this tick into a preallocated array row.
+
+        Cells of variables that are not due, failed, or are not numeric are left as NaN.
+
+        Args:
+            tick (int): The index of the current update.
+            row (np.ndarray): The row to write values into.
+
+        Returns:
+            list[int]: The ids of variables that should be untracked after too many errors.
+        """
+        vars_to_untrack: list[int] = []
+
+        for column, var_ids, get_value, decimation, fused in self._plan:
+            if decimation != 1 and tick % decimation:
+                continue
+
+            try:
+                if fused:
+                    self._store_values(row, column, get_value())
+                else:
+                    value = get_value()
+                    with contextlib.suppress(TypeError, ValueError):
+                        row[column] = value
+            except Exception as e:
+                values, failed = self._handle_read_failure(var_ids, fused, e)
+                self._store_values(row, column, values)
+                vars_to_untrack += failed
+                continue
+
+            # Only variables that failed recently have an error count to reset
+            if self._failing:
+                self._clear_errors(var_ids)
+
+        return vars_to_untrack
+
+    def _store_values(self, row: np.ndarray, column: int, values: Sequence[Any]) -> None:
+        """
+        Write consecutive values into an array row, leaving cells that cannot be stored as NaN.
+
+        Args:
+            row (np.ndarray): The row to write values into.
+            column (int): The column of the first value.
+            values (Sequence[Any]): The values to write.
+        """
+        try:
+            row[column : column + len(values)] = values
+        except (TypeError, ValueError):
+            for offset, value in enumerate(values):
+                if value is not _READ_FAILED:
+                    with contextlib.suppress(TypeError, ValueError):
+                        row[column + offset] = value
+
+    def _handle_read_failure(
+        self, var_ids: tuple[int, ...], fused: bool, error: Exception
+    ) -> tuple[list[Any], list[int]]:
+        """
+        Handle a plan entry whose getter raised.
+
+        A fused getter is retried one variable at a time so that only the variables that fail are lost.
+
+        Args:
+            var_ids (tuple[int, ...]): The ids of the variables in the plan entry.
+            fused (bool): Whether the entry was read with a fused getter.
+            error (Exception): The exception raised by the getter.
+
+        Returns:
+            tuple[list[Any], list[int]]: The values read, with failed reads marked, and the ids of
+                variables that should be untracked after too many errors.
+        """
+        if not fused:
+            return [_READ_FAILED], [var_ids[0]] if self._record_read_error(var_ids[0], error) else []
+
+        values: list[Any] = []
+        vars_to_untrack = []
+        for var_id in var_ids:
+            try:
+                values.append(self._tracked_vars[var_id]())
+            except Exception as e:
+                values.append(_READ_FAILED)
+                if self._record_read_error(var_id, e):
+                    vars_to_untrack.append(var_id)
+            else:
+                self._clear_errors((var_id,))
+        return values, vars_to_untrack
+
+    def _clear_errors(self, var_ids: tuple[int, ...]) -> None:
+        """
+        Reset the error counts of variables that were read successfully.
+
+        Args:
+            var_ids (tuple[int, ...]): The ids of the variables.
+        """
+        for var_id in var_ids:
+            if var_id in self._failing:
+                self._failing.discard(var_id)
+                self._error_count[var_id] = 0
+
+    def _begin_row(self, tick: int, stringify: bool) -> tuple[list[Any], Optional[np.ndarray]]:
+        """
+        Start a new row, capturing the timestamp once for the whole row.
+
+        Args:
+            tick (int): The index of the current update.
+            stringify (bool): Whether values in the row are stored as strings.
+
+        Returns:
+            tuple[list[Any], Optional[np.ndarray]]: The list to append values to, and with the numpy
+                backend the preallocated row to write values into instead.
+        """
+        # With the numpy backend values are written straight into a preallocated row
+        if self._array_buffer is not None:
+            return [], self._array_buffer.next_row(time.monotonic_ns(), tick)
+
+        if not self._timestamp_columns:
+            return [], None
+
+        timestamp_ns = time.monotonic_ns()
+        return ([str(timestamp_ns), str(tick)] if stringify else [timestamp_ns, tick]), None
+
+    def _publish_telemetry(self, tick: int, data: list[Any], row: Optional[np.ndarray]) -> None:
+        """
+        Publish the values of the current row into the telemetry ring, creating the ring if needed.
+
+        Args:
+            tick (int): The index of the current update.
+            data (list[Any]): The row list, used when there is no array row.
+            row (Optional[np.ndarray]): The array row with the numpy backend.
+        """
+        if self._telemetry is None:
+            try:
+                self._telemetry = TelemetryPublisher(
+                    self._telemetry_name,  # type: ignore[arg-type]
+                    list(self._var_names.values()),
+                    self._telemetry_capacity,
                 )
+            except (OSError, ValueError) as e:
+                self.error(f"Failed to create telemetry ring {self._telemetry_name}, disabling telemetry: {e}")
+                self._telemetry_name = None
+                return
 
-            if len(self._buffer) >= self._buffer_size:
-                self.flush_buffer()
+        if row is not None:
+            self._telemetry.publish(row, tick=tick)
+        else:
+            self._telemetry.publish(data[2:] if self._timestamp_columns else data, tick=tick)
+
+    def _close_telemetry(self) -> None:
+        """
+        Close the telemetry ring, if one is open.
+        """
+        if self._telemetry is not None:
+            self._telemetry.close()
+            self._telemetry = None
+
+    def _record_read_error(self, var_id: int, error: Exception) -> bool:
+        """
+        Log a failed read of a tracked variable and count it towards auto-untracking.
+
+        Args:
+            var_id (int): The id of the tracked variable.
+            error (Exception): The exception raised while reading the variable.
+
+        Returns:
+            bool: True if the variable has failed too many times in a row and should be untracked.
+        """
+        var_name = self._var_names.get(var_id, "unknown")
+        self.warning(f"Error getting value for {var_name}: {error}")
+
+        # Increment error count and check if we should untrack
+        self._error_count[var_id] = self._error_count.get(var_id, 0) + 1
+        self._failing.add(var_id)
+        return self._error_count[var_id] >= self._max_errors_before_untrack
+
+    def _auto_untrack(self, var_id: int) -> None:
+        """
+        Stop tracking a variable that failed too many times in a row.
+
+        Args:
+            var_id (int): The id of the tracked variable.
+        """
+        var_name = self._var_names.get(var_id, "unknown")
+        self._start_new_data_file()
+        if self._array_buffer is not None:
+            self._array_buffer.remove_column(list(self._tracked_vars).index(var_id))
+        self._tracked_vars.pop(var_id, None)
+        self._var_names.pop(var_id, None)
+        self._decimation.pop(var_id, None)
+        self._attributes.pop(var_id, None)
+        self._failing.discard(var_id)
+        self._error_count.pop(var_id, None)
+        self._rebuild_plan()
+        self.warning(f"Auto-untracked variable {var_name} after {self._max_errors_before_untrack} consecutive errors")
+
+    def _pending_rows(self) -> Any:
+        """
+        Get the buffer that holds rows waiting to be flushed for the active buffer backend.
+
+        Returns:
+            Any: The deque or `ArrayRingBuffer` in use.
+        """
+        return self._array_buffer if self._array_buffer is not None else self._buffer
 
     def flush_buffer(self) -> None:
         """
@@ -507,55 +1184,306 @@ class Logger(logging.Logger):
 
         Ensures that the file handler is available, writes the header if not yet written,
         writes all buffered rows to the CSV, clears the buffer, and flushes the file.
+        If the background writer is enabled, the rows are handed off to the writer thread instead.
         """
-        if not self._buffer or not self._enable_csv_logging:
+        buffer = self._pending_rows()
+        if not len(buffer) or not self._enable_csv_logging:
             return
 
         with self._lock:
             try:
                 self._ensure_file_handler()
+                rows = self._array_rows(buffer) if isinstance(buffer, ArrayRingBuffer) else buffer
 
-                if self._file is None:
-                    try:
-                        self._file = open(self._csv_path, "w", newline="")
-                        self._writer = csv.writer(self._file)  # type: ignore[assignment]
-                    except Exception as e:
-                        self.error(f"Failed to open CSV file {self._csv_path}: {e}")
-                        # Clear buffer to prevent memory buildup
-                        self._buffer.clear()
-                        return
-
-                if not self._header_written:
-                    self._write_header()
+                if self._async_enabled:
+                    # The array buffer is reused, so the writer thread gets its own copy
+                    self._ensure_async_writer().submit(np.array(rows) if isinstance(buffer, ArrayRingBuffer) else rows)
+                    buffer.clear()
+                    return
 
-                try:
-                    self._writer.writerows(self._buffer)  # type: ignore[attr-defined]
-                    self._buffer.clear()
-                    self._file.flush()
-                except Exception as e:
-                    self.error(f"Failed to write to CSV file: {e}")
-                    # Try to recover by reopening the file
-                    if self._file:
-                        with contextlib.suppress(Exception):
-                            self._file.close()
-                    self._file = None
-                    self._writer = None
-                    self._header_written = False
+                with self._file_lock:
+                    if self._write_rows(rows):
+                        buffer.clear()
             except Exception as e:
                 self.error(f"Unexpected error in flush_buffer: {e}")
 
+    def _array_rows(self, buffer: ArrayRingBuffer) -> np.ndarray:
+        """
+        Get the rows held in an `ArrayRingBuffer`, with the timestamp and tick columns if enabled.
+
+        Args:
+            buffer (ArrayRingBuffer): The array buffer.
+
+        Returns:
+            np.ndarray: A 2-D float64 array, or a structured array if the timestamp columns are enabled.
+        """
+        return buffer.records() if self._timestamp_columns else buffer.rows()
+
+    def _column_names(self) -> list[str]:
+        """
+        Get the names of the columns written to the data file.
+
+        Returns:
+            list[str]: The column names, including the timestamp and tick columns if enabled.
+        """
+        names = list(self._var_names.values())
+        return ["timestamp_ns", "tick", *names] if self._timestamp_columns else names
+
+    def _write_rows(self, rows: Any) -> bool:
+        """
+        Write rows to the data file, opening it and writing the header first if needed.
+
+        This can run on the background writer thread, so it must not take `self._lock`.
+        Callers are expected to hold `self._file_lock`.
+
+        Args:
+            rows (Any): An iterable of rows to write.
+
+        Returns:
+            bool: True if the rows were consumed (written, or dropped because the file could not be opened),
+                False if they should be kept for a later attempt.
+        """
+        if self._data_format == DataFormat.BINARY:
+            return self._write_binary_rows(rows)
+        if self._data_format == DataFormat.SEGMENTED:
+            return self._write_segment_rows(rows)
+        if self._data_format == DataFormat.COMPRESSED:
+            return self._write_compressed_rows(rows)
+
+        if self._file is None:
+            try:
+                self._file = open(self._csv_path, "w", newline="")
+                self._writer = csv.writer(self._file)  # type: ignore[assignment]
+            except Exception as e:
+                self._log_write_error(f"Failed to open CSV file {self._csv_path}: {e}")
+                # Drop the rows to prevent memory buildup
+                self._failed_rows += len(rows)
+                return True
+
+        if not self._header_written:
+            self._write_header()
+
+        try:
+            self._writer.writerows(rows)  # type: ignore[attr-defined]
+            self._file.flush()
+        except Exception as e:
+            self._log_write_error(f"Failed to write to CSV file: {e}")
+            # Try to recover by reopening the file
+            if self._file:
+                with contextlib.suppress(Exception):
+                    self._file.close()
+            self._file = None
+            self._writer = None
+            self._header_written = False
+            return False
+        return True
+
+    def _write_binary_rows(self, rows: Any) -> bool:
+        """
+        Write rows to the binary data file, creating it on the first call.
+
+        A batch that fails to write is dropped rather than retried, since part of it may already be on disk.
+
+        Args:
+            rows (Any): An iterable of rows to write.
+
+        Returns:
+            bool: Always True, as the rows are consumed either way.
+        """
+        try:
+            if self._binary_writer is None:
+                self._binary_writer = BinaryLogWriter(
+                    self._binary_path,
+                    self._column_names(),
+                    integer_columns=("timestamp_ns", "tick") if self._timestamp_columns else (),
+                )
+            self._binary_writer.write_rows(rows)
+        except Exception as e:
+            self._log_write_error(f"Failed to write to binary file {self._binary_path}: {e}")
+            self._failed_rows += len(rows)
+        return True
+
+    def _write_segment_rows(self, rows: Any) -> bool:
+        """
+        Append rows to the current log segment as one checksummed record, creating the writer on the first call.
+
+        Each record is synced to disk as it is written, so a crash loses at most the rows still in the buffer.
+
+        Args:
+            rows (Any): An iterable of rows to write.
+
+        Returns:
+            bool: True if the rows were written or could not be written because the segment could not be opened,
+                False if they should be kept for a later attempt.
+        """
+        try:
+            if self._segment_writer is None:
+                self._segment_writer = SegmentWriter(
+                    self._segment_base_path,
+                    self._column_names(),
+                    max_bytes=self._file_max_bytes,
+                    max_seconds=self._segment_max_seconds,
+                )
+            self._segment_writer.write_rows(rows)
+        except OSError as e:
+            self._log_write_error(f"Failed to write to log segment {self._segment_base_path}: {e}")
+            # Start a fresh segment on the next attempt, so a partial record is never followed by more data
+            if self._segment_writer is not None:
+                with contextlib.suppress(OSError):
+                    self._segment_writer.close()
+                self._segment_writer = None
+            return False
+        return True
+
+    def _write_compressed_rows(self, rows: Any) -> bool:
+        """
+        Compress rows into one frame of the compressed data file, creating the file on the first call.
+
+        With the timestamp columns enabled, the frame covers the timestamps of its first and last rows;
+        otherwise it covers the time since the previous frame.
+
+        Args:
+            rows (Any): An iterable of rows to write.
+
+        Returns:
+            bool: Always True, as the rows are consumed either way.
+        """
+        try:
+            if self._compressed_writer is None:
+                self._compressed_writer = CompressedLogWriter(self._compressed_path, self._column_names())
+            if self._timestamp_columns and len(rows):
+                self._compressed_writer.write_rows(rows, start_ns=int(rows[0][0]), end_ns=int(rows[-1][0]))
+            else:
+                self._compressed_writer.write_rows(rows)
+        except Exception as e:
+            self._log_write_error(f"Failed to write to compressed file {self._compressed_path}: {e}")
+            self._failed_rows += len(rows)
+        return True
+
+    def _write_rows_and_sync(self, rows: list[Any]) -> None:
+        """
+        Write a batch of rows handed off by the background writer and sync them to disk.
+
+        Args:
+            rows (list[Any]): The batch of rows to write.
+        """
+        with self._file_lock:
+            if not self._write_rows(rows):
+                # The batch is no longer buffered, so unlike a synchronous flush it cannot be retried
+                self._failed_rows += len(rows)
+                return
+            if self._binary_writer is not None:
+                self._binary_writer.sync()
+            elif self._segment_writer is not None:
+                self._segment_writer.sync()
+            elif self._compressed_writer is not None:
+                self._compressed_writer.sync()
+            elif self._file is not None:
+                os.fsync(self._file.fileno())
+
+    def _data_file_open(self) -> bool:
+        """
+        Check whether a data file is open in any format.
+
+        Returns:
+            bool: True if a data file is open.
+        """
+        return any(
+            writer is not None
+            for writer in (self._file, self._binary_writer, self._segment_writer, self._compressed_writer)
+        )
+
+    def _start_new_data_file(self) -> None:
+        """
+        Finish the current data file before the set of columns changes.
+
+        A data file has a single header (or dtype), so once one is open the buffered rows are written to it
+        under the current columns, and later rows go to a new file whose name has a numbered suffix,
+        e.g. `my_log_1.csv`. Rows held in an `ArrayRingBuffer` before the first flush are reshaped in place instead.
+        """
+        if self._data_file_open() or self._async_writer is not None or (self._array_buffer is None and self._buffer):
+            self.flush_buffer()
+            self._stop_async_writer()
+        if not self._data_file_open():
+            return
+
+        self._close_data_file()
+        self._header_written = False
+        self._data_file_index += 1
+        self._set_data_paths(f"{os.path.splitext(self._file_path)[0]}_{self._data_file_index}")
+        self.info(f"Tracked columns changed, writing data to a new file with suffix _{self._data_file_index}")
+
+    def _close_data_file(self) -> None:
+        """
+        Close the CSV or binary data file, if one is open.
+        """
+        if self._file:
+            self._file.close()
+            self._file = None
+            self._writer = None
+        if self._binary_writer is not None:
+            self._binary_writer.close()
+            self._binary_writer = None
+        if self._segment_writer is not None:
+            self._segment_writer.close()
+            self._segment_writer = None
+        if self._compressed_writer is not None:
+            self._compressed_writer.close()
+            self._compressed_writer = None
+
+    def _log_write_error(self, msg: str) -> None:
+        """
+        Log an error from the CSV write path.
+
+        Bypasses `_ensure_file_handler` so that the background writer thread never waits on `self._lock`,
+        which the control thread may hold while blocked on a full queue.
+
+        Args:
+            msg (str): The error message.
+        """
+        logging.Logger.error(self, msg)
+
+    def _ensure_async_writer(self) -> BackgroundWriter:
+        """
+        Start the background writer thread if it is not running.
+
+        Returns:
+            BackgroundWriter: The running background writer.
+        """
+        if self._async_writer is None:
+            self._async_writer = BackgroundWriter(
+                write_rows=self._write_rows_and_sync,
+                max_queue_size=self._async_queue_size,
+                policy=self._backpressure_policy,
+                batch_size=self._buffer_size,
+                on_error=lambda e: self._log_write_error(f"Background writer failed to write rows: {e}"),
+                name="LoggerWriter",
+            )
+            self._async_writer.start()
+        return self._async_writer
+
+    def _stop_async_writer(self) -> None:
+        """
+        Drain and stop the background writer thread, if one is running.
+        """
+        if self._async_writer is not None:
+            self._async_writer.close(drain=True)
+            self._dropped_rows += self._async_writer.dropped_rows
+            self._failed_rows += self._async_writer.failed_rows
+            self._async_writer = None
+
     def _write_header(self) -> None:
         """
         Write the CSV header based on tracked variable names.
         This header is written only once per log file.
         """
         try:
-            header = list(self._var_names.values())
+            header = self._column_names() if self._var_names else []
             if header:  # Only write header if we have variables
                 self._writer.writerow(header)  # type: ignore[attr-defined]
                 self._header_written = True
         except Exception as e:
-            self.error(f"Failed to write CSV header: {e}")
+            self._log_write_error(f"Failed to write CSV header: {e}")
 
     def _generate_file_paths(self) -> None:
         """
@@ -576,11 +1504,24 @@ class Logger(logging.Logger):
 
             file_path = os.path.join(self._log_path, base_name)
             self._file_path = file_path + ".log"
-            self._csv_path = file_path + ".csv"
+            self._data_file_index = 0
+            self._set_data_paths(file_path)
         except Exception as e:
             print(f"Error generating file paths: {e}")  # Use print as logger might not be ready
             raise
 
+    def _set_data_paths(self, base_path: str) -> None:
+        """
+        Set the paths of the data files for every data format.
+
+        Args:
+            base_path (str): The path without an extension.
+        """
+        self._csv_path = base_path + ".csv"
+        self._binary_path = base_path + ".npy"
+        self._segment_base_path = base_path
+        self._compressed_path = base_path + ".clog"
+
     def __del__(self) -> None:
         """
         Destructor for the Logger class.
@@ -635,10 +1576,18 @@ class Logger(logging.Logger):
                 # Reset tracking and state variables
                 self._tracked_vars.clear()
                 self._var_names.clear()
+                self._decimation.clear()
+                self._attributes.clear()
+                self._failing.clear()
                 self._error_count.clear()
+                self._rebuild_plan()
                 self._header_written = False
                 self._file = None
                 self._writer = None
+                self._tick = 0
+                self._rate_limits.clear()
+                if self._array_buffer is not None:
+                    self._array_buffer = ArrayRingBuffer(capacity=self._buffer_size)
 
                 self.debug("Logger reset successfully")
             except Exception as e:
@@ -658,10 +1607,9 @@ class Logger(logging.Logger):
         with self._lock:
             try:
                 self.flush_buffer()
-                if self._file:
-                    self._file.close()
-                    self._file = None
-                    self._writer = None
+                self._stop_async_writer()
+                self._close_data_file()
+                self._close_telemetry()
             except Exception as e:
                 self.error(f"Error closing logger: {e}")
 
@@ -669,13 +1617,16 @@ class Logger(logging.Logger):
         """
         Log a debug message.
 
-        Ensures that the file handler is set up before logging.
+        Returns immediately if the level is disabled. Otherwise, ensures that the file handler is set up
+        before logging.
 
         Args:
             msg (object): The message to log.
             *args (object): Additional arguments.
             **kwargs (Any): Additional keyword arguments.
         """
+        if not self.isEnabledFor(logging.DEBUG):
+            return
         self._ensure_file_handler()
         super().debug(msg, *args, **kwargs)
 
@@ -683,13 +1634,16 @@ class Logger(logging.Logger):
         """
         Log an info message.
 
-        Ensures that the file handler is set up before logging.
+        Returns immediately if the level is disabled. Otherwise, ensures that the file handler is set up
+        before logging.
 
         Args:
             msg (object): The message to log.
             *args (object): Additional arguments.
             **kwargs (Any): Additional keyword arguments.
         """
+        if not self.isEnabledFor(logging.INFO):
+            return
         self._ensure_file_handler()
         super().info(msg, *args, **kwargs)
 
@@ -697,13 +1651,16 @@ class Logger(logging.Logger):
         """
         Log a warning message.
 
-        Ensures that the file handler is set up before logging.
+        Returns immediately if the level is disabled. Otherwise, ensures that the file handler is set up
+        before logging.
 
         Args:
             msg (object): The message to log.
             *args (object): Additional arguments.
             **kwargs (Any): Additional keyword arguments.
         """
+        if not self.isEnabledFor(logging.WARNING):
+            return
         self._ensure_file_handler()
         super().warning(msg, *args, **kwargs)
 
@@ -711,13 +1668,16 @@ class Logger(logging.Logger):
         """
         Log an error message.
 
-        Ensures that the file handler is set up before logging.
+        Returns immediately if the level is disabled. Otherwise, ensures that the file handler is set up
+        before logging.
 
         Args:
             msg (object): The message to log.
             *args (object): Additional arguments.
             **kwargs (Any): Additional keyword arguments.
         """
+        if not self.isEnabledFor(logging.ERROR):
+            return
         self._ensure_file_handler()
         super().error(msg, *args, **kwargs)
 
@@ -725,13 +1685,16 @@ class Logger(logging.Logger):
         """
         Log a critical message.
 
-        Ensures that the file handler is set up before logging.
+        Returns immediately if the level is disabled. Otherwise, ensures that the file handler is set up
+        before logging.
 
         Args:
             msg (object): The message to log.
             *args (object): Additional arguments.
             **kwargs (Any): Additional keyword arguments.
         """
+        if not self.isEnabledFor(logging.CRITICAL):
+            return
         self._ensure_file_handler()
         super().critical(msg, *args, **kwargs)
 
@@ -747,9 +1710,84 @@ class Logger(logging.Logger):
             *args (object): Additional arguments.
             **kwargs (Any): Additional keyword arguments.
         """
+        if not self.isEnabledFor(level.value if isinstance(level, LogLevel) else level):
+            return
         self._ensure_file_handler()
         super().log(level, msg, *args, **kwargs)
 
+    def log_rate_limited(
+        self,
+        level: LogLevel,
+        msg: object,
+        *args: object,
+        max_count: int = 1,
+        interval: float = 1.0,
+        key: Optional[Hashable] = None,
+        **kwargs: Any,
+    ) -> bool:
+        """
+        Log a message at most `max_count` times per `interval` seconds per call site.
+
+        Messages over the limit are counted instead of logged. The first message logged in a later
+        interval is preceded by a summary with the number of messages that were suppressed. No lock is
+        taken, so concurrent callers sharing a call site may occasionally exceed the limit by a message.
+
+        Args:
+            level (LogLevel): The log level.
+            msg (object): The message to log.
+            *args (object): Additional arguments.
+            max_count (int): The number of messages logged per interval. Defaults to 1.
+            interval (float): The length of an interval in seconds. Defaults to 1.0.
+            key (Optional[Hashable]): Identifies the messages that share a limit. Defaults to the
+                code object and line number of the caller.
+            **kwargs (Any): Additional keyword arguments.
+
+        Returns:
+            bool: True if the message was logged; otherwise, False.
+
+        Examples:
+            >>> while True:
+            ...     LOGGER.log_rate_limited(LogLevel.WARNING, "Sensor %s timed out", sensor.name, interval=5.0)
+        """
+        if not self.isEnabledFor(level.value):
+            return False
+
+        if key is None:
+            caller = sys._getframe(1)
+            key = (caller.f_code, caller.f_lineno)
+
+        now = time.monotonic()
+        state = self._rate_limits.get(key)
+        if state is None:
+            state = self._rate_limits[key] = [now, 0, 0]
+        elif now - state[0] >= interval:
+            if state[2]:
+                self.log(
+                    level.value,
+                    "%d similar messages were suppressed in the last %.1f s",
+                    state[2],
+                    now - state[0],
+                )
+            state[0], state[1], state[2] = now, 0, 0
+
+        if state[1] >= max_count:
+            state[2] += 1
+            return False
+
+        state[1] += 1
+        self.log(level.value, msg, *args, **kwargs)
+        return True
+
+    @property
+    def suppressed_messages(self) -> int:
+        """
+        Get the number of rate-limited messages suppressed in the current interval of each call site.
+
+        Returns:
+            int: The number of suppressed messages not yet reported in a summary.
+        """
+        return sum(state[2] for state in self._rate_limits.values())
+
     @property
     def log_format(self) -> str:
         """
@@ -784,6 +1822,76 @@ class Logger(logging.Logger):
         """
         return self._csv_path
 
+    @property
+    def binary_path(self) -> Optional[str]:
+        """
+        Get the current file path for the binary data file.
+
+        Returns:
+            Optional[str]: The binary file path as a string, or None if not set.
+        """
+        return self._binary_path
+
+    @property
+    def segment_base_path(self) -> Optional[str]:
+        """
+        Get the path prefix of the log segments. Segments are named `<segment_base_path>.<index>.seg`.
+
+        Returns:
+            Optional[str]: The segment path prefix as a string, or None if not set.
+        """
+        return self._segment_base_path
+
+    @property
+    def compressed_path(self) -> Optional[str]:
+        """
+        Get the current file path for the compressed data file.
+
+        Returns:
+            Optional[str]: The compressed file path as a string, or None if not set.
+        """
+        return self._compressed_path
+
+    @property
+    def data_format(self) -> DataFormat:
+        """
+        Get the file format used to record tracked variables.
+
+        Returns:
+            DataFormat: The data file format.
+        """
+        return self._data_format
+
+    @property
+    def buffer_backend(self) -> BufferBackend:
+        """
+        Get the storage used to buffer tracked values between flushes.
+
+        Returns:
+            BufferBackend: The buffer backend.
+        """
+        return self._buffer_backend
+
+    @property
+    def telemetry_name(self) -> Optional[str]:
+        """
+        Get the name of the shared memory block that rows are published into.
+
+        Returns:
+            Optional[str]: The telemetry name, or None if telemetry is disabled.
+        """
+        return self._telemetry_name
+
+    @property
+    def timestamp_columns_enabled(self) -> bool:
+        """
+        Get whether rows are prefixed with `timestamp_ns` and `tick` columns.
+
+        Returns:
+            bool: Whether the timestamp columns are enabled.
+        """
+        return self._timestamp_columns
+
     @property
     def log_path(self) -> str:
         """
@@ -864,6 +1972,50 @@ class Logger(logging.Logger):
         """
         return len(self._tracked_vars)
 
+    @property
+    def async_writer_enabled(self) -> bool:
+        """
+        Get whether rows are written from a background writer thread.
+
+        Returns:
+            bool: Whether the background writer is enabled.
+        """
+        return self._async_enabled
+
+    @property
+    def backpressure_policy(self) -> BackpressurePolicy:
+        """
+        Get the policy applied when the background writer queue is full.
+
+        Returns:
+            BackpressurePolicy: The backpressure policy.
+        """
+        return self._backpressure_policy
+
+    @property
+    def dropped_rows(self) -> int:
+        """
+        Get the number of rows dropped by the background writer since the logger was created.
+
+        Returns:
+            int: The number of dropped rows.
+        """
+        writer = self._async_writer
+        return self._dropped_rows + (writer.dropped_rows if writer is not None else 0)
+
+    @property
+    def failed_rows(self) -> int:
+        """
+        Get the number of rows lost because they failed to write since the logger was created.
+
+        Rows kept in the buffer for a later attempt are not counted.
+
+        Returns:
+            int: The number of rows that failed to write.
+        """
+        writer = self._async_writer
+        return self._failed_rows + (writer.failed_rows if writer is not None else 0)
+
 
 # Initialize a global logger instance to be used throughout the library
 LOGGER = Logger()
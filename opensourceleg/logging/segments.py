@@ -0,0 +1,365 @@
+"""
+Segmented log module for opensourceleg library.
+
+Module Overview:
+
+This module defines a crash-safe, append-only format for tracked variables. Rows are written
+to a series of segment files as checksummed, length-prefixed records, and each segment starts
+with a record holding the column names, so every segment can be read on its own.
+
+A record is laid out as:
+
+    magic (4 bytes) | kind (1 byte) | payload length (uint32) | CRC-32 of payload (uint32) | payload
+
+The payload of a rows record is the rows encoded as CSV text. A record that is cut short or
+fails its checksum marks the end of the valid data in its segment, so a process that dies
+mid-write loses at most the record it was writing.
+
+Key Classes:
+
+- `SegmentWriter`: Appends rows to rotating segment files with periodic sync points.
+- `SegmentRecoveryReport`: Summary of a call to `recover`.
+
+Key Functions:
+
+- `segment_paths`: List the segment files that belong to a base path.
+- `read_segment`: Read the valid records of one segment file.
+- `recover`: Stitch the valid records of all segments into a clean CSV file.
+
+Usage Guide:
+
+1. Create a `SegmentWriter` with a base path and the column names, and call `write_rows`.
+2. After a session, or after a crash, run `recover` to produce a CSV file:
+
+    python -m opensourceleg.logging.segments ./logs/session -o ./logs/session.csv
+"""
+
+import argparse
+import csv
+import glob
+import io
+import os
+import re
+import struct
+import time
+import zlib
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+__all__ = [
+    "RECORD_COLUMNS",
+    "RECORD_ROWS",
+    "SegmentRecoveryReport",
+    "SegmentWriter",
+    "read_segment",
+    "recover",
+    "segment_paths",
+]
+
+RECORD_COLUMNS = 1
+RECORD_ROWS = 2
+
+_MAGIC = b"OSLS"
+_RECORD_HEADER = struct.Struct("<4sBII")
+_SEGMENT_SUFFIX = ".seg"
+
+
+def _segment_path(base_path: str, index: int) -> str:
+    return f"{base_path}.{index:05d}{_SEGMENT_SUFFIX}"
+
+
+def _encode_rows(rows: Iterable[Sequence[Any]]) -> bytes:
+    text = io.StringIO()
+    csv.writer(text).writerows(rows)
+    return text.getvalue().encode("utf-8")
+
+
+def _decode_rows(payload: bytes) -> list[list[str]]:
+    return list(csv.reader(io.StringIO(payload.decode("utf-8"))))
+
+
+def _find_segments(base_path: str) -> list[tuple[int, str]]:
+    pattern = re.compile(re.escape(os.path.basename(base_path)) + r"\.(\d+)" + re.escape(_SEGMENT_SUFFIX) + "$")
+    segments = []
+    for path in glob.glob(glob.escape(base_path) + ".*" + _SEGMENT_SUFFIX):
+        match = pattern.match(os.path.basename(path))
+        if match:
+            segments.append((int(match.group(1)), path))
+    return sorted(segments)
+
+
+def segment_paths(base_path: str) -> list[str]:
+    """
+    List the segment files that belong to a base path, in the order they were written.
+
+    Args:
+        base_path (str): The base path passed to `SegmentWriter`.
+
+    Returns:
+        list[str]: The segment file paths.
+    """
+    return [path for _, path in _find_segments(base_path)]
+
+
+class SegmentWriter:
+    """
+    Appends rows to rotating segment files as checksummed, length-prefixed records.
+
+    Segments are named `<base_path>.<index>.seg`. A new writer never overwrites existing segments;
+    it continues numbering after the last segment already on disk.
+
+    Args:
+        base_path (str): The path prefix of the segment files.
+        names (Sequence[str]): The column names, written at the start of each segment.
+        max_bytes (int): Start a new segment once the current one reaches this size. 0 disables. Defaults to 0.
+        max_seconds (float): Start a new segment once the current one is this old. 0 disables. Defaults to 0.
+        sync_every (int): Sync to disk after this many records. Defaults to 1 (every record).
+
+    Examples:
+        >>> writer = SegmentWriter("./logs/session", ["time", "position"], max_bytes=1_000_000)
+        >>> writer.write_rows([[0.0, 1.5], [0.01, 1.6]])
+        >>> writer.close()
+    """
+
+    def __init__(
+        self,
+        base_path: str,
+        names: Sequence[str],
+        max_bytes: int = 0,
+        max_seconds: float = 0,
+        sync_every: int = 1,
+    ) -> None:
+        if sync_every <= 0:
+            raise ValueError(f"sync_every must be positive, got {sync_every}")
+
+        self._base_path = base_path
+        self._names = list(names)
+        self._max_bytes: int = max_bytes
+        self._max_seconds: float = max_seconds
+        self._sync_every: int = sync_every
+
+        existing = _find_segments(base_path)
+        self._next_index: int = existing[-1][0] + 1 if existing else 0
+        self._file: Optional[Any] = None
+        self._path: Optional[str] = None
+        self._opened_at: float = 0.0
+        self._unsynced_records: int = 0
+        self._paths: list[str] = []
+
+    def __repr__(self) -> str:
+        return f"SegmentWriter(base_path={self._base_path}, segments={len(self._paths)})"
+
+    def write_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        """
+        Append rows to the current segment as one record, rotating the segment first if it is due.
+
+        Args:
+            rows (Iterable[Sequence[Any]]): The rows to append.
+        """
+        payload = _encode_rows(rows)
+        if not payload:
+            return
+
+        if self._file is None or self._rotation_due():
+            self._rotate()
+
+        self._write_record(RECORD_ROWS, payload)
+
+    def sync(self) -> None:
+        """
+        Flush the current segment and sync it to disk.
+        """
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._unsynced_records = 0
+
+    def close(self) -> None:
+        """
+        Sync and close the current segment.
+        """
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+    def _rotation_due(self) -> bool:
+        if self._max_bytes > 0 and self._file.tell() >= self._max_bytes:  # type: ignore[union-attr]
+            return True
+        return self._max_seconds > 0 and time.monotonic() - self._opened_at >= self._max_seconds
+
+    def _rotate(self) -> None:
+        self.close()
+        self._path = _segment_path(self._base_path, self._next_index)
+        self._next_index += 1
+        self._file = open(self._path, "xb")
+        self._opened_at = time.monotonic()
+        self._paths.append(self._path)
+        self._write_record(RECORD_COLUMNS, _encode_rows([self._names]))
+
+    def _write_record(self, kind: int, payload: bytes) -> None:
+        header = _RECORD_HEADER.pack(_MAGIC, kind, len(payload), zlib.crc32(payload))
+        self._file.write(header + payload)  # type: ignore[union-attr]
+        self._unsynced_records += 1
+        if self._unsynced_records >= self._sync_every:
+            self.sync()
+        else:
+            self._file.flush()  # type: ignore[union-attr]
+
+    @property
+    def path(self) -> Optional[str]:
+        """
+        Get the path of the segment currently being written.
+
+        Returns:
+            Optional[str]: The segment path, or None if no segment has been opened yet.
+        """
+        return self._path
+
+    @property
+    def paths(self) -> list[str]:
+        """
+        Get the paths of all segments opened by this writer.
+
+        Returns:
+            list[str]: The segment paths, oldest first.
+        """
+        return list(self._paths)
+
+
+def read_segment(path: str) -> tuple[list[tuple[int, bytes]], int]:
+    """
+    Read the valid records of one segment file.
+
+    Reading stops at the first record that is cut short, has a bad magic number, or fails its checksum.
+
+    Args:
+        path (str): The segment file path.
+
+    Returns:
+        tuple[list[tuple[int, bytes]], int]: The (kind, payload) of each valid record, and the number
+            of trailing bytes that were not part of a valid record.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    records = []
+    offset = 0
+    while offset + _RECORD_HEADER.size <= len(data):
+        magic, kind, length, crc = _RECORD_HEADER.unpack_from(data, offset)
+        start = offset + _RECORD_HEADER.size
+        payload = data[start : start + length]
+        if magic != _MAGIC or len(payload) != length or zlib.crc32(payload) != crc:
+            break
+        records.append((kind, payload))
+        offset = start + length
+
+    return records, len(data) - offset
+
+
+@dataclass
+class SegmentRecoveryReport:
+    """
+    Summary of a call to `recover`.
+
+    Attributes:
+        output_path (str): The CSV file that was written.
+        segments (int): The number of segment files read.
+        records (int): The number of valid records read.
+        rows (int): The number of data rows written.
+        damaged_segments (list[str]): Segments with trailing bytes that were not part of a valid record.
+        discarded_bytes (int): The total number of trailing bytes that were discarded.
+    """
+
+    output_path: str
+    segments: int = 0
+    records: int = 0
+    rows: int = 0
+    damaged_segments: list[str] = field(default_factory=list)
+    discarded_bytes: int = 0
+
+
+def recover(base_path: str, output_path: Optional[str] = None) -> SegmentRecoveryReport:
+    """
+    Stitch the valid records of all segments of a base path into a clean CSV file.
+
+    The column header is written once, and again only if a later segment has different columns.
+
+    Args:
+        base_path (str): The base path passed to `SegmentWriter`.
+        output_path (Optional[str]): The CSV file to write. Defaults to `<base_path>.csv`.
+
+    Returns:
+        SegmentRecoveryReport: A summary of what was recovered.
+
+    Raises:
+        FileNotFoundError: If there are no segments for the base path.
+
+    Examples:
+        >>> report = recover("./logs/session")
+        >>> report.rows
+        12000
+    """
+    paths = segment_paths(base_path)
+    if not paths:
+        raise FileNotFoundError(f"No log segments found for {base_path}")
+
+    report = SegmentRecoveryReport(output_path=output_path or f"{base_path}.csv")
+    header: Optional[list[str]] = None
+
+    with open(report.output_path, "w", newline="") as output:
+        writer = csv.writer(output)
+        for path in paths:
+            records, discarded = read_segment(path)
+            report.segments += 1
+            report.records += len(records)
+            if discarded:
+                report.damaged_segments.append(path)
+                report.discarded_bytes += discarded
+
+            for kind, payload in records:
+                rows = _decode_rows(payload)
+                if kind == RECORD_COLUMNS:
+                    if rows and rows[0] != header:
+                        header = rows[0]
+                        writer.writerow(header)
+                elif kind == RECORD_ROWS:
+                    writer.writerows(rows)
+                    report.rows += len(rows)
+
+    return report
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Command line entry point that recovers a segmented log into a CSV file.
+
+    Args:
+        argv (Optional[Sequence[str]]): The command line arguments. Defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: The exit status.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m opensourceleg.logging.segments",
+        description="Stitch the valid records of a segmented log into a clean CSV file.",
+    )
+    parser.add_argument("base_path", help="Base path of the segment files, without the .<index>.seg suffix.")
+    parser.add_argument("-o", "--output", help="CSV file to write. Defaults to <base_path>.csv.")
+    args = parser.parse_args(argv)
+
+    try:
+        report = recover(args.base_path, args.output)
+    except FileNotFoundError as e:
+        parser.error(str(e))
+
+    print(
+        f"Recovered {report.rows} rows from {report.segments} segments into {report.output_path}. "
+        f"Discarded {report.discarded_bytes} bytes from {len(report.damaged_segments)} damaged segments."
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,160 @@
+"""
+Shared memory module for opensourceleg library.
+
+Module Overview:
+
+This module creates, attaches to and removes the `multiprocessing.shared_memory` blocks used by
+`opensourceleg.logging.telemetry` and `opensourceleg.utilities.pipeline`. It lives in the logging
+package, which the utilities package already depends on, so both can import it.
+
+Before Python 3.13, attaching to a block registers it with the resource tracker of the attaching
+process, which removes the block when that process exits even though another process still owns
+it. `attach_shared_memory` undoes that registration, unless the block was created by this process
+or by a parent process that shares its resource tracker, in which case the registration belongs
+to the creator.
+
+Key Functions:
+
+- `create_shared_memory`: Create a block, optionally replacing a stale block with the same name.
+- `attach_shared_memory`: Attach to a block owned by another process.
+- `unlink_shared_memory`: Close and remove a block created with `create_shared_memory`.
+- `register_shared_memory`: Record blocks created by a parent process that shares the resource tracker.
+- `process_exists`: Check whether the process that owns a block is still running.
+
+Usage Guide:
+
+1. In the owning process, create the block with `create_shared_memory` and remove it with
+   `unlink_shared_memory` when done.
+2. In other processes, attach with `attach_shared_memory` and call `close()` on the block when done.
+"""
+
+import os
+import sys
+from collections.abc import Iterable
+from multiprocessing import shared_memory
+from typing import Callable, Optional
+
+__all__ = [
+    "attach_shared_memory",
+    "create_shared_memory",
+    "process_exists",
+    "register_shared_memory",
+    "unlink_shared_memory",
+]
+
+# Names of the blocks registered with this process's resource tracker by their creator
+_created: set[str] = set()
+
+
+def create_shared_memory(
+    name: str, size: int, is_stale: Optional[Callable[[shared_memory.SharedMemory], bool]] = None
+) -> shared_memory.SharedMemory:
+    """
+    Create a shared memory block owned by this process.
+
+    If a block with the same name exists, for example one left behind by a process that did not shut
+    down cleanly, it is replaced when `is_stale` accepts it.
+
+    Args:
+        name (str): The name of the block.
+        size (int): The size of the block in bytes.
+        is_stale (Optional[Callable[[shared_memory.SharedMemory], bool]]): Called with an existing block
+            of the same name to decide whether it can be replaced. None replaces any block. Defaults to None.
+
+    Returns:
+        shared_memory.SharedMemory: The new block.
+
+    Raises:
+        FileExistsError: If a block with the same name exists and `is_stale` rejects it.
+    """
+    try:
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+    except FileExistsError:
+        existing = shared_memory.SharedMemory(name=name)
+        if is_stale is not None and not is_stale(existing):
+            _untrack(existing)
+            existing.close()
+            raise FileExistsError(f"Shared memory block {name} is in use") from None
+        existing.close()
+        existing.unlink()
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+
+    _created.add(shm.name)
+    return shm
+
+
+def attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """
+    Attach to an existing shared memory block without taking ownership of it.
+
+    Args:
+        name (str): The name of the block.
+
+    Returns:
+        shared_memory.SharedMemory: The block. Call `close()` on it to detach.
+
+    Raises:
+        FileNotFoundError: If no block with that name exists.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    shm = shared_memory.SharedMemory(name=name)
+    if shm.name not in _created:
+        _untrack(shm)
+    return shm
+
+
+def unlink_shared_memory(shm: shared_memory.SharedMemory) -> None:
+    """
+    Close and remove a shared memory block created with `create_shared_memory`.
+
+    Processes that are still attached keep their mapping until they close it.
+
+    Args:
+        shm (shared_memory.SharedMemory): The block.
+    """
+    shm.close()
+    shm.unlink()
+    _created.discard(shm.name)
+
+
+def register_shared_memory(names: Iterable[str]) -> None:
+    """
+    Record shared memory blocks that a parent process created and registered with the resource tracker
+    this process shares, so that attaching to them here leaves that registration in place.
+
+    Args:
+        names (Iterable[str]): The names of the blocks.
+    """
+    _created.update(names)
+
+
+def process_exists(pid: int) -> bool:
+    """
+    Check whether a process is running, for example the owner recorded in the header of a block.
+
+    Args:
+        pid (int): The process ID.
+
+    Returns:
+        bool: True if the process is running, or if that cannot be checked on this platform.
+    """
+    if os.name != "posix":
+        # Shared memory outlives its last handle only on POSIX, so an existing block is in use
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _untrack(shm: shared_memory.SharedMemory) -> None:
+    # Attaching registered the block with the resource tracker, which would remove it when this
+    # process exits even though another process owns it
+    from multiprocessing import resource_tracker
+
+    resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
@@ -0,0 +1,422 @@
+"""
+Telemetry module for opensourceleg library.
+
+Module Overview:
+
+This module defines a live telemetry channel that publishes rows of tracked values into a
+`multiprocessing.shared_memory` ring buffer. Other processes attach to the ring by name and
+poll it without locks and without any cooperation from the publisher, so the cost of
+publishing a row does not depend on how many observers are attached.
+
+Each slot of the ring is guarded by a sequence counter (a seqlock). The publisher makes the
+counter odd before it writes the slot and even again afterwards, and a reader keeps a copied
+row only if the counter held the expected even value both before and after the copy. Rows
+that were overwritten or torn while being read are skipped and counted in `missed_rows`.
+
+The shared memory block is laid out as:
+
+    header | column names (UTF-8, newline separated) | slots
+
+and each slot holds a sequence counter, a `time.monotonic_ns()` timestamp, a tick index and
+one float64 value per column.
+
+Key Classes:
+
+- `TelemetryPublisher`: Creates the ring buffer and publishes rows into it.
+- `TelemetryReader`: Attaches to a ring buffer by name and reads the published rows.
+- `TelemetrySample`: The rows returned by a read.
+
+Usage Guide:
+
+1. In the control process, enable telemetry on the logger with `LOGGER.set_telemetry("osl")`,
+   or create a `TelemetryPublisher` and call `publish` yourself.
+2. In a monitoring process, create a `TelemetryReader("osl")` and call `read_new` or `latest`
+   periodically.
+"""
+
+import os
+import struct
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Optional, Union
+
+import numpy as np
+
+from opensourceleg.logging.sharedmemory import (
+    attach_shared_memory,
+    create_shared_memory,
+    process_exists,
+    unlink_shared_memory,
+)
+
+__all__ = ["TelemetryPublisher", "TelemetryReader", "TelemetrySample"]
+
+_MAGIC = b"OSLT"
+_VERSION = 1
+# magic, version, columns, capacity, names length, publisher pid, then the published row count and closed flag
+_HEADER = struct.Struct("<4sIIIIIQQ")
+_HEAD_OFFSET = 24
+_CLOSED_OFFSET = 32
+_SLOT_FIELDS = 3  # Sequence counter, timestamp and tick before the values of each slot
+
+
+def _align(size: int) -> int:
+    return -(-size // 8) * 8
+
+
+def _is_abandoned(shm: shared_memory.SharedMemory) -> bool:
+    """
+    Check whether a shared memory block is a telemetry ring left behind by a publisher that has exited.
+    """
+    if shm.size < _HEADER.size:
+        return False
+    magic, _, _, _, _, pid, _, closed = _HEADER.unpack_from(shm.buf)  # type: ignore[arg-type]
+    if magic != _MAGIC:
+        return False
+    return bool(closed) or not process_exists(pid)
+
+
+class _Ring:
+    """
+    Numpy views of a telemetry ring in a shared memory block.
+    """
+
+    def __init__(self, buffer: Any, columns: int, capacity: int, names_length: int) -> None:
+        slots_offset = _align(_HEADER.size + names_length)
+        self.head: np.ndarray = np.ndarray((1,), dtype=np.uint64, buffer=buffer, offset=_HEAD_OFFSET)
+        self.closed: np.ndarray = np.ndarray((1,), dtype=np.uint64, buffer=buffer, offset=_CLOSED_OFFSET)
+        self.slots: np.ndarray = np.ndarray(
+            (capacity, _SLOT_FIELDS + columns), dtype=np.uint64, buffer=buffer, offset=slots_offset
+        )
+        self.sequence = self.slots[:, 0]
+        self.timestamps = self.slots[:, 1].view(np.int64)
+        self.ticks = self.slots[:, 2].view(np.int64)
+        self.values = self.slots.view(np.float64)[:, _SLOT_FIELDS:]
+
+    def release(self) -> None:
+        # Views must be dropped before the shared memory block can be closed
+        del self.head, self.closed, self.slots, self.sequence, self.timestamps, self.ticks, self.values
+
+
+@dataclass
+class TelemetrySample:
+    """
+    Rows read from a telemetry ring, oldest first.
+
+    Attributes:
+        timestamps (np.ndarray): The int64 `time.monotonic_ns()` timestamp of each row.
+        ticks (np.ndarray): The int64 tick index of each row.
+        values (np.ndarray): A (rows, columns) float64 array of values.
+    """
+
+    timestamps: np.ndarray
+    ticks: np.ndarray
+    values: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.ticks)
+
+
+class TelemetryPublisher:
+    """
+    Creates a shared memory ring buffer and publishes rows of float64 values into it.
+
+    Publishing a row writes one slot in place and never blocks. When the ring is full the oldest
+    slot is overwritten, so readers that fall more than `capacity` rows behind miss rows instead of
+    slowing down the publisher. A telemetry ring with the same name, left behind by a publisher process
+    that has exited without closing it, is replaced.
+
+    Args:
+        name (str): The name of the shared memory block that readers attach to.
+        names (Sequence[str]): The column names.
+        capacity (int): The number of rows held in the ring. Defaults to 1024.
+
+    Raises:
+        ValueError: If `capacity` is not positive.
+        FileExistsError: If a shared memory block with the same name is in use.
+
+    Examples:
+        >>> publisher = TelemetryPublisher("osl", ["position", "velocity"])
+        >>> publisher.publish([1.5, 0.2], tick=0)
+        >>> publisher.close()
+    """
+
+    def __init__(self, name: str, names: Sequence[str], capacity: int = 1024) -> None:
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+
+        self._names = [str(n) for n in names]
+        encoded_names = "\n".join(self._names).encode("utf-8")
+        columns = len(self._names)
+        size = _align(_HEADER.size + len(encoded_names)) + capacity * (_SLOT_FIELDS + columns) * 8
+
+        self._shm = create_shared_memory(name, size, is_stale=_is_abandoned)
+        buffer: memoryview = self._shm.buf  # type: ignore[assignment]
+        buffer[: _HEADER.size] = _HEADER.pack(
+            _MAGIC, _VERSION, columns, capacity, len(encoded_names), os.getpid(), 0, 0
+        )
+        buffer[_HEADER.size : _HEADER.size + len(encoded_names)] = encoded_names
+        self._ring: Optional[_Ring] = _Ring(buffer, columns, capacity, len(encoded_names))
+        self._capacity: int = capacity
+        self._published_rows: int = 0
+
+    def __repr__(self) -> str:
+        return f"TelemetryPublisher(name={self.name}, columns={len(self._names)}, capacity={self._capacity})"
+
+    def publish(
+        self, values: Union[Sequence[Any], np.ndarray], tick: Optional[int] = None, timestamp_ns: Optional[int] = None
+    ) -> None:
+        """
+        Publish one row.
+
+        Values that cannot be converted to float64 are published as NaN.
+
+        Args:
+            values (Union[Sequence[Any], np.ndarray]): One value per column.
+            tick (Optional[int]): Index of the row. Defaults to the number of rows published before this one.
+            timestamp_ns (Optional[int]): Timestamp of the row in nanoseconds. Defaults to `time.monotonic_ns()`.
+
+        Raises:
+            RuntimeError: If the publisher has been closed.
+        """
+        ring = self._ring
+        if ring is None:
+            raise RuntimeError("Cannot publish to a closed TelemetryPublisher")
+
+        n = self._published_rows
+        index = n % self._capacity
+        ring.sequence[index] = 2 * n + 1
+        ring.timestamps[index] = time.monotonic_ns() if timestamp_ns is None else timestamp_ns
+        ring.ticks[index] = n if tick is None else tick
+        try:
+            ring.values[index] = values
+        except (TypeError, ValueError):
+            self._store_slow(ring.values[index], values)
+        ring.sequence[index] = 2 * n + 2
+        ring.head[0] = n + 1
+        self._published_rows = n + 1
+
+    def _store_slow(self, row: np.ndarray, values: Union[Sequence[Any], np.ndarray]) -> None:
+        row.fill(np.nan)
+        for column, value in enumerate(values[: len(row)]):
+            try:
+                row[column] = value
+            except (TypeError, ValueError):
+                continue
+
+    def close(self) -> None:
+        """
+        Mark the ring as closed for readers and remove the shared memory block.
+
+        Readers that are already attached keep their mapping until they close it.
+        """
+        if self._ring is None:
+            return
+
+        self._ring.closed[0] = 1
+        self._ring.release()
+        self._ring = None
+        unlink_shared_memory(self._shm)
+
+    @property
+    def name(self) -> str:
+        """
+        Get the name of the shared memory block.
+
+        Returns:
+            str: The name readers attach to.
+        """
+        return self._shm.name
+
+    @property
+    def names(self) -> list[str]:
+        """
+        Get the column names.
+
+        Returns:
+            list[str]: The column names.
+        """
+        return list(self._names)
+
+    @property
+    def capacity(self) -> int:
+        """
+        Get the number of rows held in the ring.
+
+        Returns:
+            int: The capacity in rows.
+        """
+        return self._capacity
+
+    @property
+    def published_rows(self) -> int:
+        """
+        Get the number of rows published.
+
+        Returns:
+            int: The number of published rows.
+        """
+        return self._published_rows
+
+
+class TelemetryReader:
+    """
+    Attaches to a telemetry ring buffer by name and reads the rows published into it.
+
+    Reading never blocks or signals the publisher. A reader starts at the oldest row still held
+    in the ring.
+
+    Args:
+        name (str): The name of the shared memory block.
+
+    Raises:
+        FileNotFoundError: If no telemetry ring with that name exists.
+        ValueError: If the shared memory block is not a telemetry ring.
+
+    Examples:
+        >>> reader = TelemetryReader("osl")
+        >>> sample = reader.read_new()
+        >>> sample.values[:, reader.names.index("position")]
+        array([1.5, 1.6, 1.7])
+    """
+
+    def __init__(self, name: str) -> None:
+        self._shm = attach_shared_memory(name)
+        buffer: memoryview = self._shm.buf  # type: ignore[assignment]
+        magic, version, columns, capacity, names_length, _, _, _ = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC or version != _VERSION:
+            self._shm.close()
+            raise ValueError(f"Shared memory block {name} is not a telemetry ring")
+
+        encoded_names = bytes(buffer[_HEADER.size : _HEADER.size + names_length])
+        self._names = encoded_names.decode("utf-8").split("\n") if columns else []
+        self._ring: Optional[_Ring] = _Ring(buffer, columns, capacity, names_length)
+        self._capacity: int = capacity
+        self._next_row: int = max(0, int(self._ring.head[0]) - capacity)
+        self._missed_rows: int = 0
+
+    def __repr__(self) -> str:
+        return f"TelemetryReader(name={self._shm.name}, columns={len(self._names)}, capacity={self._capacity})"
+
+    def read_new(self) -> TelemetrySample:
+        """
+        Read the rows published since the previous call.
+
+        Returns:
+            TelemetrySample: Copies of the rows, oldest first. Rows that were overwritten before they
+                could be read are counted in `missed_rows`.
+        """
+        ring = self._active_ring()
+        head = int(ring.head[0])
+        start = max(self._next_row, head - self._capacity)
+        self._missed_rows += start - self._next_row
+        self._next_row = head
+
+        rows = np.arange(start, head, dtype=np.uint64)
+        sample = self._read_rows(ring, rows)
+        self._missed_rows += len(rows) - len(sample)
+        return sample
+
+    def latest(self) -> Optional[TelemetrySample]:
+        """
+        Read the most recently published row without affecting `read_new`.
+
+        Returns:
+            Optional[TelemetrySample]: A sample with one row, or None if no complete row is available.
+        """
+        ring = self._active_ring()
+        head = int(ring.head[0])
+        if head == 0:
+            return None
+
+        sample = self._read_rows(ring, np.array([head - 1], dtype=np.uint64))
+        return sample if len(sample) else None
+
+    def _read_rows(self, ring: _Ring, rows: np.ndarray) -> TelemetrySample:
+        indices = rows % np.uint64(self._capacity)
+        expected = rows * np.uint64(2) + np.uint64(2)
+
+        # Seqlock read: keep a slot only if its counter was stable and even around the copy
+        before = ring.sequence[indices]
+        slots = ring.slots[indices]
+        after = ring.sequence[indices]
+        valid = (before == expected) & (after == expected)
+        if not valid.all():
+            slots = slots[valid]
+
+        return TelemetrySample(
+            timestamps=slots[:, 1].view(np.int64),
+            ticks=slots[:, 2].view(np.int64),
+            values=slots.view(np.float64)[:, _SLOT_FIELDS:],
+        )
+
+    def _active_ring(self) -> _Ring:
+        if self._ring is None:
+            raise RuntimeError("Cannot read from a closed TelemetryReader")
+        return self._ring
+
+    def close(self) -> None:
+        """
+        Detach from the shared memory block.
+        """
+        if self._ring is None:
+            return
+
+        self._ring.release()
+        self._ring = None
+        self._shm.close()
+
+    @property
+    def names(self) -> list[str]:
+        """
+        Get the column names.
+
+        Returns:
+            list[str]: The column names.
+        """
+        return list(self._names)
+
+    @property
+    def capacity(self) -> int:
+        """
+        Get the number of rows held in the ring.
+
+        Returns:
+            int: The capacity in rows.
+        """
+        return self._capacity
+
+    @property
+    def published_rows(self) -> int:
+        """
+        Get the number of rows published so far.
+
+        Returns:
+            int: The number of published rows.
+        """
+        return int(self._active_ring().head[0])
+
+    @property
+    def missed_rows(self) -> int:
+        """
+        Get the number of rows that `read_new` skipped because they were overwritten.
+
+        Returns:
+            int: The number of missed rows.
+        """
+        return self._missed_rows
+
+    @property
+    def closed(self) -> bool:
+        """
+        Check if the publisher has closed the ring.
+
+        A closed ring receives no more rows. If the publisher starts a new ring with the same name,
+        for example after the tracked variables changed, create a new reader to attach to it.
+
+        Returns:
+            bool: True if the publisher has closed the ring; otherwise, False.
+        """
+        return bool(self._active_ring().closed[0])
@@ -0,0 +1,311 @@
+"""
+Background writer module for opensourceleg library.
+
+Module Overview:
+
+This module defines `BackgroundWriter`, a small helper that moves disk I/O off the control
+thread. Rows are handed off to a bounded queue and a dedicated daemon thread takes them out
+in batches and passes them to a user supplied write function.
+
+Key Classes:
+
+- `BackpressurePolicy`: Enum that defines what happens when the hand-off queue is full.
+- `BackgroundWriter`: Bounded hand-off queue drained by a dedicated writer thread.
+
+Usage Guide:
+
+1. Create a `BackgroundWriter` with a function that writes a batch of rows.
+2. Call `submit` from the producer thread to hand off rows.
+3. Call `close` to drain the queue and stop the writer thread.
+"""
+
+import threading
+from collections import deque
+from collections.abc import Iterable, Sequence
+from enum import Enum
+from typing import Any, Callable, Optional
+
+__all__ = ["BackgroundWriter", "BackpressurePolicy"]
+
+
+class BackpressurePolicy(Enum):
+    """
+    Enum for the policies applied by the BackgroundWriter when its queue is full.
+
+    Attributes:
+        BLOCK: The producer waits until the writer thread has made room in the queue.
+        DROP_OLDEST: The oldest queued row is discarded to make room for the new row.
+        DROP_NEWEST: The new row is discarded and the queue is left untouched.
+    """
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+
+
+class BackgroundWriter:
+    """
+    Bounded hand-off queue drained by a dedicated writer thread.
+
+    The producer only pays for appending rows to a deque under a short-lived lock; formatting,
+    writing and syncing happen in `write_rows` on the writer thread.
+
+    Args:
+        write_rows (Callable[[list[Sequence[Any]]], None]): Function called on the writer thread
+            with a batch of rows.
+        max_queue_size (int): Maximum number of rows held in the queue. Defaults to 10000.
+        policy (BackpressurePolicy): Policy applied when the queue is full. Defaults to BLOCK.
+            A blocked producer drops the row instead if the writer thread is not running.
+        batch_size (int): Maximum number of rows passed to `write_rows` at once. Defaults to 1000.
+        on_error (Optional[Callable[[Exception], None]]): Called on the writer thread if
+            `write_rows` raises. Defaults to None.
+        name (str): Name of the writer thread. Defaults to "BackgroundWriter".
+
+    Examples:
+        >>> writer = BackgroundWriter(write_rows=print, max_queue_size=100)
+        >>> writer.start()
+        >>> writer.submit([[1, 2], [3, 4]])
+        2
+        >>> writer.close()
+        [[1, 2], [3, 4]]
+    """
+
+    def __init__(
+        self,
+        write_rows: Callable[[list[Sequence[Any]]], None],
+        max_queue_size: int = 10000,
+        policy: BackpressurePolicy = BackpressurePolicy.BLOCK,
+        batch_size: int = 1000,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        name: str = "BackgroundWriter",
+    ) -> None:
+        if max_queue_size <= 0:
+            raise ValueError(f"max_queue_size must be positive, got {max_queue_size}")
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+        self._write_rows = write_rows
+        self._max_queue_size: int = max_queue_size
+        self._policy: BackpressurePolicy = policy
+        self._batch_size: int = batch_size
+        self._on_error = on_error
+        self._name: str = name
+
+        self._queue: deque = deque()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running: bool = False
+        self._in_flight: int = 0
+
+        self._submitted_rows: int = 0
+        self._written_rows: int = 0
+        self._dropped_rows: int = 0
+        self._failed_rows: int = 0
+        self._error_count: int = 0
+
+    def __repr__(self) -> str:
+        return f"BackgroundWriter(policy={self._policy.name}, pending={self.pending_rows})"
+
+    def start(self) -> None:
+        """
+        Start the writer thread. Calling this on a running writer has no effect.
+        """
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+            self._thread.start()
+
+    def submit(self, rows: Iterable[Sequence[Any]]) -> int:
+        """
+        Hand off rows to the writer thread, applying the backpressure policy when the queue is full.
+
+        Args:
+            rows (Iterable[Sequence[Any]]): The rows to hand off.
+
+        Returns:
+            int: The number of rows that were accepted into the queue.
+        """
+        accepted = 0
+        with self._condition:
+            for row in rows:
+                if len(self._queue) >= self._max_queue_size:
+                    if self._policy == BackpressurePolicy.DROP_NEWEST:
+                        self._dropped_rows += 1
+                        continue
+                    elif self._policy == BackpressurePolicy.DROP_OLDEST:
+                        self._queue.popleft()
+                        self._dropped_rows += 1
+                    else:
+                        # Wake the writer thread before waiting on it to make room
+                        self._condition.notify_all()
+                        while len(self._queue) >= self._max_queue_size and self._running:
+                            self._condition.wait()
+
+                        # Nothing will drain the queue once the writer has stopped
+                        if len(self._queue) >= self._max_queue_size:
+                            self._dropped_rows += 1
+                            continue
+
+                self._queue.append(row)
+                accepted += 1
+
+            self._submitted_rows += accepted
+            self._condition.notify_all()
+        return accepted
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every queued row has been written.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait in seconds. Defaults to None (wait forever).
+
+        Returns:
+            bool: True if the queue was drained, False if the timeout expired first.
+        """
+        with self._condition:
+            if not self._running:
+                return not self._queue
+            return self._condition.wait_for(lambda: not self._queue and self._in_flight == 0, timeout=timeout)
+
+    def close(self, drain: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Stop the writer thread.
+
+        Args:
+            drain (bool): If True, rows still in the queue are written before the thread exits.
+                Otherwise they are discarded and counted as dropped. Defaults to True.
+            timeout (Optional[float]): Maximum time to wait for the thread to exit. Defaults to None.
+        """
+        with self._condition:
+            if not drain:
+                self._dropped_rows += len(self._queue)
+                self._queue.clear()
+            self._running = False
+            self._condition.notify_all()
+
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue and self._running:
+                    self._condition.wait()
+
+                if not self._queue:
+                    return
+
+                batch = [self._queue.popleft() for _ in range(min(len(self._queue), self._batch_size))]
+                self._in_flight = len(batch)
+                self._condition.notify_all()
+
+            written = True
+            try:
+                self._write_rows(batch)
+            except Exception as e:
+                written = False
+                self._error_count += 1
+                if self._on_error is not None:
+                    self._on_error(e)
+
+            with self._condition:
+                if written:
+                    self._written_rows += len(batch)
+                else:
+                    self._failed_rows += len(batch)
+                self._in_flight = 0
+                self._condition.notify_all()
+
+    @property
+    def policy(self) -> BackpressurePolicy:
+        """
+        Get the backpressure policy.
+
+        Returns:
+            BackpressurePolicy: The policy applied when the queue is full.
+        """
+        return self._policy
+
+    @property
+    def max_queue_size(self) -> int:
+        """
+        Get the maximum number of rows held in the queue.
+
+        Returns:
+            int: The queue capacity in rows.
+        """
+        return self._max_queue_size
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Check if the writer thread is running.
+
+        Returns:
+            bool: True if the writer thread is running; otherwise, False.
+        """
+        return self._running
+
+    @property
+    def pending_rows(self) -> int:
+        """
+        Get the number of rows that are queued or currently being written.
+
+        Returns:
+            int: The number of rows not yet written.
+        """
+        return len(self._queue) + self._in_flight
+
+    @property
+    def submitted_rows(self) -> int:
+        """
+        Get the number of rows accepted into the queue.
+
+        Returns:
+            int: The number of accepted rows.
+        """
+        return self._submitted_rows
+
+    @property
+    def written_rows(self) -> int:
+        """
+        Get the number of rows passed to the write function in batches that were written without an error.
+
+        Returns:
+            int: The number of written rows.
+        """
+        return self._written_rows
+
+    @property
+    def dropped_rows(self) -> int:
+        """
+        Get the number of rows discarded by the backpressure policy or by a non-draining close.
+
+        Returns:
+            int: The number of dropped rows.
+        """
+        return self._dropped_rows
+
+    @property
+    def failed_rows(self) -> int:
+        """
+        Get the number of rows in batches for which the write function raised.
+
+        Returns:
+            int: The number of rows that failed to write.
+        """
+        return self._failed_rows
+
+    @property
+    def error_count(self) -> int:
+        """
+        Get the number of batches for which the write function raised.
+
+        Returns:
+            int: The number of failed batches.
+        """
+        return self._error_count
@@ -4,7 +4,7 @@ from typing import Optional, Union
 import numpy as np
 from smbus2 import SMBus
 
-from opensourceleg.logging import LOGGER
+from opensourceleg.logging import LOGGER, LogLevel
 from opensourceleg.math import from_twos_complement, to_twos_complement
 from opensourceleg.sensors.base import EncoderBase
 from opensourceleg.utilities import SoftRealtimeLoop
@@ -212,9 +212,10 @@ class AS5048B(EncoderBase):  # ToDo: We use AS5048B -- need to look into name ch
         """Calculate angular velocity in radians per second"""
         try:
             # TODO: Add linearization logic here for the velocity attribute
-            LOGGER.warning(
+            LOGGER.log_rate_limited(
+                LogLevel.WARNING,
                 "Velocity attribute does not use the linearization map. "
-                "Please calculate the velocity using the position attribute."
+                "Please calculate the velocity using the position attribute.",
             )
             encAngleDataOld = AS5048B._get_14bit(self._encdata_old[4:6])
             encAngleDataNew = AS5048B._get_14bit(self._encdata_new[4:6])
@@ -1,2 +1,7 @@
+from .clock import *  # noqa: F403
+from .loopstats import *  # noqa: F403
+from .pipeline import *  # noqa: F403
+from .realtime import *  # noqa: F403
+from .scheduler import *  # noqa: F403
 from .softrealtimeloop import *  # noqa: F403
 from .units import *  # noqa: F403
@@ -0,0 +1,135 @@
+"""
+Clock module for opensourceleg library.
+
+Module Overview:
+
+This module defines the clocks that `SoftRealtimeLoop`, `RateMonotonicScheduler` and the state
+machine in `opensourceleg.control` read time from. By default they use `SystemClock`, which reads
+the monotonic system clock. Passing a `SimulatedClock` instead makes time advance only when the
+loop sleeps, so offline runs finish as fast as the code executes and give identical results on
+every run.
+
+Key Classes:
+
+- `Clock`: Abstract base class for clocks.
+- `SystemClock`: The monotonic system clock.
+- `SimulatedClock`: A clock that advances instantly when slept on.
+
+Usage Guide:
+
+1. Create a `SimulatedClock`.
+2. Pass it as `clock` to `SoftRealtimeLoop` and `StateMachine` (or `State`).
+3. Run the loop as usual: every tick advances the clock by exactly `dt`.
+"""
+
+import time
+from abc import ABC, abstractmethod
+
+__all__ = ["Clock", "SimulatedClock", "SystemClock"]
+
+
+class Clock(ABC):
+    """
+    Abstract base class for clocks.
+    """
+
+    @abstractmethod
+    def monotonic(self) -> float:
+        """
+        Get the current time.
+
+        Returns:
+            float: The current time in seconds. Only differences between readings are meaningful.
+        """
+        pass
+
+    @abstractmethod
+    def sleep(self, seconds: float) -> None:
+        """
+        Wait for a duration.
+
+        Args:
+            seconds (float): The duration in seconds.
+        """
+        pass
+
+    def sleep_until(self, deadline: float) -> None:
+        """
+        Wait until an absolute time on this clock.
+
+        Args:
+            deadline (float): The time to wait for in seconds.
+        """
+        remaining = deadline - self.monotonic()
+        if remaining > 0:
+            self.sleep(remaining)
+
+
+class SystemClock(Clock):
+    """
+    The monotonic system clock, read with `time.monotonic`.
+
+    Examples:
+        >>> clock = SystemClock()
+        >>> clock.monotonic()
+        12345.678
+    """
+
+    def __repr__(self) -> str:
+        return "SystemClock"
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float) -> None:
+        time.sleep(seconds)
+
+
+class SimulatedClock(Clock):
+    """
+    A clock that only advances when it is slept on or advanced explicitly.
+
+    Sleeping returns immediately after moving the clock forward, so code timed by this clock runs as
+    fast as it executes, and deterministically.
+
+    Args:
+        start (float): The initial time in seconds. Defaults to 0.0.
+
+    Examples:
+        >>> clock = SimulatedClock()
+        >>> clock.sleep(0.5)
+        >>> clock.monotonic()
+        0.5
+    """
+
+    def __init__(self, start: float = 0.0) -> None:
+        self._now: float = start
+
+    def __repr__(self) -> str:
+        return f"SimulatedClock(now={self._now})"
+
+    def monotonic(self) -> float:
+        return self._now
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            self._now += seconds
+
+    def sleep_until(self, deadline: float) -> None:
+        # Jump to the deadline exactly instead of accumulating rounding errors of deadline - now
+        if deadline > self._now:
+            self._now = deadline
+
+    def advance(self, seconds: float) -> None:
+        """
+        Move the clock forward, for example to simulate the time a computation takes.
+
+        Args:
+            seconds (float): The duration in seconds.
+
+        Raises:
+            ValueError: If the duration is negative.
+        """
+        if seconds < 0:
+            raise ValueError(f"A monotonic clock cannot go backwards, got {seconds} seconds")
+        self._now += seconds
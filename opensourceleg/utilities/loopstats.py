@@ -0,0 +1,244 @@
+"""
+Loop statistics module for opensourceleg library.
+
+Module Overview:
+
+This module defines `LoopStats`, the timing statistics kept by `SoftRealtimeLoop`. Wake-up
+latencies are counted in a fixed-bin histogram that is allocated once, so recording a tick
+does not grow any container, and tail percentiles such as p99.9 can be read at any time.
+Alongside the histogram it keeps the compute and sleep time of every iteration and counts
+deadline misses and runs of consecutive misses.
+
+Key Classes:
+
+- `LoopStats`: Fixed-bin latency histogram with compute time, sleep time and deadline-miss counters.
+
+Usage Guide:
+
+1. Read `loop.stats` of a running or finished `SoftRealtimeLoop`, for example `loop.stats.p99`.
+2. Call `loop.stats.track(LOGGER)` to record the timing of every tick in the logger, or
+   `loop.stats.summary()` to get all statistics as a dictionary.
+"""
+
+from typing import Any, Optional
+
+import numpy as np
+
+__all__ = ["LoopStats"]
+
+
+class LoopStats:
+    """
+    Fixed-bin latency histogram with compute time, sleep time and deadline-miss counters.
+
+    Latencies are counted in bins of `bin_width` seconds from 0 to `max_latency`; longer latencies are
+    counted in an overflow bin. Percentiles are reported as the upper edge of the bin they fall in, so
+    they are accurate to one bin width, except that the maximum is tracked exactly.
+
+    Args:
+        dt (float): The time step of the loop in seconds.
+        bin_width (float): The width of a histogram bin in seconds. Defaults to 10 microseconds.
+        max_latency (Optional[float]): The upper edge of the last regular bin in seconds. Defaults to `dt`.
+
+    Examples:
+        >>> stats = LoopStats(dt=0.001)
+        >>> stats.record(latency=20e-6, compute_time=400e-6, sleep_time=580e-6, missed=False)
+        >>> stats.p50
+        2e-05
+    """
+
+    def __init__(self, dt: float, bin_width: float = 1e-5, max_latency: Optional[float] = None) -> None:
+        if bin_width <= 0:
+            raise ValueError(f"bin_width must be positive, got {bin_width}")
+
+        self.dt: float = dt
+        self._bin_width: float = bin_width
+        bins = max(1, int(round((dt if max_latency is None else max_latency) / bin_width)))
+        self._histogram: np.ndarray = np.zeros(bins + 1, dtype=np.int64)  # The last bin counts overflows
+        self._last_bin: int = bins
+        self.reset()
+
+    def __repr__(self) -> str:
+        return f"LoopStats(count={self.count}, p99={self.p99:.6f}, deadline_misses={self.deadline_misses})"
+
+    def reset(self) -> None:
+        """
+        Clear all statistics. The histogram storage is kept for reuse.
+        """
+        self._histogram.fill(0)
+        self.count: int = 0
+        self.max_latency: float = 0.0
+        self.total_compute_time: float = 0.0
+        self.max_compute_time: float = 0.0
+        self.total_sleep_time: float = 0.0
+        self.deadline_misses: int = 0
+        self.consecutive_misses: int = 0
+        self.max_consecutive_misses: int = 0
+        self.last_latency: float = 0.0
+        self.last_compute_time: float = 0.0
+        self.last_sleep_time: float = 0.0
+
+    def record(self, latency: float, compute_time: float, sleep_time: float, missed: bool) -> None:
+        """
+        Record the timing of one iteration.
+
+        Args:
+            latency (float): How late the loop woke up relative to its deadline, in seconds.
+            compute_time (float): How long the loop body ran, in seconds.
+            sleep_time (float): How long the loop waited for the deadline, in seconds.
+            missed (bool): Whether the loop body returned after the deadline had already passed.
+        """
+        latency = abs(latency)
+        index = int(latency / self._bin_width)
+        self._histogram[index if index < self._last_bin else self._last_bin] += 1
+        self.count += 1
+        self.last_latency = latency
+        self.last_compute_time = compute_time
+        self.last_sleep_time = sleep_time
+        self.total_compute_time += compute_time
+        self.total_sleep_time += sleep_time
+        if latency > self.max_latency:
+            self.max_latency = latency
+        if compute_time > self.max_compute_time:
+            self.max_compute_time = compute_time
+
+        if missed:
+            self.deadline_misses += 1
+            self.consecutive_misses += 1
+            if self.consecutive_misses > self.max_consecutive_misses:
+                self.max_consecutive_misses = self.consecutive_misses
+        else:
+            self.consecutive_misses = 0
+
+    def percentile(self, q: float) -> float:
+        """
+        Get a latency percentile from the histogram.
+
+        Args:
+            q (float): The percentile, from 0 to 100.
+
+        Returns:
+            float: The upper edge of the bin that contains the percentile in seconds, capped at the
+                maximum latency. 0.0 if nothing has been recorded.
+        """
+        if not 0 <= q <= 100:
+            raise ValueError(f"q must be between 0 and 100, got {q}")
+        if self.count == 0:
+            return 0.0
+
+        rank = max(1, int(np.ceil(self.count * q / 100.0)))
+        index = int(np.searchsorted(np.cumsum(self._histogram), rank))
+        if index >= self._last_bin:
+            return self.max_latency
+        return min((index + 1) * self._bin_width, self.max_latency)
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Get all statistics as a dictionary.
+
+        Returns:
+            dict[str, Any]: The statistics, with times in seconds.
+        """
+        return {
+            "count": self.count,
+            "p50": self.p50,
+            "p99": self.p99,
+            "p999": self.p999,
+            "max_latency": self.max_latency,
+            "mean_compute_time": self.mean_compute_time,
+            "max_compute_time": self.max_compute_time,
+            "mean_sleep_time": self.mean_sleep_time,
+            "deadline_misses": self.deadline_misses,
+            "max_consecutive_misses": self.max_consecutive_misses,
+        }
+
+    def track(self, logger: Any, prefix: str = "loop_") -> None:
+        """
+        Record the timing of the latest iteration in every row of a logger.
+
+        Adds the columns `last_latency`, `last_compute_time`, `last_sleep_time`, `deadline_misses`
+        and `consecutive_misses`, each with the prefix.
+
+        Args:
+            logger (Logger): The logger, for example `LOGGER`.
+            prefix (str): The prefix of the column names. Defaults to "loop_".
+
+        Examples:
+            >>> loop = SoftRealtimeLoop(dt=0.001)
+            >>> loop.stats.track(LOGGER)
+        """
+        logger.track_attributes(
+            self,
+            ["last_latency", "last_compute_time", "last_sleep_time", "deadline_misses", "consecutive_misses"],
+            prefix=prefix,
+        )
+
+    @property
+    def histogram(self) -> np.ndarray:
+        """
+        Get a copy of the latency histogram.
+
+        Returns:
+            np.ndarray: The count of each bin. The last bin counts latencies of `max_latency` or more.
+        """
+        return self._histogram.copy()
+
+    @property
+    def bin_edges(self) -> np.ndarray:
+        """
+        Get the lower edges of the histogram bins.
+
+        Returns:
+            np.ndarray: The lower edge of each bin in seconds.
+        """
+        return np.arange(self._last_bin + 1) * self._bin_width
+
+    @property
+    def p50(self) -> float:
+        """
+        Get the median latency.
+
+        Returns:
+            float: The 50th percentile latency in seconds.
+        """
+        return self.percentile(50)
+
+    @property
+    def p99(self) -> float:
+        """
+        Get the 99th percentile latency.
+
+        Returns:
+            float: The 99th percentile latency in seconds.
+        """
+        return self.percentile(99)
+
+    @property
+    def p999(self) -> float:
+        """
+        Get the 99.9th percentile latency.
+
+        Returns:
+            float: The 99.9th percentile latency in seconds.
+        """
+        return self.percentile(99.9)
+
+    @property
+    def mean_compute_time(self) -> float:
+        """
+        Get the mean time the loop body ran per iteration.
+
+        Returns:
+            float: The mean compute time in seconds.
+        """
+        return self.total_compute_time / self.count if self.count else 0.0
+
+    @property
+    def mean_sleep_time(self) -> float:
+        """
+        Get the mean time the loop waited per iteration.
+
+        Returns:
+            float: The mean sleep time in seconds.
+        """
+        return self.total_sleep_time / self.count if self.count else 0.0
@@ -0,0 +1,605 @@
+"""
+Pipeline module for opensourceleg library.
+
+Module Overview:
+
+This module runs the parts of a controller, such as device I/O, the control law and logging, as
+separate processes so that they do not compete for the GIL. Each process runs its own
+`SoftRealtimeLoop`, and all loops start together so that their ticks stay aligned.
+
+The processes exchange fixed-layout records of float64 values through shared memory. Every stage
+writes one record, and any stage can read the records of the others. A record is double buffered:
+the writer fills the buffer that readers are not using and then publishes it by incrementing a
+sequence counter, so writing never waits for readers. A reader copies the published buffer and
+keeps the copy only if the counter did not change in the meantime, so it always sees a consistent
+snapshot of the latest complete record.
+
+Key Classes:
+
+- `SharedState`: A double-buffered record of named float64 values in shared memory.
+- `StateSnapshot`: A consistent copy of a record.
+- `PipelineStage`: One process of the pipeline.
+- `ControlPipeline`: Starts, runs and stops the stages.
+
+Usage Guide:
+
+1. Create a `ControlPipeline` with the time step of the fastest stage.
+2. Add a `PipelineStage` for each process, with the names of the values it writes and the stages it
+   reads from. Create devices in `setup`, which runs in the stage's own process.
+3. Start the pipeline with `start`, or use it as a context manager, and `stop` it when done.
+
+Examples:
+    >>> def control(inputs):
+    ...     return [-20.0 * inputs["io"]["knee_position"]]
+    >>> pipeline = ControlPipeline(dt=0.001)
+    >>> pipeline.add_stage(IOStage("io", outputs=["knee_position"], inputs=["control"]))
+    >>> pipeline.add_stage(PipelineStage("control", step=control, outputs=["knee_torque"], inputs=["io"]))
+    >>> with pipeline:
+    ...     time.sleep(10.0)
+"""
+
+import multiprocessing
+import os
+import struct
+import time
+from collections.abc import Sequence
+from multiprocessing import shared_memory
+from typing import Any, Callable, Optional, Union
+
+import numpy as np
+
+from opensourceleg.logging.logger import LOGGER
+from opensourceleg.logging.sharedmemory import (
+    attach_shared_memory,
+    create_shared_memory,
+    process_exists,
+    register_shared_memory,
+    unlink_shared_memory,
+)
+from opensourceleg.utilities.softrealtimeloop import SoftRealtimeLoop
+
+__all__ = ["ControlPipeline", "PipelineStage", "SharedState", "StateSnapshot"]
+
+_MAGIC = b"OSLR"
+_VERSION = 2
+# magic, version, fields, names length, owner pid, padding, then the sequence counter
+_HEADER = struct.Struct("<4sIIII4xQ")
+_SEQUENCE_OFFSET = _HEADER.size - 8
+_RECORD_FIELDS = 2  # Tick and timestamp before the values of each buffer
+
+
+def _align(size: int) -> int:
+    return -(-size // 8) * 8
+
+
+def _is_abandoned(shm: shared_memory.SharedMemory) -> bool:
+    """
+    Check whether a shared memory block is a shared state record left behind by an owner that has exited.
+    """
+    if shm.size < _HEADER.size:
+        return False
+    magic, _, _, _, pid, _ = _HEADER.unpack_from(shm.buf)  # type: ignore[arg-type]
+    if magic != _MAGIC:
+        return False
+    return not process_exists(pid)
+
+
+class StateSnapshot:
+    """
+    A consistent copy of a `SharedState` record.
+
+    Values can be read by name, for example `snapshot["knee_position"]`.
+
+    Attributes:
+        tick (int): The tick of the writing stage's loop when the record was written, or -1 if nothing
+            has been written yet.
+        timestamp_ns (int): The `time.monotonic_ns()` time the record was written, or 0 if nothing has
+            been written yet.
+        values (np.ndarray): The float64 values, in the order of the record's field names.
+    """
+
+    __slots__ = ("_index", "tick", "timestamp_ns", "values")
+
+    def __init__(self, tick: int, timestamp_ns: int, values: np.ndarray, index: dict[str, int]) -> None:
+        self.tick: int = tick
+        self.timestamp_ns: int = timestamp_ns
+        self.values: np.ndarray = values
+        self._index = index
+
+    def __repr__(self) -> str:
+        return f"StateSnapshot(tick={self.tick}, values={dict(zip(self._index, self.values.tolist()))})"
+
+    def __getitem__(self, name: str) -> float:
+        return float(self.values[self._index[name]])
+
+    @property
+    def age(self) -> float:
+        """
+        Get the time since the record was written.
+
+        Returns:
+            float: The age in seconds.
+        """
+        return (time.monotonic_ns() - self.timestamp_ns) * 1e-9
+
+
+class SharedState:
+    """
+    A double-buffered record of named float64 values in shared memory, with one writer and any number
+    of readers in any process.
+
+    Writing never blocks. Reading copies the latest complete record and retries if the writer published
+    a new record during the copy, which only happens if the copy takes longer than a writer tick.
+
+    Args:
+        name (str): The name of the shared memory block.
+        fields (Optional[Sequence[str]]): The names of the values. If given, a new block is created and
+            this object owns it; a block with the same name left behind by an owner that has exited is
+            replaced. If None, attach to an existing block. Defaults to None.
+
+    Raises:
+        FileExistsError: If creating and a block with the same name is owned by a running process.
+        FileNotFoundError: If attaching and no block with that name exists.
+        ValueError: If attaching and the block is not a shared state record.
+
+    Examples:
+        >>> state = SharedState("osl_io", ["knee_position", "knee_velocity"])
+        >>> state.write([0.1, 0.0], tick=0)
+        >>> SharedState("osl_io").read()["knee_position"]
+        0.1
+    """
+
+    def __init__(self, name: str, fields: Optional[Sequence[str]] = None) -> None:
+        self._owner: bool = fields is not None
+        if fields is not None:
+            self._fields = [str(f) for f in fields]
+            encoded_fields = "\n".join(self._fields).encode("utf-8")
+            size = _align(_HEADER.size + len(encoded_fields)) + 2 * (_RECORD_FIELDS + len(self._fields)) * 8
+            self._shm = create_shared_memory(name, size, is_stale=_is_abandoned)
+            buffer: memoryview = self._shm.buf  # type: ignore[assignment]
+            buffer[: _HEADER.size] = _HEADER.pack(
+                _MAGIC, _VERSION, len(self._fields), len(encoded_fields), os.getpid(), 0
+            )
+            buffer[_HEADER.size : _HEADER.size + len(encoded_fields)] = encoded_fields
+        else:
+            self._shm = attach_shared_memory(name)
+            buffer = self._shm.buf  # type: ignore[assignment]
+            magic, version, field_count, fields_length, _, _ = _HEADER.unpack_from(buffer)
+            if magic != _MAGIC or version != _VERSION:
+                self._shm.close()
+                raise ValueError(f"Shared memory block {name} is not a shared state record")
+            encoded_fields = bytes(buffer[_HEADER.size : _HEADER.size + fields_length])
+            self._fields = encoded_fields.decode("utf-8").split("\n") if field_count else []
+
+        self._index: dict[str, int] = {field: i for i, field in enumerate(self._fields)}
+        self._sequence: Optional[np.ndarray] = np.ndarray((1,), dtype=np.uint64, buffer=buffer, offset=_SEQUENCE_OFFSET)
+        self._buffers: Optional[np.ndarray] = np.ndarray(
+            (2, _RECORD_FIELDS + len(self._fields)),
+            dtype=np.uint64,
+            buffer=buffer,
+            offset=_align(_HEADER.size + len(encoded_fields)),
+        )
+        self._scratch: np.ndarray = np.zeros(_RECORD_FIELDS + len(self._fields), dtype=np.uint64)
+
+    def __repr__(self) -> str:
+        return f"SharedState(name={self.name}, fields={self._fields})"
+
+    def write(self, values: Union[Sequence[float], np.ndarray], tick: int = 0) -> None:
+        """
+        Publish a new record.
+
+        Only one process may write a record.
+
+        Args:
+            values (Union[Sequence[float], np.ndarray]): One value per field.
+            tick (int): The tick of the writer's loop. Defaults to 0.
+
+        Raises:
+            RuntimeError: If the record has been closed.
+        """
+        sequence, buffers = self._active()
+        next_sequence = int(sequence[0]) + 1
+        record = buffers[next_sequence % 2]
+        record[0] = tick
+        record[1] = time.monotonic_ns()
+        record.view(np.float64)[_RECORD_FIELDS:] = values
+        sequence[0] = next_sequence
+
+    def read(self, retries: int = 8) -> StateSnapshot:
+        """
+        Copy the latest complete record.
+
+        Args:
+            retries (int): How many times to retry if the writer published during the copy. Defaults to 8.
+
+        Returns:
+            StateSnapshot: The record. Its tick is -1 if nothing has been written yet.
+
+        Raises:
+            RuntimeError: If no consistent copy could be made, or the record has been closed.
+        """
+        sequence, buffers = self._active()
+        scratch = self._scratch
+        for _ in range(retries + 1):
+            published = int(sequence[0])
+            scratch[:] = buffers[published % 2]
+            if int(sequence[0]) == published:
+                if published == 0:
+                    return StateSnapshot(-1, 0, scratch.view(np.float64)[_RECORD_FIELDS:].copy(), self._index)
+                return StateSnapshot(
+                    int(scratch[0].view(np.int64)),
+                    int(scratch[1].view(np.int64)),
+                    scratch.view(np.float64)[_RECORD_FIELDS:].copy(),
+                    self._index,
+                )
+        raise RuntimeError(f"Could not read a consistent record from {self.name}")
+
+    def _active(self) -> tuple[np.ndarray, np.ndarray]:
+        if self._sequence is None or self._buffers is None:
+            raise RuntimeError(f"SharedState {self.name} is closed")
+        return self._sequence, self._buffers
+
+    def close(self) -> None:
+        """
+        Detach from the shared memory block, and remove it if this object created it.
+        """
+        if self._sequence is None:
+            return
+
+        # Views must be dropped before the shared memory block can be closed
+        self._sequence = None
+        self._buffers = None
+        if self._owner:
+            unlink_shared_memory(self._shm)
+        else:
+            self._shm.close()
+
+    @property
+    def name(self) -> str:
+        """
+        Get the name of the shared memory block.
+
+        Returns:
+            str: The name.
+        """
+        return self._shm.name
+
+    @property
+    def fields(self) -> list[str]:
+        """
+        Get the names of the values.
+
+        Returns:
+            list[str]: The field names.
+        """
+        return list(self._fields)
+
+    @property
+    def sequence(self) -> int:
+        """
+        Get the number of records written.
+
+        Returns:
+            int: The number of records.
+        """
+        return int(self._active()[0][0])
+
+
+class PipelineStage:
+    """
+    One process of a `ControlPipeline`.
+
+    On every tick of its loop the stage reads the records of its input stages, calls `step` with them,
+    and writes the returned values to its own record. Pass a `step` function, or subclass and override
+    `setup`, `step` and `teardown`. The stage object is sent to its process when the pipeline starts,
+    so create devices and other resources in `setup`, not in `__init__`.
+
+    Args:
+        name (str): The name of the stage.
+        step (Optional[Callable[[dict[str, StateSnapshot]], Optional[Sequence[float]]]]): The function
+            called on every tick with the snapshots of the input stages by name. It returns one value
+            per output, or None to leave the record unchanged. Defaults to None, which calls the `step`
+            method.
+        outputs (Sequence[str]): The names of the values the stage writes. Defaults to none.
+        inputs (Sequence[str]): The names of the stages whose records the stage reads. Defaults to none.
+        divisor (int): Run the stage on every `divisor`-th tick of the pipeline. Defaults to 1.
+
+    Examples:
+        >>> class IOStage(PipelineStage):
+        ...     def setup(self):
+        ...         self.knee = DephyActuator(port="/dev/ttyACM0")
+        ...         self.knee.start()
+        ...     def step(self, inputs):
+        ...         self.knee.set_motor_torque(inputs["control"]["knee_torque"])
+        ...         self.knee.update()
+        ...         return [self.knee.output_position]
+        ...     def teardown(self):
+        ...         self.knee.stop()
+    """
+
+    def __init__(
+        self,
+        name: str,
+        step: Optional[Callable[[dict[str, StateSnapshot]], Optional[Sequence[float]]]] = None,
+        outputs: Sequence[str] = (),
+        inputs: Sequence[str] = (),
+        divisor: int = 1,
+    ) -> None:
+        if divisor < 1:
+            raise ValueError(f"divisor must be at least 1, got {divisor}")
+
+        self.name: str = name
+        self.outputs: list[str] = list(outputs)
+        self.inputs: list[str] = list(inputs)
+        self.divisor: int = divisor
+        self._step = step
+
+    def __repr__(self) -> str:
+        return f"PipelineStage(name={self.name}, inputs={self.inputs}, outputs={self.outputs})"
+
+    def setup(self) -> None:
+        """
+        Prepare the stage. Called once in the stage's process before the first tick.
+        """
+        pass
+
+    def step(self, inputs: dict[str, StateSnapshot]) -> Optional[Sequence[float]]:
+        """
+        Run one tick of the stage.
+
+        Args:
+            inputs (dict[str, StateSnapshot]): The latest record of each input stage, by stage name.
+
+        Returns:
+            Optional[Sequence[float]]: One value per output, or None to leave the record unchanged.
+        """
+        if self._step is None:
+            raise NotImplementedError(f"PipelineStage {self.name} needs a step function or a step method")
+        return self._step(inputs)
+
+    def teardown(self) -> None:
+        """
+        Release the stage's resources. Called once in the stage's process after the last tick.
+        """
+        pass
+
+
+def _run_stage(
+    stage: PipelineStage,
+    state_names: dict[str, str],
+    dt: float,
+    ready: Any,
+    go: Any,
+    stop: Any,
+) -> None:
+    """
+    Entry point of a stage's process.
+    """
+    output: Optional[SharedState] = None
+    inputs: dict[str, SharedState] = {}
+    # The parent process owns the blocks, so attaching here must not hand them to the resource tracker
+    register_shared_memory(state_names.values())
+    try:
+        stage.setup()
+        if stage.outputs:
+            output = SharedState(state_names[stage.name])
+        inputs = {name: SharedState(state_names[name]) for name in stage.inputs}
+        # Start all loops together so that their ticks line up
+        ready.release()
+        go.wait()
+
+        loop = SoftRealtimeLoop(dt=dt * stage.divisor, report=False)
+        for _t in loop:
+            if stop.is_set():
+                loop.stop()
+                continue
+            values = stage.step({name: state.read() for name, state in inputs.items()})
+            if values is not None and output is not None:
+                output.write(values, tick=loop.n)
+    except Exception:
+        LOGGER.exception(f"Pipeline stage {stage.name} failed, stopping the pipeline")
+        stop.set()
+        raise
+    finally:
+        stage.teardown()
+        for state in [output, *inputs.values()]:
+            if state is not None:
+                state.close()
+
+
+class ControlPipeline:
+    """
+    Runs the stages of a controller in separate processes that exchange state through shared memory.
+
+    The pipeline creates one `SharedState` record per stage with outputs, named `<name>_<stage>`, starts
+    one process per stage, and waits until every stage has finished its setup before all loops start
+    together. If a stage raises an exception, the other stages stop too.
+
+    Args:
+        dt (float): The time step of the pipeline in seconds. A stage runs every `divisor` time steps.
+            Defaults to 0.001.
+        name (str): The prefix of the shared memory block names. Defaults to "osl".
+        start_method (Optional[str]): The multiprocessing start method, for example "spawn". Defaults to
+            None, which uses the platform default.
+
+    Examples:
+        >>> pipeline = ControlPipeline(dt=0.001)
+        >>> pipeline.add_stage(IOStage("io", outputs=["knee_position"], inputs=["control"]))
+        >>> pipeline.add_stage(PipelineStage("control", step=control, outputs=["knee_torque"], inputs=["io"]))
+        >>> pipeline.start()
+        >>> pipeline.read("io")["knee_position"]
+        0.12
+        >>> pipeline.stop()
+    """
+
+    def __init__(self, dt: float = 0.001, name: str = "osl", start_method: Optional[str] = None) -> None:
+        self.dt: float = dt
+        self.name: str = name
+        self._context: Any = multiprocessing.get_context(start_method)
+        self._stages: dict[str, PipelineStage] = {}
+        self._states: dict[str, SharedState] = {}
+        self._processes: list[Any] = []
+        self._stop_event: Any = None
+        self._go_event: Any = None
+
+    def __repr__(self) -> str:
+        return f"ControlPipeline(name={self.name}, stages={list(self._stages)})"
+
+    def __enter__(self) -> "ControlPipeline":
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    def add_stage(self, stage: PipelineStage) -> PipelineStage:
+        """
+        Add a stage. Stages can only be added while the pipeline is stopped.
+
+        Args:
+            stage (PipelineStage): The stage.
+
+        Returns:
+            PipelineStage: The stage.
+
+        Raises:
+            ValueError: If a stage with that name already exists.
+            RuntimeError: If the pipeline is running.
+        """
+        if self.is_running:
+            raise RuntimeError("Cannot add a stage to a running pipeline")
+        if stage.name in self._stages:
+            raise ValueError(f"A stage named {stage.name} already exists")
+        self._stages[stage.name] = stage
+        return stage
+
+    def start(self, timeout: float = 10.0) -> None:
+        """
+        Start the stage processes and wait until every stage has finished its setup.
+
+        Args:
+            timeout (float): How long to wait for the setup of the stages in seconds. Defaults to 10.0.
+
+        Raises:
+            ValueError: If a stage reads from a stage that does not exist or has no outputs.
+            RuntimeError: If the pipeline is already running, or a stage fails or times out during setup.
+        """
+        if self.is_running:
+            raise RuntimeError("The pipeline is already running")
+        for stage in self._stages.values():
+            for source in stage.inputs:
+                if source not in self._stages or not self._stages[source].outputs:
+                    raise ValueError(f"Stage {stage.name} reads from {source}, which has no outputs")
+
+        self._states = {
+            stage.name: SharedState(f"{self.name}_{stage.name}", stage.outputs)
+            for stage in self._stages.values()
+            if stage.outputs
+        }
+        state_names = {name: state.name for name, state in self._states.items()}
+        ready = self._context.Semaphore(0)
+        self._go_event = self._context.Event()
+        self._stop_event = self._context.Event()
+        self._processes = [
+            self._context.Process(
+                target=_run_stage,
+                args=(stage, state_names, self.dt, ready, self._go_event, self._stop_event),
+                name=f"{self.name}_{stage.name}",
+                daemon=True,
+            )
+            for stage in self._stages.values()
+        ]
+        for process in self._processes:
+            process.start()
+
+        if not self._wait_until_ready(ready, timeout):
+            self.stop()
+            raise RuntimeError("A pipeline stage failed or timed out during setup")
+        self._go_event.set()
+
+    def _wait_until_ready(self, ready: Any, timeout: float) -> bool:
+        """
+        Wait until every stage has finished its setup, or a stage has failed or died.
+
+        Args:
+            ready (Any): The semaphore each stage releases after its setup.
+            timeout (float): How long to wait in seconds.
+
+        Returns:
+            bool: True if every stage is ready; otherwise, False.
+        """
+        deadline = time.monotonic() + timeout
+        for _ in self._processes:
+            while not ready.acquire(timeout=0.05):
+                failed = self._stop_event.is_set() or not all(p.is_alive() for p in self._processes)
+                if failed or time.monotonic() > deadline:
+                    return False
+        return True
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """
+        Stop the stage processes and remove the shared memory blocks.
+
+        Args:
+            timeout (float): How long to wait for each stage to finish its teardown in seconds. Defaults to 2.0.
+        """
+        if self._stop_event is not None:
+            self._stop_event.set()
+            # Stages that are still waiting to start see the stop event on their first tick
+            self._go_event.set()
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                LOGGER.warning(f"Pipeline stage process {process.name} did not stop, terminating it")
+                process.terminate()
+                process.join()
+
+        for state in self._states.values():
+            state.close()
+        self._states = {}
+        self._stop_event = None
+
+    def read(self, stage_name: str) -> StateSnapshot:
+        """
+        Read the latest record of a stage, for example to monitor the pipeline from the parent process.
+
+        Args:
+            stage_name (str): The name of the stage.
+
+        Returns:
+            StateSnapshot: The record.
+
+        Raises:
+            KeyError: If the pipeline is not running or the stage has no outputs.
+        """
+        return self._states[stage_name].read()
+
+    @property
+    def stages(self) -> list[PipelineStage]:
+        """
+        Get the stages.
+
+        Returns:
+            list[PipelineStage]: The stages in the order they were added.
+        """
+        return list(self._stages.values())
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Check if the pipeline has been started and not stopped, and no stage has failed.
+
+        Returns:
+            bool: True if the pipeline is running; otherwise, False.
+        """
+        return self._stop_event is not None and not self._stop_event.is_set()
+
+    @property
+    def exitcodes(self) -> dict[str, Optional[int]]:
+        """
+        Get the exit code of each stage process of the last run.
+
+        Returns:
+            dict[str, Optional[int]]: The exit code by stage name, None for processes still running.
+        """
+        return {process.name.removeprefix(f"{self.name}_"): process.exitcode for process in self._processes}
@@ -0,0 +1,300 @@
+"""
+Real-time process setup helpers for opensourceleg library.
+
+Module Overview:
+
+This module defines `RealtimeProfile`, which shields a control loop from Linux scheduling and
+memory noise. It can switch the process to a real-time scheduling policy, pin it to a set of
+(ideally isolated) CPU cores, lock its memory with `mlockall`, pre-fault heap pages so that the
+loop does not take page faults, and disable the garbage collector while the loop runs.
+
+Every step is optional and falls back gracefully: a step that fails, typically because the
+process lacks `CAP_SYS_NICE` or `CAP_IPC_LOCK`, is recorded in the returned `RealtimeReport`
+and the remaining steps are still applied.
+
+Key Classes:
+
+- `RealtimeProfile`: The settings to apply, and the state needed to restore them.
+- `RealtimeReport`: What was applied and what failed.
+
+Key Functions:
+
+- `isolated_cpus`: The CPU cores isolated from the general scheduler with `isolcpus`.
+
+Usage Guide:
+
+1. Create a `RealtimeProfile`, for example `RealtimeProfile(priority=80, cpus=isolated_cpus())`.
+2. Pass it to `SoftRealtimeLoop(realtime_profile=...)`, or call `apply` and `restore` yourself
+   (or use the profile as a context manager).
+"""
+
+import ctypes
+import ctypes.util
+import gc
+import os
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+__all__ = ["RealtimeProfile", "RealtimeReport", "isolated_cpus"]
+
+MCL_CURRENT = 1
+MCL_FUTURE = 2
+M_TRIM_THRESHOLD = -1
+M_MMAP_MAX = -4
+# glibc defaults for the options above
+DEFAULT_TRIM_THRESHOLD = 128 * 1024
+DEFAULT_MMAP_MAX = 65536
+
+
+def _load_libc() -> ctypes.CDLL:
+    if not sys.platform.startswith("linux"):
+        raise OSError(f"This feature is only available on Linux, not {sys.platform}")
+    return ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+
+
+def _errno_error() -> OSError:
+    error = ctypes.get_errno()
+    return OSError(error, os.strerror(error))
+
+
+def isolated_cpus() -> set[int]:
+    """
+    Get the CPU cores isolated from the general scheduler with the `isolcpus` kernel parameter.
+
+    Returns:
+        set[int]: The isolated cores, or an empty set if there are none or this is not Linux.
+
+    Examples:
+        >>> isolated_cpus()
+        {3}
+    """
+    try:
+        with open("/sys/devices/system/cpu/isolated") as f:
+            text = f.read().strip()
+    except OSError:
+        return set()
+
+    cpus: set[int] = set()
+    for part in filter(None, text.split(",")):
+        first, _, last = part.partition("-")
+        cpus.update(range(int(first), int(last or first) + 1))
+    return cpus
+
+
+@dataclass
+class RealtimeReport:
+    """
+    What a call to `RealtimeProfile.apply` changed, and what failed.
+
+    Attributes:
+        scheduler (bool): Whether the real-time scheduling policy was applied.
+        affinity (bool): Whether the CPU affinity was applied.
+        memory_locked (bool): Whether memory was locked with `mlockall`.
+        prefaulted_bytes (int): The number of heap bytes pre-faulted.
+        gc_disabled (bool): Whether the garbage collector was disabled.
+        errors (list[str]): One message per step that failed.
+    """
+
+    scheduler: bool = False
+    affinity: bool = False
+    memory_locked: bool = False
+    prefaulted_bytes: int = 0
+    gc_disabled: bool = False
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """
+        Check if every requested step was applied.
+
+        Returns:
+            bool: True if no step failed; otherwise, False.
+        """
+        return not self.errors
+
+    def __str__(self) -> str:
+        applied = [
+            name
+            for name, done in [
+                ("scheduler", self.scheduler),
+                ("affinity", self.affinity),
+                ("memory lock", self.memory_locked),
+                (f"prefault {self.prefaulted_bytes} bytes", self.prefaulted_bytes > 0),
+                ("gc disabled", self.gc_disabled),
+            ]
+            if done
+        ]
+        text = f"Real-time profile applied: {', '.join(applied) or 'nothing'}."
+        if self.errors:
+            text += f" Failed: {'; '.join(self.errors)}."
+        return text
+
+
+class RealtimeProfile:
+    """
+    Real-time settings for the process running a control loop.
+
+    Args:
+        priority (Optional[int]): The `SCHED_FIFO` priority, from 1 to 99. None leaves the scheduling
+            policy unchanged. Defaults to 80.
+        cpus (Optional[Iterable[int]]): The CPU cores to pin the process to, for example `isolated_cpus()`.
+            None leaves the affinity unchanged. Defaults to None.
+        lock_memory (bool): Whether to lock current and future memory with `mlockall`. Defaults to True.
+        prefault_bytes (int): The number of heap bytes to allocate and touch once, after disabling heap
+            trimming, so that later allocations reuse resident pages. `restore` sets heap trimming back to
+            the glibc defaults. 0 disables. Defaults to 8 MiB.
+        disable_gc (bool): Whether to freeze the objects allocated so far and disable the garbage
+            collector until `restore`. Defaults to True.
+
+    Examples:
+        >>> profile = RealtimeProfile(priority=80, cpus=isolated_cpus())
+        >>> report = profile.apply()
+        >>> report.ok
+        True
+        >>> profile.restore()
+    """
+
+    def __init__(
+        self,
+        priority: Optional[int] = 80,
+        cpus: Optional[Iterable[int]] = None,
+        lock_memory: bool = True,
+        prefault_bytes: int = 8 * 1024 * 1024,
+        disable_gc: bool = True,
+    ) -> None:
+        if priority is not None and not 1 <= priority <= 99:
+            raise ValueError(f"priority must be between 1 and 99, got {priority}")
+        if prefault_bytes < 0:
+            raise ValueError(f"prefault_bytes must not be negative, got {prefault_bytes}")
+
+        self.priority: Optional[int] = priority
+        self.cpus: Optional[set[int]] = set(cpus) if cpus is not None else None
+        self.lock_memory: bool = lock_memory
+        self.prefault_bytes: int = prefault_bytes
+        self.disable_gc: bool = disable_gc
+
+        self._saved_scheduler: Optional[tuple[int, Any]] = None
+        self._saved_affinity: Optional[set[int]] = None
+        self._memory_locked: bool = False
+        self._heap_tuned: bool = False
+        self._gc_was_enabled: Optional[bool] = None
+        self._report: Optional[RealtimeReport] = None
+
+    def __repr__(self) -> str:
+        return f"RealtimeProfile(priority={self.priority}, cpus={self.cpus})"
+
+    def __enter__(self) -> RealtimeReport:
+        return self.apply()
+
+    def __exit__(self, *args: Any) -> None:
+        self.restore()
+
+    def apply(self) -> RealtimeReport:
+        """
+        Apply the profile to the calling process, skipping any step that fails.
+
+        Returns:
+            RealtimeReport: What was applied and what failed.
+        """
+        report = RealtimeReport()
+        if self.priority is not None:
+            report.scheduler = self._apply_step(report, "scheduler", self._set_scheduler)
+        if self.cpus is not None:
+            report.affinity = self._apply_step(report, "affinity", self._set_affinity)
+        if self.lock_memory:
+            report.memory_locked = self._apply_step(report, "memory lock", self._lock_memory)
+        if self.prefault_bytes and self._apply_step(report, "prefault", self._prefault_heap):
+            report.prefaulted_bytes = self.prefault_bytes
+        if self.disable_gc:
+            self._gc_was_enabled = gc.isenabled()
+            gc.freeze()
+            gc.disable()
+            report.gc_disabled = True
+
+        self._report = report
+        return report
+
+    def restore(self) -> None:
+        """
+        Undo the scheduling, affinity, memory lock and garbage collector changes made by `apply`.
+
+        The heap trimming and mmap options changed for pre-faulting are set back to the glibc defaults.
+        Any values set through `MALLOC_TRIM_THRESHOLD_` or `MALLOC_MMAP_MAX_` are not restored, and glibc
+        keeps its dynamic mmap threshold off once these options have been set.
+        """
+        if self._gc_was_enabled is not None:
+            gc.unfreeze()
+            if self._gc_was_enabled:
+                gc.enable()
+            self._gc_was_enabled = None
+
+        if self._memory_locked:
+            _load_libc().munlockall()
+            self._memory_locked = False
+
+        if self._heap_tuned:
+            libc = _load_libc()
+            libc.mallopt(M_TRIM_THRESHOLD, DEFAULT_TRIM_THRESHOLD)
+            libc.mallopt(M_MMAP_MAX, DEFAULT_MMAP_MAX)
+            self._heap_tuned = False
+
+        if self._saved_affinity is not None:
+            os.sched_setaffinity(0, self._saved_affinity)
+            self._saved_affinity = None
+
+        if self._saved_scheduler is not None:
+            policy, param = self._saved_scheduler
+            os.sched_setscheduler(0, policy, param)
+            self._saved_scheduler = None
+
+    def _apply_step(self, report: RealtimeReport, name: str, step: Callable[[], None]) -> bool:
+        try:
+            step()
+        except (OSError, AttributeError) as e:
+            # AttributeError: the os or libc function does not exist on this platform
+            report.errors.append(f"{name}: {e}")
+            return False
+        return True
+
+    def _set_scheduler(self) -> None:
+        saved = (os.sched_getscheduler(0), os.sched_getparam(0))
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(self.priority))  # type: ignore[arg-type]
+        self._saved_scheduler = saved
+
+    def _set_affinity(self) -> None:
+        saved = os.sched_getaffinity(0)
+        os.sched_setaffinity(0, self.cpus)  # type: ignore[arg-type]
+        self._saved_affinity = saved
+
+    def _lock_memory(self) -> None:
+        if _load_libc().mlockall(MCL_CURRENT | MCL_FUTURE) != 0:
+            raise _errno_error()
+        self._memory_locked = True
+
+    def _prefault_heap(self) -> None:
+        libc = _load_libc()
+        # Keep freed memory in the heap instead of returning it to the kernel
+        libc.mallopt(M_TRIM_THRESHOLD, -1)
+        libc.mallopt(M_MMAP_MAX, 0)
+        self._heap_tuned = True
+
+        libc.malloc.restype = ctypes.c_void_p
+        libc.memset.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_size_t]
+        libc.free.argtypes = [ctypes.c_void_p]
+        buffer = libc.malloc(ctypes.c_size_t(self.prefault_bytes))
+        if not buffer:
+            raise _errno_error()
+        libc.memset(buffer, 0, self.prefault_bytes)
+        libc.free(buffer)
+
+    @property
+    def report(self) -> Optional[RealtimeReport]:
+        """
+        Get the report of the last call to `apply`.
+
+        Returns:
+            Optional[RealtimeReport]: The report, or None if the profile has not been applied.
+        """
+        return self._report
@@ -0,0 +1,372 @@
+"""
+Scheduler module for opensourceleg library.
+
+Module Overview:
+
+This module defines `RateMonotonicScheduler`, which runs several periodic tasks at integer
+divisors of the rate of a `SoftRealtimeLoop`. Tasks run in rate-monotonic order: on each tick
+the tasks with the smallest divisor (the highest rate) run first. Each task is given a phase
+so that slow tasks are spread over different ticks instead of all landing on tick 0.
+
+Tasks can have an execution time budget. Before a task runs, the scheduler checks that its
+budget still fits in the time left in the tick. If it does not fit, for example because a
+higher-rate task overran, the task's `OverrunPolicy` decides whether this release is skipped
+or deferred to a later tick.
+
+Tasks marked as sheddable are low-priority work that the adaptive mode of the loop may switch off,
+lowest rate first, when the loop keeps missing its deadlines.
+
+Key Classes:
+
+- `OverrunPolicy`: What happens to a task that does not fit in the current tick.
+- `ScheduledTask`: A registered task with its timing statistics.
+- `RateMonotonicScheduler`: Runs the registered tasks on every tick of a loop.
+
+Usage Guide:
+
+1. Create a `RateMonotonicScheduler` with a `SoftRealtimeLoop`.
+2. Register tasks with `add_task`, giving each the divisor of the loop rate it runs at.
+3. Call `run`, or call `tick` once per iteration of your own loop.
+"""
+
+import math
+from enum import Enum
+from typing import Any, Callable, Optional
+
+from opensourceleg.utilities.softrealtimeloop import SoftRealtimeLoop
+
+__all__ = ["OverrunPolicy", "RateMonotonicScheduler", "ScheduledTask"]
+
+
+class OverrunPolicy(Enum):
+    """
+    Enum for what the RateMonotonicScheduler does with a task whose budget does not fit in the current tick.
+
+    Attributes:
+        SKIP: Drop this release of the task. It runs again at its next release.
+        DEFER: Keep the release pending and run it on the first later tick where it fits. A pending
+            release is dropped if the next release of the task arrives first.
+    """
+
+    SKIP = "skip"
+    DEFER = "defer"
+
+
+class ScheduledTask:
+    """
+    A task registered with a RateMonotonicScheduler, with its timing statistics.
+
+    Args:
+        func (Callable[[], Any]): The function to run.
+        name (str): The name of the task.
+        divisor (int): The task runs on every `divisor`-th tick.
+        phase (int): The tick, from 0 to `divisor - 1`, within each period that the task is released on.
+        budget (Optional[float]): The execution time budget in seconds. None means no budget.
+        policy (OverrunPolicy): What to do with a release whose budget does not fit in the tick.
+        sheddable (bool): Whether the task may be shed when the loop cannot keep up.
+    """
+
+    def __init__(
+        self,
+        func: Callable[[], Any],
+        name: str,
+        divisor: int,
+        phase: int,
+        budget: Optional[float],
+        policy: OverrunPolicy,
+        sheddable: bool = False,
+    ) -> None:
+        self.func = func
+        self.name: str = name
+        self.divisor: int = divisor
+        self.phase: int = phase
+        self.budget: Optional[float] = budget
+        self.policy: OverrunPolicy = policy
+        self.sheddable: bool = sheddable
+        self.reset()
+
+    def __repr__(self) -> str:
+        return f"ScheduledTask(name={self.name}, divisor={self.divisor}, phase={self.phase})"
+
+    def reset(self) -> None:
+        """
+        Clear the pending release and the statistics, and restore the task if it was shed.
+        """
+        self.is_shed: bool = False
+        self.pending: bool = False
+        self.runs: int = 0
+        self.skipped: int = 0
+        self.deferred: int = 0
+        self.overruns: int = 0
+        self.last_time: float = 0.0
+        self.max_time: float = 0.0
+        self.total_time: float = 0.0
+
+    def record(self, elapsed: float) -> None:
+        """
+        Record the execution time of one run.
+
+        Args:
+            elapsed (float): The execution time in seconds.
+        """
+        self.runs += 1
+        self.last_time = elapsed
+        self.total_time += elapsed
+        if elapsed > self.max_time:
+            self.max_time = elapsed
+        if self.budget is not None and elapsed > self.budget:
+            self.overruns += 1
+
+    @property
+    def mean_time(self) -> float:
+        """
+        Get the mean execution time.
+
+        Returns:
+            float: The mean execution time in seconds.
+        """
+        return self.total_time / self.runs if self.runs else 0.0
+
+
+class RateMonotonicScheduler:
+    """
+    Runs periodic tasks at integer divisors of the rate of a SoftRealtimeLoop, highest rate first.
+
+    The scheduler registers itself as a shed handler of the loop, so a loop in adaptive mode sheds the
+    sheddable tasks, lowest rate first, before it lowers its rate.
+
+    Args:
+        loop (SoftRealtimeLoop): The loop that drives the scheduler.
+        frame_budget (Optional[float]): The time in seconds that the tasks of one tick may use. Defaults
+            to the current time step of the loop, which grows if an adaptive loop lowers its rate.
+
+    Examples:
+        >>> loop = SoftRealtimeLoop(dt=0.001)
+        >>> scheduler = RateMonotonicScheduler(loop)
+        >>> scheduler.add_task(actuator.update, divisor=1, budget=0.0003)
+        >>> scheduler.add_task(fsm.update, divisor=5)
+        >>> scheduler.add_task(thermal_bookkeeping, divisor=1000, policy=OverrunPolicy.DEFER)
+        >>> scheduler.add_task(publish_plots, divisor=20, sheddable=True)
+        >>> scheduler.run()
+    """
+
+    def __init__(self, loop: SoftRealtimeLoop, frame_budget: Optional[float] = None) -> None:
+        self.loop: SoftRealtimeLoop = loop
+        self._frame_budget: Optional[float] = frame_budget
+        self._tasks: list[ScheduledTask] = []
+        self._tick: int = 0
+        loop.add_shed_handler(self.shed, self.restore_tasks)
+
+    def __repr__(self) -> str:
+        return f"RateMonotonicScheduler(tasks={[task.name for task in self._tasks]})"
+
+    def add_task(
+        self,
+        func: Callable[[], Any],
+        divisor: int = 1,
+        name: Optional[str] = None,
+        budget: Optional[float] = None,
+        policy: OverrunPolicy = OverrunPolicy.SKIP,
+        phase: Optional[int] = None,
+        sheddable: bool = False,
+    ) -> ScheduledTask:
+        """
+        Register a task.
+
+        Args:
+            func (Callable[[], Any]): The function to run.
+            divisor (int): Run the task on every `divisor`-th tick of the loop. Defaults to 1 (every tick).
+            name (Optional[str]): The name of the task. Defaults to the name of the function.
+            budget (Optional[float]): The execution time budget in seconds. Defaults to None (no budget).
+            policy (OverrunPolicy): What to do with a release whose budget does not fit in the tick.
+                Defaults to SKIP.
+            phase (Optional[int]): The tick within each period that the task is released on. Defaults to
+                the phase that overlaps least with the tasks already registered.
+            sheddable (bool): Whether the adaptive mode of the loop may shed the task when the loop cannot
+                keep up. Defaults to False.
+
+        Returns:
+            ScheduledTask: The registered task.
+
+        Raises:
+            ValueError: If the divisor, phase or budget is invalid, or the name is already taken.
+        """
+        if divisor < 1:
+            raise ValueError(f"divisor must be at least 1, got {divisor}")
+        if phase is not None and not 0 <= phase < divisor:
+            raise ValueError(f"phase must be between 0 and {divisor - 1}, got {phase}")
+        if budget is not None and budget <= 0:
+            raise ValueError(f"budget must be positive, got {budget}")
+
+        name = name or str(getattr(func, "__name__", repr(func)))
+        if any(task.name == name for task in self._tasks):
+            raise ValueError(f"A task named {name} is already registered")
+
+        if phase is None:
+            phase = self._least_loaded_phase(divisor)
+
+        task = ScheduledTask(func, name, divisor, phase, budget, policy, sheddable)
+        self._tasks.append(task)
+        # Rate-monotonic priority: highest rate first, then in order of registration
+        self._tasks.sort(key=lambda t: t.divisor)
+        return task
+
+    def remove_task(self, name: str) -> None:
+        """
+        Unregister a task.
+
+        Args:
+            name (str): The name of the task.
+
+        Raises:
+            KeyError: If no task has that name.
+        """
+        for task in self._tasks:
+            if task.name == name:
+                self._tasks.remove(task)
+                return
+        raise KeyError(name)
+
+    def shed(self) -> bool:
+        """
+        Stop running the sheddable task with the lowest rate that is still running.
+
+        Returns:
+            bool: True if a task was shed, or False if there is no sheddable task left.
+        """
+        for task in reversed(self._tasks):
+            if task.sheddable and not task.is_shed:
+                task.is_shed = True
+                task.pending = False
+                return True
+        return False
+
+    def restore_tasks(self) -> None:
+        """
+        Start running all shed tasks again.
+        """
+        for task in self._tasks:
+            task.is_shed = False
+
+    def _least_loaded_phase(self, divisor: int) -> int:
+        """
+        Find the phase for a new task that overlaps least with the tasks already registered.
+
+        A task with divisor d and phase p shares ticks with a task with divisor dj and phase pj only if
+        p and pj are equal modulo g = gcd(d, dj), and then on a fraction g / dj of the new task's releases.
+        Overlaps are weighted by the budget of the other task, or 1 if it has none.
+
+        Args:
+            divisor (int): The divisor of the new task.
+
+        Returns:
+            int: The phase with the least weighted overlap, the lowest such phase on ties.
+        """
+        costs = [0.0] * divisor
+        for task in self._tasks:
+            g = math.gcd(divisor, task.divisor)
+            weight = (task.budget or 1.0) * g / task.divisor
+            for phase in range(task.phase % g, divisor, g):
+                costs[phase] += weight
+        return costs.index(min(costs))
+
+    def tick(self) -> None:
+        """
+        Run the tasks released on the current tick, and any deferred tasks that fit, then advance the tick.
+        """
+        tick = self._tick
+        self._tick += 1
+        clock = self.loop.clock
+        frame_end = clock.monotonic() + self.frame_budget
+
+        for task in self._tasks:
+            if task.is_shed:
+                continue
+            if tick % task.divisor == task.phase:
+                if task.pending:
+                    # The deferred release never found room before the next one arrived
+                    task.skipped += 1
+                task.pending = True
+            elif not task.pending:
+                continue
+
+            start = clock.monotonic()
+            if task.budget is not None and start + task.budget > frame_end:
+                if task.policy == OverrunPolicy.DEFER:
+                    task.deferred += 1
+                else:
+                    task.pending = False
+                    task.skipped += 1
+                continue
+
+            task.pending = False
+            task.func()
+            task.record(clock.monotonic() - start)
+
+    def run(self) -> None:
+        """
+        Run the tasks on every iteration of the loop until the loop stops.
+        """
+        for _t in self.loop:
+            self.tick()
+
+    def reset(self) -> None:
+        """
+        Restart at tick 0 and clear the pending releases and statistics of every task.
+        """
+        self._tick = 0
+        for task in self._tasks:
+            task.reset()
+
+    def print_report(self) -> None:
+        """
+        Print the timing statistics of every task.
+        """
+        for task in self._tasks:
+            budget = f"{1e3 * task.budget:.3f}" if task.budget is not None else "none"
+            shed = " (shed)" if task.is_shed else ""
+            print(
+                f"{task.name}{shed} (every {task.divisor} ticks, phase {task.phase}, budget {budget} ms): "
+                f"{task.runs} runs, mean {1e3 * task.mean_time:.3f} ms, max {1e3 * task.max_time:.3f} ms, "
+                f"{task.overruns} overruns, {task.skipped} skipped, {task.deferred} deferred"
+            )
+
+    @property
+    def frame_budget(self) -> float:
+        """
+        Get the time that the tasks of one tick may use.
+
+        Returns:
+            float: The frame budget in seconds, or the current time step of the loop if none was given.
+        """
+        return self.loop.dt if self._frame_budget is None else self._frame_budget
+
+    @frame_budget.setter
+    def frame_budget(self, frame_budget: Optional[float]) -> None:
+        """
+        Set the time that the tasks of one tick may use.
+
+        Args:
+            frame_budget (Optional[float]): The frame budget in seconds. None follows the time step of the loop.
+        """
+        self._frame_budget = frame_budget
+
+    @property
+    def tasks(self) -> list[ScheduledTask]:
+        """
+        Get the registered tasks in the order they run within a tick.
+
+        Returns:
+            list[ScheduledTask]: The tasks.
+        """
+        return list(self._tasks)
+
+    @property
+    def tick_count(self) -> int:
+        """
+        Get the number of ticks run.
+
+        Returns:
+            int: The number of ticks.
+        """
+        return self._tick
@@ -1,16 +1,336 @@
+import asyncio
+import ctypes
+import errno
 import os
+import select
 import signal
 import sys
 import time
+from collections.abc import Awaitable
+from enum import Enum
 from math import sqrt
-from typing import Any, Callable
+from typing import Any, Callable, Optional, Union
+
+import numpy as np
+
+from opensourceleg.logging.logger import LOGGER
+from opensourceleg.utilities.clock import Clock, SystemClock
+from opensourceleg.utilities.loopstats import LoopStats
+from opensourceleg.utilities.realtime import RealtimeProfile, RealtimeReport, _load_libc
 
 # Calculate the precision of sleep. Python 3.11 has nanosecond sleep
 # Older versions have microsecond sleep
 python_version = sys.version_info.minor
 PRECISION_OF_SLEEP = 1e-09 if python_version >= 11 else 1e-06
+# The event loop rounds its select timeout up to whole milliseconds, so it may wake up to 1 ms late
+ASYNC_SLEEP_MARGIN = 1e-03
+
+__all__ = [
+    "AsyncSoftRealtimeLoop",
+    "LoopKiller",
+    "SleepBackend",
+    "SleepCalibrator",
+    "SoftRealtimeLoop",
+    "compare_sleep_backends",
+]
+
+CLOCK_MONOTONIC = 1  # Same clock as time.monotonic on Linux
+TIMER_ABSTIME = 1  # Also the value of TFD_TIMER_ABSTIME
+TFD_CLOEXEC = 0o2000000
+
+
+class SleepBackend(Enum):
+    """
+    Enum for the ways a SoftRealtimeLoop can wait for its next deadline.
+
+    Attributes:
+        BUSY_WAIT: Sleep until shortly before the deadline, then spin until it passes. Precise on any
+            platform, but keeps a CPU core busy for part of every tick.
+        CLOCK_NANOSLEEP: Sleep until the absolute deadline on CLOCK_MONOTONIC with
+            `clock_nanosleep(TIMER_ABSTIME)`. Linux only.
+        TIMERFD: Arm a `timerfd` with the absolute deadline on CLOCK_MONOTONIC and block on it. Linux only.
+    """
+
+    BUSY_WAIT = "busy_wait"
+    CLOCK_NANOSLEEP = "clock_nanosleep"
+    TIMERFD = "timerfd"
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = (("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long))
+
+
+class _Itimerspec(ctypes.Structure):
+    _fields_ = (("it_interval", _Timespec), ("it_value", _Timespec))
+
+
+def _set_timespec(timespec: _Timespec, deadline: float) -> None:
+    timespec.tv_sec, timespec.tv_nsec = divmod(round(deadline * 1e9), 1_000_000_000)
+
+
+class _ClockNanosleep:
+    """
+    Sleeps until an absolute CLOCK_MONOTONIC deadline with clock_nanosleep.
+    """
+
+    def __init__(self) -> None:
+        self._clock_nanosleep = _load_libc().clock_nanosleep
+        self._clock_nanosleep.argtypes = [
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.POINTER(_Timespec),
+            ctypes.POINTER(_Timespec),
+        ]
+        self._clock_nanosleep.restype = ctypes.c_int
+        self._deadline = _Timespec()
+
+    def sleep_until(self, deadline: float, wakeup_fd: Optional[int] = None) -> None:
+        # clock_nanosleep is never restarted after a signal handler, so it needs no wakeup fd
+        _set_timespec(self._deadline, deadline)
+        # Returns the error number directly; EINTR hands control back to check for a stop signal
+        result = self._clock_nanosleep(CLOCK_MONOTONIC, TIMER_ABSTIME, ctypes.byref(self._deadline), None)
+        if result not in (0, errno.EINTR):
+            raise OSError(result, os.strerror(result))
+
+    def close(self) -> None:
+        pass
+
+
+class _TimerFd:
+    """
+    Sleeps until an absolute CLOCK_MONOTONIC deadline by arming a timerfd and reading from it.
+    """
+
+    def __init__(self) -> None:
+        libc = _load_libc()
+        libc.timerfd_create.argtypes = [ctypes.c_int, ctypes.c_int]
+        libc.timerfd_create.restype = ctypes.c_int
+        self._timerfd_settime = libc.timerfd_settime
+        self._timerfd_settime.argtypes = [
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.POINTER(_Itimerspec),
+            ctypes.POINTER(_Itimerspec),
+        ]
+        self._timerfd_settime.restype = ctypes.c_int
+
+        self._fd: int = libc.timerfd_create(CLOCK_MONOTONIC, TFD_CLOEXEC)
+        if self._fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+        self._spec = _Itimerspec()
+
+    def sleep_until(self, deadline: float, wakeup_fd: Optional[int] = None) -> None:
+        _set_timespec(self._spec.it_value, deadline)
+        if self._timerfd_settime(self._fd, TIMER_ABSTIME, ctypes.byref(self._spec), None) < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+        if wakeup_fd is None:
+            # Blocks until the timer expires; returns at once if the deadline has already passed
+            os.read(self._fd, 8)
+            return
+
+        # Blocks until the timer expires or a signal arrives. Re-arming the timer clears a pending expiration.
+        readable, _, _ = select.select([self._fd, wakeup_fd], [], [])
+        if self._fd in readable:
+            os.read(self._fd, 8)
+        if wakeup_fd in readable:
+            _drain(wakeup_fd)
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def _drain(fd: int) -> None:
+    """
+    Reads everything written to a non-blocking pipe so far.
+    """
+    try:
+        while os.read(fd, 512):
+            pass
+    except BlockingIOError:
+        pass
+
+
+_wakeup_pipe: Optional[tuple[int, int]] = None
+
+
+def _register_wakeup_pipe() -> Optional[int]:
+    """
+    Registers the process-wide self-pipe as the signal wakeup fd, creating it on first use.
+
+    Returns:
+        Optional[int]: The read end of the pipe, or None if another wakeup fd, for example one set by
+            asyncio, is already registered.
+    """
+    global _wakeup_pipe
+    if _wakeup_pipe is None:
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        os.set_blocking(write_fd, False)
+        _wakeup_pipe = (read_fd, write_fd)
+
+    read_fd, write_fd = _wakeup_pipe
+    previous = signal.set_wakeup_fd(write_fd, warn_on_full_buffer=False)
+    if previous not in (-1, write_fd):
+        signal.set_wakeup_fd(previous)
+        return None
+    _drain(read_fd)
+    return read_fd
+
+
+def _forget_wakeup_pipe() -> None:
+    # A forked child must not share the pipe, or it would wake up on the parent's signals and vice versa
+    global _wakeup_pipe
+    if _wakeup_pipe is not None:
+        try:
+            previous = signal.set_wakeup_fd(-1)
+            if previous not in (-1, _wakeup_pipe[1]):
+                signal.set_wakeup_fd(previous)
+        except ValueError:
+            # Only the main thread can change the wakeup fd
+            pass
+        for fd in _wakeup_pipe:
+            os.close(fd)
+        _wakeup_pipe = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_wakeup_pipe)
+
+
+def _create_sleeper(backend: SleepBackend) -> Optional[Union[_ClockNanosleep, _TimerFd]]:
+    if backend == SleepBackend.CLOCK_NANOSLEEP:
+        return _ClockNanosleep()
+    if backend == SleepBackend.TIMERFD:
+        return _TimerFd()
+    return None
+
+
+class SleepCalibrator:
+    """
+    Measures how late sleeps wake up on this machine and derives how long before a deadline to stop
+    sleeping and start busy waiting.
+
+    The overshoot of the most recent sleeps is kept in a fixed-size window. The spin margin is the
+    chosen quantile of the overshoot minus the jitter target: a loop that sleeps until `margin` before
+    its deadline and busy waits for the rest wakes up at most `jitter_target` late in all but
+    (100 - quantile) % of the ticks, while spinning as little as possible. If the machine's sleeps are
+    already precise enough, the margin is 0 and the loop does not spin at all. The margin is capped at
+    `max_margin`, so that the loop keeps sleeping, and keeps measuring, after a burst of late wake-ups.
+
+    Args:
+        jitter_target (float): The latency in seconds that the loop may wake up late. Defaults to 0.0.
+        quantile (float): The percentile of the overshoot to plan for, from 0 to 100. Defaults to 99.0.
+        window (int): The number of recent overshoots to keep. Defaults to 256.
+        update_interval (int): Recompute the margin after this many new overshoots. Defaults to 32.
+        max_margin (float): The largest margin in seconds. Defaults to 1e-3 (1 millisecond).
+
+    Examples:
+        >>> calibrator = SleepCalibrator(jitter_target=20e-6)
+        >>> calibrator.calibrate()
+        >>> calibrator.margin
+        4.1e-05
+    """
+
+    def __init__(
+        self,
+        jitter_target: float = 0.0,
+        quantile: float = 99.0,
+        window: int = 256,
+        update_interval: int = 32,
+        max_margin: float = 1e-3,
+    ) -> None:
+        if jitter_target < 0:
+            raise ValueError(f"jitter_target must not be negative, got {jitter_target}")
+        if not 0 <= quantile <= 100:
+            raise ValueError(f"quantile must be between 0 and 100, got {quantile}")
+        if window < 1 or update_interval < 1:
+            raise ValueError("window and update_interval must be at least 1")
+
+        self.jitter_target: float = jitter_target
+        self.quantile: float = quantile
+        self.update_interval: int = update_interval
+        self.max_margin: float = max_margin
+        self._overshoots: np.ndarray = np.zeros(window)
+        self._count: int = 0
+        self._overshoot_quantile: float = 0.0
+        self._margin: float = 0.0
+
+    def __repr__(self) -> str:
+        return f"SleepCalibrator(margin={self._margin:.6f}, samples={self._count})"
+
+    def calibrate(
+        self, samples: int = 100, duration: float = 1e-4, sleep: Optional[Callable[[float], None]] = None
+    ) -> None:
+        """
+        Measures the overshoot of a series of short sleeps, for use before the loop starts.
+
+        Args:
+            samples (int): The number of sleeps. Defaults to 100.
+            duration (float): The duration of each sleep in seconds. Defaults to 100 microseconds.
+            sleep (Optional[Callable[[float], None]]): The sleep function to measure, which should be the one
+                the loop sleeps with, such as `LoopKiller.wait`. Defaults to None, which means `time.sleep`.
+        """
+        sleep = time.sleep if sleep is None else sleep
+        for _ in range(samples):
+            start = time.monotonic()
+            sleep(duration)
+            self.record(time.monotonic() - start - duration)
+        self.update()
+
+    def record(self, overshoot: float) -> None:
+        """
+        Records how late one sleep woke up, and recomputes the margin every `update_interval` sleeps.
+
+        Args:
+            overshoot (float): The time between the requested and the actual wake-up in seconds.
+        """
+        self._overshoots[self._count % len(self._overshoots)] = overshoot
+        self._count += 1
+        if self._count % self.update_interval == 0:
+            self.update()
+
+    def update(self) -> None:
+        """
+        Recomputes the margin from the recorded overshoots.
+        """
+        if self._count == 0:
+            return
+        self._overshoot_quantile = float(np.percentile(self._overshoots[: self._count], self.quantile))
+        self._margin = min(max(0.0, self._overshoot_quantile - self.jitter_target), self.max_margin)
+
+    @property
+    def margin(self) -> float:
+        """
+        Gets how long before a deadline to stop sleeping and start busy waiting.
+
+        Returns:
+            float: The margin in seconds.
+        """
+        return self._margin
 
-__all__ = ["LoopKiller", "SoftRealtimeLoop"]
+    @property
+    def overshoot_quantile(self) -> float:
+        """
+        Gets the planned-for quantile of the sleep overshoot.
+
+        Returns:
+            float: The overshoot in seconds.
+        """
+        return self._overshoot_quantile
+
+    @property
+    def samples(self) -> int:
+        """
+        Gets the number of overshoots recorded.
+
+        Returns:
+            int: The number of overshoots.
+        """
+        return self._count
 
 
 class LoopKiller:
@@ -22,6 +342,11 @@ class LoopKiller:
     when it detects a shutdown signal, it sets a flag, which is used by the Soft Realtime Loop to stop iterating.
     Typically, it detects the CTRL-C from your keyboard, which sends a SIGTERM signal.
 
+    On UNIX, the Loop Killer also registers a process-wide self-pipe with `signal.set_wakeup_fd`, unless
+    another wakeup fd is already registered. Python writes to the pipe whenever a signal arrives, so `wait`
+    and the timerfd sleep backend can block on the pipe together with the deadline and wake up as soon as
+    a shutdown signal arrives, without polling for signals.
+
     the function_in_loop argument to the Soft Realtime Loop's blocking_loop method is the function to be run every loop.
     A typical usage would set function_in_loop to be a method of an object, so that the object
     could store program state. See the 'ifmain' for two examples.
@@ -34,7 +359,7 @@ class LoopKiller:
 
     """
 
-    def __init__(self, fade_time: float = 0.0):
+    def __init__(self, fade_time: float = 0.0, clock: Optional[Clock] = None):
         if os.name == "posix":
             self.signals = [signal.SIGTERM, signal.SIGINT, signal.SIGHUP]
         else:
@@ -45,10 +370,40 @@ class LoopKiller:
 
         self._fade_time: float = fade_time
         self._soft_kill_time: float = 0.0
+        self._clock: Clock = SystemClock() if clock is None else clock
+        self._read_fd: Optional[int] = _register_wakeup_pipe() if os.name == "posix" else None
 
     def __repr__(self) -> str:
         return "LoopKiller"
 
+    def wait(self, timeout: float) -> None:
+        """
+        Sleeps for up to `timeout` seconds, returning early if a signal arrives.
+
+        Args:
+            timeout (float): The longest time to sleep in seconds.
+
+        Example:
+            >>> killer = LoopKiller()
+            >>> killer.wait(0.001)
+        """
+        if self._read_fd is None:
+            time.sleep(timeout)
+            return
+        readable, _, _ = select.select([self._read_fd], [], [], timeout)
+        if readable:
+            _drain(self._read_fd)
+
+    @property
+    def wakeup_fd(self) -> Optional[int]:
+        """
+        Gets the read end of the self-pipe, which becomes readable when a signal arrives.
+
+        Returns:
+            Optional[int]: The file descriptor, or None if the self-pipe is not registered.
+        """
+        return self._read_fd
+
     def handle_signal(self, signum: Any, frame: Any) -> None:
         """
         Method to handle the signal from the operating system.
@@ -80,7 +435,7 @@ class LoopKiller:
             >>> killer.get_fade()
         """
         if self._kill_soon:
-            t = time.monotonic() - self._soft_kill_time
+            t = self._clock.monotonic() - self._soft_kill_time
             if t >= self._fade_time:
                 return 0.0
             return 1.0 - (t / self._fade_time)
@@ -107,7 +462,7 @@ class LoopKiller:
         if self._kill_now:
             return True
         if self._kill_soon:
-            t = time.monotonic() - self._soft_kill_time
+            t = self._clock.monotonic() - self._soft_kill_time
             if t > self._fade_time:
                 self._kill_now = True
         return self._kill_now
@@ -129,7 +484,7 @@ class LoopKiller:
             else:
                 if self._fade_time > 0.0:
                     self._kill_soon = True
-                    self._soft_kill_time = time.monotonic()
+                    self._soft_kill_time = self._clock.monotonic()
                 else:
                     self._kill_now = True
         else:
@@ -162,7 +517,21 @@ class SoftRealtimeLoop:
     """
 
     def __init__(
-        self, dt: float = 0.001, report: bool = True, fade: float = 0.0, maintain_original_phase: bool = False
+        self,
+        dt: float = 0.001,
+        report: bool = True,
+        fade: float = 0.0,
+        maintain_original_phase: bool = False,
+        sleep_backend: SleepBackend = SleepBackend.BUSY_WAIT,
+        realtime_profile: Optional[RealtimeProfile] = None,
+        histogram_bin_width: float = 1e-5,
+        on_overrun: Optional[Callable[[float], None]] = None,
+        on_consecutive_misses: Optional[Callable[[int], None]] = None,
+        miss_limit: int = 5,
+        adaptive: bool = False,
+        max_dt: Optional[float] = None,
+        clock: Optional[Clock] = None,
+        jitter_target: Optional[float] = None,
     ):
         """
         Initializes the SoftRealtimeLoop.
@@ -174,19 +543,88 @@ class SoftRealtimeLoop:
             maintain_original_phase (bool): If True, the iterator will try to keep the time elapsed
                 equal to (loop_number * dt). If False, the iterator will only look at the difference
                 between the current loop and the previous loop. Default is False.
+            sleep_backend (SleepBackend): How to wait for the next deadline. The kernel timer backends
+                use far less CPU than BUSY_WAIT. If the selected backend is not available on this platform,
+                the loop falls back to BUSY_WAIT with a warning. Default is BUSY_WAIT.
+            realtime_profile (Optional[RealtimeProfile]): Real-time settings applied when iteration starts
+                and restored when it stops. Steps that fail are logged as a warning. Default is None.
+            histogram_bin_width (float): The bin width of the latency histogram in `stats`, in seconds.
+                Default is 1e-5 (10 microseconds).
+            on_overrun (Optional[Callable[[float], None]]): Called with the overrun in seconds whenever the
+                loop body returns after its deadline. Default is None.
+            on_consecutive_misses (Optional[Callable[[int], None]]): Called with the number of consecutive
+                deadline misses every time it reaches a multiple of `miss_limit`. Default is None.
+            miss_limit (int): The number of consecutive deadline misses that counts as the loop not keeping
+                up. Default is 5.
+            adaptive (bool): If True, the loop degrades every time it misses `miss_limit` deadlines in a row:
+                it first sheds low-priority work through the handlers added with `add_shed_handler`, and once
+                there is nothing left to shed, doubles its time step up to `max_dt`. The loop runs degraded
+                until it is reset. Default is False.
+            max_dt (Optional[float]): The largest time step the adaptive mode may lower the rate to. Default
+                is None, which means 4 * dt.
+            clock (Optional[Clock]): The clock the loop reads time from and sleeps on. With a `SimulatedClock`
+                every tick advances the clock by exactly `dt` without waiting, and `sleep_backend` is ignored.
+                Default is None, which means the system clock.
+            jitter_target (Optional[float]): With the BUSY_WAIT backend, measure the sleep overshoot of this
+                machine when iteration starts and keep measuring it online, and only busy wait for as long as
+                needed to wake up at most this many seconds late. See `SleepCalibrator`. Default is None,
+                which sleeps until `PRECISION_OF_SLEEP` before each deadline.
+
+        Raises:
+            ValueError: If `miss_limit` is less than 1.
         """
+        # Check the arguments before installing signal handlers or opening a kernel timer
+        if miss_limit < 1:
+            raise ValueError(f"miss_limit must be at least 1, got {miss_limit}")
+
+        self.clock: Clock = SystemClock() if clock is None else clock
+        self.sleep_backend: SleepBackend = sleep_backend
+        self._sleeper: Optional[Union[_ClockNanosleep, _TimerFd]] = None
+        self._sleep_fn: Optional[Callable[[float], None]] = None
+        if isinstance(self.clock, SystemClock):
+            try:
+                self._sleeper = _create_sleeper(sleep_backend)
+            except (OSError, AttributeError) as e:
+                LOGGER.warning(f"Sleep backend {sleep_backend.value} is not available, using busy_wait instead: {e}")
+                self.sleep_backend = SleepBackend.BUSY_WAIT
+            if self._sleeper is not None:
+                self._sleep_fn = self._sleep_on_kernel_timer
+        else:
+            # Busy waiting and kernel timers only work on the system clock
+            self._sleep_fn = self.clock.sleep_until
+
+        self.sleep_calibrator: Optional[SleepCalibrator] = None
+        if jitter_target is not None and self._sleep_fn is None:
+            # Sleep for at least half of every tick
+            self.sleep_calibrator = SleepCalibrator(jitter_target=jitter_target, max_margin=dt / 2)
+
+        self.realtime_profile: Optional[RealtimeProfile] = realtime_profile
+        self.realtime_report: Optional[RealtimeReport] = None
+
         self._fade_time: float = fade
         self.dt: float = dt
+        self.nominal_dt: float = dt
+        self.max_dt: float = 4 * dt if max_dt is None else max(dt, max_dt)
+        self.on_overrun: Optional[Callable[[float], None]] = on_overrun
+        self.on_consecutive_misses: Optional[Callable[[int], None]] = on_consecutive_misses
+        self.miss_limit: int = miss_limit
+        self.adaptive: bool = adaptive
+        self._shed_handlers: list[tuple[Callable[[], bool], Optional[Callable[[], None]]]] = []
+        self.shed_count: int = 0
         self.report: bool = report
         self._maintain_original_phase: bool = maintain_original_phase  # Can only be configured at init
-        self.loop_start_time: float = time.monotonic()
+        self.loop_start_time: float = self.clock.monotonic()
         self.loop_deadline: float = self.loop_start_time + self.dt
         self.iteration_start_time: float = self.loop_start_time
         self.sum_err: float = 0.0
         self.sum_var: float = 0.0
         self.sleep_t_agg: float = 0.0
+        self.stats: LoopStats = LoopStats(dt=dt, bin_width=histogram_bin_width)
+        self._last_error: float = 0.0
+        self._wake_time: float = 0.0
+        self.cpu_start_time: float = time.thread_time()
         self.n: int = 0
-        self.killer = LoopKiller(fade_time=self._fade_time)
+        self.killer = LoopKiller(fade_time=self._fade_time, clock=self.clock)
 
     def __repr__(self) -> str:
         """
@@ -200,17 +638,24 @@ class SoftRealtimeLoop:
     def __del__(self) -> None:
         """
         Destructor for the SoftRealtimeLoop.
-        Prints the performance report if reporting is enabled.
+        Prints the performance report if reporting is enabled and releases the sleep backend.
         """
-        self.print_report()
+        # __init__ may have raised before setting everything up
+        if getattr(self, "report", False):
+            self.print_report()
+        if getattr(self, "realtime_profile", None) is not None:
+            self.realtime_profile.restore()  # type: ignore[union-attr]
+        if getattr(self, "_sleeper", None) is not None:
+            self._sleeper.close()  # type: ignore[union-attr]
 
     def print_report(self) -> None:
         """
         Prints a performance report for the loop, including average error,
-        standard deviation of error, and percentage of time spent sleeping.
+        standard deviation of error, maximum error, and the percentages of time spent
+        sleeping and using the CPU, so that sleep backends can be compared.
         """
         if self.report and self.n > 0:
-            print("In %d cycles at %.2f Hz:" % (self.n, 1.0 / self.dt))
+            print("In %d cycles at %.2f Hz with %s:" % (self.n, 1.0 / self.dt, self.sleep_backend.value))
             print("\tavg error: %.3f milliseconds" % (1e3 * self.sum_err / self.n))
             if self.n > 1:
                 print(
@@ -219,13 +664,35 @@ class SoftRealtimeLoop:
                 )
             else:
                 print("\tstddev error: N/A (need at least 2 samples)")
+            stats = self.stats
+            print(
+                f"\tlatency p50 / p99 / p99.9 / max: {1e3 * stats.p50:.3f} / {1e3 * stats.p99:.3f} / "
+                f"{1e3 * stats.p999:.3f} / {1e3 * stats.max_latency:.3f} milliseconds"
+            )
+            print(
+                f"\tmean compute / sleep time: {1e3 * stats.mean_compute_time:.3f} / "
+                f"{1e3 * stats.mean_sleep_time:.3f} milliseconds"
+            )
+            print(f"\tdeadline misses: {stats.deadline_misses} (at most {stats.max_consecutive_misses} in a row)")
+            if self.sleep_calibrator is not None:
+                print(
+                    f"\tsleep overshoot p{self.sleep_calibrator.quantile:g}: "
+                    f"{1e3 * self.sleep_calibrator.overshoot_quantile:.3f} milliseconds, "
+                    f"busy wait margin: {1e3 * self.sleep_calibrator.margin:.3f} milliseconds"
+                )
+            if self.degraded:
+                print(
+                    f"\tdegraded: rate lowered to {1.0 / self.dt:.2f} Hz, " f"{self.shed_count} low-priority tasks shed"
+                )
 
             total_time = self.time_since_start
             print(f"\ttotal time: {total_time:.1f} s")
             if total_time > 0:
                 print("\tpercent of time sleeping: %.1f %%" % (self.sleep_t_agg / total_time * 100.0))
+                print("\tCPU usage: %.1f %%" % (self.cpu_time / total_time * 100.0))
             else:
                 print("\tpercent of time sleeping: N/A (total time is zero)")
+                print("\tCPU usage: N/A (total time is zero)")
 
     def reset(self) -> None:
         """
@@ -240,14 +707,25 @@ class SoftRealtimeLoop:
         """
         if self.n > 0:
             self.print_report()
-        self.loop_start_time = time.monotonic()
-        self.loop_deadline = self.loop_start_time + self.dt
-        self.iteration_start_time = self.loop_start_time
+        if self.realtime_profile is not None:
+            self.realtime_profile.restore()
+        self._restore_degradation()
+        self._start_timing()
         self.sum_err = 0.0
         self.sum_var = 0.0
         self.sleep_t_agg = 0.0
+        self.stats.reset()
         self.n = 0
-        self.killer = LoopKiller(fade_time=self._fade_time)
+        self.killer = LoopKiller(fade_time=self._fade_time, clock=self.clock)
+
+    def _start_timing(self) -> None:
+        """
+        Starts the loop timing and CPU time measurement from now.
+        """
+        self.loop_start_time = self.clock.monotonic()
+        self.loop_deadline = self.loop_start_time + self.dt
+        self.iteration_start_time = self.loop_start_time
+        self.cpu_start_time = time.thread_time()
 
     def run(self, function_to_run: Callable[[], int]) -> None:
         """
@@ -292,12 +770,20 @@ class SoftRealtimeLoop:
 
     def __iter__(self) -> "SoftRealtimeLoop":
         """
-        Resets the loop and returns the iterator object.
+        Resets the loop, applies the real-time profile if one is set, and returns the iterator object.
 
         Returns:
             SoftRealtimeLoop: The iterator object.
         """
         self.reset()
+        if self.realtime_profile is not None:
+            self.realtime_report = self.realtime_profile.apply()
+            if not self.realtime_report.ok:
+                LOGGER.warning(str(self.realtime_report))
+        if self.sleep_calibrator is not None and self.sleep_calibrator.samples == 0:
+            # Calibrate after the real-time profile is applied, since it changes how precisely the process sleeps
+            self.sleep_calibrator.calibrate(sleep=self.killer.wait)
+            self._start_timing()
         return self
 
     def __next__(self) -> float:
@@ -310,10 +796,100 @@ class SoftRealtimeLoop:
         Raises:
             StopIteration: If the loop is stopped.
         """
-        if self._maintain_original_phase:
-            return self._next_original_phase()
-        else:
-            return self._next_consistent_dt()
+        entered = self.clock.monotonic()
+        deadline = self.loop_deadline if self._maintain_original_phase else self.iteration_start_time + self.dt
+        first = self.n == 0
+        try:
+            t = self._next_original_phase() if self._maintain_original_phase else self._next_consistent_dt()
+        except StopIteration:
+            if self.realtime_profile is not None:
+                self.realtime_profile.restore()
+            raise
+
+        self._finish_tick(entered, deadline, first)
+        return t
+
+    def _finish_tick(self, entered: float, deadline: float, first: bool) -> None:
+        """
+        Records the timing of the iteration that just ended and handles a missed deadline.
+
+        Args:
+            entered (float): The time the loop body returned.
+            deadline (float): The deadline of the iteration.
+            first (bool): Whether this is the first iteration, which has no loop body to time.
+        """
+        woke = self.clock.monotonic()
+        if not first:
+            missed = entered > deadline
+            self.stats.record(self._last_error, entered - self._wake_time, woke - entered, missed)
+            if missed:
+                self._handle_miss(entered - deadline)
+        self._wake_time = woke
+
+    def _handle_miss(self, overrun: float) -> None:
+        """
+        Calls the overrun and consecutive miss callbacks, and degrades the loop in adaptive mode.
+
+        Args:
+            overrun (float): How long after its deadline the loop body returned, in seconds.
+        """
+        if self.on_overrun is not None:
+            self.on_overrun(overrun)
+
+        misses = self.stats.consecutive_misses
+        if misses % self.miss_limit == 0:
+            if self.on_consecutive_misses is not None:
+                self.on_consecutive_misses(misses)
+            if self.adaptive:
+                self.degrade()
+
+    def add_shed_handler(self, shed: Callable[[], bool], restore: Optional[Callable[[], None]] = None) -> None:
+        """
+        Registers low-priority work that the adaptive mode may shed before lowering the rate.
+
+        Handlers are tried in the order they were added.
+
+        Args:
+            shed (Callable[[], bool]): Sheds some work. Returns True if it shed anything, or False if
+                there is nothing left to shed.
+            restore (Optional[Callable[[], None]]): Restores all shed work. Called when the loop is reset.
+
+        Example:
+            >>> loop = SoftRealtimeLoop(dt=0.001, adaptive=True)
+            >>> loop.add_shed_handler(lambda: plotter.disable(), plotter.enable)
+        """
+        self._shed_handlers.append((shed, restore))
+
+    def degrade(self) -> bool:
+        """
+        Takes one degradation step: sheds low-priority work if any is left, otherwise doubles the time step
+        up to `max_dt`.
+
+        Returns:
+            bool: True if the loop was degraded, or False if it is already fully degraded.
+        """
+        for shed, _restore in self._shed_handlers:
+            if shed():
+                self.shed_count += 1
+                LOGGER.warning("SoftRealtimeLoop is missing deadlines, shed low-priority work")
+                return True
+
+        if self.dt >= self.max_dt:
+            return False
+
+        self.dt = min(2 * self.dt, self.max_dt)
+        LOGGER.warning(f"SoftRealtimeLoop is missing deadlines, lowered the rate to {1.0 / self.dt:.2f} Hz")
+        return True
+
+    def _restore_degradation(self) -> None:
+        """
+        Restores the nominal time step and all shed work.
+        """
+        self.dt = self.nominal_dt
+        self.shed_count = 0
+        for _shed, restore in self._shed_handlers:
+            if restore is not None:
+                restore()
 
     def _next_original_phase(self) -> float:
         """
@@ -332,6 +908,34 @@ class SoftRealtimeLoop:
             self.n += 1
             return self.time_since_start
 
+        if self._sleep_fn is not None:
+            self._sleep_until(self.loop_deadline)
+        else:
+            self._busy_wait_original_phase()
+
+        # If the loop is killed while we were waiting, raise a StopIteration
+        if self.killer.kill_now:
+            raise StopIteration
+
+        error = self.clock.monotonic() - self.loop_deadline  # seconds
+        self.sum_err += error
+        self.sum_var += error**2
+        self._last_error = error
+        self.n += 1
+
+        # Increase the dt naively based on the time that we should have slept
+        self.loop_deadline += self.dt
+
+        return self.loop_deadline - self.loop_start_time
+
+    def _busy_wait_original_phase(self) -> None:
+        """
+        Waits for the loop deadline by sleeping, then busy waiting for the remainder.
+        """
+        if self.sleep_calibrator is not None:
+            self._calibrated_wait(self.loop_deadline)
+            return
+
         ## Sleep the amount we need to satisfy the dt.
         sleep_curr_loop = 0.0
         # Calculate the time we need to sleep
@@ -339,14 +943,14 @@ class SoftRealtimeLoop:
 
         while time.monotonic() < self.loop_deadline - 2 * PRECISION_OF_SLEEP and not self.killer.kill_now:
             t_pre_sleep = time.monotonic()
-            time.sleep(max(PRECISION_OF_SLEEP, self.loop_deadline - time.monotonic() - PRECISION_OF_SLEEP))
+            self.killer.wait(max(PRECISION_OF_SLEEP, self.loop_deadline - time.monotonic() - PRECISION_OF_SLEEP))
             self.sleep_t_agg += time.monotonic() - t_pre_sleep
 
         while sleep_time > 0 and not self.killer.kill_now:
             # Calculate the time spent sleeping
             t_pre_sleep = time.monotonic()
             # Sleep for the time we need to satisfy the dt
-            time.sleep(max(PRECISION_OF_SLEEP, sleep_time + PRECISION_OF_SLEEP))
+            self.killer.wait(max(PRECISION_OF_SLEEP, sleep_time + PRECISION_OF_SLEEP))
             # Update the time spent sleeping to calculate the sleep percentage
             sleep_curr_loop += time.monotonic() - t_pre_sleep
             # Recalculate if we still need to sleep
@@ -355,24 +959,56 @@ class SoftRealtimeLoop:
         # Update the time slept
         self.sleep_t_agg += sleep_curr_loop
 
-        # Busy wait until the time we should be running at
+        # Busy wait until the time we should be running at. Signal handlers run between bytecodes and set
+        # kill_now, so there is no need to poll for signals here.
         while time.monotonic() < self.loop_deadline and not self.killer.kill_now:
-            if os.name == "posix" and signal.sigtimedwait(self.killer.signals, 0):
-                self.stop()
+            pass
 
-        # If the loop is killed while we were waiting, raise a StopIteration
-        if self.killer.kill_now:
-            raise StopIteration
+    def _calibrated_wait(self, deadline: float) -> None:
+        """
+        Sleeps until the calibrated margin before a deadline, records the overshoot of the sleep, and busy
+        waits for the rest.
 
-        error = time.monotonic() - self.loop_deadline  # seconds
-        self.sum_err += error
-        self.sum_var += error**2
-        self.n += 1
+        Args:
+            deadline (float): The deadline on the `time.monotonic` clock.
+        """
+        calibrator: SleepCalibrator = self.sleep_calibrator  # type: ignore[assignment]
+        wake_target = deadline - calibrator.margin
+        t_pre_sleep = time.monotonic()
+        if t_pre_sleep < wake_target:
+            self.killer.wait(wake_target - t_pre_sleep)
+            woke = time.monotonic()
+            self.sleep_t_agg += woke - t_pre_sleep
+            # A signal ends the sleep early, which says nothing about the overshoot
+            if woke >= wake_target:
+                calibrator.record(woke - wake_target)
+
+        while time.monotonic() < deadline and not self.killer.kill_now:
+            pass
+
+    def _sleep_until(self, deadline: float) -> None:
+        """
+        Waits for an absolute deadline with the kernel timer sleep backend, or on a clock other than the
+        system clock.
 
-        # Increase the dt naively based on the time that we should have slept
-        self.loop_deadline += self.dt
+        A signal interrupts the wait, so the loop still stops promptly when it is killed.
 
-        return self.loop_deadline - self.loop_start_time
+        Args:
+            deadline (float): The deadline on the loop's clock.
+        """
+        t_pre_sleep = self.clock.monotonic()
+        while not self.killer.kill_now and self.clock.monotonic() < deadline:
+            self._sleep_fn(deadline)  # type: ignore[misc]
+        self.sleep_t_agg += self.clock.monotonic() - t_pre_sleep
+
+    def _sleep_on_kernel_timer(self, deadline: float) -> None:
+        """
+        Sleeps until an absolute deadline with the kernel timer sleep backend, waking up early if a signal arrives.
+
+        Args:
+            deadline (float): The deadline on the `time.monotonic` clock.
+        """
+        self._sleeper.sleep_until(deadline, self.killer.wakeup_fd)  # type: ignore[union-attr]
 
     def _next_consistent_dt(self) -> float:
         """
@@ -392,19 +1028,12 @@ class SoftRealtimeLoop:
         if self.killer.kill_now:
             raise StopIteration
 
-        time_since_last_loop = time.monotonic() - self.iteration_start_time
-        sleep_time = max(self.dt - time_since_last_loop - 2 * PRECISION_OF_SLEEP, 0)
-        actual_time_to_sleep = max(PRECISION_OF_SLEEP, sleep_time)
-        time.sleep(actual_time_to_sleep)
-        # Update the time slept
-        self.sleep_t_agg += actual_time_to_sleep
-
-        # Busy wait to compensate for sleep durations precision
-        time_to_busy_wait = time.monotonic() + PRECISION_OF_SLEEP
-        while time.monotonic() < time_to_busy_wait and not self.killer.kill_now:
-            if os.name == "posix" and signal.sigtimedwait(self.killer.signals, 0):
-                self.stop()
+        if self._sleep_fn is not None:
+            self._sleep_until(self.iteration_start_time + self.dt)
+            if self.killer.kill_now:
                 raise StopIteration
+        else:
+            self._busy_wait_consistent_dt()
 
         ## Handle how much error that we have in a given loop
         # Calculate the error for the loop and update the max errors
@@ -412,6 +1041,7 @@ class SoftRealtimeLoop:
         # Update the statistics for the error
         self.sum_err += abs(error)
         self.sum_var += abs(error) ** 2
+        self._last_error = error
         self.n += 1
 
         # Update the previous loop time
@@ -419,6 +1049,64 @@ class SoftRealtimeLoop:
 
         return self.time_since_start
 
+    def _busy_wait_consistent_dt(self) -> None:
+        """
+        Waits for one time step after the previous iteration by sleeping, then busy waiting briefly.
+
+        Raises:
+            StopIteration: If a stop signal arrives while waiting.
+        """
+        if self.sleep_calibrator is not None:
+            self._calibrated_wait(self.iteration_start_time + self.dt)
+            if self.killer.kill_now:
+                raise StopIteration
+            return
+
+        time_since_last_loop = time.monotonic() - self.iteration_start_time
+        sleep_time = max(self.dt - time_since_last_loop - 2 * PRECISION_OF_SLEEP, 0)
+        actual_time_to_sleep = max(PRECISION_OF_SLEEP, sleep_time)
+        # Returns early if a signal arrives
+        self.killer.wait(actual_time_to_sleep)
+        # Update the time slept
+        self.sleep_t_agg += actual_time_to_sleep
+
+        # Busy wait to compensate for sleep durations precision
+        time_to_busy_wait = time.monotonic() + PRECISION_OF_SLEEP
+        while time.monotonic() < time_to_busy_wait and not self.killer.kill_now:
+            pass
+        if self.killer.kill_now:
+            raise StopIteration
+
+    @property
+    def max_err(self) -> float:
+        """
+        Gets the largest timing error since the loop started.
+
+        Returns:
+            float: The maximum absolute error in seconds.
+        """
+        return self.stats.max_latency
+
+    @property
+    def degraded(self) -> bool:
+        """
+        Checks if the adaptive mode has shed work or lowered the rate since the loop started.
+
+        Returns:
+            bool: True if the loop is degraded; otherwise, False.
+        """
+        return self.shed_count > 0 or self.dt != self.nominal_dt
+
+    @property
+    def cpu_time(self) -> float:
+        """
+        Gets the CPU time used by the thread running the loop since the loop started.
+
+        Returns:
+            float: The CPU time in seconds.
+        """
+        return time.thread_time() - self.cpu_start_time
+
     @property
     def time_since_start(self) -> float:
         """
@@ -437,7 +1125,127 @@ class SoftRealtimeLoop:
         Returns:
             float: The current monotonic time.
         """
-        return time.monotonic()
+        return self.clock.monotonic()
+
+
+class AsyncSoftRealtimeLoop(SoftRealtimeLoop):
+    """
+    Soft Realtime Loop for asyncio code, such as the `async` update methods of `MoteusActuator`.
+
+    Iterate over it with `async for`, or pass coroutine functions to `arun`. Between ticks the loop
+    awaits `asyncio.sleep`, so other tasks on the event loop keep running, and then waits out the last
+    `ASYNC_SLEEP_MARGIN` seconds the same way as `SoftRealtimeLoop`, because the event loop can only time
+    its wake-ups to the millisecond. Phase keeping, statistics, reporting, fade-out and the adaptive mode
+    behave exactly as in `SoftRealtimeLoop`.
+
+    Example:
+        >>> loop = AsyncSoftRealtimeLoop(dt=0.005)
+        >>> async for t in loop:
+        ...     await asyncio.gather(knee.update(), ankle.update())
+        >>> await loop.arun(knee.update, ankle.update)
+    """
+
+    def __repr__(self) -> str:
+        return "AsyncSoftRealtimeLoop"
+
+    def __aiter__(self) -> "AsyncSoftRealtimeLoop":
+        """
+        Resets the loop, applies the real-time profile if one is set, and returns the asynchronous iterator.
+
+        Returns:
+            AsyncSoftRealtimeLoop: The asynchronous iterator object.
+        """
+        self.__iter__()
+        return self
+
+    async def __anext__(self) -> float:
+        """
+        Waits for the next iteration without blocking the event loop.
+
+        Returns:
+            float: The time since the loop started.
+
+        Raises:
+            StopAsyncIteration: If the loop is stopped.
+        """
+        entered = self.clock.monotonic()
+        deadline = self.loop_deadline if self._maintain_original_phase else self.iteration_start_time + self.dt
+        first = self.n == 0
+        if not first and not self.killer.kill_now:
+            await self._async_sleep_until(deadline)
+
+        try:
+            # The deadline is at most ASYNC_SLEEP_MARGIN away, so this only waits out the remainder
+            t = self._next_original_phase() if self._maintain_original_phase else self._next_consistent_dt()
+        except StopIteration:
+            if self.realtime_profile is not None:
+                self.realtime_profile.restore()
+            raise StopAsyncIteration from None
+
+        self._finish_tick(entered, deadline, first)
+        return t
+
+    async def _async_sleep_until(self, deadline: float) -> None:
+        """
+        Awaits until shortly before an absolute deadline, or until the loop is killed.
+
+        Args:
+            deadline (float): The deadline on the loop's clock.
+        """
+        if not isinstance(self.clock, SystemClock):
+            # Simulated time does not pass while awaiting, so jump to the deadline and just yield
+            await asyncio.sleep(0)
+            return
+
+        t_pre_sleep = time.monotonic()
+        remaining = deadline - ASYNC_SLEEP_MARGIN - t_pre_sleep
+        while remaining > 0 and not self.killer.kill_now:
+            await asyncio.sleep(remaining)
+            remaining = deadline - ASYNC_SLEEP_MARGIN - time.monotonic()
+        self.sleep_t_agg += time.monotonic() - t_pre_sleep
+
+    async def arun(self, *functions_to_run: Callable[[], Awaitable[Any]]) -> None:
+        """
+        Runs the loop with the specified coroutine functions.
+
+        The coroutines of each tick run concurrently, so the updates of several devices overlap. The loop
+        stops when any of them returns 0.
+
+        Args:
+            *functions_to_run (Callable[[], Awaitable[Any]]): The coroutine functions to run in each loop
+                iteration.
+
+        Example:
+            >>> loop = AsyncSoftRealtimeLoop(dt=0.005)
+            >>> await loop.arun(knee.update, ankle.update)
+        """
+        async for _t in self:
+            results = await asyncio.gather(*(function() for function in functions_to_run))
+            if 0 in results:
+                self.stop()
+
+
+def compare_sleep_backends(dt: float = 0.001, duration: float = 1.0) -> None:
+    """
+    Runs an empty loop with each sleep backend in turn and prints its report.
+
+    Compare the CPU usage and error statistics of the kernel timer backends with BUSY_WAIT on the
+    target machine. Backends that are not available on this platform fall back to BUSY_WAIT.
+
+    Args:
+        dt (float): The time step of the loop in seconds. Default is 0.001 (1ms).
+        duration (float): How long to run each backend in seconds. Default is 1.0.
+
+    Example:
+        >>> compare_sleep_backends(dt=0.002, duration=5.0)
+    """
+    for backend in SleepBackend:
+        loop = SoftRealtimeLoop(dt=dt, report=True, sleep_backend=backend)
+        for t in loop:
+            if t >= duration:
+                loop.stop()
+        loop.print_report()
+        loop.report = False
 
 
 if __name__ == "__main__":
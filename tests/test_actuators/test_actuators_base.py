@@ -10,6 +10,7 @@ from opensourceleg.actuators.base import (
     CONTROL_MODES,
     MOTOR_CONSTANTS,
     ActuatorBase,
+    ActuatorState,
     ControlGains,
     ControlModeConfig,
     MethodWithRequiredModes,
@@ -17,6 +18,7 @@ from opensourceleg.actuators.base import (
     requires,
 )
 from opensourceleg.logging.exceptions import ControlModeException
+from opensourceleg.utilities.clock import SimulatedClock
 
 DEFAULT_VALUES = [0, 1, 1000, -1000]
 
@@ -556,3 +558,94 @@ def test_motor_constants(mock_actuator: MockActuator):
     assert mock_actuator.MOTOR_CONSTANTS.NM_S_PER_RAD_TO_B == 0.1
     assert mock_actuator.MOTOR_CONSTANTS.MAX_CASE_TEMPERATURE == 100.0
     assert mock_actuator.MOTOR_CONSTANTS.MAX_WINDING_TEMPERATURE == 150.0
+
+
+def test_mode_dispatch_table():
+    restricted = MockActuator._MODE_RESTRICTED_METHODS
+    assert "set_motor_voltage" in restricted[CONTROL_MODES.IDLE]
+    assert "set_motor_voltage" not in restricted[CONTROL_MODES.VOLTAGE]
+    assert "set_motor_position" not in restricted[CONTROL_MODES.IMPEDANCE]
+    assert MockActuator._MODE_TRANSITIONS[CONTROL_MODES.IDLE, CONTROL_MODES.CURRENT] == (
+        frozenset({"set_motor_current", "set_motor_torque", "set_output_torque", "set_current_gains"}),
+        frozenset(),
+    )
+
+
+def test_mode_switch_reuses_restricted_methods(mock_actuator: MockActuator):
+    restricted = mock_actuator.set_motor_voltage
+    mock_actuator.set_control_mode(CONTROL_MODES.VOLTAGE)
+
+    # An available method is the plain method of the class
+    assert "set_motor_voltage" not in vars(mock_actuator)
+    assert mock_actuator.set_motor_voltage.__func__ is MockActuator.set_motor_voltage
+
+    mock_actuator.set_control_mode(CONTROL_MODES.POSITION)
+    assert mock_actuator.set_motor_voltage is restricted
+    with pytest.raises(ControlModeException):
+        mock_actuator.set_motor_voltage(5.0)
+    mock_actuator.set_motor_position(1.0)
+
+
+def test_requires_overrides_method_modes():
+    class RestrictedActuator(MockActuator):
+        @requires(CONTROL_MODES.VOLTAGE, CONTROL_MODES.CURRENT)
+        def set_motor_voltage(self, value):
+            return value
+
+        @requires(CONTROL_MODES.POSITION)
+        def set_motor_home(self):
+            return True
+
+    actuator = RestrictedActuator("restricted", 10.0, MOTOR_CONSTANTS(1000, 0.1, 1.0, 0.1, 100.0, 150.0))
+    with pytest.raises(ControlModeException):
+        actuator.set_motor_home()
+
+    actuator.set_control_mode(CONTROL_MODES.CURRENT)
+    assert actuator.set_motor_voltage(5.0) == 5.0
+    with pytest.raises(ControlModeException):
+        actuator.set_motor_home()
+
+    actuator.set_control_mode(CONTROL_MODES.POSITION)
+    assert actuator.set_motor_home()
+    with pytest.raises(ControlModeException):
+        actuator.set_motor_voltage(5.0)
+
+
+def test_actuator_state():
+    state = ActuatorState()
+    assert state.motor_position == 0.0
+    with pytest.raises(AttributeError):
+        state.motor_angle = 1.0
+
+    state.motor_position = 1.5
+    snapshot = state.copy()
+    state.motor_position = 2.0
+    assert snapshot.motor_position == 1.5
+    assert snapshot.as_dict()["motor_position"] == 1.5
+    assert set(snapshot.as_dict()) == set(ActuatorState.__slots__)
+
+
+def test_command_deduplication(mock_actuator: MockActuator):
+    clock = SimulatedClock()
+
+    # Disabled by default: every command is sent
+    assert mock_actuator._command_changed("gains", 1.0, 2.0)
+    assert mock_actuator._command_changed("gains", 1.0, 2.0)
+
+    mock_actuator.set_command_deduplication(tolerance=0.5, keep_alive=0.1, clock=clock)
+    assert mock_actuator._command_changed("gains", 1.0, 2.0)
+    assert not mock_actuator._command_changed("gains", 1.0, 2.4)
+    assert mock_actuator._command_changed("setpoint", 1.0)
+    assert mock_actuator._command_changed("gains", 1.0, 2.6)
+    assert mock_actuator.skipped_commands == 1
+
+    clock.advance(0.05)
+    assert not mock_actuator._command_changed("gains", 1.0, 2.6)
+    clock.advance(0.15)
+    assert mock_actuator._command_changed("gains", 1.0, 2.6)
+
+    mock_actuator.set_control_mode(CONTROL_MODES.VOLTAGE)
+    assert mock_actuator._command_changed("gains", 1.0, 2.6)
+
+    with pytest.raises(ValueError):
+        mock_actuator.set_command_deduplication(tolerance=-1.0)
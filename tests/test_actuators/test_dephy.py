@@ -0,0 +1,111 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from opensourceleg.actuators.base import CONTROL_MODES
+from opensourceleg.actuators.dephy import (
+    M_PER_SEC_SQUARED_ACCLSB,
+    RAD_PER_DEG,
+    DephyActuator,
+    DephyLegacyActuator,
+)
+
+FRAME = {
+    "mot_ang": 8192,
+    "mot_vel": 90,
+    "mot_acc": 3,
+    "mot_volt": 12000,
+    "mot_cur": 1500,
+    "batt_volt": 36000,
+    "batt_curr": 200,
+    "temperature": 30,
+    "accelx": 8192,
+    "accely": 0,
+    "accelz": -8192,
+    "gyrox": 0,
+    "gyroy": 0,
+    "gyroz": 0,
+    "status_ex": 0,
+}
+
+
+@pytest.fixture
+def dephy_actuator():
+    actuator = DephyActuator(offline=True, gear_ratio=9.0)
+    actuator.read = lambda: FRAME
+    return actuator
+
+
+def test_update_decodes_state(dephy_actuator: DephyActuator):
+    assert dephy_actuator.motor_position == 0.0
+
+    dephy_actuator.update()
+    state = dephy_actuator.state
+    assert state.motor_encoder_counts == 8192
+    assert state.motor_position == pytest.approx(np.pi)
+    assert state.motor_velocity == pytest.approx(90 * RAD_PER_DEG)
+    assert state.motor_current == 1500.0
+    assert state.motor_torque == pytest.approx(1.5 * 0.1133)
+    assert state.accelx == pytest.approx(8192 * M_PER_SEC_SQUARED_ACCLSB)
+    assert state.winding_temperature > 0
+
+    assert dephy_actuator.motor_position == state.motor_position
+    assert dephy_actuator.output_position == pytest.approx(np.pi / 9.0)
+    assert dephy_actuator.output_torque == pytest.approx(state.motor_torque * 9.0)
+    assert dephy_actuator.case_temperature == 30.0
+    assert dephy_actuator.battery_voltage == 36000.0
+
+
+def test_state_follows_zero_position(dephy_actuator: DephyActuator):
+    dephy_actuator.update()
+    snapshot = dephy_actuator.state.copy()
+
+    dephy_actuator.set_motor_zero_position(np.pi / 2)
+    assert dephy_actuator.motor_position == pytest.approx(np.pi / 2)
+    assert snapshot.motor_position == pytest.approx(np.pi)
+
+    dephy_actuator.update()
+    assert dephy_actuator.motor_position == pytest.approx(np.pi / 2)
+
+
+def test_legacy_update_decodes_state(dephy_actuator: DephyActuator):
+    actuator = DephyLegacyActuator(offline=True, gear_ratio=9.0)
+    actuator.read = lambda: SimpleNamespace(**FRAME)
+    actuator.update()
+    dephy_actuator.update()
+    assert actuator.state.as_dict() == dephy_actuator.state.as_dict()
+
+
+def test_command_deduplication(dephy_actuator: DephyActuator):
+    sent = []
+    dephy_actuator.command_motor_voltage = lambda value: sent.append(value)
+    dephy_actuator.command_motor_current = lambda value: sent.append(value)
+    dephy_actuator.set_gains = lambda **gains: sent.append(gains)
+    dephy_actuator.stop_motor = lambda: None
+    dephy_actuator.set_command_deduplication(tolerance=0.0, keep_alive=None)
+    dephy_actuator.set_control_mode(CONTROL_MODES.VOLTAGE)
+
+    for _ in range(3):
+        dephy_actuator.set_motor_voltage(1000)
+    dephy_actuator.set_motor_voltage(1001)
+    assert sent == [1000, 1001]
+
+    dephy_actuator.set_control_mode(CONTROL_MODES.CURRENT)
+    sent.clear()
+    dephy_actuator.set_current_gains(kp=40, ki=400, kd=0, ff=128)
+    dephy_actuator.set_current_gains(kp=40.2, ki=400, kd=0, ff=128)
+    dephy_actuator.set_motor_current(1000)
+    assert sent == [{"kp": 40, "ki": 400, "kd": 0, "k": 0, "b": 0, "ff": 128}, 1000]
+
+
+def test_missing_data_logged_per_actuator(monkeypatch):
+    from opensourceleg.actuators import dephy
+
+    calls = []
+    monkeypatch.setattr(dephy.LOGGER, "log_rate_limited", lambda level, msg, key=None: calls.append((msg, key)))
+    for tag in ["knee", "ankle"]:
+        DephyActuator(tag=tag, offline=True)._decode_state(None)
+
+    assert [key for _, key in calls] == [("knee", "no_data"), ("ankle", "no_data")]
+    assert calls[0][0].startswith("[knee] ")
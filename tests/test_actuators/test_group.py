@@ -0,0 +1,196 @@
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+from opensourceleg.actuators.base import (
+    CONTROL_MODE_CONFIGS,
+    CONTROL_MODES,
+    MOTOR_CONSTANTS,
+    ActuatorBase,
+)
+from opensourceleg.actuators.group import ActuatorGroup
+from opensourceleg.logging.exceptions import ControlModeException
+
+CONSTANTS = MOTOR_CONSTANTS(1000, 0.1, 1.0, 0.1, 100.0, 150.0)
+
+
+class RecordingActuator(ActuatorBase):
+    update_delay = 0.0
+
+    def __init__(self, tag, gear_ratio=10.0):
+        super().__init__(tag, gear_ratio, CONSTANTS)
+        self.commands = []
+        self.updates = 0
+        self._position = 0.0
+
+    @property
+    def _CONTROL_MODE_CONFIGS(self):
+        return CONTROL_MODE_CONFIGS()
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def update(self):
+        time.sleep(self.update_delay)
+        self.updates += 1
+
+    def set_motor_voltage(self, value):
+        self.commands.append(("voltage", value))
+
+    def set_motor_current(self, value):
+        self.commands.append(("current", value))
+
+    def set_motor_position(self, value):
+        self.commands.append(("position", value))
+        self._position = value
+
+    def set_motor_torque(self, value):
+        self.commands.append(("torque", value))
+
+    def set_output_torque(self, value):
+        self.commands.append(("output_torque", value))
+
+    def set_current_gains(self, kp=1.0, ki=2.0, kd=3.0, ff=4.0):
+        self.commands.append(("current_gains", kp, ki, kd, ff))
+
+    def set_position_gains(self, kp=1.0, ki=2.0, kd=3.0, ff=4.0):
+        self.commands.append(("position_gains", kp, ki, kd, ff))
+
+    def set_impedance_gains(self, kp=1.0, ki=2.0, kd=3.0, k=4.0, b=5.0, ff=6.0):
+        self.commands.append(("impedance_gains", kp, ki, kd, k, b, ff))
+
+    def home(self, *args, **kwargs):
+        pass
+
+    @property
+    def motor_position(self):
+        return self._position
+
+    @property
+    def motor_velocity(self):
+        return 0.0
+
+    @property
+    def motor_voltage(self):
+        return 0.0
+
+    @property
+    def motor_current(self):
+        return 0.0
+
+    @property
+    def motor_torque(self):
+        return 0.0
+
+    @property
+    def case_temperature(self):
+        return 25.0
+
+    @property
+    def winding_temperature(self):
+        return 30.0
+
+
+class BatchedActuator(RecordingActuator):
+    cycles = 0
+
+    @classmethod
+    async def update_group(cls, actuators, executor=None):
+        cls.cycles += 1
+        for actuator in actuators:
+            actuator.updates += 1
+
+
+def test_group_setters():
+    knee, ankle = RecordingActuator("knee"), RecordingActuator("ankle", gear_ratio=5.0)
+    joints = ActuatorGroup([knee, ankle])
+    assert len(joints) == 2
+    assert joints["ankle"] is ankle
+    assert joints.tags == ["knee", "ankle"]
+
+    joints.set_control_mode(CONTROL_MODES.POSITION)
+    assert joints.modes == [CONTROL_MODES.POSITION, CONTROL_MODES.POSITION]
+
+    joints.set_output_positions([1.0, 2.0])
+    assert knee.commands[-1] == ("position", 10.0)
+    assert ankle.commands[-1] == ("position", 10.0)
+    np.testing.assert_allclose(joints.output_positions, [1.0, 2.0])
+    np.testing.assert_allclose(joints.read_many(["motor_position", "case_temperature"]), [[10, 25], [10, 25]])
+
+    # A single value is used for every actuator, and missing gains keep the defaults
+    joints.set_position_gains(kp=7.0)
+    assert knee.commands[-1] == ("position_gains", 7.0, 2.0, 3.0, 4.0)
+    assert ankle.commands[-1] == ("position_gains", 7.0, 2.0, 3.0, 4.0)
+
+    with pytest.raises(ValueError):
+        joints.set_motor_positions([1.0, 2.0, 3.0])
+
+
+def test_group_validates_modes_before_sending():
+    knee, ankle = RecordingActuator("knee"), RecordingActuator("ankle")
+    joints = ActuatorGroup([knee, ankle])
+    joints.set_control_mode(CONTROL_MODES.CURRENT)
+    ankle.set_control_mode(CONTROL_MODES.VOLTAGE)
+
+    with pytest.raises(ControlModeException):
+        joints.set_motor_currents([1.0, 2.0])
+    assert knee.commands == []
+
+    with pytest.raises(ValueError):
+        ActuatorGroup([knee, RecordingActuator("knee")])
+    with pytest.raises(ValueError):
+        ActuatorGroup([])
+
+
+def test_group_update_parallel():
+    actuators = [RecordingActuator(f"joint_{i}") for i in range(4)]
+    for actuator in actuators:
+        actuator.update_delay = 0.05
+
+    with ActuatorGroup(actuators, parallel=True) as joints:
+        start = time.monotonic()
+        assert joints.update() is None
+        elapsed = time.monotonic() - start
+        executor = joints._executor
+
+    assert joints._executor is None
+    assert executor._shutdown
+    assert [actuator.updates for actuator in actuators] == [1, 1, 1, 1]
+    assert elapsed < 0.15
+
+
+def test_group_batched_update():
+    knee, ankle, hip = BatchedActuator("knee"), BatchedActuator("ankle"), RecordingActuator("hip")
+    joints = ActuatorGroup([knee, ankle, hip])
+
+    pending = joints.update()
+    assert pending is not None
+    assert hip.updates == 1
+    asyncio.run(pending)
+
+    assert BatchedActuator.cycles == 1
+    assert knee.updates == ankle.updates == 1
+
+
+class AsyncActuator(RecordingActuator):
+    async def set_motor_voltage(self, value):
+        await asyncio.sleep(0.05)
+        self.commands.append(("voltage", value))
+
+
+def test_group_async_setters_run_concurrently():
+    actuators = [AsyncActuator(f"joint_{i}") for i in range(4)]
+    joints = ActuatorGroup(actuators)
+    joints.set_control_mode(CONTROL_MODES.VOLTAGE)
+
+    start = time.monotonic()
+    asyncio.run(joints.set_motor_voltages([1.0, 2.0, 3.0, 4.0]))
+    elapsed = time.monotonic() - start
+
+    assert [actuator.commands for actuator in actuators] == [[("voltage", float(i))] for i in range(1, 5)]
+    assert elapsed < 0.15
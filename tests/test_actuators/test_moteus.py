@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+
+moteus = pytest.importorskip("opensourceleg.actuators.moteus")
+
+
+def test_missing_data_logged_per_actuator(monkeypatch):
+    calls = []
+    monkeypatch.setattr(moteus.LOGGER, "log_rate_limited", lambda level, msg, key=None: calls.append((msg, key)))
+    for tag in ["knee", "ankle"]:
+        assert moteus.MoteusActuator(tag=tag, offline=True).motor_voltage == 0.0
+
+    assert [key for _, key in calls] == [("knee", "no_data"), ("ankle", "no_data")]
+    assert calls[0][0].startswith("[knee] ")
+
+
+class FakeReply:
+    def __init__(self, servo_id):
+        self.id = servo_id
+        self.values = {
+            moteus.MoteusRegister.VOLTAGE: 24.0,
+            moteus.MoteusRegister.Q_CURRENT: 0.0,
+            moteus.MoteusRegister.TEMPERATURE: 30.0,
+        }
+
+
+class FakeTransport:
+    def __init__(self, replies):
+        self.replies = replies
+
+    async def cycle(self, commands):
+        return self.replies
+
+
+def test_update_group_missing_reply():
+    transport = FakeTransport([FakeReply(1)])
+    servos = []
+    for servo_id, tag in [(1, "knee"), (2, "ankle")]:
+        servo = moteus.MoteusActuator(tag=tag, servo_id=servo_id, offline=True)
+        moteus.Controller.__init__(servo, id=servo_id, transport=transport)
+        servo._interface.transport = transport
+        servo._command = servo.make_query()
+        servos.append(servo)
+
+    asyncio.run(moteus.MoteusActuator.update_group(servos))
+
+    knee, ankle = servos
+    assert knee.case_temperature == 30.0
+    assert ankle._data is None
+    assert ankle.case_temperature == 0.0
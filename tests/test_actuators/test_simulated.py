@@ -0,0 +1,120 @@
+import pytest
+
+from opensourceleg.actuators.base import CONTROL_MODES
+from opensourceleg.actuators.simulated import SIMULATED_ACTUATOR_CONSTANTS, SimulatedActuator
+from opensourceleg.extras.safety import ThermalLimitException
+from opensourceleg.logging.exceptions import ControlModeException
+from opensourceleg.utilities.clock import SimulatedClock
+from opensourceleg.utilities.softrealtimeloop import SoftRealtimeLoop
+
+
+def run(actuator: SimulatedActuator, updates: int) -> None:
+    for _ in range(updates):
+        actuator.update()
+
+
+@pytest.fixture
+def actuator():
+    actuator = SimulatedActuator(gear_ratio=9.0, frequency=1000, substeps=10)
+    actuator.start()
+    yield actuator
+    actuator.stop()
+
+
+def test_voltage_mode_reaches_back_emf_speed(actuator: SimulatedActuator):
+    assert actuator.mode == CONTROL_MODES.VOLTAGE
+    actuator.set_motor_voltage(6000)
+    run(actuator, 1000)
+
+    no_load_speed = 6.0 / SIMULATED_ACTUATOR_CONSTANTS.NM_PER_AMP
+    assert actuator.motor_velocity == pytest.approx(no_load_speed, rel=0.02)
+    assert actuator.motor_velocity < no_load_speed
+    assert actuator.motor_voltage == pytest.approx(6000)
+    assert actuator.elapsed_time == pytest.approx(1.0)
+
+
+def test_current_and_torque_modes(actuator: SimulatedActuator):
+    actuator.set_control_mode(CONTROL_MODES.CURRENT)
+    actuator.set_motor_current(2000)
+    run(actuator, 10)
+    assert actuator.motor_current == pytest.approx(2000, rel=1e-3)
+    assert actuator.motor_torque == pytest.approx(2.0 * SIMULATED_ACTUATOR_CONSTANTS.NM_PER_AMP, rel=1e-3)
+
+    actuator.set_control_mode(CONTROL_MODES.TORQUE)
+    actuator.set_output_torque(-0.9)
+    run(actuator, 10)
+    assert actuator.motor_torque == pytest.approx(-0.1, rel=1e-3)
+
+
+def test_position_and_velocity_modes(actuator: SimulatedActuator):
+    actuator.set_control_mode(CONTROL_MODES.POSITION)
+    actuator.set_position_gains(kp=30, ki=0, kd=0.05)
+    actuator.set_output_position(0.2)
+    run(actuator, 500)
+    assert actuator.output_position == pytest.approx(0.2, abs=1e-3)
+
+    with pytest.raises(ControlModeException):
+        actuator.set_motor_velocity(10.0)
+
+    actuator.set_control_mode(CONTROL_MODES.VELOCITY)
+    actuator.set_output_velocity(5.0)
+    run(actuator, 500)
+    assert actuator.output_velocity == pytest.approx(5.0, rel=0.01)
+
+
+def test_impedance_holds_load_with_scaled_stiffness(actuator: SimulatedActuator):
+    actuator.set_control_mode(CONTROL_MODES.IMPEDANCE)
+    # Held at the current position until a setpoint is given
+    run(actuator, 100)
+    assert actuator.output_position == pytest.approx(0.0, abs=1e-3)
+
+    actuator.load = lambda position, velocity: -10.0
+    actuator.set_output_impedance(k=100, b=3)
+    actuator.set_output_position(0.0)
+    run(actuator, 1000)
+    # The motor friction carries a little of the load
+    assert actuator.output_position == pytest.approx(-0.1, abs=2e-3)
+    assert actuator.output_velocity == pytest.approx(0.0, abs=1e-3)
+
+
+def test_idle_coasts_and_windings_heat(actuator: SimulatedActuator):
+    actuator.set_control_mode(CONTROL_MODES.CURRENT)
+    actuator.set_motor_current(15000)
+    run(actuator, 1000)
+    assert actuator.winding_temperature > actuator.case_temperature > 21.0
+
+    actuator.set_control_mode(CONTROL_MODES.IDLE)
+    velocity = actuator.motor_velocity
+    run(actuator, 10)
+    assert actuator.motor_current == 0.0
+    assert 0.0 < actuator.motor_velocity < velocity
+
+    actuator.thermal_model.T_w = actuator.max_winding_temperature + 1.0
+    with pytest.raises(ThermalLimitException):
+        actuator.update()
+
+
+def test_follows_simulated_clock():
+    clock = SimulatedClock()
+    actuator = SimulatedActuator(frequency=500, substeps=4, clock=clock)
+    loop = SoftRealtimeLoop(dt=0.01, report=False, clock=clock)
+    with actuator:
+        actuator.set_motor_voltage(3000)
+        for t in loop:
+            actuator.update()
+            if t >= 1.0:
+                loop.stop()
+
+    assert actuator.elapsed_time == pytest.approx(clock.monotonic(), abs=1e-9)
+
+
+def test_command_deduplication_follows_simulated_clock():
+    clock = SimulatedClock()
+    actuator = SimulatedActuator(clock=clock)
+    actuator.set_command_deduplication(tolerance=0.0, keep_alive=0.1)
+
+    assert actuator._command_changed("setpoint", 1.0)
+    clock.advance(0.05)
+    assert not actuator._command_changed("setpoint", 1.0)
+    clock.advance(0.1)
+    assert actuator._command_changed("setpoint", 1.0)
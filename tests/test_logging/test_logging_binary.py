@@ -0,0 +1,226 @@
+import os
+
+import numpy as np
+import pytest
+
+from opensourceleg.logging.binary import BinaryLogWriter, infer_dtype, read_binary_log
+from opensourceleg.logging.logger import DataFormat, Logger
+
+CURR_DIR = os.path.dirname(os.path.realpath(__file__))
+
+
+def test_infer_dtype():
+    dtype = infer_dtype(["flag", "count", "value", "label", "value"], [True, 3, 1.5, "idle", np.float32(2.0)])
+    assert dtype.names == ("flag", "count", "value", "label", "value_1")
+    assert dtype["flag"] == np.dtype("<f8")
+    assert dtype["count"] == np.dtype("<f8")
+    assert dtype["value"] == np.dtype("<f8")
+    assert dtype["label"].kind == "U"
+    assert dtype["value_1"] == np.dtype("<f8")
+
+
+def test_infer_dtype_integer_columns():
+    dtype = infer_dtype(["tick", "count", "tick"], [1, 2, 3], integer_columns=["tick"])
+    assert dtype["tick"] == np.dtype("<i8")
+    assert dtype["count"] == np.dtype("<f8")
+    # Only the first column with a duplicated name is an integer column
+    assert dtype["tick_1"] == np.dtype("<f8")
+
+
+def test_infer_dtype_length_mismatch():
+    with pytest.raises(ValueError):
+        infer_dtype(["a", "b"], [1])
+
+
+def test_binary_writer_round_trip(tmp_path):
+    path = str(tmp_path / "log.npy")
+    writer = BinaryLogWriter(path, ["step", "position"])
+    assert writer.dtype is None
+
+    writer.write_rows([[0, 0.5], [1, 0.75]])
+    writer.write_rows([[2, 1.0]])
+    writer.close()
+
+    assert writer.row_count == 3
+    data = read_binary_log(path)
+    assert list(data["step"]) == [0, 1, 2]
+    assert list(data["position"]) == [0.5, 0.75, 1.0]
+
+    # The header row count is kept up to date, so numpy can open the file directly
+    loaded = np.load(path, mmap_mode="r")
+    assert loaded.shape == (3,)
+    assert loaded.dtype == data.dtype
+
+
+def test_binary_writer_bad_values(tmp_path):
+    path = str(tmp_path / "log.npy")
+    writer = BinaryLogWriter(path, ["step", "position"])
+    writer.write_rows([[0, 0.5], [1, "ERROR"], [2]])
+    writer.close()
+
+    data = read_binary_log(path)
+    assert list(data["step"]) == [0, 1, 2]
+    assert data["position"][0] == 0.5
+    assert np.isnan(data["position"][1])
+    assert np.isnan(data["position"][2])
+
+
+def test_read_binary_log_recovers_truncated_file(tmp_path):
+    path = str(tmp_path / "log.npy")
+    writer = BinaryLogWriter(path, ["value"])
+    writer.write_rows([[1.0], [2.0]])
+    writer.close()
+
+    # Simulate rows appended after the last header update
+    with open(path, "ab") as f:
+        f.write(np.array([3.0], dtype="<f8").tobytes())
+
+    data = read_binary_log(path)
+    assert list(data["value"]) == [1.0, 2.0, 3.0]
+
+
+@pytest.fixture
+def binary_logger():
+    log = Logger(log_path=CURR_DIR, file_name="test_logging_binary", buffer_size=2)
+    log.reset()
+    log.set_data_format(DataFormat.BINARY)
+
+    yield log
+
+    log.set_data_format(DataFormat.CSV)
+    log.reset()
+    log.set_buffer_size(1000)
+    for ext in [".log", ".csv", ".npy"]:
+        file_path = os.path.join(CURR_DIR, f"test_logging_binary{ext}")
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+
+def test_logger_binary_format(binary_logger):
+    assert binary_logger.data_format == DataFormat.BINARY
+    assert binary_logger.binary_path.endswith("test_logging_binary.npy")
+
+    values = iter(range(5))
+    binary_logger.track_variable(lambda: next(values), "x")
+    binary_logger.track_variable(lambda: 0.5, "y")
+    for _ in range(5):
+        binary_logger.update()
+
+    # Values are kept typed in the buffer
+    assert list(binary_logger._buffer) == [[4, 0.5]]
+    binary_logger.close()
+
+    data = read_binary_log(binary_logger.binary_path)
+    assert data.dtype.names == ("x", "y")
+    assert list(data["x"]) == [0, 1, 2, 3, 4]
+    assert not os.path.exists(binary_logger.csv_path)
+
+
+def test_logger_binary_first_read_fails(binary_logger):
+    calls = iter(range(100))
+
+    def flaky():
+        if next(calls) == 0:
+            raise RuntimeError("sensor not ready")
+        return 1.5
+
+    binary_logger.track_variable(flaky, "x")
+    binary_logger.track_variable(lambda: 3, "slow", decimation=2)
+    for _ in range(4):
+        binary_logger.update()
+    binary_logger.close()
+
+    data = read_binary_log(binary_logger.binary_path)
+    assert data.dtype["x"] == np.dtype("<f8")
+    assert data.dtype["slow"] == np.dtype("<f8")
+    assert np.isnan(data["x"][0])
+    assert list(data["x"][1:]) == [1.5, 1.5, 1.5]
+
+
+def test_logger_binary_failed_reads_are_nan(binary_logger):
+    calls = iter(range(100))
+
+    def flaky():
+        if next(calls) % 2:
+            raise RuntimeError("sensor dropped out")
+        return 3
+
+    binary_logger.track_variable(flaky, "count")
+    binary_logger.track_variable(lambda: False, "flag")
+    for _ in range(4):
+        binary_logger.update()
+    binary_logger.close()
+
+    data = read_binary_log(binary_logger.binary_path)
+    np.testing.assert_array_equal(data["count"], [3, np.nan, 3, np.nan])
+    np.testing.assert_array_equal(data["flag"], [0, 0, 0, 0])
+
+
+def test_logger_binary_decimation(binary_logger):
+    binary_logger.track_variable(lambda: 7, "count", decimation=2)
+    binary_logger.track_variable(lambda: True, "flag", decimation=2)
+    binary_logger.track_variable(lambda: 1.5, "value")
+    for _ in range(4):
+        binary_logger.update()
+    binary_logger.close()
+
+    # Skipped ticks are NaN, not 0
+    data = read_binary_log(binary_logger.binary_path)
+    np.testing.assert_array_equal(data["count"], [7, np.nan, 7, np.nan])
+    np.testing.assert_array_equal(data["flag"], [1, np.nan, 1, np.nan])
+    np.testing.assert_array_equal(data["value"], [1.5, 1.5, 1.5, 1.5])
+
+
+def test_binary_writer_missing_values_use_fast_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "log.npy")
+    writer = BinaryLogWriter(path, ["count", "value"])
+    monkeypatch.setattr("opensourceleg.logging.binary._fill_value", lambda dtype: pytest.fail("slow path"))
+    writer.write_rows([[7, 1.5], [None, 1.5]])
+    writer.close()
+
+    data = read_binary_log(path)
+    assert data["count"][0] == 7
+    assert np.isnan(data["count"][1])
+
+
+def test_logger_binary_track_variable_mid_run(binary_logger):
+    binary_logger.track_variable(lambda: 1.0, "a")
+    for _ in range(3):
+        binary_logger.update()
+    first_path = binary_logger.binary_path
+    binary_logger.track_variable(lambda: 2, "b")
+    for _ in range(2):
+        binary_logger.update()
+    binary_logger.close()
+
+    data = read_binary_log(first_path)
+    assert data.dtype.names == ("a",)
+    assert list(data["a"]) == [1.0, 1.0, 1.0]
+
+    assert binary_logger.binary_path.endswith("test_logging_binary_1.npy")
+    data = read_binary_log(binary_logger.binary_path)
+    assert data.dtype.names == ("a", "b")
+    assert list(data["b"]) == [2, 2]
+    os.remove(binary_logger.binary_path)
+
+
+def test_binary_writer_infers_type_from_first_real_value(tmp_path):
+    path = str(tmp_path / "log.npy")
+    writer = BinaryLogWriter(path, ["a", "b"])
+    writer.write_rows([[None, float("nan")], [2, float("nan")]])
+    writer.close()
+
+    assert writer.dtype["a"] == np.dtype("<f8")
+    assert writer.dtype["b"] == np.dtype("<f8")
+
+
+def test_binary_writer_integer_columns(tmp_path):
+    path = str(tmp_path / "log.npy")
+    writer = BinaryLogWriter(path, ["tick", "value"], integer_columns=["tick"])
+    writer.write_rows([[2**60 + 1, 1], [2**60 + 2, None]])
+    writer.close()
+
+    data = read_binary_log(path)
+    assert list(data["tick"]) == [2**60 + 1, 2**60 + 2]
+    assert data["value"][0] == 1
+    assert np.isnan(data["value"][1])
@@ -0,0 +1,144 @@
+import csv
+import os
+
+import numpy as np
+import pytest
+
+from opensourceleg.logging.binary import read_binary_log
+from opensourceleg.logging.buffers import ArrayRingBuffer
+from opensourceleg.logging.logger import BufferBackend, DataFormat, Logger
+
+CURR_DIR = os.path.dirname(os.path.realpath(__file__))
+
+
+def test_ring_buffer_invalid_sizes():
+    with pytest.raises(ValueError):
+        ArrayRingBuffer(capacity=0)
+    with pytest.raises(ValueError):
+        ArrayRingBuffer(capacity=1, columns=-1)
+
+
+def test_ring_buffer_rows_and_timestamps():
+    buffer = ArrayRingBuffer(capacity=4, columns=2)
+    for i in range(3):
+        row = buffer.next_row(timestamp_ns=i * 10)
+        row[0] = i
+        row[1] = i * 2
+
+    assert len(buffer) == 3
+    np.testing.assert_array_equal(buffer.rows(), [[0, 0], [1, 2], [2, 4]])
+    np.testing.assert_array_equal(buffer.timestamps(), [0, 10, 20])
+
+    buffer.clear()
+    assert len(buffer) == 0
+    assert buffer.rows().shape == (0, 2)
+
+
+def test_ring_buffer_next_row_resets_values():
+    buffer = ArrayRingBuffer(capacity=1, columns=1)
+    buffer.next_row()[0] = 1.0
+    buffer.clear()
+    assert np.isnan(buffer.next_row()[0])
+
+
+def test_ring_buffer_overwrites_oldest():
+    buffer = ArrayRingBuffer(capacity=3, columns=1)
+    for i in range(5):
+        buffer.next_row(timestamp_ns=i)[0] = i
+
+    assert buffer.overwritten_rows == 2
+    np.testing.assert_array_equal(buffer.rows()[:, 0], [2, 3, 4])
+    np.testing.assert_array_equal(buffer.timestamps(), [2, 3, 4])
+
+
+def test_ring_buffer_columns():
+    buffer = ArrayRingBuffer(capacity=3, columns=2)
+    row = buffer.next_row()
+    row[:] = [1, 2]
+
+    buffer.add_column()
+    assert buffer.columns == 3
+    assert np.isnan(buffer.rows()[0, 2])
+
+    buffer.remove_column(0)
+    np.testing.assert_array_equal(buffer.rows()[0, :1], [2])
+    assert buffer.columns == 2
+
+
+def test_ring_buffer_resize():
+    buffer = ArrayRingBuffer(capacity=4, columns=1)
+    for i in range(4):
+        buffer.next_row(timestamp_ns=i)[0] = i
+
+    buffer.resize(2)
+    assert buffer.capacity == 2
+    assert buffer.overwritten_rows == 2
+    np.testing.assert_array_equal(buffer.rows()[:, 0], [2, 3])
+
+    buffer.resize(5)
+    buffer.next_row()[0] = 4
+    np.testing.assert_array_equal(buffer.rows()[:, 0], [2, 3, 4])
+
+
+@pytest.fixture
+def numpy_logger():
+    log = Logger(log_path=CURR_DIR, file_name="test_logging_buffers", buffer_size=3)
+    log.reset()
+    log.set_buffer_backend(BufferBackend.NUMPY)
+
+    yield log
+
+    log.set_buffer_backend(BufferBackend.DEQUE)
+    log.set_data_format(DataFormat.CSV)
+    log.reset()
+    log.set_buffer_size(1000)
+    for ext in [".log", ".csv", ".npy"]:
+        file_path = os.path.join(CURR_DIR, f"test_logging_buffers{ext}")
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+
+def test_logger_numpy_backend_csv(numpy_logger):
+    assert numpy_logger.buffer_backend == BufferBackend.NUMPY
+    values = iter(range(4))
+    numpy_logger.track_variable(lambda: next(values), "x")
+    numpy_logger.track_variable(lambda: "text", "label")
+
+    for _ in range(4):
+        numpy_logger.update()
+
+    assert len(numpy_logger._buffer) == 0
+    assert len(numpy_logger._array_buffer) == 1
+    numpy_logger.close()
+
+    with open(numpy_logger.csv_path, newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows == [["x", "label"], ["0.0", "nan"], ["1.0", "nan"], ["2.0", "nan"], ["3.0", "nan"]]
+
+
+def test_logger_numpy_backend_adds_column_mid_run(numpy_logger):
+    numpy_logger.set_data_format(DataFormat.BINARY)
+    numpy_logger.track_variable(lambda: 1.0, "a")
+    numpy_logger.update()
+    numpy_logger.track_variable(lambda: 2.0, "b")
+    numpy_logger.update()
+    numpy_logger.close()
+
+    data = read_binary_log(numpy_logger.binary_path)
+    assert data.dtype.names == ("a", "b")
+    np.testing.assert_array_equal(data["a"], [1.0, 1.0])
+    assert np.isnan(data["b"][0])
+    assert data["b"][1] == 2.0
+
+
+def test_logger_numpy_backend_untracks_column(numpy_logger):
+    def failing():
+        raise ValueError("broken")
+
+    numpy_logger.set_max_errors_before_untrack(1)
+    numpy_logger.track_variable(failing, "bad")
+    numpy_logger.track_variable(lambda: 5.0, "good")
+    numpy_logger.update()
+
+    assert numpy_logger._array_buffer.columns == 1
+    np.testing.assert_array_equal(numpy_logger._array_buffer.rows(), [[5.0]])
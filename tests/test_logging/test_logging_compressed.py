@@ -0,0 +1,129 @@
+import os
+
+import pytest
+
+from opensourceleg.logging.compressed import (
+    CompressedLogReader,
+    CompressedLogWriter,
+    Compression,
+    available_compression,
+)
+from opensourceleg.logging.logger import DataFormat, Logger
+
+CURR_DIR = os.path.dirname(os.path.realpath(__file__))
+
+
+def write_frames(path, frames=3, rows_per_frame=4):
+    writer = CompressedLogWriter(path, ["t", "value"], codec=Compression.ZLIB)
+    for frame in range(frames):
+        start = frame * rows_per_frame
+        rows = [[t, t * 0.5] for t in range(start, start + rows_per_frame)]
+        writer.write_rows(rows, start_ns=start, end_ns=start + rows_per_frame - 1)
+    return writer
+
+
+def test_available_compression():
+    assert isinstance(available_compression(), Compression)
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "log.clog")
+    writer = write_frames(path)
+    writer.write_rows([])
+    writer.close()
+    assert writer.compression_ratio > 0
+
+    reader = CompressedLogReader(path)
+    assert reader.columns == ["t", "value"]
+    assert reader.codec == Compression.ZLIB
+    assert [frame.rows for frame in reader.frames] == [4, 4, 4]
+    rows = reader.read_all()
+    assert len(rows) == 12
+    assert rows[5] == ["5", "2.5"]
+
+
+def test_read_range_only_decompresses_overlapping_frames(tmp_path, monkeypatch):
+    path = str(tmp_path / "log.clog")
+    write_frames(path).close()
+
+    reader = CompressedLogReader(path)
+    read = []
+    original = reader.read_frame
+    monkeypatch.setattr(reader, "read_frame", lambda index: read.append(index) or original(index))
+
+    rows = reader.read_range(5, 6)
+    assert read == [1]
+    assert [row[0] for row in rows] == ["4", "5", "6", "7"]
+
+
+def test_index_rebuilt_without_footer(tmp_path):
+    path = str(tmp_path / "log.clog")
+    writer = write_frames(path)
+    # Simulate a crash: frames are on disk but the index was never written
+    writer._file.close()
+
+    reader = CompressedLogReader(path)
+    assert len(reader.frames) == 3
+    assert len(reader.read_all()) == 12
+
+
+def test_corrupt_frame(tmp_path):
+    path = str(tmp_path / "log.clog")
+    writer = write_frames(path, frames=1)
+    writer.close()
+
+    frame = CompressedLogReader(path).frames[0]
+    with open(path, "r+b") as f:
+        f.seek(frame.offset)
+        f.write(b"\x00")
+
+    with pytest.raises(ValueError):
+        CompressedLogReader(path).read_frame(0)
+
+
+def test_not_a_compressed_log(tmp_path):
+    path = tmp_path / "log.clog"
+    path.write_bytes(b"not a log")
+    with pytest.raises(ValueError):
+        CompressedLogReader(str(path))
+
+
+def test_write_after_close(tmp_path):
+    writer = write_frames(str(tmp_path / "log.clog"), frames=0)
+    writer.close()
+    with pytest.raises(ValueError):
+        writer.write_rows([[1, 2]])
+
+
+@pytest.fixture
+def compressed_logger():
+    log = Logger(log_path=CURR_DIR, file_name="test_logging_compressed", buffer_size=2)
+    log.reset()
+    log.set_data_format(DataFormat.COMPRESSED)
+
+    yield log
+
+    log.set_timestamp_columns(False)
+    log.set_data_format(DataFormat.CSV)
+    log.reset()
+    log.set_buffer_size(1000)
+    for path in [log.compressed_path, log.file_path]:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def test_logger_compressed_format(compressed_logger):
+    compressed_logger.set_timestamp_columns(True)
+    values = iter(range(5))
+    compressed_logger.track_variable(lambda: next(values), "x")
+    for _ in range(5):
+        compressed_logger.update()
+    compressed_logger.close()
+
+    reader = CompressedLogReader(compressed_logger.compressed_path)
+    assert reader.columns == ["timestamp_ns", "tick", "x"]
+    assert [frame.rows for frame in reader.frames] == [2, 2, 1]
+    rows = reader.read_all()
+    assert [row[2] for row in rows] == ["0", "1", "2", "3", "4"]
+    assert reader.frames[1].start_ns == int(rows[2][0])
+    assert reader.frames[1].end_ns == int(rows[3][0])
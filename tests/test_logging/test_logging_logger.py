@@ -4,9 +4,11 @@ import os
 from collections import deque
 from unittest.mock import Mock
 
+import numpy as np
 import pytest
 
-from opensourceleg.logging.logger import LOGGER, Logger, LogLevel
+from opensourceleg.logging.binary import read_binary_log
+from opensourceleg.logging.logger import LOGGER, BufferBackend, DataFormat, LazyMessage, Logger, LogLevel
 
 CURR_DIR = os.path.dirname(os.path.realpath(__file__))
 
@@ -277,13 +279,13 @@ def test_update(isolated_logger: Logger):
     assert not isolated_logger._tracked_vars
     isolated_logger.track_variable(test_func, "first")
     isolated_logger.update()
+    assert list(isolated_logger._buffer) == [["18"]]
+    # Tracking a new variable writes the buffered rows under the old header first
     isolated_logger.track_variable(test_func2, "second")
     isolated_logger.update()
-    assert all([
-        isolated_logger._buffer[0] == ["18"],
-        isolated_logger._buffer[1] == ["18", "8"],
-        len(isolated_logger._buffer) == 2,
-    ])
+    assert list(isolated_logger._buffer) == [["18", "8"]]
+    isolated_logger.close()
+    os.remove(isolated_logger.csv_path)
 
 
 # Test update size exceeded
@@ -555,3 +557,249 @@ def test_file_backup_count():
 # Test initialized global logger
 def test_global():
     assert isinstance(LOGGER, Logger)
+
+
+# Test timestamp and tick columns
+def test_timestamp_columns(isolated_logger: Logger):
+    isolated_logger.set_timestamp_columns(True)
+    assert isolated_logger.timestamp_columns_enabled
+    isolated_logger.track_variable(lambda: 7, "seven")
+    isolated_logger.update()
+    isolated_logger.update()
+    isolated_logger.flush_buffer()
+    isolated_logger.close()
+
+    with open(isolated_logger._csv_path) as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["timestamp_ns", "tick", "seven"]
+    assert [row[1:] for row in rows[1:]] == [["0", "7"], ["1", "7"]]
+    assert int(rows[1][0]) <= int(rows[2][0])
+
+
+def test_track_variable_mid_run_starts_new_csv(isolated_logger: Logger):
+    isolated_logger.track_variable(lambda: 1.0, "a")
+    isolated_logger.update()
+    isolated_logger.flush_buffer()
+    isolated_logger.update()
+    first_path = isolated_logger.csv_path
+    isolated_logger.track_variable(lambda: 2.0, "b")
+    isolated_logger.update()
+    isolated_logger.close()
+
+    with open(first_path) as f:
+        assert list(csv.reader(f)) == [["a"], ["1.0"], ["1.0"]]
+    assert isolated_logger.csv_path.endswith("test_logging_1.csv")
+    with open(isolated_logger.csv_path) as f:
+        assert list(csv.reader(f)) == [["a", "b"], ["1.0", "2.0"]]
+    os.remove(isolated_logger.csv_path)
+
+
+def test_timestamp_columns_numpy_binary(isolated_logger: Logger):
+    isolated_logger.set_timestamp_columns(True)
+    isolated_logger.set_buffer_backend(BufferBackend.NUMPY)
+    isolated_logger.set_data_format(DataFormat.BINARY)
+    isolated_logger.track_variable(lambda: 1.5, "value")
+    for _ in range(3):
+        isolated_logger.update()
+    isolated_logger.close()
+
+    data = read_binary_log(isolated_logger.binary_path)
+    assert data.dtype.names == ("timestamp_ns", "tick", "value")
+    assert data.dtype["timestamp_ns"] == np.int64
+    assert list(data["tick"]) == [0, 1, 2]
+    assert list(data["value"]) == [1.5, 1.5, 1.5]
+    assert np.all(np.diff(data["timestamp_ns"]) >= 0)
+    os.remove(isolated_logger.binary_path)
+
+
+# Test per-variable decimation
+def test_track_variable_decimation(isolated_logger: Logger):
+    calls = {"fast": 0, "slow": 0}
+
+    def fast():
+        calls["fast"] += 1
+        return calls["fast"]
+
+    def slow():
+        calls["slow"] += 1
+        return calls["slow"]
+
+    isolated_logger.track_variable(fast, "fast")
+    isolated_logger.track_variable(slow, "slow", decimation=3)
+    for _ in range(5):
+        isolated_logger.update()
+
+    assert calls == {"fast": 5, "slow": 2}
+    assert list(isolated_logger._buffer) == [["1", "1"], ["2", ""], ["3", ""], ["4", "2"], ["5", ""]]
+
+
+def test_track_variable_decimation_skips_empty_rows(isolated_logger: Logger):
+    isolated_logger.track_variable(lambda: 1, "a", decimation=2)
+    isolated_logger.track_variable(lambda: 2, "b", decimation=3)
+    for _ in range(7):
+        isolated_logger.update()
+
+    # Ticks 1 and 5 have nothing due
+    assert list(isolated_logger._buffer) == [["1", "2"], ["1", ""], ["", "2"], ["1", ""], ["1", "2"]]
+
+
+def test_track_variable_invalid_decimation(isolated_logger: Logger):
+    isolated_logger.track_variable(lambda: 1, "a", decimation=0)
+    assert isolated_logger._plan[0][3] == 1
+
+
+def test_track_variable_decimation_numpy(isolated_logger: Logger):
+    isolated_logger.set_buffer_backend(BufferBackend.NUMPY)
+    isolated_logger.track_variable(lambda: 1.0, "a")
+    isolated_logger.track_variable(lambda: 2.0, "b", decimation=2)
+    for _ in range(3):
+        isolated_logger.update()
+
+    rows = isolated_logger._array_buffer.rows()
+    np.testing.assert_array_equal(rows[:, 0], [1.0, 1.0, 1.0])
+    assert rows[0, 1] == 2.0
+    assert np.isnan(rows[1, 1])
+    assert rows[2, 1] == 2.0
+
+
+class Joint:
+    def __init__(self):
+        self.position = 1.0
+        self.velocity = 2.0
+        self.current = 3.0
+
+
+# Test fused attribute tracking
+def test_track_attributes(isolated_logger: Logger):
+    joint = Joint()
+    isolated_logger.track_attributes(joint, ["position", "velocity", "current"], prefix="knee_")
+
+    assert list(isolated_logger._var_names.values()) == ["knee_position", "knee_velocity", "knee_current"]
+    assert len(isolated_logger._plan) == 1
+    assert isolated_logger._plan[0][4]
+
+    isolated_logger.update()
+    joint.position = 4.0
+    isolated_logger.update()
+    assert list(isolated_logger._buffer) == [["1.0", "2.0", "3.0"], ["4.0", "2.0", "3.0"]]
+
+
+def test_track_attributes_plan_splits(isolated_logger: Logger):
+    knee = Joint()
+    ankle = Joint()
+    isolated_logger.track_attributes(knee, ["position", "velocity"])
+    isolated_logger.track_variable(lambda: 0, "other")
+    isolated_logger.track_attributes(ankle, ["position"])
+    isolated_logger.track_attributes(ankle, ["current"], decimation=2)
+
+    assert [(entry[0], len(entry[1]), entry[4]) for entry in isolated_logger._plan] == [
+        (0, 2, True),
+        (2, 1, False),
+        (3, 1, False),
+        (4, 1, False),
+    ]
+
+
+def test_track_attributes_slow_path(isolated_logger: Logger):
+    joint = Joint()
+    isolated_logger.set_max_errors_before_untrack(2)
+    isolated_logger.track_attributes(joint, ["position", "velocity"])
+
+    del joint.velocity
+    isolated_logger.update()
+    assert list(isolated_logger._buffer)[-1] == ["1.0", "ERROR"]
+    assert isolated_logger._error_count[list(isolated_logger._tracked_vars)[1]] == 1
+
+    joint.velocity = 5.0
+    isolated_logger.update()
+    assert list(isolated_logger._buffer)[-1] == ["1.0", "5.0"]
+    assert not isolated_logger._failing
+
+    del joint.velocity
+    isolated_logger.update()
+    isolated_logger.update()
+    assert list(isolated_logger._var_names.values()) == ["position"]
+    # The rows read before untracking were written under the old header
+    assert not isolated_logger._buffer
+    isolated_logger.update()
+    assert list(isolated_logger._buffer) == [["1.0"]]
+    isolated_logger.close()
+    os.remove(isolated_logger.csv_path)
+
+
+def test_track_attributes_numpy(isolated_logger: Logger):
+    joint = Joint()
+    isolated_logger.set_buffer_backend(BufferBackend.NUMPY)
+    isolated_logger.track_attributes(joint, ["position", "velocity", "current"])
+    isolated_logger.update()
+    del joint.current
+    isolated_logger.update()
+
+    rows = isolated_logger._array_buffer.rows()
+    np.testing.assert_array_equal(rows[0], [1.0, 2.0, 3.0])
+    np.testing.assert_array_equal(rows[1, :2], [1.0, 2.0])
+    assert np.isnan(rows[1, 2])
+
+
+def test_disabled_level_skips_file_handler(isolated_logger: Logger):
+    isolated_logger.setLevel(logging.INFO)
+    isolated_logger._ensure_file_handler = Mock()
+    isolated_logger.debug("debug_test")
+    isolated_logger.log(logging.DEBUG, "debug_test")
+    isolated_logger._ensure_file_handler.assert_not_called()
+
+    isolated_logger.info("info_test")
+    isolated_logger._ensure_file_handler.assert_called_once()
+    del isolated_logger._ensure_file_handler
+    isolated_logger.setLevel(logging.DEBUG)
+
+
+def test_lazy_message(isolated_logger: Logger):
+    build = Mock(return_value="built")
+    message = LazyMessage(build, 1, scale=2)
+    isolated_logger.setLevel(logging.INFO)
+    isolated_logger.debug(message)
+    build.assert_not_called()
+
+    assert str(message) == "built"
+    build.assert_called_once_with(1, scale=2)
+    isolated_logger.setLevel(logging.DEBUG)
+
+
+def test_log_rate_limited(isolated_logger: Logger, monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("opensourceleg.logging.logger.time.monotonic", lambda: now[0])
+    isolated_logger.log = Mock()
+
+    def hot_path():
+        return isolated_logger.log_rate_limited(LogLevel.WARNING, "Sensor %s timed out", "imu", max_count=2)
+
+    assert [hot_path() for _ in range(5)] == [True, True, False, False, False]
+    assert isolated_logger.log.call_count == 2
+    assert isolated_logger.suppressed_messages == 3
+
+    now[0] += 1.5
+    assert hot_path()
+    isolated_logger.log.assert_any_call(
+        logging.WARNING, "%d similar messages were suppressed in the last %.1f s", 3, 1.5
+    )
+    isolated_logger.log.assert_called_with(logging.WARNING, "Sensor %s timed out", "imu")
+    assert isolated_logger.suppressed_messages == 0
+    del isolated_logger.log
+
+
+def test_log_rate_limited_keys(isolated_logger: Logger):
+    isolated_logger.log = Mock()
+    for _ in range(3):
+        isolated_logger.log_rate_limited(LogLevel.INFO, "first")
+        isolated_logger.log_rate_limited(LogLevel.INFO, "second")
+    assert isolated_logger.log.call_count == 2
+
+    assert isolated_logger.log_rate_limited(LogLevel.INFO, "keyed", key="sensor")
+    assert not isolated_logger.log_rate_limited(LogLevel.INFO, "keyed again", key="sensor")
+
+    isolated_logger.setLevel(logging.ERROR)
+    assert not isolated_logger.log_rate_limited(LogLevel.INFO, "disabled", key="other")
+    assert "other" not in isolated_logger._rate_limits
+    isolated_logger.setLevel(logging.DEBUG)
+    del isolated_logger.log
@@ -0,0 +1,146 @@
+import csv
+import os
+
+import pytest
+
+from opensourceleg.logging.logger import DataFormat, Logger
+from opensourceleg.logging.segments import (
+    RECORD_COLUMNS,
+    RECORD_ROWS,
+    SegmentWriter,
+    main,
+    read_segment,
+    recover,
+    segment_paths,
+)
+
+CURR_DIR = os.path.dirname(os.path.realpath(__file__))
+
+
+def read_csv(path):
+    with open(path, newline="") as f:
+        return list(csv.reader(f))
+
+
+def test_segment_writer_records(tmp_path):
+    base = str(tmp_path / "session")
+    writer = SegmentWriter(base, ["a", "b"])
+    writer.write_rows([[1, 2], [3, 4]])
+    writer.write_rows([])
+    writer.close()
+
+    assert segment_paths(base) == [f"{base}.00000.seg"]
+    records, discarded = read_segment(writer.path)
+    assert discarded == 0
+    assert records == [(RECORD_COLUMNS, b"a,b\r\n"), (RECORD_ROWS, b"1,2\r\n3,4\r\n")]
+
+
+def test_segment_writer_invalid_sync_every(tmp_path):
+    with pytest.raises(ValueError):
+        SegmentWriter(str(tmp_path / "session"), ["a"], sync_every=0)
+
+
+def test_segment_writer_rotates_by_size(tmp_path):
+    base = str(tmp_path / "session")
+    writer = SegmentWriter(base, ["a"], max_bytes=1)
+    for i in range(3):
+        writer.write_rows([[i]])
+    writer.close()
+
+    assert len(writer.paths) == 3
+    assert segment_paths(base) == writer.paths
+
+
+def test_segment_writer_continues_numbering(tmp_path):
+    base = str(tmp_path / "session")
+    first = SegmentWriter(base, ["a"])
+    first.write_rows([[1]])
+    first.close()
+
+    second = SegmentWriter(base, ["a"])
+    second.write_rows([[2]])
+    second.close()
+
+    assert segment_paths(base) == [f"{base}.00000.seg", f"{base}.00001.seg"]
+
+
+def test_recover_skips_damaged_tail(tmp_path):
+    base = str(tmp_path / "session")
+    writer = SegmentWriter(base, ["a", "b"], max_bytes=1)
+    writer.write_rows([[1, 2]])
+    writer.write_rows([[3, 4]])
+    writer.close()
+
+    # Simulate a crash in the middle of writing a record
+    with open(writer.paths[0], "ab") as f:
+        f.write(b"OSLS\x02\x10\x00\x00\x00")
+
+    report = recover(base)
+    assert report.output_path == f"{base}.csv"
+    assert report.segments == 2
+    assert report.rows == 2
+    assert report.damaged_segments == [writer.paths[0]]
+    assert report.discarded_bytes == 9
+    assert read_csv(report.output_path) == [["a", "b"], ["1", "2"], ["3", "4"]]
+
+
+def test_recover_detects_corruption(tmp_path):
+    base = str(tmp_path / "session")
+    writer = SegmentWriter(base, ["a"])
+    writer.write_rows([[1]])
+    writer.write_rows([[2]])
+    writer.close()
+
+    with open(writer.path, "r+b") as f:
+        f.seek(-1, os.SEEK_END)
+        f.write(b"9")
+
+    report = recover(base, str(tmp_path / "out.csv"))
+    assert read_csv(report.output_path) == [["a"], ["1"]]
+
+
+def test_recover_missing(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        recover(str(tmp_path / "missing"))
+
+
+def test_recover_cli(tmp_path, capsys):
+    base = str(tmp_path / "session")
+    writer = SegmentWriter(base, ["a"])
+    writer.write_rows([[1]])
+    writer.close()
+
+    output = str(tmp_path / "cli.csv")
+    assert main([base, "-o", output]) == 0
+    assert "Recovered 1 rows from 1 segments" in capsys.readouterr().out
+    assert read_csv(output) == [["a"], ["1"]]
+
+
+@pytest.fixture
+def segmented_logger():
+    log = Logger(log_path=CURR_DIR, file_name="test_logging_segments", buffer_size=2)
+    log.reset()
+    log.set_data_format(DataFormat.SEGMENTED)
+
+    yield log
+
+    log.set_data_format(DataFormat.CSV)
+    log.reset()
+    log.set_buffer_size(1000)
+    for path in [*segment_paths(log.segment_base_path), log.segment_base_path + ".csv", log.file_path]:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def test_logger_segmented_format(segmented_logger):
+    values = iter(range(5))
+    segmented_logger.track_variable(lambda: next(values), "x")
+    for _ in range(5):
+        segmented_logger.update()
+
+    # Full buffers are already on disk before close
+    assert len(segment_paths(segmented_logger.segment_base_path)) == 1
+    segmented_logger.close()
+
+    report = recover(segmented_logger.segment_base_path)
+    assert read_csv(report.output_path) == [["x"], ["0"], ["1"], ["2"], ["3"], ["4"]]
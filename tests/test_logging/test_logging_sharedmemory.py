@@ -0,0 +1,33 @@
+import os
+
+import pytest
+
+from opensourceleg.logging.sharedmemory import attach_shared_memory, create_shared_memory, unlink_shared_memory
+
+
+@pytest.fixture
+def block_name():
+    return f"osl_shm_test_{os.getpid()}"
+
+
+def test_create_attach_unlink(block_name):
+    shm = create_shared_memory(block_name, 16)
+    shm.buf[:4] = b"abcd"
+
+    attached = attach_shared_memory(block_name)
+    assert bytes(attached.buf[:4]) == b"abcd"
+    attached.close()
+
+    unlink_shared_memory(shm)
+    with pytest.raises(FileNotFoundError):
+        attach_shared_memory(block_name)
+
+
+def test_create_replaces_stale_block(block_name):
+    stale = create_shared_memory(block_name, 16)
+    stale.buf[:4] = b"old!"
+
+    shm = create_shared_memory(block_name, 16)
+    assert bytes(shm.buf[:4]) == bytes(4)
+    stale.close()
+    unlink_shared_memory(shm)
@@ -0,0 +1,195 @@
+import glob
+import multiprocessing
+import os
+
+import numpy as np
+import pytest
+
+from opensourceleg.logging.logger import BufferBackend, Logger
+from opensourceleg.logging.telemetry import TelemetryPublisher, TelemetryReader
+
+CURR_DIR = os.path.dirname(os.path.realpath(__file__))
+
+
+@pytest.fixture
+def ring_name():
+    return f"osl_test_{os.getpid()}"
+
+
+def test_publish_and_read(ring_name):
+    publisher = TelemetryPublisher(ring_name, ["position", "velocity"], capacity=8)
+    reader = TelemetryReader(ring_name)
+    assert reader.names == ["position", "velocity"]
+    assert reader.latest() is None
+    assert len(reader.read_new()) == 0
+
+    for tick in range(3):
+        publisher.publish([tick, tick * 2.0], tick=tick, timestamp_ns=100 + tick)
+
+    sample = reader.read_new()
+    np.testing.assert_array_equal(sample.ticks, [0, 1, 2])
+    np.testing.assert_array_equal(sample.timestamps, [100, 101, 102])
+    np.testing.assert_array_equal(sample.values, [[0, 0], [1, 2], [2, 4]])
+    assert len(reader.read_new()) == 0
+
+    latest = reader.latest()
+    np.testing.assert_array_equal(latest.values, [[2, 4]])
+    assert reader.published_rows == 3
+
+    publisher.close()
+    assert reader.closed
+    reader.close()
+
+
+def test_overwritten_rows_are_missed(ring_name):
+    publisher = TelemetryPublisher(ring_name, ["x"], capacity=4)
+    reader = TelemetryReader(ring_name)
+    for tick in range(10):
+        publisher.publish([tick])
+
+    sample = reader.read_new()
+    np.testing.assert_array_equal(sample.ticks, [6, 7, 8, 9])
+    assert reader.missed_rows == 6
+
+    publisher.close()
+    reader.close()
+
+
+def test_torn_slot_is_skipped(ring_name):
+    publisher = TelemetryPublisher(ring_name, ["x"], capacity=4)
+    reader = TelemetryReader(ring_name)
+    publisher.publish([1.0])
+    publisher.publish([2.0])
+
+    # Simulate the publisher being in the middle of writing the second slot
+    publisher._ring.sequence[1] += 1
+    sample = reader.read_new()
+    np.testing.assert_array_equal(sample.values, [[1.0]])
+    assert reader.missed_rows == 1
+
+    publisher.close()
+    reader.close()
+
+
+def test_invalid_values_are_nan(ring_name):
+    publisher = TelemetryPublisher(ring_name, ["a", "b", "c"], capacity=2)
+    reader = TelemetryReader(ring_name)
+    publisher.publish(["1.5", "", None])
+
+    values = reader.read_new().values[0]
+    assert values[0] == 1.5
+    assert np.isnan(values[1:]).all()
+
+    publisher.close()
+    with pytest.raises(RuntimeError):
+        publisher.publish([1.0, 2.0, 3.0])
+    reader.close()
+
+
+def test_reader_missing_ring():
+    with pytest.raises(FileNotFoundError):
+        TelemetryReader(f"osl_missing_{os.getpid()}")
+
+
+def _abandon_ring(name):
+    TelemetryPublisher(name, ["x"])
+    os._exit(0)
+
+
+def test_stale_ring_is_replaced(ring_name):
+    # A forked child shares this process's resource tracker, so its ring outlives it
+    child = multiprocessing.get_context("fork").Process(target=_abandon_ring, args=(ring_name,))
+    child.start()
+    child.join()
+
+    publisher = TelemetryPublisher(ring_name, ["y"])
+    reader = TelemetryReader(ring_name)
+    assert reader.names == ["y"]
+    reader.close()
+    publisher.close()
+
+
+def test_ring_in_use_is_not_replaced(ring_name):
+    publisher = TelemetryPublisher(ring_name, ["x"])
+    with pytest.raises(FileExistsError):
+        TelemetryPublisher(ring_name, ["y"])
+
+    reader = TelemetryReader(ring_name)
+    assert reader.names == ["x"]
+    reader.close()
+    publisher.close()
+
+
+@pytest.fixture
+def telemetry_logger(ring_name):
+    log = Logger(log_path=CURR_DIR, file_name="test_logging_telemetry")
+    log.reset()
+    log.set_telemetry(ring_name, capacity=16)
+
+    yield log
+
+    log.set_telemetry(None)
+    log.set_timestamp_columns(False)
+    log.set_buffer_backend(BufferBackend.DEQUE)
+    log.reset()
+    for path in [*glob.glob(os.path.join(CURR_DIR, "test_logging_telemetry*.csv")), log.file_path]:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+@pytest.mark.parametrize("backend", [BufferBackend.DEQUE, BufferBackend.NUMPY])
+def test_logger_publishes_rows(telemetry_logger, ring_name, backend):
+    telemetry_logger.set_buffer_backend(backend)
+    telemetry_logger.set_timestamp_columns(True)
+    values = iter(range(10))
+    telemetry_logger.track_variable(lambda: next(values), "x")
+    telemetry_logger.track_variable(lambda: "text", "label")
+    telemetry_logger.update()
+
+    reader = TelemetryReader(ring_name)
+    assert reader.names == ["x", "label"]
+    telemetry_logger.update()
+    sample = reader.read_new()
+    np.testing.assert_array_equal(sample.ticks, [0, 1])
+    np.testing.assert_array_equal(sample.values[:, 0], [0, 1])
+    assert np.isnan(sample.values[:, 1]).all()
+
+    # Tracking another variable starts a new ring with the new columns
+    telemetry_logger.track_variable(lambda: 1.0, "y")
+    assert reader.closed
+    reader.close()
+    telemetry_logger.update()
+    reader = TelemetryReader(ring_name)
+    assert reader.names == ["x", "label", "y"]
+    reader.close()
+
+    telemetry_logger.close()
+    with pytest.raises(FileNotFoundError):
+        TelemetryReader(ring_name)
+
+
+def test_logger_disables_telemetry_when_ring_in_use(telemetry_logger, ring_name):
+    other = TelemetryPublisher(ring_name, ["other"])
+    telemetry_logger.track_variable(lambda: 1.0, "x")
+    telemetry_logger.update()
+    assert telemetry_logger._telemetry is None
+    assert telemetry_logger._telemetry_name is None
+
+    reader = TelemetryReader(ring_name)
+    assert reader.names == ["other"]
+    reader.close()
+    other.close()
+
+
+def test_logger_publishes_raw_values_with_inline_csv(telemetry_logger, monkeypatch):
+    telemetry_logger.set_async_writer(False)
+    telemetry_logger.track_variable(lambda: 0.25, "x")
+    telemetry_logger.track_variable(lambda: 3, "slow", decimation=2)
+    telemetry_logger.update()
+
+    published = []
+    monkeypatch.setattr(telemetry_logger._telemetry, "publish", lambda values, tick: published.append(values))
+    telemetry_logger.update()
+
+    assert published == [[0.25, None]]
+    assert list(telemetry_logger._buffer) == [["0.25", "3"], ["0.25", ""]]
@@ -0,0 +1,170 @@
+import csv
+import os
+import threading
+
+import pytest
+
+from opensourceleg.logging.logger import Logger
+from opensourceleg.logging.writer import BackgroundWriter, BackpressurePolicy
+
+CURR_DIR = os.path.dirname(os.path.realpath(__file__))
+
+
+class RecordingSink:
+    def __init__(self):
+        self.rows = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, batch):
+        self.release.wait()
+        self.rows.extend(batch)
+
+
+@pytest.fixture
+def sink():
+    return RecordingSink()
+
+
+def test_writer_invalid_sizes(sink):
+    with pytest.raises(ValueError):
+        BackgroundWriter(sink, max_queue_size=0)
+    with pytest.raises(ValueError):
+        BackgroundWriter(sink, batch_size=0)
+
+
+def test_writer_writes_all_rows_in_order(sink):
+    writer = BackgroundWriter(sink, batch_size=3)
+    writer.start()
+    assert writer.is_running
+    assert writer.submit([[i] for i in range(10)]) == 10
+    assert writer.flush(timeout=5)
+    writer.close()
+
+    assert sink.rows == [[i] for i in range(10)]
+    assert writer.submitted_rows == 10
+    assert writer.written_rows == 10
+    assert writer.dropped_rows == 0
+    assert writer.pending_rows == 0
+    assert not writer.is_running
+
+
+def test_writer_drop_newest(sink):
+    writer = BackgroundWriter(sink, max_queue_size=2, policy=BackpressurePolicy.DROP_NEWEST)
+    assert writer.submit([[1], [2], [3], [4]]) == 2
+    assert writer.dropped_rows == 2
+
+    writer.start()
+    writer.close()
+    assert sink.rows == [[1], [2]]
+
+
+def test_writer_drop_oldest(sink):
+    writer = BackgroundWriter(sink, max_queue_size=2, policy=BackpressurePolicy.DROP_OLDEST)
+    assert writer.submit([[1], [2], [3], [4]]) == 4
+    assert writer.dropped_rows == 2
+
+    writer.start()
+    writer.close()
+    assert sink.rows == [[3], [4]]
+
+
+def test_writer_block_waits_for_room(sink):
+    writer = BackgroundWriter(sink, max_queue_size=2, batch_size=1, policy=BackpressurePolicy.BLOCK)
+    writer.start()
+    sink.release.clear()
+
+    producer = threading.Thread(target=writer.submit, args=([[i] for i in range(6)],))
+    producer.start()
+    producer.join(timeout=0.2)
+    assert producer.is_alive()
+
+    sink.release.set()
+    producer.join(timeout=5)
+    writer.close()
+
+    assert not producer.is_alive()
+    assert sink.rows == [[i] for i in range(6)]
+    assert writer.dropped_rows == 0
+
+
+def test_writer_close_without_drain(sink):
+    writer = BackgroundWriter(sink)
+    writer.submit([[1], [2], [3]])
+    writer.close(drain=False)
+    assert writer.dropped_rows == 3
+    assert sink.rows == []
+
+
+def test_writer_reports_errors():
+    errors = []
+
+    def failing_sink(batch):
+        raise OSError("disk full")
+
+    writer = BackgroundWriter(failing_sink, on_error=errors.append)
+    writer.start()
+    writer.submit([[1]])
+    writer.close()
+
+    assert writer.error_count == 1
+    assert len(errors) == 1
+    assert isinstance(errors[0], OSError)
+    assert writer.written_rows == 0
+    assert writer.failed_rows == 1
+
+
+@pytest.fixture
+def async_logger():
+    log = Logger(log_path=CURR_DIR, file_name="test_logging_writer", buffer_size=2, async_writer=True)
+    log.reset()
+
+    yield log
+
+    log.set_async_writer(False)
+    log.reset()
+    log.set_buffer_size(1000)
+    for ext in [".log", ".csv"]:
+        file_path = os.path.join(CURR_DIR, f"test_logging_writer{ext}")
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+
+def test_logger_async_writes_csv(async_logger):
+    assert async_logger.async_writer_enabled
+    values = iter(range(5))
+    async_logger.track_variable(lambda: next(values), "x")
+
+    for _ in range(5):
+        async_logger.update()
+    assert async_logger._async_writer is not None
+    async_logger.close()
+
+    assert async_logger._async_writer is None
+    with open(async_logger._csv_path, newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows == [["x"], ["0"], ["1"], ["2"], ["3"], ["4"]]
+    assert async_logger.dropped_rows == 0
+
+
+def test_logger_set_async_writer_policy(async_logger):
+    async_logger.set_async_writer(True, queue_size=3, policy=BackpressurePolicy.DROP_NEWEST)
+    assert async_logger.backpressure_policy == BackpressurePolicy.DROP_NEWEST
+    assert async_logger._async_queue_size == 3
+
+    async_logger.set_async_writer(False)
+    assert not async_logger.async_writer_enabled
+    assert async_logger._async_writer is None
+
+
+def test_logger_async_counts_failed_rows(async_logger, monkeypatch):
+    failed = async_logger.failed_rows
+    monkeypatch.setattr(async_logger, "_write_rows", lambda rows: False)
+    async_logger.track_variable(lambda: 1.0, "x")
+
+    for _ in range(4):
+        async_logger.update()
+    async_logger.flush_buffer()
+    async_logger._stop_async_writer()
+
+    assert async_logger.failed_rows - failed == 4
@@ -0,0 +1,101 @@
+import asyncio
+import time
+
+import pytest
+
+from opensourceleg.control.fsm import State, StateMachine
+from opensourceleg.utilities.clock import SimulatedClock, SystemClock
+from opensourceleg.utilities.scheduler import RateMonotonicScheduler
+from opensourceleg.utilities.softrealtimeloop import AsyncSoftRealtimeLoop, SoftRealtimeLoop
+
+
+def test_system_clock(monkeypatch):
+    clock = SystemClock()
+    monkeypatch.setattr(time, "monotonic", lambda: 42.0)
+    assert clock.monotonic() == 42.0
+
+
+def test_simulated_clock():
+    clock = SimulatedClock(start=1.0)
+    assert clock.monotonic() == 1.0
+    clock.sleep(0.5)
+    clock.sleep(-1.0)
+    assert clock.monotonic() == 1.5
+    clock.sleep_until(3.0)
+    clock.sleep_until(2.0)
+    assert clock.monotonic() == 3.0
+    clock.advance(1.0)
+    assert clock.monotonic() == 4.0
+    with pytest.raises(ValueError):
+        clock.advance(-1.0)
+
+
+@pytest.mark.parametrize("maintain_original_phase", [False, True])
+def test_loop_on_simulated_clock(maintain_original_phase):
+    clock = SimulatedClock()
+    loop = SoftRealtimeLoop(dt=0.01, report=False, maintain_original_phase=maintain_original_phase, clock=clock)
+    start = time.monotonic()
+    for t in loop:
+        clock.advance(0.002)
+        if t >= 60.0:
+            loop.stop()
+
+    assert time.monotonic() - start < 5.0
+    assert clock.monotonic() == pytest.approx(60.0, abs=0.02)
+    assert loop.stats.deadline_misses == 0
+    assert loop.stats.mean_compute_time == pytest.approx(0.002)
+
+
+def test_fade_on_simulated_clock():
+    clock = SimulatedClock()
+    loop = SoftRealtimeLoop(dt=0.01, report=False, fade=0.1, clock=clock)
+    fades = []
+    for t in loop:
+        if t >= 1.0 and not fades:
+            loop.stop()
+        if t >= 1.0:
+            fades.append(loop.fade)
+
+    assert fades[0] == 1.0
+    assert fades[-1] == pytest.approx(0.1, abs=1e-6)
+    assert clock.monotonic() == pytest.approx(1.11, abs=0.011)
+
+
+def test_async_loop_on_simulated_clock():
+    clock = SimulatedClock()
+    loop = AsyncSoftRealtimeLoop(dt=0.01, report=False, clock=clock)
+
+    async def update():
+        return 0 if loop.n == 1000 else 1
+
+    asyncio.run(loop.arun(update))
+    assert clock.monotonic() == pytest.approx(9.99)
+
+
+def walking_scenario(duration):
+    clock = SimulatedClock()
+    loop = SoftRealtimeLoop(dt=0.005, report=False, clock=clock)
+    scheduler = RateMonotonicScheduler(loop)
+    stance = State("stance", minimum_time_in_state=0.6)
+    swing = State("swing", minimum_time_in_state=0.4)
+    fsm = StateMachine(states=[stance, swing], initial_state_name="stance", clock=clock)
+    fsm.add_transition(stance, swing, "toe_off", criteria=lambda: True)
+    fsm.add_transition(swing, stance, "heel_strike", criteria=lambda: True)
+
+    trace = []
+    scheduler.add_task(lambda: trace.append((loop.time_since_start, fsm.current_state.name)), divisor=4)
+    scheduler.add_task(fsm.update)
+    fsm.start()
+    for t in loop:
+        scheduler.tick()
+        if t >= duration:
+            loop.stop()
+    return trace
+
+
+def test_walking_scenario_is_deterministic():
+    first = walking_scenario(60.0)
+    assert first == walking_scenario(60.0)
+    # One stride every second
+    strides = sum(1 for (_, a), (_, b) in zip(first, first[1:]) if a == "swing" and b == "stance")
+    assert strides == pytest.approx(60, abs=1)
@@ -0,0 +1,82 @@
+import os
+
+import numpy as np
+import pytest
+
+from opensourceleg.logging.logger import Logger
+from opensourceleg.utilities.loopstats import LoopStats
+from opensourceleg.utilities.softrealtimeloop import SoftRealtimeLoop
+
+CURR_DIR = os.path.dirname(os.path.realpath(__file__))
+
+
+def test_histogram_and_percentiles():
+    stats = LoopStats(dt=0.001, bin_width=1e-5)
+    assert stats.p99 == 0.0
+    for _ in range(98):
+        stats.record(latency=15e-6, compute_time=2e-4, sleep_time=8e-4, missed=False)
+    stats.record(latency=-55e-6, compute_time=2e-4, sleep_time=8e-4, missed=False)
+    stats.record(latency=0.004, compute_time=5e-3, sleep_time=0.0, missed=True)
+
+    assert stats.count == 100
+    assert stats.histogram.sum() == 100
+    assert stats.histogram[1] == 98
+    assert stats.histogram[-1] == 1
+    assert stats.p50 == pytest.approx(2e-5)
+    assert stats.p99 == pytest.approx(6e-5)
+    assert stats.p999 == stats.max_latency == 0.004
+    assert stats.max_compute_time == 5e-3
+    assert stats.mean_sleep_time == pytest.approx(98 * 8e-4 / 100 + 8e-6)
+    np.testing.assert_allclose(stats.bin_edges[:3], [0, 1e-5, 2e-5])
+    with pytest.raises(ValueError):
+        stats.percentile(101)
+
+
+def test_deadline_misses():
+    stats = LoopStats(dt=0.001)
+    for missed in [True, True, False, True, True, True, False]:
+        stats.record(latency=0.0, compute_time=0.0, sleep_time=0.0, missed=missed)
+    assert stats.deadline_misses == 5
+    assert stats.consecutive_misses == 0
+    assert stats.max_consecutive_misses == 3
+
+    stats.reset()
+    assert stats.summary()["deadline_misses"] == 0
+    assert stats.histogram.sum() == 0
+
+
+def test_loop_records_stats():
+    srtl = SoftRealtimeLoop(dt=0.002, report=False)
+    ticks = []
+
+    def body():
+        ticks.append(None)
+        # Overrun the time step on the third iteration
+        if len(ticks) == 3:
+            while srtl.time_since_start < 0.002 * 5:
+                pass
+        return 0 if len(ticks) == 6 else 1
+
+    srtl.run(body)
+    stats = srtl.stats
+    assert stats.count == srtl.n - 1
+    assert stats.deadline_misses >= 1
+    assert stats.max_compute_time > 0.002
+    assert srtl.max_err == stats.max_latency
+
+
+def test_track_in_logger():
+    log = Logger(log_path=CURR_DIR, file_name="test_loopstats")
+    log.reset()
+    stats = LoopStats(dt=0.001)
+    stats.track(log, prefix="srtl_")
+    stats.record(latency=2e-5, compute_time=3e-4, sleep_time=7e-4, missed=True)
+    log.update()
+
+    assert list(log._var_names.values())[:2] == ["srtl_last_latency", "srtl_last_compute_time"]
+    assert list(log._buffer)[-1] == ["2e-05", "0.0003", "0.0007", "1", "1"]
+
+    log.reset()
+    for path in [log.csv_path, log.file_path]:
+        if path and os.path.exists(path):
+            os.remove(path)
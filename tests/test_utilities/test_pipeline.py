@@ -0,0 +1,159 @@
+import multiprocessing
+import os
+import time
+
+import numpy as np
+import pytest
+
+from opensourceleg.logging.telemetry import TelemetryPublisher
+from opensourceleg.utilities.pipeline import ControlPipeline, PipelineStage, SharedState
+
+
+def _unique(name: str) -> str:
+    return f"osltest_{name}_{os.getpid()}"
+
+
+def io_step(inputs):
+    return [time.monotonic(), inputs["control"]["torque"]]
+
+
+def control_step(inputs):
+    return [2.5]
+
+
+class FailingSetupStage(PipelineStage):
+    def setup(self):
+        raise ValueError("setup failed")
+
+
+def test_shared_state_write_read():
+    state = SharedState(_unique("state"), ["a", "b"])
+    try:
+        snapshot = state.read()
+        assert snapshot.tick == -1
+        assert state.sequence == 0
+
+        state.write([1.0, -2.0], tick=3)
+        state.write([4.0, 5.0], tick=4)
+        reader = SharedState(state.name)
+        try:
+            assert reader.fields == ["a", "b"]
+            snapshot = reader.read()
+            assert snapshot.tick == 4
+            assert snapshot["a"] == 4.0
+            assert snapshot["b"] == 5.0
+            assert snapshot.age >= 0
+            assert reader.sequence == 2
+        finally:
+            reader.close()
+    finally:
+        state.close()
+
+    with pytest.raises(RuntimeError):
+        state.read()
+
+
+def test_shared_state_rejects_other_blocks():
+    publisher = TelemetryPublisher(_unique("telemetry"), ["a"])
+    try:
+        with pytest.raises(ValueError):
+            SharedState(publisher.name)
+    finally:
+        publisher.close()
+
+
+def _abandon_state(name):
+    SharedState(name, ["a"])
+    os._exit(0)
+
+
+def test_shared_state_replaces_stale_block():
+    # A forked child shares this process's resource tracker, so its block outlives it
+    name = _unique("stale")
+    child = multiprocessing.get_context("fork").Process(target=_abandon_state, args=(name,))
+    child.start()
+    child.join()
+
+    state = SharedState(name, ["a", "b", "c"])
+    try:
+        assert SharedState(name).fields == ["a", "b", "c"]
+    finally:
+        state.close()
+
+
+def test_shared_state_in_use_is_not_replaced():
+    first = SharedState(_unique("in_use"), ["a"])
+    try:
+        first.write([1.0])
+        with pytest.raises(FileExistsError):
+            SharedState(first.name, ["b"])
+        reader = SharedState(first.name)
+        assert reader.read()["a"] == 1.0
+        reader.close()
+    finally:
+        first.close()
+
+
+def test_shared_state_torn_read():
+    state = SharedState(_unique("torn"), ["a"])
+    try:
+        state.write([1.0])
+        sequence = state._sequence
+
+        class Racing(np.ndarray):
+            # Every read of the sequence sees a new record being published
+            def __getitem__(self, index):
+                value = np.ndarray.__getitem__(self, index)
+                sequence[0] += 1
+                return value
+
+        state._sequence = sequence.view(Racing)
+        with pytest.raises(RuntimeError):
+            state.read(retries=2)
+        state._sequence = sequence
+    finally:
+        state.close()
+
+
+def test_pipeline_validation():
+    pipeline = ControlPipeline(dt=0.005, name=_unique("validation"))
+    pipeline.add_stage(PipelineStage("io", step=io_step, outputs=["time", "torque"], inputs=["control"]))
+    with pytest.raises(ValueError):
+        pipeline.add_stage(PipelineStage("io", step=io_step))
+    with pytest.raises(ValueError):
+        PipelineStage("slow", step=io_step, divisor=0)
+
+    # The control stage it reads from does not exist
+    with pytest.raises(ValueError):
+        pipeline.start()
+    assert not pipeline.is_running
+
+
+def test_pipeline_exchanges_state():
+    pipeline = ControlPipeline(dt=0.005, name=_unique("exchange"))
+    pipeline.add_stage(PipelineStage("io", step=io_step, outputs=["time", "torque"], inputs=["control"]))
+    pipeline.add_stage(PipelineStage("control", step=control_step, outputs=["torque"], inputs=["io"], divisor=2))
+
+    with pipeline:
+        assert pipeline.is_running
+        time.sleep(0.3)
+        snapshot = pipeline.read("io")
+        assert snapshot.tick > 0
+        assert snapshot["torque"] == 2.5
+        assert pipeline.read("control")["torque"] == 2.5
+
+    assert not pipeline.is_running
+    assert pipeline.exitcodes == {"io": 0, "control": 0}
+
+
+def test_pipeline_setup_failure():
+    pipeline = ControlPipeline(dt=0.005, name=_unique("failure"))
+    pipeline.add_stage(PipelineStage("io", step=io_step, outputs=["time", "torque"]))
+    pipeline.add_stage(FailingSetupStage("broken", step=control_step))
+
+    start = time.monotonic()
+    with pytest.raises(RuntimeError):
+        pipeline.start(timeout=5.0)
+    assert time.monotonic() - start < 2.0
+    assert not pipeline.is_running
+    assert pipeline.exitcodes["broken"] != 0
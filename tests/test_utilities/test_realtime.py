@@ -0,0 +1,102 @@
+import gc
+import os
+import sys
+from unittest.mock import mock_open
+
+import pytest
+
+from opensourceleg.utilities import realtime
+from opensourceleg.utilities.realtime import RealtimeProfile, isolated_cpus
+from opensourceleg.utilities.softrealtimeloop import SoftRealtimeLoop
+
+linux_only = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Requires Linux")
+
+
+def test_isolated_cpus(monkeypatch):
+    monkeypatch.setattr(realtime, "open", mock_open(read_data="1-3,5\n"), raising=False)
+    assert isolated_cpus() == {1, 2, 3, 5}
+
+    monkeypatch.setattr(realtime, "open", mock_open(read_data="\n"), raising=False)
+    assert isolated_cpus() == set()
+
+
+def test_invalid_profile():
+    with pytest.raises(ValueError):
+        RealtimeProfile(priority=0)
+    with pytest.raises(ValueError):
+        RealtimeProfile(prefault_bytes=-1)
+
+
+def test_gc_disabled_and_restored():
+    assert gc.isenabled()
+    profile = RealtimeProfile(priority=None, lock_memory=False, prefault_bytes=0)
+    with profile as report:
+        assert report.ok
+        assert report.gc_disabled
+        assert not gc.isenabled()
+    assert gc.isenabled()
+    assert profile.report is report
+
+
+@linux_only
+def test_missing_privileges_fall_back(monkeypatch):
+    def denied(*args):
+        raise PermissionError(1, "Operation not permitted")
+
+    monkeypatch.setattr(os, "sched_setscheduler", denied)
+    affinity = os.sched_getaffinity(0)
+    profile = RealtimeProfile(priority=50, cpus=affinity, lock_memory=False, prefault_bytes=4096, disable_gc=False)
+    report = profile.apply()
+
+    assert not report.ok
+    assert not report.scheduler
+    assert report.errors[0].startswith("scheduler:")
+    assert report.affinity
+    assert report.prefaulted_bytes == 4096
+    assert "Failed: scheduler" in str(report)
+
+    profile.restore()
+    assert os.sched_getaffinity(0) == affinity
+
+
+class FakeLibc:
+    def __init__(self):
+        self.options = {}
+        # ctypes attributes such as restype are set on these, so they must be plain functions
+        self.malloc = lambda size: 1
+        self.memset = lambda buffer, value, size: None
+        self.free = lambda buffer: None
+
+    def mallopt(self, option, value):
+        self.options[option] = value
+        return 1
+
+
+def test_heap_options_restored(monkeypatch):
+    libc = FakeLibc()
+    monkeypatch.setattr(realtime, "_load_libc", lambda: libc)
+    profile = RealtimeProfile(priority=None, lock_memory=False, prefault_bytes=4096, disable_gc=False)
+
+    assert profile.apply().prefaulted_bytes == 4096
+    assert libc.options == {realtime.M_TRIM_THRESHOLD: -1, realtime.M_MMAP_MAX: 0}
+
+    profile.restore()
+    assert libc.options == {
+        realtime.M_TRIM_THRESHOLD: realtime.DEFAULT_TRIM_THRESHOLD,
+        realtime.M_MMAP_MAX: realtime.DEFAULT_MMAP_MAX,
+    }
+
+
+def test_loop_applies_profile():
+    profile = RealtimeProfile(priority=None, lock_memory=False, prefault_bytes=0)
+    loop = SoftRealtimeLoop(dt=0.001, report=False, realtime_profile=profile)
+    gc_enabled = []
+
+    def body():
+        gc_enabled.append(gc.isenabled())
+        return 0 if len(gc_enabled) == 3 else 1
+
+    loop.run(body)
+    assert gc_enabled == [False, False, False]
+    assert gc.isenabled()
+    assert loop.realtime_report.gc_disabled
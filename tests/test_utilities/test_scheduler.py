@@ -0,0 +1,153 @@
+import time
+
+import pytest
+
+from opensourceleg.utilities.scheduler import OverrunPolicy, RateMonotonicScheduler
+from opensourceleg.utilities.softrealtimeloop import SoftRealtimeLoop
+
+
+@pytest.fixture
+def scheduler():
+    return RateMonotonicScheduler(SoftRealtimeLoop(dt=0.001, report=False))
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    clock = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    return clock
+
+
+def test_divisors_and_priority(scheduler):
+    calls = []
+    scheduler.add_task(lambda: calls.append("slow"), divisor=4, name="slow", phase=1)
+    scheduler.add_task(lambda: calls.append("fast"), divisor=1, name="fast")
+    scheduler.add_task(lambda: calls.append("mid"), divisor=2, name="mid", phase=1)
+    assert [task.name for task in scheduler.tasks] == ["fast", "mid", "slow"]
+
+    for _ in range(8):
+        scheduler.tick()
+    assert calls.count("fast") == 8
+    assert calls.count("mid") == 4
+    assert calls.count("slow") == 2
+    # Higher rate tasks run first within a tick
+    assert calls[1:4] == ["fast", "mid", "slow"]
+    assert scheduler.tick_count == 8
+
+
+def test_invalid_tasks(scheduler):
+    scheduler.add_task(lambda: None, name="task")
+    with pytest.raises(ValueError):
+        scheduler.add_task(lambda: None, name="task")
+    with pytest.raises(ValueError):
+        scheduler.add_task(lambda: None, divisor=0, name="zero")
+    with pytest.raises(ValueError):
+        scheduler.add_task(lambda: None, divisor=2, phase=2, name="phase")
+    with pytest.raises(ValueError):
+        scheduler.add_task(lambda: None, budget=0, name="budget")
+
+    scheduler.remove_task("task")
+    assert scheduler.tasks == []
+    with pytest.raises(KeyError):
+        scheduler.remove_task("task")
+
+
+def test_phases_are_staggered(scheduler):
+    phases = [scheduler.add_task(lambda: None, divisor=4, name=str(i)).phase for i in range(4)]
+    assert sorted(phases) == [0, 1, 2, 3]
+
+    # Tasks with a divisor of 2 go on the less loaded half of the divisor-4 schedule
+    scheduler.add_task(lambda: None, divisor=8, name="heavy", phase=0, budget=5.0)
+    assert scheduler.add_task(lambda: None, divisor=2, name="half").phase == 1
+
+
+def run_for(fake_clock, seconds):
+    def task():
+        fake_clock[0] += seconds
+
+    return task
+
+
+def test_skip_policy(scheduler, fake_clock):
+    scheduler.add_task(run_for(fake_clock, 0.0009), name="fast", budget=0.0005)
+    slow = scheduler.add_task(run_for(fake_clock, 0.0001), name="slow", divisor=2, phase=0, budget=0.0002)
+    fast = scheduler.tasks[0]
+
+    scheduler.tick()
+    assert fast.overruns == 1
+    assert slow.skipped == 1
+    assert slow.runs == 0
+    assert not slow.pending
+
+
+def test_defer_policy(scheduler, fake_clock):
+    durations = iter([0.0009, 0.0001, 0.0001])
+    fast = scheduler.add_task(lambda: fake_clock.__setitem__(0, fake_clock[0] + next(durations)), name="fast")
+    slow = scheduler.add_task(
+        run_for(fake_clock, 0.0001), name="slow", divisor=4, phase=0, budget=0.0002, policy=OverrunPolicy.DEFER
+    )
+
+    scheduler.tick()
+    assert slow.deferred == 1
+    assert slow.pending
+
+    scheduler.tick()
+    assert slow.runs == 1
+    assert not slow.pending
+    assert fast.runs == 2
+
+    scheduler.reset()
+    assert slow.runs == 0
+    assert scheduler.tick_count == 0
+
+
+def test_run_with_loop():
+    loop = SoftRealtimeLoop(dt=0.001, report=False)
+    scheduler = RateMonotonicScheduler(loop)
+    counter = {"n": 0}
+
+    def count():
+        counter["n"] += 1
+        if counter["n"] == 3:
+            loop.stop()
+
+    scheduler.add_task(count, divisor=2)
+    scheduler.run()
+    assert counter["n"] == 3
+    assert scheduler.tick_count >= 5
+
+
+def test_shed_tasks():
+    loop = SoftRealtimeLoop(dt=0.001, report=False, adaptive=True)
+    scheduler = RateMonotonicScheduler(loop)
+    calls = []
+    scheduler.add_task(lambda: calls.append("control"), name="control")
+    scheduler.add_task(lambda: calls.append("plot"), name="plot", divisor=2, phase=0, sheddable=True)
+    scheduler.add_task(lambda: calls.append("save"), name="save", divisor=4, phase=0, sheddable=True)
+
+    assert loop.degrade()
+    assert [task.is_shed for task in scheduler.tasks] == [False, False, True]
+    assert loop.degrade()
+    assert loop.dt == 0.001
+    assert loop.degrade()
+    assert loop.dt == 0.002
+
+    scheduler.tick()
+    assert calls == ["control"]
+    assert scheduler.frame_budget == 0.002
+
+    loop.reset()
+    assert not any(task.is_shed for task in scheduler.tasks)
+    scheduler.reset()
+    scheduler.tick()
+    assert calls == ["control", "control", "plot", "save"]
+
+
+def test_explicit_frame_budget():
+    loop = SoftRealtimeLoop(dt=0.001, report=False, adaptive=True)
+    scheduler = RateMonotonicScheduler(loop, frame_budget=0.0005)
+    loop.dt = 0.002
+    assert scheduler.frame_budget == 0.0005
+
+    scheduler.frame_budget = None
+    assert scheduler.frame_budget == 0.002
@@ -1,8 +1,21 @@
+import asyncio
+import os
+import signal
+import sys
+import threading
 import time
 
 import pytest
 
-from opensourceleg.utilities.softrealtimeloop import LoopKiller, SoftRealtimeLoop
+from opensourceleg.utilities import softrealtimeloop
+from opensourceleg.utilities.clock import SimulatedClock
+from opensourceleg.utilities.softrealtimeloop import (
+    AsyncSoftRealtimeLoop,
+    LoopKiller,
+    SleepBackend,
+    SleepCalibrator,
+    SoftRealtimeLoop,
+)
 
 
 def test_loopkiller_init():
@@ -199,3 +212,226 @@ def test_softrealtimeloop_n():
     expected_n = demo.x
     srtl.run(demo.update)
     assert expected_n == srtl.n
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Kernel timer backends require Linux")
+@pytest.mark.parametrize("backend", [SleepBackend.CLOCK_NANOSLEEP, SleepBackend.TIMERFD])
+@pytest.mark.parametrize("maintain_original_phase", [False, True])
+def test_softrealtimeloop_sleep_backend(backend, maintain_original_phase):
+    srtl = SoftRealtimeLoop(
+        dt=0.002, report=False, sleep_backend=backend, maintain_original_phase=maintain_original_phase
+    )
+    assert srtl.sleep_backend == backend
+    demo = DemoClass()
+    start = time.monotonic()
+    srtl.run(demo.update)
+    assert srtl.n == 5
+    assert time.monotonic() - start >= 0.002 * 4
+    assert srtl.sleep_t_agg > 0
+    assert srtl.max_err >= 0
+    assert srtl.cpu_time >= 0
+
+
+def test_softrealtimeloop_sleep_backend_fallback(monkeypatch):
+    def unavailable(backend):
+        raise OSError("not available")
+
+    monkeypatch.setattr(softrealtimeloop, "_create_sleeper", unavailable)
+    srtl = SoftRealtimeLoop(sleep_backend=SleepBackend.TIMERFD)
+    assert srtl.sleep_backend == SleepBackend.BUSY_WAIT
+    assert srtl._sleeper is None
+
+
+def test_softrealtimeloop_report_backend(capsys):
+    srtl = SoftRealtimeLoop(dt=0.001)
+    srtl.run(DemoClass().update)
+    srtl.print_report()
+    report = capsys.readouterr().out
+    assert "with busy_wait" in report
+    assert "p99.9 / max" in report
+    assert "deadline misses: 0" in report
+    assert "CPU usage" in report
+
+
+def test_softrealtimeloop_miss_callbacks():
+    overruns = []
+    misses = []
+    loop = SoftRealtimeLoop(
+        dt=0.001, report=False, on_overrun=overruns.append, on_consecutive_misses=misses.append, miss_limit=2
+    )
+    for _t in loop:
+        time.sleep(0.003)
+        if loop.n >= 6:
+            loop.stop()
+
+    assert len(overruns) >= 4
+    assert all(overrun > 0 for overrun in overruns)
+    assert misses[:2] == [2, 4]
+    assert not loop.degraded
+
+
+def test_softrealtimeloop_adaptive():
+    shed = []
+    loop = SoftRealtimeLoop(dt=0.001, report=False, miss_limit=1, adaptive=True, max_dt=0.003)
+    loop.add_shed_handler(lambda: len(shed) < 1 and not shed.append(1), shed.clear)
+
+    handler = signal.getsignal(signal.SIGTERM)
+    with pytest.raises(ValueError):
+        SoftRealtimeLoop(miss_limit=0)
+    # Invalid arguments are rejected before the loop installs its signal handlers
+    assert signal.getsignal(signal.SIGTERM) is handler
+
+    assert loop.degrade()
+    assert loop.shed_count == 1
+    assert loop.degrade()
+    assert loop.dt == 0.002
+    assert loop.degrade()
+    assert loop.dt == 0.003
+    assert not loop.degrade()
+    assert loop.degraded
+
+    loop.reset()
+    assert loop.dt == 0.001
+    assert shed == []
+    assert not loop.degraded
+
+    for _t in loop:
+        time.sleep(0.005)
+        if loop.n >= 5:
+            loop.stop()
+    assert loop.dt == 0.003
+
+
+@pytest.mark.parametrize("maintain_original_phase", [False, True])
+def test_async_softrealtimeloop_iter(maintain_original_phase):
+    loop = AsyncSoftRealtimeLoop(dt=0.005, report=False, maintain_original_phase=maintain_original_phase)
+    ticks = []
+
+    async def background():
+        # Runs while the loop is sleeping between ticks
+        while True:
+            ticks.append("background")
+            await asyncio.sleep(0.001)
+
+    async def main():
+        task = asyncio.create_task(background())
+        times = []
+        async for t in loop:
+            times.append(t)
+            if len(times) == 5:
+                loop.stop()
+        task.cancel()
+        return times
+
+    times = asyncio.run(main())
+    assert len(times) == 5
+    # Three time steps between the second and last tick, allowing for scheduling jitter
+    assert 0.014 <= times[-1] - times[1] < 0.05
+    assert loop.n == 5
+    assert loop.stats.count == 4
+    assert len(ticks) > 5
+
+
+def test_async_softrealtimeloop_arun():
+    loop = AsyncSoftRealtimeLoop(dt=0.01, report=False)
+    calls = {"a": 0, "b": 0}
+
+    async def update(name, delay):
+        await asyncio.sleep(delay)
+        calls[name] += 1
+        return 0 if calls[name] == 4 else 1
+
+    start = time.monotonic()
+    asyncio.run(loop.arun(lambda: update("a", 0.004), lambda: update("b", 0.004)))
+    elapsed = time.monotonic() - start
+
+    assert calls == {"a": 4, "b": 4}
+    # The updates overlap, so no tick overran its deadline
+    assert loop.stats.deadline_misses == 0
+    assert elapsed < 0.1
+
+
+def send_signal_later(delay):
+    timer = threading.Timer(delay, os.kill, args=(os.getpid(), signal.SIGTERM))
+    timer.start()
+    return timer
+
+
+@pytest.mark.skipif(os.name != "posix", reason="The self-pipe is only used on POSIX")
+def test_loopkiller_wait_wakes_on_signal():
+    killer = LoopKiller()
+    assert killer.wakeup_fd is not None
+    timer = send_signal_later(0.05)
+    start = time.monotonic()
+    killer.wait(2.0)
+    timer.join()
+    assert time.monotonic() - start < 1.0
+    assert killer.kill_now
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="timerfd is Linux only")
+@pytest.mark.parametrize("backend", [SleepBackend.BUSY_WAIT, SleepBackend.TIMERFD])
+@pytest.mark.parametrize("maintain_original_phase", [False, True])
+def test_softrealtimeloop_stops_on_signal_while_sleeping(backend, maintain_original_phase):
+    loop = SoftRealtimeLoop(
+        dt=2.0, report=False, sleep_backend=backend, maintain_original_phase=maintain_original_phase
+    )
+    start = time.monotonic()
+    timer = None
+    for _t in loop:
+        if timer is None:
+            timer = send_signal_later(0.05)
+    timer.join()
+    assert time.monotonic() - start < 1.0
+
+
+def test_sleep_calibrator():
+    calibrator = SleepCalibrator(jitter_target=20e-6, quantile=90, window=10, update_interval=5, max_margin=1e-3)
+    assert calibrator.margin == 0.0
+    for overshoot in [50e-6] * 9 + [5e-3]:
+        calibrator.record(overshoot)
+    # The single outlier is above the 90th percentile
+    assert calibrator.overshoot_quantile == pytest.approx(50e-6 + 0.1 * (5e-3 - 50e-6))
+    assert calibrator.margin == pytest.approx(calibrator.overshoot_quantile - 20e-6)
+
+    # Only the most recent overshoots count, and the margin is capped
+    for _ in range(10):
+        calibrator.record(3e-3)
+    assert calibrator.margin == 1e-3
+    for _ in range(10):
+        calibrator.record(10e-6)
+    assert calibrator.margin == 0.0
+    assert calibrator.samples == 30
+
+    calibrator = SleepCalibrator()
+    calibrator.calibrate(samples=10, duration=1e-5)
+    assert calibrator.samples == 10
+    assert calibrator.overshoot_quantile > 0
+
+    durations = []
+    calibrator.calibrate(samples=5, duration=1e-5, sleep=durations.append)
+    assert durations == [1e-5] * 5
+    assert calibrator.samples == 15
+
+    with pytest.raises(ValueError):
+        SleepCalibrator(jitter_target=-1.0)
+    with pytest.raises(ValueError):
+        SleepCalibrator(quantile=101)
+
+
+@pytest.mark.parametrize("maintain_original_phase", [False, True])
+def test_softrealtimeloop_calibrated_sleep(maintain_original_phase):
+    loop = SoftRealtimeLoop(
+        dt=0.002, report=False, jitter_target=50e-6, maintain_original_phase=maintain_original_phase
+    )
+    for t in loop:
+        if t >= 0.1:
+            loop.stop()
+
+    calibrator = loop.sleep_calibrator
+    assert calibrator.samples > 100
+    assert 0.0 <= calibrator.margin <= 0.001
+    assert loop.n >= 25
+
+    # A simulated clock does not busy wait, so there is nothing to calibrate
+    assert SoftRealtimeLoop(clock=SimulatedClock(), jitter_target=0.0).sleep_calibrator is None
@@ -5,7 +5,7 @@ import pandas as pd
 
 from opensourceleg.actuators.moteus import MoteusActuator
 from opensourceleg.logging.logger import LOGGER
-from opensourceleg.utilities import SoftRealtimeLoop
+from opensourceleg.utilities import AsyncSoftRealtimeLoop
 
 TIME_TO_STEP = 1.0
 FREQUENCY = 200
@@ -27,7 +27,7 @@ async def main():
         "Command_Position": [],
     })
 
-    clock = SoftRealtimeLoop(dt=DT)
+    clock = AsyncSoftRealtimeLoop(dt=DT)
 
     try:
         await mc1.start()
@@ -40,7 +40,7 @@ async def main():
 
         await mc1.update()
 
-        for t in clock:
+        async for t in clock:
             # current_time = time.monotonic()
 
             if t > TIME_TO_STEP:
@@ -68,7 +68,6 @@ async def main():
             )
 
             print("------")
-            await asyncio.sleep(DT)
 
     finally:
         position_data.to_csv("position_data_moteus.csv", index=False)
@@ -5,7 +5,7 @@ from moteus import Register
 
 from opensourceleg.actuators.moteus import MoteusActuator
 from opensourceleg.logging.logger import LOGGER
-from opensourceleg.utilities import SoftRealtimeLoop
+from opensourceleg.utilities import AsyncSoftRealtimeLoop
 
 TIME_TO_STEP = 1.0
 FREQUENCY = 200
@@ -26,7 +26,7 @@ async def main():
         "Command_Torque": [],
     })
 
-    clock = SoftRealtimeLoop(dt=DT)
+    clock = AsyncSoftRealtimeLoop(dt=DT)
 
     try:
         await mc1.start()
@@ -39,7 +39,7 @@ async def main():
 
         await mc1.update()
 
-        for t in clock:
+        async for t in clock:
             # current_time = time.monotonic()
             if t > TIME_TO_STEP:
                 mc1.set_motor_torque(
@@ -63,8 +63,6 @@ async def main():
                 ignore_index=True,
             )
 
-            await asyncio.sleep(DT)
-
     finally:
         torque_data.to_csv("torque_data.csv", index=False)
         await mc1.stop()
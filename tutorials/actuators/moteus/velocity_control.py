@@ -8,7 +8,7 @@ from opensourceleg.actuators.moteus import MoteusActuator
 from opensourceleg.logging.logger import LOGGER
 
 # import time
-from opensourceleg.utilities import SoftRealtimeLoop
+from opensourceleg.utilities import AsyncSoftRealtimeLoop
 
 TIME_TO_STEP = 1.0
 FREQUENCY = 200
@@ -28,7 +28,7 @@ async def main():
         "Output_Velocity": [],
         "Command_Velocity": [],
     })
-    clock = SoftRealtimeLoop(dt=DT)
+    clock = AsyncSoftRealtimeLoop(dt=DT)
 
     try:
         await mc1.start()
@@ -41,7 +41,7 @@ async def main():
 
         await mc1.update()
 
-        for t in clock:
+        async for t in clock:
             # current_time = time.monotonic()
 
             if t > TIME_TO_STEP:
@@ -73,7 +73,6 @@ async def main():
             )
 
             print("------")
-            await asyncio.sleep(DT)
 
     finally:
         velocity_data.to_csv("velocity_data_moteus.csv", index=False)